@@ -17,28 +17,132 @@ mod Events {
 }
 
 
+// Verification against key material already loaded, shared by FalconSignatureVerifier
+// (which fetches it from the registry) and FalconVerifierWithRegistry (which reads
+// its own storage). Both emit the same raw success / failure events.
+pub mod shared {
+    use core::array::{ArrayTrait, Span, SpanTrait};
+    use core::traits::{Into, TryInto};
+    use falcon::falcon::{FalconVerificationError, verify_uncompressed};
+    use moosh_id::hint_verify::{HintVerificationError, verify_with_hint};
+    use moosh_id::ntt_verify::verify_uncompressed_ntt;
+    use starknet::SyscallResultTrait;
+    use starknet::syscalls::emit_event_syscall;
+
+    const PK_SIZE_512: u32 = 512;
+    const PK_SIZE_1024: u32 = 1024;
+
+    fn get_msg_hash_part(msg_point_span: Span<u16>) -> felt252 {
+        if msg_point_span.len() > 0 {
+            (*msg_point_span.at(0)).into()
+        } else {
+            0.into()
+        }
+    }
+
+    fn emit_result(key_hash: felt252, msg_hash_part: felt252, error: Option<felt252>) -> bool {
+        let mut keys = array![key_hash];
+        match error {
+            Option::None => {
+                let mut data = array![msg_hash_part];
+                emit_event_syscall(keys.span(), data.span()).unwrap_syscall();
+                true
+            },
+            Option::Some(error_felt) => {
+                let mut data = array![msg_hash_part, error_felt];
+                emit_event_syscall(keys.span(), data.span()).unwrap_syscall();
+                false
+            },
+        }
+    }
+
+    /// pk_coeffs is the key itself, or its NTT form when is_ntt is set
+    pub fn verify_for_key(
+        key_hash: felt252,
+        pk_coeffs: Span<u16>,
+        is_ntt: bool,
+        s1_coeffs_span: Span<u16>,
+        msg_point_span: Span<u16>,
+    ) -> bool {
+        let n_val: u32 = pk_coeffs.len().try_into().unwrap();
+
+        // Validate key size
+        assert(n_val == PK_SIZE_512 || n_val == PK_SIZE_1024, 'Invalid PK size');
+        assert(s1_coeffs_span.len() == pk_coeffs.len(), 's1 length mismatch');
+        assert(msg_point_span.len() == pk_coeffs.len(), 'msg_point length');
+
+        let msg_hash_part = get_msg_hash_part(msg_point_span);
+
+        let result = if is_ntt {
+            verify_uncompressed_ntt(s1_coeffs_span, pk_coeffs, msg_point_span, n_val)
+        } else {
+            verify_uncompressed(s1_coeffs_span, pk_coeffs, msg_point_span, n_val)
+        };
+
+        let error = match result {
+            Result::Ok(()) => Option::None,
+            Result::Err(falcon_error) => Option::Some(
+                match falcon_error {
+                    FalconVerificationError::NormOverflow => 'NormOverflow',
+                },
+            ),
+        };
+        emit_result(key_hash, msg_hash_part, error)
+    }
+
+    pub fn verify_for_key_with_hint(
+        key_hash: felt252,
+        pk_coeffs: Span<u16>,
+        s1_coeffs_span: Span<u16>,
+        msg_point_span: Span<u16>,
+        s0_span: Span<u16>,
+        t_hint: Span<felt252>,
+        c_hint: Span<felt252>,
+    ) -> bool {
+        let n_val: u32 = pk_coeffs.len().try_into().unwrap();
+
+        // Validate key size
+        assert(n_val == PK_SIZE_512 || n_val == PK_SIZE_1024, 'Invalid PK size');
+
+        let msg_hash_part = get_msg_hash_part(msg_point_span);
+
+        let result = verify_with_hint(
+            key_hash, s1_coeffs_span, pk_coeffs, msg_point_span, s0_span, t_hint, c_hint,
+        );
+        let error = match result {
+            Result::Ok(()) => Option::None,
+            Result::Err(hint_error) => Option::Some(
+                match hint_error {
+                    HintVerificationError::NormOverflow => 'NormOverflow',
+                    HintVerificationError::HintMismatch => 'HintMismatch',
+                    HintVerificationError::CarryOutOfRange => 'CarryOutOfRange',
+                },
+            ),
+        };
+        emit_result(key_hash, msg_hash_part, error)
+    }
+}
+
 #[starknet::contract]
 pub mod FalconSignatureVerifier {
     // --- Core Imports ---
     use core::array::{ArrayTrait, Span, SpanTrait};
     use core::option::OptionTrait;
     use core::traits::{Into, TryInto};
-    use falcon::falcon::{FalconVerificationError, verify_uncompressed};
+    use super::shared::{verify_for_key, verify_for_key_with_hint};
 
     // --- Dependency Imports ---
     use moosh_id::keyregistry::FalconPublicKeyRegistry::{
         IFalconPublicKeyRegistryDispatcher, IFalconPublicKeyRegistryDispatcherTrait,
     };
-    use starknet::syscalls::emit_event_syscall;
-    use starknet::{ContractAddress, SyscallResultTrait};
-
-    // --- Constants ---
-    const PK_SIZE_512: u32 = 512;
-    const PK_SIZE_1024: u32 = 1024;
+    use starknet::{ContractAddress, get_caller_address, get_tx_info};
 
     // --- Starknet Imports ---
     use starknet::event::{EventEmitter};
-    use starknet::storage::{StoragePointerReadAccess, StoragePointerWriteAccess};
+    use starknet::storage::{
+        Map, StorageMapReadAccess, StorageMapWriteAccess, StoragePointerReadAccess,
+        StoragePointerWriteAccess,
+    };
 
     use super::Events::{VerificationFailed, VerificationSuccess}; // Import the event data structs
 
@@ -46,6 +150,14 @@ pub mod FalconSignatureVerifier {
     #[storage]
     struct Storage {
         key_registry_address: ContractAddress,
+        // Account that deployed the verifier; may set the registry shards once
+        admin: ContractAddress,
+        // Sharded deployment: key_hash lives in registry_shards[key_hash % shard_count].
+        // With no shards set every key is looked up in key_registry_address.
+        shard_count: u32,
+        registry_shards: Map<u32, ContractAddress>,
+        // Look up NTT-form keys first; the registries must have get_public_key_ntt
+        use_ntt_keys: bool,
     }
 
     // --- Contract's Main Event Enum ---
@@ -60,8 +172,15 @@ pub mod FalconSignatureVerifier {
 
     // --- Constructor ---
     #[constructor]
-    fn constructor(ref self: ContractState, key_registry_addr: ContractAddress) {
+    // use_ntt_keys needs registries with get_public_key_ntt (keyregistry.cairo since
+    // register_public_key_ntt); leave it off for registries declared before that
+    fn constructor(
+        ref self: ContractState, key_registry_addr: ContractAddress, use_ntt_keys: bool,
+    ) {
         self.key_registry_address.write(key_registry_addr);
+        self.use_ntt_keys.write(use_ntt_keys);
+        // The sending account rather than the caller, which is the UDC when deployed through it
+        self.admin.write(get_tx_info().unbox().account_contract_address);
     }
 
     // --- Contract Interface (ABI) ---
@@ -73,11 +192,40 @@ pub mod FalconSignatureVerifier {
             s1_coeffs_span: Span<u16>,
             msg_point_span: Span<u16>,
         ) -> bool;
+
+        // s0 and the product quotients (t, c) come from the caller and are checked
+        // at a Fiat-Shamir point instead of computing s1 * pk on chain
+        fn verify_signature_for_key_hash_with_hint(
+            self: @TContractState,
+            key_hash: felt252,
+            s1_coeffs_span: Span<u16>,
+            msg_point_span: Span<u16>,
+            s0_span: Span<u16>,
+            t_hint: Span<felt252>,
+            c_hint: Span<felt252>,
+        ) -> bool;
+
+        // Shards are fixed once set, since their count decides where each key lives
+        fn set_registry_shards(ref self: TContractState, shards: Span<ContractAddress>);
+        fn get_registry_shards(self: @TContractState) -> Array<ContractAddress>;
     }
 
     // --- Contract Implementation ---
     #[generate_trait]
     impl InternalImpl of InternalTrait {
+        // Registry holding key_hash: its shard, or the single registry if unsharded
+        fn registry_for(self: @ContractState, key_hash: felt252) -> IFalconPublicKeyRegistryDispatcher {
+            let shard_count = self.shard_count.read();
+            let contract_address = if shard_count == 0 {
+                self.key_registry_address.read()
+            } else {
+                let key_hash_u256: u256 = key_hash.into();
+                let shard: u32 = (key_hash_u256 % shard_count.into()).try_into().unwrap();
+                self.registry_shards.read(shard)
+            };
+            IFalconPublicKeyRegistryDispatcher { contract_address }
+        }
+
         fn emit_success(ref self: ContractState, key_hash: felt252, msg_hash_part: felt252) {
             self.emit(Event::VerificationSuccess(VerificationSuccess { key_hash, msg_hash_part }));
         }
@@ -92,14 +240,6 @@ pub mod FalconSignatureVerifier {
                     ),
                 );
         }
-
-        fn get_msg_hash_part(msg_point_span: Span<u16>) -> felt252 {
-            if msg_point_span.len() > 0 {
-                (*msg_point_span.at(0)).into()
-            } else {
-                0.into()
-            }
-        }
     }
 
     #[abi(embed_v0)]
@@ -110,40 +250,67 @@ pub mod FalconSignatureVerifier {
             s1_coeffs_span: Span<u16>,
             msg_point_span: Span<u16>,
         ) -> bool {
-            let registry_address = self.key_registry_address.read();
-            let key_registry_dispatcher = IFalconPublicKeyRegistryDispatcher {
-                contract_address: registry_address,
-            };
+            let key_registry_dispatcher = self.registry_for(key_hash);
 
+            // Keys registered with their NTT form skip the forward NTT of the key
+            if self.use_ntt_keys.read() {
+                let pk_ntt_array = key_registry_dispatcher.get_public_key_ntt(key_hash);
+                if pk_ntt_array.len() != 0 {
+                    return verify_for_key(
+                        key_hash, pk_ntt_array.span(), true, s1_coeffs_span, msg_point_span,
+                    );
+                }
+            }
             let pk_coeffs_array = key_registry_dispatcher.get_public_key(key_hash);
-            let n_val: u32 = pk_coeffs_array.len().try_into().unwrap();
-
-            // Validate key size
-            assert(n_val == PK_SIZE_512 || n_val == PK_SIZE_1024, 'Invalid PK size');
-            assert(s1_coeffs_span.len() == pk_coeffs_array.len(), 's1 length mismatch');
-            assert(msg_point_span.len() == pk_coeffs_array.len(), 'msg_point length');
-
-            let msg_hash_part = InternalImpl::get_msg_hash_part(msg_point_span);
-
-            match verify_uncompressed(
-                s1_coeffs_span, pk_coeffs_array.span(), msg_point_span, n_val,
-            ) {
-                Result::Ok(()) => {
-                    let mut keys = array![key_hash];
-                    let mut data = array![msg_hash_part];
-                    emit_event_syscall(keys.span(), data.span()).unwrap_syscall();
-                    true
-                },
-                Result::Err(falcon_error) => {
-                    let error_felt = match falcon_error {
-                        FalconVerificationError::NormOverflow => 'NormOverflow',
-                    };
-                    let mut keys = array![key_hash];
-                    let mut data = array![msg_hash_part, error_felt];
-                    emit_event_syscall(keys.span(), data.span()).unwrap_syscall();
-                    false
-                },
+            verify_for_key(key_hash, pk_coeffs_array.span(), false, s1_coeffs_span, msg_point_span)
+        }
+
+        fn verify_signature_for_key_hash_with_hint(
+            self: @ContractState,
+            key_hash: felt252,
+            s1_coeffs_span: Span<u16>,
+            msg_point_span: Span<u16>,
+            s0_span: Span<u16>,
+            t_hint: Span<felt252>,
+            c_hint: Span<felt252>,
+        ) -> bool {
+            let key_registry_dispatcher = self.registry_for(key_hash);
+            let pk_coeffs_array = key_registry_dispatcher.get_public_key(key_hash);
+            verify_for_key_with_hint(
+                key_hash,
+                pk_coeffs_array.span(),
+                s1_coeffs_span,
+                msg_point_span,
+                s0_span,
+                t_hint,
+                c_hint,
+            )
+        }
+
+        fn set_registry_shards(ref self: ContractState, shards: Span<ContractAddress>) {
+            assert(get_caller_address() == self.admin.read(), 'Only admin can set shards');
+            assert(self.shard_count.read() == 0, 'Shards already set');
+            assert(shards.len() != 0, 'No shards given');
+            let mut i: u32 = 0;
+            while i < shards.len() {
+                self.registry_shards.write(i, *shards.at(i));
+                i += 1;
+            }
+            self.shard_count.write(shards.len());
+        }
+
+        fn get_registry_shards(self: @ContractState) -> Array<ContractAddress> {
+            let shard_count = self.shard_count.read();
+            if shard_count == 0 {
+                return array![self.key_registry_address.read()];
+            }
+            let mut shards = ArrayTrait::new();
+            let mut i: u32 = 0;
+            while i < shard_count {
+                shards.append(self.registry_shards.read(i));
+                i += 1;
             }
+            shards
         }
     }
 
@@ -0,0 +1,151 @@
+// Decoding of Falcon's compressed signature encoding (falcon.py compress / decompress).
+//
+// Each coefficient is a sign bit, its 7 low bits, then its high bits (|x| >> 7) in
+// unary: that many 0 bits followed by a 1. The bit string is zero-padded to whole
+// bytes, and the bytes are sent 31 per felt252, big-endian, the last felt padded
+// with zero bytes at the end.
+use core::array::{ArrayTrait, SpanTrait};
+use core::option::{Option, OptionTrait};
+use core::traits::{DivRem, Into, TryInto};
+
+pub const BYTES_PER_WORD: u32 = 31;
+const Q: u16 = 12289;
+// |x| above Q / 2 cannot be a centered coefficient mod Q
+const MAX_ABS_COEFF: u32 = 6144;
+const HIGH_HALF_BOUND: u128 = 0x1000000000000000000000000000000; // 2^120
+
+// Splits felt252 words into their 31 big-endian bytes each; None if a word
+// does not fit in 31 bytes
+fn words_to_bytes(words: Span<felt252>) -> Option<Array<u8>> {
+    let mut bytes = ArrayTrait::new();
+    let mut valid = true;
+    for word in words {
+        let value: u256 = (*word).into();
+        if value.high >= HIGH_HALF_BOUND {
+            valid = false;
+            break;
+        }
+        // 31 bytes = 15 in the high u128 + 16 in the low u128
+        append_be_bytes(value.high, 15, ref bytes);
+        append_be_bytes(value.low, 16, ref bytes);
+    }
+    if !valid {
+        return Option::None;
+    }
+    Option::Some(bytes)
+}
+
+fn append_be_bytes(value: u128, count: u32, ref bytes: Array<u8>) {
+    let mut little_endian = ArrayTrait::new();
+    let mut rest = value;
+    let mut k: u32 = 0;
+    while k < count {
+        let (quotient, byte) = DivRem::div_rem(rest, 256_u128.try_into().unwrap());
+        little_endian.append(byte.try_into().unwrap());
+        rest = quotient;
+        k += 1;
+    }
+    let mut k = count;
+    while k > 0 {
+        k -= 1;
+        bytes.append(*little_endian.at(k));
+    }
+}
+
+fn bit_mask(bit_in_byte: u32) -> u8 {
+    match bit_in_byte {
+        0 => 0x80,
+        1 => 0x40,
+        2 => 0x20,
+        3 => 0x10,
+        4 => 0x08,
+        5 => 0x04,
+        6 => 0x02,
+        _ => 0x01,
+    }
+}
+
+// Bit `pos` of the byte string, most significant bit of each byte first
+fn read_bit(bytes: Span<u8>, pos: u32) -> bool {
+    let (byte_index, bit_in_byte) = DivRem::div_rem(pos, 8_u32.try_into().unwrap());
+    (*bytes.at(byte_index) & bit_mask(bit_in_byte)) != 0
+}
+
+/// Decodes n signature coefficients, reduced mod Q, from compressed felt252 words.
+/// Returns None if the encoding is malformed, encodes -0, has a coefficient of
+/// absolute value above Q / 2, or has set bits after the n-th coefficient.
+pub fn decompress_s1(words: Span<felt252>, n: u32) -> Option<Array<u16>> {
+    let bytes = match words_to_bytes(words) {
+        Option::Some(bytes) => bytes.span(),
+        Option::None => { return Option::None; },
+    };
+    let total_bits = bytes.len() * 8;
+
+    let mut coeffs = ArrayTrait::new();
+    let mut pos: u32 = 0;
+    let mut valid = true;
+    while coeffs.len() < n {
+        // Sign bit and 7 low bits
+        if pos + 8 > total_bits {
+            valid = false;
+            break;
+        }
+        let negative = read_bit(bytes, pos);
+        let mut abs_value: u32 = 0;
+        let mut k: u32 = 1;
+        while k < 8 {
+            abs_value *= 2;
+            if read_bit(bytes, pos + k) {
+                abs_value += 1;
+            }
+            k += 1;
+        }
+        pos += 8;
+
+        // High bits in unary, terminated by a 1
+        let mut high: u32 = 0;
+        loop {
+            if pos >= total_bits || abs_value + high * 128 > MAX_ABS_COEFF {
+                valid = false;
+                break;
+            }
+            let bit = read_bit(bytes, pos);
+            pos += 1;
+            if bit {
+                break;
+            }
+            high += 1;
+        }
+        if !valid {
+            break;
+        }
+        abs_value += high * 128;
+
+        if abs_value == 0 && negative {
+            valid = false;
+            break;
+        }
+        let abs_coeff: u16 = abs_value.try_into().unwrap();
+        coeffs.append(if negative {
+            Q - abs_coeff
+        } else {
+            abs_coeff
+        });
+    }
+    if !valid {
+        return Option::None;
+    }
+
+    // Everything after the last coefficient must be padding
+    while pos < total_bits {
+        if read_bit(bytes, pos) {
+            valid = false;
+            break;
+        }
+        pos += 1;
+    }
+    if !valid {
+        return Option::None;
+    }
+    Option::Some(coeffs)
+}
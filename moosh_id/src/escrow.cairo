@@ -2,6 +2,7 @@
 pub mod Escrow {
     use core::traits::Into;
     use core::traits::TryInto;
+    use core::option::OptionTrait;
     use core::num::traits::Zero;
     use core::array::Span;
     use starknet::{
@@ -29,6 +30,10 @@ pub mod Escrow {
         IFalconSignatureVerifierDispatcherTrait,
     };
 
+    use moosh_id::compression::decompress_s1;
+    use moosh_id::packing::unpack_u14_words;
+    use core::poseidon::poseidon_hash_span;
+
     // Import key registry interface
     use moosh_id::keyregistry::FalconPublicKeyRegistry::{
         IFalconPublicKeyRegistryDispatcher,
@@ -64,7 +69,10 @@ pub mod Escrow {
 
         // Message point for signature verification
         msg_point_len: u32,
-        msg_points: Map::<u32, u16>
+        msg_points: Map::<u32, u16>,
+        // Poseidon hash of the message point when only the commitment is stored
+        // (0 if the point itself is in msg_points)
+        msg_point_commitment: felt252
     }
 
     #[event]
@@ -171,9 +179,21 @@ pub mod Escrow {
         fn get_escrow_details(self: @TContractState) -> EscrowDetails;
         fn deposit(ref self: TContractState) -> bool;
         fn claim(ref self: TContractState, s1_coeffs: Span<u16>) -> bool;
+        fn claim_compressed(ref self: TContractState, s1_compressed: Span<felt252>) -> bool;
+        fn claim_with_msg_point(
+            ref self: TContractState, s1_coeffs: Span<u16>, msg_point_packed: Span<felt252>
+        ) -> bool;
+        fn claim_compressed_with_msg_point(
+            ref self: TContractState, s1_compressed: Span<felt252>, msg_point_packed: Span<felt252>
+        ) -> bool;
         fn dispute(ref self: TContractState) -> bool;
         fn get_client_allowance(self: @TContractState) -> u256;
         fn set_message_points(ref self: TContractState, msg_point_span: Span<u16>) -> bool;
+        fn get_message_point(self: @TContractState) -> Array<u16>;
+        fn set_message_point_commitment(
+            ref self: TContractState, msg_point_len: u32, commitment: felt252
+        ) -> bool;
+        fn get_message_point_commitment(self: @TContractState) -> felt252;
     }
 
     #[generate_trait]
@@ -255,6 +275,86 @@ pub mod Escrow {
             }
         }
 
+        fn claim_with_signature(
+            ref self: ContractState,
+            s1_coeffs: Span<u16>,
+            msg_point: Span<u16>
+        ) -> bool {
+            // Check if deposit has been made
+            assert(self.is_deposited.read(), 'Not deposited');
+            
+            // Check if already claimed or disputed
+            assert(!self.is_claimed.read(), 'Already claimed');
+            assert(!self.is_disputed.read(), 'Contract disputed');
+            
+            // Check service status
+            let status = InternalFunctions::get_service_status(@self);
+            assert(status == 3, 'Service period not complete');
+            
+            // Get the key hash and verifier
+            let key_hash = self.provider_key_hash.read();
+            let verifier = IFalconSignatureVerifierDispatcher { 
+                contract_address: self.verifier.read() 
+            };
+            
+            // Verify the signature
+            let is_valid = verifier.verify_signature_for_key_hash(
+                key_hash,
+                s1_coeffs,
+                msg_point
+            );
+            assert(is_valid, 'Invalid signature');
+            
+            
+            // Verify caller is the provider
+            let caller = get_caller_address();
+            
+            self.is_claimed.write(true);
+            self.is_completed.write(true);
+            
+            // Transfer tokens to provider
+            let total_amount = self.total_amount.read();
+            let strk = IERC20Dispatcher { contract_address: self.strk_token.read() };
+            
+            // Validate and transfer
+            assert(
+                InternalFunctions::validate_balance_for_operation(@self, total_amount),
+                'Insufficient balance for claim'
+            );
+            InternalFunctions::safe_transfer(@self, strk, caller, total_amount);
+            
+            // Emit claim event
+            self.emit(Event::EscrowClaimed(
+                EscrowClaimed {
+                    provider: caller,
+                    amount: total_amount
+                }
+            ));
+            
+            true
+        }
+
+        fn stored_msg_point(self: @ContractState) -> Array<u16> {
+            assert(self.msg_point_commitment.read() == 0, 'Msg point must be supplied');
+            InternalFunctions::get_msg_point_span(self)
+        }
+
+        // Unpacks a claimer-supplied message point and checks it against the commitment
+        fn committed_msg_point(self: @ContractState, msg_point_packed: Span<felt252>) -> Array<u16> {
+            let commitment = self.msg_point_commitment.read();
+            assert(commitment != 0, 'No msg point commitment');
+
+            let msg_point = unpack_u14_words(msg_point_packed, self.msg_point_len.read())
+                .expect('Invalid packed msg point');
+            let mut msg_point_felts = ArrayTrait::new();
+            for coeff in msg_point.span() {
+                let coeff_felt: felt252 = (*coeff).into();
+                msg_point_felts.append(coeff_felt);
+            };
+            assert(poseidon_hash_span(msg_point_felts.span()) == commitment, 'Msg point mismatch');
+            msg_point
+        }
+
         fn get_msg_point_span(self: @ContractState) -> Array<u16> {
             let msg_point_len = self.msg_point_len.read();
             let mut msg_point_array = ArrayTrait::new();
@@ -363,61 +463,40 @@ pub mod Escrow {
             ref self: ContractState,
             s1_coeffs: Span<u16>
         ) -> bool {
-            // Check if deposit has been made
-            assert(self.is_deposited.read(), 'Not deposited');
-            
-            // Check if already claimed or disputed
-            assert(!self.is_claimed.read(), 'Already claimed');
-            assert(!self.is_disputed.read(), 'Contract disputed');
-            
-            // Check service status
-            let status = InternalFunctions::get_service_status(@self);
-            assert(status == 3, 'Service period not complete');
-            
-            // Get the key hash and verifier
-            let key_hash = self.provider_key_hash.read();
-            let verifier = IFalconSignatureVerifierDispatcher { 
-                contract_address: self.verifier.read() 
-            };
-            
-            // Get stored message point
-            let msg_point_array = InternalFunctions::get_msg_point_span(@self);
-            
-            // Verify the signature
-            let is_valid = verifier.verify_signature_for_key_hash(
-                key_hash,
-                s1_coeffs,
-                msg_point_array.span()
-            );
-            assert(is_valid, 'Invalid signature');
-            
-            
-            // Verify caller is the provider
-            let caller = get_caller_address();
-            
-            self.is_claimed.write(true);
-            self.is_completed.write(true);
-            
-            // Transfer tokens to provider
-            let total_amount = self.total_amount.read();
-            let strk = IERC20Dispatcher { contract_address: self.strk_token.read() };
-            
-            // Validate and transfer
-            assert(
-                InternalFunctions::validate_balance_for_operation(@self, total_amount),
-                'Insufficient balance for claim'
-            );
-            InternalFunctions::safe_transfer(@self, strk, caller, total_amount);
-            
-            // Emit claim event
-            self.emit(Event::EscrowClaimed(
-                EscrowClaimed {
-                    provider: caller,
-                    amount: total_amount
-                }
-            ));
-            
-            true
+            let msg_point = InternalFunctions::stored_msg_point(@self);
+            InternalFunctions::claim_with_signature(ref self, s1_coeffs, msg_point.span())
+        }
+
+        fn claim_compressed(
+            ref self: ContractState,
+            s1_compressed: Span<felt252>
+        ) -> bool {
+            // Falcon compressed s1, 31 bytes per felt (see compression.cairo)
+            let n = self.msg_point_len.read();
+            let s1_coeffs = decompress_s1(s1_compressed, n).expect('Invalid compressed signature');
+            let msg_point = InternalFunctions::stored_msg_point(@self);
+            InternalFunctions::claim_with_signature(ref self, s1_coeffs.span(), msg_point.span())
+        }
+
+        fn claim_with_msg_point(
+            ref self: ContractState,
+            s1_coeffs: Span<u16>,
+            msg_point_packed: Span<felt252>
+        ) -> bool {
+            // Message point packed 17 per felt (see packing.cairo)
+            let msg_point = InternalFunctions::committed_msg_point(@self, msg_point_packed);
+            InternalFunctions::claim_with_signature(ref self, s1_coeffs, msg_point.span())
+        }
+
+        fn claim_compressed_with_msg_point(
+            ref self: ContractState,
+            s1_compressed: Span<felt252>,
+            msg_point_packed: Span<felt252>
+        ) -> bool {
+            let n = self.msg_point_len.read();
+            let s1_coeffs = decompress_s1(s1_compressed, n).expect('Invalid compressed signature');
+            let msg_point = InternalFunctions::committed_msg_point(@self, msg_point_packed);
+            InternalFunctions::claim_with_signature(ref self, s1_coeffs.span(), msg_point.span())
         }
 
         fn dispute(ref self: ContractState) -> bool {
@@ -568,5 +647,35 @@ pub mod Escrow {
             
             true
         }
+
+        fn get_message_point(self: @ContractState) -> Array<u16> {
+            // Lets the provider sign against the stored point off-chain;
+            // empty when only a commitment is stored
+            if self.msg_point_commitment.read() != 0 {
+                return ArrayTrait::new();
+            }
+            InternalFunctions::get_msg_point_span(self)
+        }
+
+        fn set_message_point_commitment(
+            ref self: ContractState, msg_point_len: u32, commitment: felt252
+        ) -> bool {
+            // Only client can set message points
+            InternalFunctions::assert_only_client(@self);
+
+            // Ensure message points haven't been set before, in either form
+            assert(self.msg_point_len.read() == 0, 'Message already set');
+            assert(msg_point_len > 0, 'Message point must not be empty');
+            assert(commitment != 0, 'Commitment must be non-zero');
+
+            // msg_point_len also marks the message as set for deposit
+            self.msg_point_len.write(msg_point_len);
+            self.msg_point_commitment.write(commitment);
+            true
+        }
+
+        fn get_message_point_commitment(self: @ContractState) -> felt252 {
+            self.msg_point_commitment.read()
+        }
     }
 } 
\ No newline at end of file
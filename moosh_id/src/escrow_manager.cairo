@@ -0,0 +1,339 @@
+// Many escrows in one contract, keyed by ID, instead of one Escrow deployment per
+// agreement. create_escrow records the escrow and takes the deposit in the same
+// call; the client only has to approve the manager for the amount first (both fit
+// in one multicall). Message points are always stored as a Poseidon commitment
+// and supplied packed on claim, as with Escrow's commitment mode.
+#[starknet::contract]
+pub mod EscrowManager {
+    use core::array::{ArrayTrait, Span, SpanTrait};
+    use core::num::traits::Zero;
+    use core::option::OptionTrait;
+    use core::poseidon::poseidon_hash_span;
+    use core::traits::{Into, TryInto};
+    use moosh_id::addressverifier::FalconSignatureVerifier::{
+        IFalconSignatureVerifierDispatcher, IFalconSignatureVerifierDispatcherTrait,
+    };
+    use moosh_id::compression::decompress_s1;
+    use moosh_id::keyregistry::FalconPublicKeyRegistry::{
+        IFalconPublicKeyRegistryDispatcher, IFalconPublicKeyRegistryDispatcherTrait,
+    };
+    use moosh_id::packing::unpack_u14_words;
+    use openzeppelin::token::erc20::interface::{IERC20Dispatcher, IERC20DispatcherTrait};
+    use starknet::storage::{
+        Map, StorageMapReadAccess, StorageMapWriteAccess, StoragePointerReadAccess,
+        StoragePointerWriteAccess,
+    };
+    use starknet::{ContractAddress, get_block_number, get_caller_address, get_contract_address};
+
+    // Service status, as computed by Escrow::get_service_status
+    const STATUS_PENDING: u8 = 1;
+    const STATUS_ACTIVE: u8 = 2;
+    const STATUS_COMPLETED: u8 = 3;
+
+    #[derive(Drop, Copy, Serde, starknet::Store)]
+    pub struct EscrowRecord {
+        pub provider_key_hash: felt252,
+        pub total_amount: u128,
+        pub service_period_blocks: u64,
+        // Block of create_escrow, which is also the deposit
+        pub service_start_block: u64,
+        pub is_claimed: bool,
+        pub is_disputed: bool,
+        pub client: ContractAddress,
+        pub provider: ContractAddress,
+        pub msg_point_len: u32,
+        pub msg_point_commitment: felt252,
+    }
+
+    #[storage]
+    struct Storage {
+        verifier: ContractAddress,
+        key_registry: ContractAddress,
+        strk_token: ContractAddress,
+        escrow_count: u64,
+        // IDs are 1-based; a zero client means no escrow with that ID
+        escrows: Map<u64, EscrowRecord>,
+    }
+
+    #[event]
+    #[derive(Drop, starknet::Event)]
+    pub enum Event {
+        EscrowCreated: EscrowCreated,
+        EscrowClaimed: EscrowClaimed,
+        EscrowDisputed: EscrowDisputed,
+    }
+
+    #[derive(Drop, starknet::Event)]
+    pub struct EscrowCreated {
+        #[key]
+        pub escrow_id: u64,
+        pub client: ContractAddress,
+        pub provider_key_hash: felt252,
+        pub total_amount: u128,
+        pub service_period_blocks: u64,
+    }
+
+    #[derive(Drop, starknet::Event)]
+    pub struct EscrowClaimed {
+        #[key]
+        pub escrow_id: u64,
+        pub provider: ContractAddress,
+        pub amount: u128,
+    }
+
+    #[derive(Drop, starknet::Event)]
+    pub struct EscrowDisputed {
+        #[key]
+        pub escrow_id: u64,
+        pub client: ContractAddress,
+        pub blocks_served: u64,
+        pub provider_amount: u128,
+        pub client_refund: u128,
+    }
+
+    #[constructor]
+    fn constructor(
+        ref self: ContractState,
+        verifier: ContractAddress,
+        key_registry: ContractAddress,
+        strk_token: ContractAddress,
+    ) {
+        assert(!verifier.is_zero(), 'Verifier must be non-zero');
+        assert(!key_registry.is_zero(), 'Key registry must be non-zero');
+        assert(!strk_token.is_zero(), 'Token must be non-zero');
+        self.verifier.write(verifier);
+        self.key_registry.write(key_registry);
+        self.strk_token.write(strk_token);
+    }
+
+    #[starknet::interface]
+    pub trait IEscrowManager<TContractState> {
+        fn create_escrow(
+            ref self: TContractState,
+            provider_key_hash: felt252,
+            provider: ContractAddress,
+            total_amount: u128,
+            service_period_blocks: u64,
+            msg_point_len: u32,
+            msg_point_commitment: felt252,
+        ) -> u64;
+        fn claim(
+            ref self: TContractState,
+            escrow_id: u64,
+            s1_compressed: Span<felt252>,
+            msg_point_packed: Span<felt252>,
+        ) -> bool;
+        fn dispute(ref self: TContractState, escrow_id: u64) -> bool;
+        fn get_escrow(self: @TContractState, escrow_id: u64) -> EscrowRecord;
+        fn get_escrows(self: @TContractState, escrow_ids: Span<u64>) -> Array<EscrowRecord>;
+        fn get_escrow_count(self: @TContractState) -> u64;
+    }
+
+    #[generate_trait]
+    impl InternalFunctions of InternalFunctionsTrait {
+        fn read_escrow(self: @ContractState, escrow_id: u64) -> EscrowRecord {
+            let record = self.escrows.read(escrow_id);
+            assert(!record.client.is_zero(), 'Escrow not found');
+            record
+        }
+
+        fn get_service_status(record: @EscrowRecord) -> u8 {
+            let current_block = get_block_number();
+            let start_block = *record.service_start_block;
+            if current_block <= start_block {
+                STATUS_PENDING
+            } else if current_block < start_block + *record.service_period_blocks {
+                STATUS_ACTIVE
+            } else {
+                STATUS_COMPLETED
+            }
+        }
+
+        // Unpacks a claimer-supplied message point and checks it against the commitment
+        fn committed_msg_point(record: @EscrowRecord, msg_point_packed: Span<felt252>) -> Array<u16> {
+            let msg_point = unpack_u14_words(msg_point_packed, *record.msg_point_len)
+                .expect('Invalid packed msg point');
+            let mut msg_point_felts = ArrayTrait::new();
+            for coeff in msg_point.span() {
+                let coeff_felt: felt252 = (*coeff).into();
+                msg_point_felts.append(coeff_felt);
+            }
+            assert(
+                poseidon_hash_span(msg_point_felts.span()) == *record.msg_point_commitment,
+                'Msg point mismatch',
+            );
+            msg_point
+        }
+
+        fn transfer(self: @ContractState, recipient: ContractAddress, amount: u128) {
+            let strk = IERC20Dispatcher { contract_address: self.strk_token.read() };
+            assert(strk.transfer(recipient, amount.into()), 'Transfer failed');
+        }
+    }
+
+    #[abi(embed_v0)]
+    impl EscrowManagerImpl of IEscrowManager<ContractState> {
+        fn create_escrow(
+            ref self: ContractState,
+            provider_key_hash: felt252,
+            provider: ContractAddress,
+            total_amount: u128,
+            service_period_blocks: u64,
+            msg_point_len: u32,
+            msg_point_commitment: felt252,
+        ) -> u64 {
+            assert(provider_key_hash != 0, 'Provider key must be non-zero');
+            assert(!provider.is_zero(), 'Provider addr must be non-zero');
+            assert(total_amount > 0, 'Amount must be non-zero');
+            assert(service_period_blocks > 0, 'Period must be non-zero');
+            assert(msg_point_len > 0, 'Message point must not be empty');
+            assert(msg_point_commitment != 0, 'Commitment must be non-zero');
+
+            // The deposit: the client approves the manager beforehand
+            let client = get_caller_address();
+            let strk = IERC20Dispatcher { contract_address: self.strk_token.read() };
+            let transferred = strk
+                .transfer_from(client, get_contract_address(), total_amount.into());
+            assert(transferred, 'Transfer failed');
+
+            let escrow_id = self.escrow_count.read() + 1;
+            self.escrow_count.write(escrow_id);
+            self
+                .escrows
+                .write(
+                    escrow_id,
+                    EscrowRecord {
+                        provider_key_hash,
+                        total_amount,
+                        service_period_blocks,
+                        service_start_block: get_block_number(),
+                        is_claimed: false,
+                        is_disputed: false,
+                        client,
+                        provider,
+                        msg_point_len,
+                        msg_point_commitment,
+                    },
+                );
+
+            self
+                .emit(
+                    Event::EscrowCreated(
+                        EscrowCreated {
+                            escrow_id, client, provider_key_hash, total_amount, service_period_blocks,
+                        },
+                    ),
+                );
+            escrow_id
+        }
+
+        fn claim(
+            ref self: ContractState,
+            escrow_id: u64,
+            s1_compressed: Span<felt252>,
+            msg_point_packed: Span<felt252>,
+        ) -> bool {
+            let mut record = InternalFunctions::read_escrow(@self, escrow_id);
+            assert(!record.is_claimed, 'Already claimed');
+            assert(!record.is_disputed, 'Contract disputed');
+            assert(
+                InternalFunctions::get_service_status(@record) == STATUS_COMPLETED,
+                'Service period not complete',
+            );
+
+            // Falcon compressed s1 (see compression.cairo), point packed 17 per felt
+            let s1_coeffs = decompress_s1(s1_compressed, record.msg_point_len)
+                .expect('Invalid compressed signature');
+            let msg_point = InternalFunctions::committed_msg_point(@record, msg_point_packed);
+            let verifier = IFalconSignatureVerifierDispatcher {
+                contract_address: self.verifier.read(),
+            };
+            let is_valid = verifier
+                .verify_signature_for_key_hash(
+                    record.provider_key_hash, s1_coeffs.span(), msg_point.span(),
+                );
+            assert(is_valid, 'Invalid signature');
+
+            record.is_claimed = true;
+            self.escrows.write(escrow_id, record);
+
+            // Paid to the recorded provider, so a relayed claim cannot redirect funds
+            InternalFunctions::transfer(@self, record.provider, record.total_amount);
+            self
+                .emit(
+                    Event::EscrowClaimed(
+                        EscrowClaimed {
+                            escrow_id, provider: record.provider, amount: record.total_amount,
+                        },
+                    ),
+                );
+            true
+        }
+
+        fn dispute(ref self: ContractState, escrow_id: u64) -> bool {
+            let mut record = InternalFunctions::read_escrow(@self, escrow_id);
+            assert(get_caller_address() == record.client, 'Only client can call');
+            assert(!record.is_claimed, 'Already claimed');
+            assert(!record.is_disputed, 'Already disputed');
+
+            let status = InternalFunctions::get_service_status(@record);
+            let blocks_served = if status == STATUS_PENDING {
+                0
+            } else if status == STATUS_COMPLETED {
+                record.service_period_blocks
+            } else {
+                get_block_number() - record.service_start_block
+            };
+            let blocks_served_u128: u128 = blocks_served.into();
+            let provider_amount = record.total_amount
+                * blocks_served_u128
+                / record.service_period_blocks.into();
+            let client_refund = record.total_amount - provider_amount;
+
+            record.is_disputed = true;
+            self.escrows.write(escrow_id, record);
+
+            // As in Escrow, the served share goes to the key's registered owner
+            if provider_amount > 0 {
+                let key_registry = IFalconPublicKeyRegistryDispatcher {
+                    contract_address: self.key_registry.read(),
+                };
+                let key_owner = key_registry.get_key_owner(record.provider_key_hash);
+                InternalFunctions::transfer(@self, key_owner, provider_amount);
+            }
+            if client_refund > 0 {
+                InternalFunctions::transfer(@self, record.client, client_refund);
+            }
+
+            self
+                .emit(
+                    Event::EscrowDisputed(
+                        EscrowDisputed {
+                            escrow_id,
+                            client: record.client,
+                            blocks_served,
+                            provider_amount,
+                            client_refund,
+                        },
+                    ),
+                );
+            true
+        }
+
+        fn get_escrow(self: @ContractState, escrow_id: u64) -> EscrowRecord {
+            InternalFunctions::read_escrow(self, escrow_id)
+        }
+
+        fn get_escrows(self: @ContractState, escrow_ids: Span<u64>) -> Array<EscrowRecord> {
+            let mut records = ArrayTrait::new();
+            for escrow_id in escrow_ids {
+                records.append(InternalFunctions::read_escrow(self, *escrow_id));
+            }
+            records
+        }
+
+        fn get_escrow_count(self: @ContractState) -> u64 {
+            self.escrow_count.read()
+        }
+    }
+}
@@ -0,0 +1,151 @@
+// Falcon verification with a prover-supplied hint instead of an on-chain product.
+//
+// The caller sends s0 = msg_point - s1 * pk mod (x^n + 1, Q) together with integer
+// polynomials t (n - 1 coefficients) and c (n coefficients) such that, over the
+// integers,
+//
+//     s1(x) * pk(x) + s0(x) - msg_point(x) = Q * c(x) + (x^n + 1) * t(x).
+//
+// The identity is checked at one point r of the felt252 field, derived by hashing
+// all inputs (Fiat-Shamir), which holds for a wrong hint with probability at most
+// 2n / p. Bounding c keeps Q * c(x) from wrapping around p, so the identity forces
+// s0 to be the true remainder mod Q. The usual norm bound on (s0, s1) then applies.
+use core::array::{ArrayTrait, SpanTrait};
+use core::option::OptionTrait;
+use core::poseidon::poseidon_hash_span;
+use core::traits::{Into, TryInto};
+use moosh_id::ntt_verify::{centered_square, sig_bound};
+
+const Q: u16 = 12289;
+// |c_i| < 2^32, far above n * Q^2 / Q and far below p / Q
+const CARRY_OFFSET: felt252 = 0x100000000;
+const CARRY_RANGE: u64 = 0x200000000;
+
+#[derive(Drop, Copy, PartialEq, Debug)]
+pub enum HintVerificationError {
+    NormOverflow,
+    HintMismatch,
+    CarryOutOfRange,
+}
+
+fn eval_u16(poly: Span<u16>, r: felt252) -> felt252 {
+    // Horner from the highest coefficient
+    let mut acc: felt252 = 0;
+    let mut i = poly.len();
+    while i > 0 {
+        i -= 1;
+        acc = acc * r + (*poly.at(i)).into();
+    }
+    acc
+}
+
+fn eval_felt(poly: Span<felt252>, r: felt252) -> felt252 {
+    let mut acc: felt252 = 0;
+    let mut i = poly.len();
+    while i > 0 {
+        i -= 1;
+        acc = acc * r + *poly.at(i);
+    }
+    acc
+}
+
+fn pow(base: felt252, exp: u32) -> felt252 {
+    let mut result: felt252 = 1;
+    let mut b = base;
+    let mut e = exp;
+    while e > 0 {
+        if e % 2 == 1 {
+            result *= b;
+        }
+        b *= b;
+        e /= 2;
+    }
+    result
+}
+
+fn carries_in_range(c: Span<felt252>) -> bool {
+    let mut in_range = true;
+    for carry in c {
+        // Values outside (-2^32, 2^32) wrap to a huge felt and fail the u64 conversion
+        let shifted: Option<u64> = (*carry + CARRY_OFFSET).try_into();
+        if shifted.unwrap_or(CARRY_RANGE) >= CARRY_RANGE {
+            in_range = false;
+            break;
+        }
+    }
+    in_range
+}
+
+/// Fiat-Shamir evaluation point over everything the identity depends on
+pub fn challenge_point(
+    key_hash: felt252,
+    s1: Span<u16>,
+    msg_point: Span<u16>,
+    s0: Span<u16>,
+    t: Span<felt252>,
+    c: Span<felt252>,
+) -> felt252 {
+    let mut transcript = array![key_hash];
+    for x in s1 {
+        transcript.append((*x).into());
+    }
+    for x in msg_point {
+        transcript.append((*x).into());
+    }
+    for x in s0 {
+        transcript.append((*x).into());
+    }
+    for x in t {
+        transcript.append(*x);
+    }
+    for x in c {
+        transcript.append(*x);
+    }
+    poseidon_hash_span(transcript.span())
+}
+
+pub fn verify_with_hint(
+    key_hash: felt252,
+    s1: Span<u16>,
+    pk: Span<u16>,
+    msg_point: Span<u16>,
+    s0: Span<u16>,
+    t: Span<felt252>,
+    c: Span<felt252>,
+) -> Result<(), HintVerificationError> {
+    let n = pk.len();
+    assert(s1.len() == n, 's1 length mismatch');
+    assert(msg_point.len() == n, 'msg_point length');
+    assert(s0.len() == n, 's0 length mismatch');
+    assert(t.len() == n - 1, 't length mismatch');
+    assert(c.len() == n, 'c length mismatch');
+    for x in s0 {
+        assert(*x < Q, 's0 coefficient out of range');
+    }
+    for x in s1 {
+        assert(*x < Q, 's1 coefficient out of range');
+    }
+
+    if !carries_in_range(c) {
+        return Result::Err(HintVerificationError::CarryOutOfRange);
+    }
+
+    let r = challenge_point(key_hash, s1, msg_point, s0, t, c);
+    let lhs = eval_u16(s1, r) * eval_u16(pk, r) + eval_u16(s0, r) - eval_u16(msg_point, r);
+    let q: felt252 = Q.into();
+    let rhs = q * eval_felt(c, r) + (pow(r, n) + 1) * eval_felt(t, r);
+    if lhs != rhs {
+        return Result::Err(HintVerificationError::HintMismatch);
+    }
+
+    let mut norm: u64 = 0;
+    let mut i: usize = 0;
+    while i < n {
+        norm += centered_square(*s0.at(i)) + centered_square(*s1.at(i));
+        i += 1;
+    }
+    if norm > sig_bound(n) {
+        return Result::Err(HintVerificationError::NormOverflow);
+    }
+    Result::Ok(())
+}
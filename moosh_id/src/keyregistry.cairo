@@ -1,28 +1,36 @@
-#[starknet::contract]
-pub mod FalconPublicKeyRegistry {
+// Key storage shared by FalconPublicKeyRegistry and FalconVerifierWithRegistry.
+// Embedded with #[substorage(v0)] and #[flat] events, so both contracts keep the
+// registry's storage layout and PublicKeyRegistered event unchanged.
+#[starknet::component]
+pub mod KeyRegistryComponent {
     use core::array::{ArrayTrait, SpanTrait};
     use core::option::{Option, OptionTrait};
     use core::panic_with_felt252;
     use core::poseidon::poseidon_hash_span;
     use core::traits::{Into, TryInto};
+    use falcon::ntt::ntt;
+    use moosh_id::packing::{pack_u14_words, packed_len, unpack_u14_words};
     use starknet::storage::{
         Map, StorageMapReadAccess, StorageMapWriteAccess, StoragePointerReadAccess,
         StoragePointerWriteAccess,
     };
     use starknet::{ContractAddress, get_caller_address};
-
-    // --- Constants ---
-    pub const PK_SIZE_512: u32 = 512;
-    pub const PK_SIZE_1024: u32 = 1024;
-    const OWNER_STORAGE_KEY: felt252 = 'owner';
+    use super::FalconPublicKeyRegistry::{
+        IFalconPublicKeyRegistry, KeyRegistrationStatus, PACKED_PK_WORDS_1024,
+        PACKED_PK_WORDS_512, PK_SIZE_1024, PK_SIZE_512,
+    };
 
     // --- Storage ---
     #[storage]
-    struct Storage {
+    pub struct Storage {
         owner: ContractAddress,
         pk_metadata: Map<felt252, u32>,
-        pk_coefficients: Map<(felt252, u32), u16>,
+        // 17 coefficients per slot, see packing.cairo
+        pk_packed: Map<(felt252, u32), felt252>,
         pk_owners: Map<felt252, ContractAddress>,
+        // Optional NTT form of the key, packed like pk_packed
+        pk_ntt_packed: Map<(felt252, u32), felt252>,
+        pk_has_ntt: Map<felt252, bool>,
     }
 
     // --- Event Data Structures ---
@@ -34,7 +42,6 @@ pub mod FalconPublicKeyRegistry {
         registrant: ContractAddress,
     }
 
-    // --- Main Event Enum for the Contract ---
     #[event]
     #[derive(Drop, starknet::Event)]
     pub enum Event {
@@ -52,33 +59,66 @@ pub mod FalconPublicKeyRegistry {
         arr_felt252
     }
 
-    #[constructor]
-    fn constructor(ref self: ContractState) {
-        self.owner.write(get_caller_address());
+    // Same as decode_packed_public_key, but None instead of a panic for a bad key
+    fn try_decode_packed_public_key(
+        pk_packed_span: Span<felt252>,
+    ) -> Option<(u32, felt252, Array<u16>)> {
+        let word_count: u32 = pk_packed_span.len();
+        if word_count != PACKED_PK_WORDS_512 && word_count != PACKED_PK_WORDS_1024 {
+            return Option::None;
+        }
+        let pk_len = if word_count == PACKED_PK_WORDS_512 {
+            PK_SIZE_512
+        } else {
+            PK_SIZE_1024
+        };
+        match unpack_u14_words(pk_packed_span, pk_len) {
+            Option::Some(pk_coefficients) => {
+                let pk_coeffs_felt252_array = u16_span_to_felt252_array(pk_coefficients.span());
+                let key_hash = poseidon_hash_span(pk_coeffs_felt252_array.span());
+                Option::Some((pk_len, key_hash, pk_coefficients))
+            },
+            Option::None => Option::None,
+        }
     }
 
-    // --- Contract Interface (ABI) ---
-    #[starknet::interface]
-    pub trait IFalconPublicKeyRegistry<TContractState> {
-        fn register_public_key(ref self: TContractState, pk_coefficients_span: Span<u16>) -> bool;
-        fn get_public_key(self: @TContractState, key_hash: felt252) -> Array<u16>;
-        fn get_key_owner(self: @TContractState, key_hash: felt252) -> ContractAddress;
-        fn get_registry_owner(self: @TContractState) -> ContractAddress;
-    }
+    // Returns (n, key_hash, coefficients) for a packed key
+    fn decode_packed_public_key(pk_packed_span: Span<felt252>) -> (u32, felt252, Array<u16>) {
+        // Key size follows from the word count: 31 words for 512, 61 for 1024
+        let word_count: u32 = pk_packed_span.len();
+        let pk_len: u32 = if word_count == PACKED_PK_WORDS_512 {
+            PK_SIZE_512
+        } else if word_count == PACKED_PK_WORDS_1024 {
+            PK_SIZE_1024
+        } else {
+            panic_with_felt252('Invalid packed PK size')
+        };
 
-    // --- Contract Implementation ---
-    #[abi(embed_v0)]
-    impl FalconPublicKeyRegistryImpl of IFalconPublicKeyRegistry<ContractState> {
-        fn register_public_key(ref self: ContractState, pk_coefficients_span: Span<u16>) -> bool {
-            // Get caller address
-            let caller = get_caller_address();
+        // Only canonical packings are accepted, so each key has a single encoding
+        // and hashes to the same key_hash as register_public_key
+        let pk_coefficients = unpack_u14_words(pk_packed_span, pk_len)
+            .expect('Non-canonical packed PK');
+        let pk_coeffs_felt252_array = u16_span_to_felt252_array(pk_coefficients.span());
+        let key_hash = poseidon_hash_span(pk_coeffs_felt252_array.span());
+        (pk_len, key_hash, pk_coefficients)
+    }
 
-            // Validate key size (must be either 512 or 1024)
-            let pk_len: u32 = pk_coefficients_span.len().try_into().unwrap();
-            assert(pk_len == PK_SIZE_512 || pk_len == PK_SIZE_1024, 'Invalid PK size');
+    #[generate_trait]
+    pub impl InternalImpl<
+        TContractState, +HasComponent<TContractState>,
+    > of InternalTrait<TContractState> {
+        fn initializer(ref self: ComponentState<TContractState>, owner: ContractAddress) {
+            self.owner.write(owner);
+        }
 
-            let pk_coeffs_felt252_array = u16_span_to_felt252_array(pk_coefficients_span);
-            let key_hash = poseidon_hash_span(pk_coeffs_felt252_array.span());
+        // Writes a new key; returns false if key_hash is already registered
+        fn store_public_key(
+            ref self: ComponentState<TContractState>,
+            key_hash: felt252,
+            pk_len: u32,
+            packed_words: Span<felt252>,
+        ) -> bool {
+            let caller = get_caller_address();
 
             // Map::read returns V (u32 here), or V::default() (0 for u32) if not found.
             let existing_pk_length: u32 = self.pk_metadata.read(key_hash);
@@ -98,9 +138,8 @@ pub mod FalconPublicKeyRegistry {
             self.pk_owners.write(key_hash, caller);
 
             let mut i: u32 = 0;
-            while i < pk_len {
-                let coeff_val = *pk_coefficients_span.at(i.try_into().unwrap());
-                self.pk_coefficients.write((key_hash, i), coeff_val);
+            while i < packed_words.len() {
+                self.pk_packed.write((key_hash, i), *packed_words.at(i));
                 i += 1;
             }
 
@@ -116,7 +155,8 @@ pub mod FalconPublicKeyRegistry {
             true // Registration successful
         }
 
-        fn get_public_key(self: @ContractState, key_hash: felt252) -> Array<u16> {
+        // Coefficients of a registered key; panics if key_hash is unknown
+        fn read_public_key(self: @ComponentState<TContractState>, key_hash: felt252) -> Array<u16> {
             // Map::read returns V (u32 here), or V::default() (0 for u32) if not found.
             let stored_length: u32 = self.pk_metadata.read(key_hash);
 
@@ -131,25 +171,194 @@ pub mod FalconPublicKeyRegistry {
                 'Stored PK length mismatch',
             );
 
-            let mut coefficients_array = ArrayTrait::new();
+            let word_count = packed_len(stored_length);
+            let mut packed_words = ArrayTrait::new();
+            let mut i: u32 = 0;
+            while i < word_count {
+                ArrayTrait::append(ref packed_words, self.pk_packed.read((key_hash, i)));
+                i += 1;
+            }
+            unpack_u14_words(packed_words.span(), stored_length).expect('Corrupt packed PK')
+        }
+
+        // NTT form of a registered key; empty if it was registered without it
+        fn read_public_key_ntt(
+            self: @ComponentState<TContractState>, key_hash: felt252,
+        ) -> Array<u16> {
+            if !self.pk_has_ntt.read(key_hash) {
+                return ArrayTrait::new();
+            }
+            let stored_length: u32 = self.pk_metadata.read(key_hash);
+            let word_count = packed_len(stored_length);
+            let mut packed_words = ArrayTrait::new();
+            let mut i: u32 = 0;
+            while i < word_count {
+                ArrayTrait::append(ref packed_words, self.pk_ntt_packed.read((key_hash, i)));
+                i += 1;
+            }
+            unpack_u14_words(packed_words.span(), stored_length).expect('Corrupt packed PK NTT')
+        }
+    }
+
+    #[embeddable_as(KeyRegistryImpl)]
+    impl KeyRegistry<
+        TContractState, +HasComponent<TContractState>,
+    > of IFalconPublicKeyRegistry<ComponentState<TContractState>> {
+        fn register_public_key(
+            ref self: ComponentState<TContractState>, pk_coefficients_span: Span<u16>,
+        ) -> bool {
+            // Validate key size (must be either 512 or 1024)
+            let pk_len: u32 = pk_coefficients_span.len().try_into().unwrap();
+            assert(pk_len == PK_SIZE_512 || pk_len == PK_SIZE_1024, 'Invalid PK size');
+
+            let pk_coeffs_felt252_array = u16_span_to_felt252_array(pk_coefficients_span);
+            let key_hash = poseidon_hash_span(pk_coeffs_felt252_array.span());
+
+            let packed_words = pack_u14_words(pk_coefficients_span);
+            self.store_public_key(key_hash, pk_len, packed_words.span())
+        }
+
+        fn register_public_key_packed(
+            ref self: ComponentState<TContractState>, pk_packed_span: Span<felt252>,
+        ) -> bool {
+            let (pk_len, key_hash, _) = decode_packed_public_key(pk_packed_span);
+            self.store_public_key(key_hash, pk_len, pk_packed_span)
+        }
+
+        fn register_public_key_ntt(
+            ref self: ComponentState<TContractState>,
+            pk_packed_span: Span<felt252>,
+            pk_ntt_packed_span: Span<felt252>,
+        ) -> bool {
+            let (pk_len, key_hash, pk_coefficients) = decode_packed_public_key(pk_packed_span);
+
+            // The NTT form is checked once here so verifications can trust it
+            let pk_ntt = unpack_u14_words(pk_ntt_packed_span, pk_len)
+                .expect('Non-canonical packed PK NTT');
+            assert(ntt(pk_coefficients.span()) == pk_ntt.span(), 'PK NTT mismatch');
+
+            let registered = self.store_public_key(key_hash, pk_len, pk_packed_span);
+            // A key registered earlier without its NTT form gets it added
+            if self.pk_has_ntt.read(key_hash) {
+                return registered;
+            }
             let mut i: u32 = 0;
-            while i < stored_length {
-                let coeff_val = self.pk_coefficients.read((key_hash, i));
-                ArrayTrait::append(ref coefficients_array, coeff_val);
+            while i < pk_ntt_packed_span.len() {
+                self.pk_ntt_packed.write((key_hash, i), *pk_ntt_packed_span.at(i));
                 i += 1;
             }
-            coefficients_array
+            self.pk_has_ntt.write(key_hash, true);
+            true
+        }
+
+        fn register_public_keys_batch(
+            ref self: ComponentState<TContractState>, pk_packed_keys: Span<Span<felt252>>,
+        ) -> Array<KeyRegistrationStatus> {
+            // A bad or duplicate key is reported in its slot instead of failing the batch
+            let mut statuses = ArrayTrait::new();
+            for pk_packed_span in pk_packed_keys {
+                let status = match try_decode_packed_public_key(*pk_packed_span) {
+                    Option::Some((
+                        pk_len, key_hash, _,
+                    )) => {
+                        if self.store_public_key(key_hash, pk_len, *pk_packed_span) {
+                            KeyRegistrationStatus::Registered
+                        } else {
+                            KeyRegistrationStatus::AlreadyRegistered
+                        }
+                    },
+                    Option::None => KeyRegistrationStatus::Invalid,
+                };
+                statuses.append(status);
+            }
+            statuses
+        }
+
+        fn get_public_key_ntt(self: @ComponentState<TContractState>, key_hash: felt252) -> Array<u16> {
+            self.read_public_key_ntt(key_hash)
         }
 
-        fn get_key_owner(self: @ContractState, key_hash: felt252) -> ContractAddress {
+        fn get_public_key(self: @ComponentState<TContractState>, key_hash: felt252) -> Array<u16> {
+            self.read_public_key(key_hash)
+        }
+
+        fn get_key_owner(self: @ComponentState<TContractState>, key_hash: felt252) -> ContractAddress {
             let stored_length: u32 = self.pk_metadata.read(key_hash);
             assert(stored_length != 0, 'PK hash not found');
             self.pk_owners.read(key_hash)
         }
 
-        fn get_registry_owner(self: @ContractState) -> ContractAddress {
+        fn get_registry_owner(self: @ComponentState<TContractState>) -> ContractAddress {
             self.owner.read()
         }
         // TODO: get_registry_owner_keyhash if one exists
     }
 }
+
+#[starknet::contract]
+pub mod FalconPublicKeyRegistry {
+    use starknet::{ContractAddress, get_caller_address};
+    use super::KeyRegistryComponent;
+
+    component!(path: KeyRegistryComponent, storage: registry, event: RegistryEvent);
+
+    // --- Constants ---
+    pub const PK_SIZE_512: u32 = 512;
+    pub const PK_SIZE_1024: u32 = 1024;
+    pub const PACKED_PK_WORDS_512: u32 = 31;
+    pub const PACKED_PK_WORDS_1024: u32 = 61;
+
+    // Outcome of one key in register_public_keys_batch
+    #[derive(Drop, Copy, Serde, PartialEq, Debug)]
+    pub enum KeyRegistrationStatus {
+        Registered,
+        AlreadyRegistered,
+        // Wrong word count or non-canonical packing
+        Invalid,
+    }
+
+    // --- Storage ---
+    #[storage]
+    struct Storage {
+        #[substorage(v0)]
+        registry: KeyRegistryComponent::Storage,
+    }
+
+    // --- Main Event Enum for the Contract ---
+    #[event]
+    #[derive(Drop, starknet::Event)]
+    pub enum Event {
+        #[flat]
+        RegistryEvent: KeyRegistryComponent::Event,
+    }
+
+    #[constructor]
+    fn constructor(ref self: ContractState) {
+        self.registry.initializer(get_caller_address());
+    }
+
+    // --- Contract Interface (ABI) ---
+    #[starknet::interface]
+    pub trait IFalconPublicKeyRegistry<TContractState> {
+        fn register_public_key(ref self: TContractState, pk_coefficients_span: Span<u16>) -> bool;
+        fn register_public_key_packed(ref self: TContractState, pk_packed_span: Span<felt252>) -> bool;
+        // True if the key or its NTT form was stored; false if both already were
+        fn register_public_key_ntt(
+            ref self: TContractState, pk_packed_span: Span<felt252>, pk_ntt_packed_span: Span<felt252>,
+        ) -> bool;
+        fn register_public_keys_batch(
+            ref self: TContractState, pk_packed_keys: Span<Span<felt252>>,
+        ) -> Array<KeyRegistrationStatus>;
+        fn get_public_key_ntt(self: @TContractState, key_hash: felt252) -> Array<u16>;
+        fn get_public_key(self: @TContractState, key_hash: felt252) -> Array<u16>;
+        fn get_key_owner(self: @TContractState, key_hash: felt252) -> ContractAddress;
+        fn get_registry_owner(self: @TContractState) -> ContractAddress;
+    }
+
+    // --- Contract Implementation ---
+    #[abi(embed_v0)]
+    impl FalconPublicKeyRegistryImpl =
+        KeyRegistryComponent::KeyRegistryImpl<ContractState>;
+
+    impl KeyRegistryInternalImpl = KeyRegistryComponent::InternalImpl<ContractState>;
+}
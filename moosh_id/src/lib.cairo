@@ -1,4 +1,10 @@
 pub mod addressverifier;
+pub mod compression;
 pub mod esc_erc20;
 pub mod escrow;
+pub mod escrow_manager;
+pub mod hint_verify;
 pub mod keyregistry;
+pub mod ntt_verify;
+pub mod packing;
+pub mod verifier_registry;
@@ -0,0 +1,72 @@
+// Falcon verification against a public key already in NTT form.
+//
+// Same check as falcon::falcon::verify_uncompressed, s0 = msg_point - s1 * pk mod
+// (x^n + 1, Q) and ||(s0, s1)||^2 <= sig_bound(n), but s1 * pk is computed as
+// intt(ntt(s1) * pk_ntt), which skips the forward NTT of the key.
+use core::array::{ArrayTrait, SpanTrait};
+use core::traits::{Into, TryInto};
+use falcon::falcon::FalconVerificationError;
+use falcon::ntt::{intt, ntt};
+
+const Q: u32 = 12289;
+const HALF_Q: u32 = 6144;
+const SIG_BOUND_512: u64 = 34034726;
+const SIG_BOUND_1024: u64 = 70265242;
+
+pub fn sig_bound(n: u32) -> u64 {
+    if n == 512 {
+        SIG_BOUND_512
+    } else {
+        assert(n == 1024, 'Invalid Falcon degree');
+        SIG_BOUND_1024
+    }
+}
+
+// Square of the centered representative of x mod Q
+pub fn centered_square(x: u16) -> u64 {
+    let x: u32 = x.into();
+    let c: u64 = if x > HALF_Q {
+        (Q - x).into()
+    } else {
+        x.into()
+    };
+    c * c
+}
+
+/// Squared norm of (s0, s1) with s0 = msg_point - product mod Q
+pub fn signature_norm(s1: Span<u16>, product: Span<u16>, msg_point: Span<u16>) -> u64 {
+    let mut norm: u64 = 0;
+    let mut i: usize = 0;
+    while i < s1.len() {
+        let m: u32 = (*msg_point.at(i)).into();
+        let p: u32 = (*product.at(i)).into();
+        let s0: u16 = ((m + Q - p) % Q).try_into().unwrap();
+        norm += centered_square(s0) + centered_square(*s1.at(i));
+        i += 1;
+    }
+    norm
+}
+
+pub fn verify_uncompressed_ntt(
+    s1: Span<u16>, pk_ntt: Span<u16>, msg_point: Span<u16>, n: u32,
+) -> Result<(), FalconVerificationError> {
+    assert(s1.len() == n, 's1 length mismatch');
+    assert(pk_ntt.len() == n, 'pk length mismatch');
+    assert(msg_point.len() == n, 'msg_point length');
+
+    let s1_ntt = ntt(s1);
+    let mut product_ntt = ArrayTrait::new();
+    let mut i: usize = 0;
+    while i < n {
+        let a: u32 = (*s1_ntt.at(i)).into();
+        let b: u32 = (*pk_ntt.at(i)).into();
+        product_ntt.append(((a * b) % Q).try_into().unwrap());
+        i += 1;
+    }
+    let product = intt(product_ntt.span());
+
+    if signature_norm(s1, product, msg_point) > sig_bound(n) {
+        return Result::Err(FalconVerificationError::NormOverflow);
+    }
+    Result::Ok(())
+}
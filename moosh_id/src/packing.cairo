@@ -0,0 +1,106 @@
+// Packing of Falcon coefficients (values < Q = 12289 < 2^14) into felt252 words.
+//
+// Each word holds 17 coefficients of 14 bits: coefficients 0..8 of the word in the
+// low 128 bits and 9..16 in the high 128 bits, coefficient j at bit 14 * j of its half.
+// The last word of a key is zero-padded. n = 512 packs into 31 words, n = 1024 into 61.
+use core::array::{ArrayTrait, SpanTrait};
+use core::option::{Option, OptionTrait};
+use core::traits::{DivRem, Into, TryInto};
+
+pub const COEFFS_PER_WORD: u32 = 17;
+const LOW_COEFFS: u32 = 9;
+const HIGH_COEFFS: u32 = 8;
+const COEFF_SHIFT: u128 = 0x4000; // 2^14
+const HIGH_SHIFT: felt252 = 0x100000000000000000000000000000000; // 2^128
+pub const Q: u16 = 12289;
+
+/// Number of packed words needed for n coefficients
+pub fn packed_len(n: u32) -> u32 {
+    (n + COEFFS_PER_WORD - 1) / COEFFS_PER_WORD
+}
+
+fn min_u32(a: u32, b: u32) -> u32 {
+    if a < b {
+        a
+    } else {
+        b
+    }
+}
+
+// Packs coeffs[start..start + count] into one u128, first coefficient in the lowest bits
+fn pack_half(coeffs: Span<u16>, start: u32, count: u32) -> u128 {
+    let mut acc: u128 = 0;
+    let mut k = count;
+    while k > 0 {
+        k -= 1;
+        let coeff = *coeffs.at(start + k);
+        assert(coeff < Q, 'Coefficient out of range');
+        acc = acc * COEFF_SHIFT + coeff.into();
+    }
+    acc
+}
+
+// Appends `count` coefficients from `half` to `out`; None if one is not below Q
+// or if bits remain set after them (non-canonical padding)
+fn unpack_half(half: u128, count: u32, ref out: Array<u16>) -> Option<()> {
+    let mut rest = half;
+    let mut k: u32 = 0;
+    let mut valid = true;
+    while k < count {
+        let (quotient, coeff) = DivRem::div_rem(rest, COEFF_SHIFT.try_into().unwrap());
+        let coeff: u16 = coeff.try_into().unwrap();
+        if coeff >= Q {
+            valid = false;
+            break;
+        }
+        out.append(coeff);
+        rest = quotient;
+        k += 1;
+    }
+    if !valid || rest != 0 {
+        return Option::None;
+    }
+    Option::Some(())
+}
+
+/// Packs coefficients into felt252 words. Panics if a coefficient is not below Q.
+pub fn pack_u14_words(coeffs: Span<u16>) -> Array<felt252> {
+    let n = coeffs.len();
+    let mut words = ArrayTrait::new();
+    let mut start: u32 = 0;
+    while start < n {
+        let low_count = min_u32(n - start, LOW_COEFFS);
+        let high_count = min_u32(n - start - low_count, HIGH_COEFFS);
+        let low = pack_half(coeffs, start, low_count);
+        let high = pack_half(coeffs, start + low_count, high_count);
+        words.append(low.into() + high.into() * HIGH_SHIFT);
+        start += COEFFS_PER_WORD;
+    }
+    words
+}
+
+/// Unpacks n coefficients from felt252 words.
+/// Returns None unless words is the canonical packing of n coefficients below Q.
+pub fn unpack_u14_words(words: Span<felt252>, n: u32) -> Option<Array<u16>> {
+    if words.len() != packed_len(n) {
+        return Option::None;
+    }
+    let mut coeffs = ArrayTrait::new();
+    let mut remaining = n;
+    let mut valid = true;
+    for word in words {
+        let value: u256 = (*word).into();
+        let low_count = min_u32(remaining, LOW_COEFFS);
+        let high_count = min_u32(remaining - low_count, HIGH_COEFFS);
+        if unpack_half(value.low, low_count, ref coeffs).is_none()
+            || unpack_half(value.high, high_count, ref coeffs).is_none() {
+            valid = false;
+            break;
+        }
+        remaining -= low_count + high_count;
+    }
+    if !valid {
+        return Option::None;
+    }
+    Option::Some(coeffs)
+}
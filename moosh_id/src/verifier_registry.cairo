@@ -0,0 +1,89 @@
+// Registry and verifier in one contract. The verifier reads key storage through
+// KeyRegistryComponent directly, so a verification does not call out to the
+// registry and the key is never serialized across a contract boundary. Exposes
+// both the IFalconPublicKeyRegistry and IFalconSignatureVerifier ABIs, so an
+// Escrow can use the same address as its verifier and its key registry.
+#[starknet::contract]
+pub mod FalconVerifierWithRegistry {
+    use core::array::{ArrayTrait, Span, SpanTrait};
+    use moosh_id::addressverifier::FalconSignatureVerifier::IFalconSignatureVerifier;
+    use moosh_id::addressverifier::shared::{verify_for_key, verify_for_key_with_hint};
+    use moosh_id::keyregistry::KeyRegistryComponent;
+    use core::panic_with_felt252;
+    use starknet::{ContractAddress, get_caller_address, get_contract_address};
+
+    component!(path: KeyRegistryComponent, storage: registry, event: RegistryEvent);
+
+    #[abi(embed_v0)]
+    impl KeyRegistryImpl = KeyRegistryComponent::KeyRegistryImpl<ContractState>;
+    impl KeyRegistryInternalImpl = KeyRegistryComponent::InternalImpl<ContractState>;
+
+    // --- Storage ---
+    #[storage]
+    struct Storage {
+        #[substorage(v0)]
+        registry: KeyRegistryComponent::Storage,
+    }
+
+    #[event]
+    #[derive(Drop, starknet::Event)]
+    pub enum Event {
+        #[flat]
+        RegistryEvent: KeyRegistryComponent::Event,
+    }
+
+    #[constructor]
+    fn constructor(ref self: ContractState) {
+        self.registry.initializer(get_caller_address());
+    }
+
+    #[abi(embed_v0)]
+    impl FalconSignatureVerifierImpl of IFalconSignatureVerifier<ContractState> {
+        fn verify_signature_for_key_hash(
+            self: @ContractState,
+            key_hash: felt252,
+            s1_coeffs_span: Span<u16>,
+            msg_point_span: Span<u16>,
+        ) -> bool {
+            // Keys registered with their NTT form skip the forward NTT of the key
+            let pk_ntt_array = self.registry.read_public_key_ntt(key_hash);
+            if pk_ntt_array.len() != 0 {
+                return verify_for_key(
+                    key_hash, pk_ntt_array.span(), true, s1_coeffs_span, msg_point_span,
+                );
+            }
+            let pk_coeffs_array = self.registry.read_public_key(key_hash);
+            verify_for_key(key_hash, pk_coeffs_array.span(), false, s1_coeffs_span, msg_point_span)
+        }
+
+        fn verify_signature_for_key_hash_with_hint(
+            self: @ContractState,
+            key_hash: felt252,
+            s1_coeffs_span: Span<u16>,
+            msg_point_span: Span<u16>,
+            s0_span: Span<u16>,
+            t_hint: Span<felt252>,
+            c_hint: Span<felt252>,
+        ) -> bool {
+            let pk_coeffs_array = self.registry.read_public_key(key_hash);
+            verify_for_key_with_hint(
+                key_hash,
+                pk_coeffs_array.span(),
+                s1_coeffs_span,
+                msg_point_span,
+                s0_span,
+                t_hint,
+                c_hint,
+            )
+        }
+
+        // Keys always live in this contract's own storage
+        fn set_registry_shards(ref self: ContractState, _shards: Span<ContractAddress>) {
+            panic_with_felt252('Registry is co-located');
+        }
+
+        fn get_registry_shards(self: @ContractState) -> Array<ContractAddress> {
+            array![get_contract_address()]
+        }
+    }
+}
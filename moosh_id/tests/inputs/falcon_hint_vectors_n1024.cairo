@@ -0,0 +1,746 @@
+// Verification hints for falcon_test_vectors_n1024
+
+// s0 = msg_point - s1 * pk mod (x^n + 1, Q)
+pub const HINT_S0_N1024: [u16; 1024] = [
+    12110, 11999, 12280, 249, 12064, 192, 42, 354, 12158, 246, 251, 12236, 232, 45,
+    12208, 183, 12158, 12192, 104, 12047, 11983, 1, 12248, 63, 12209, 11818, 12211, 256,
+    12155, 266, 51, 11998, 12269, 32, 10, 12262, 12042, 12199, 6, 330, 12268, 12158,
+    242, 164, 30, 81, 11929, 132, 12254, 12082, 12174, 19, 12107, 12208, 235, 37,
+    12108, 208, 12288, 59, 12137, 57, 12080, 23, 85, 6, 12232, 71, 252, 12248,
+    12230, 12154, 12228, 12075, 12263, 12059, 133, 12280, 12239, 81, 152, 98, 72, 336,
+    12030, 112, 12181, 8, 12230, 33, 207, 6, 12025, 85, 12164, 12076, 12174, 11994,
+    12199, 12052, 61, 12030, 170, 12199, 0, 103, 55, 12242, 168, 12140, 12242, 11917,
+    12058, 6, 12107, 82, 103, 199, 111, 403, 11890, 12083, 421, 549, 12268, 28,
+    57, 12164, 11834, 12127, 174, 12287, 90, 12276, 12177, 12227, 178, 113, 12122, 12169,
+    91, 122, 12125, 12105, 184, 12056, 12165, 127, 12222, 85, 133, 12177, 12249, 12263,
+    139, 12236, 207, 273, 12192, 57, 12270, 12288, 12207, 23, 34, 12057, 71, 69,
+    12162, 12250, 8, 12099, 12002, 12098, 12259, 113, 51, 12246, 63, 12101, 319, 124,
+    225, 362, 12254, 109, 128, 12221, 375, 12168, 12256, 216, 12187, 12261, 238, 55,
+    262, 28, 123, 232, 148, 12148, 12212, 40, 12178, 12188, 53, 12250, 12281, 209,
+    83, 12203, 12075, 12031, 68, 12283, 42, 12253, 12110, 12029, 15, 11816, 11952, 12249,
+    25, 120, 62, 12178, 130, 326, 12050, 37, 11983, 12223, 12211, 85, 114, 287,
+    169, 12055, 12279, 12209, 222, 25, 12121, 34, 149, 12210, 90, 295, 24, 12238,
+    139, 12059, 12121, 12074, 12139, 12138, 12135, 12191, 160, 52, 19, 12200, 12107, 12233,
+    123, 118, 12255, 11895, 12125, 12170, 118, 259, 71, 41, 97, 12252, 12089, 12277,
+    0, 95, 12247, 261, 12247, 327, 43, 12167, 58, 53, 12147, 12179, 12044, 187,
+    65, 12025, 12288, 12259, 188, 12233, 331, 12214, 134, 43, 86, 12134, 12240, 12217,
+    350, 12270, 289, 12065, 69, 100, 12271, 12173, 36, 108, 12150, 12184, 12178, 12225,
+    11850, 12131, 12276, 12113, 175, 11932, 242, 12183, 12077, 182, 236, 12048, 63, 275,
+    145, 205, 12126, 41, 12248, 12061, 12251, 12275, 115, 12276, 11958, 46, 192, 69,
+    11973, 12235, 4, 139, 36, 285, 12187, 12216, 20, 12247, 12219, 47, 12185, 222,
+    12277, 12074, 60, 102, 257, 93, 12253, 12197, 58, 126, 12097, 12062, 69, 101,
+    12235, 292, 12, 32, 12182, 16, 12087, 195, 66, 12160, 12273, 54, 11995, 11993,
+    12190, 132, 17, 12202, 36, 12228, 381, 41, 12131, 12240, 360, 12048, 12287, 212,
+    19, 12059, 58, 360, 124, 12039, 12044, 12235, 129, 12215, 12009, 56, 311, 12268,
+    12248, 12240, 12145, 12010, 150, 240, 268, 25, 106, 53, 12228, 162, 147, 12283,
+    12068, 12157, 12264, 12170, 238, 27, 12072, 422, 7, 94, 12274, 155, 12274, 12218,
+    12197, 157, 358, 12194, 91, 12255, 87, 26, 113, 189, 12238, 312, 19, 494,
+    12218, 18, 11866, 12163, 66, 112, 12226, 12264, 56, 12214, 12231, 199, 7, 12281,
+    45, 12125, 40, 12275, 12248, 30, 12270, 157, 12007, 12241, 124, 12264, 130, 12135,
+    86, 11, 417, 343, 37, 294, 12233, 11894, 126, 236, 308, 12180, 187, 261,
+    222, 194, 266, 12142, 184, 225, 205, 12157, 11975, 12251, 1, 12070, 21, 101,
+    12163, 203, 12183, 56, 3, 12224, 12238, 12137, 12009, 12073, 365, 12103, 76, 107,
+    77, 12201, 251, 11953, 117, 12216, 248, 12288, 12233, 38, 12217, 11904, 191, 12220,
+    179, 12220, 12159, 125, 240, 100, 239, 22, 12110, 12281, 3, 118, 12256, 12229,
+    181, 90, 113, 12200, 12146, 34, 64, 12046, 5, 12250, 30, 12176, 68, 12236,
+    12212, 41, 37, 79, 12221, 12071, 12241, 12286, 142, 121, 9, 46, 12281, 117,
+    12259, 61, 7, 12170, 12216, 12125, 12272, 45, 122, 83, 241, 12054, 323, 12249,
+    30, 12099, 12251, 216, 177, 12261, 12244, 12274, 105, 193, 20, 29, 20, 12173,
+    129, 317, 12052, 105, 12256, 12211, 12096, 12148, 45, 48, 125, 168, 130, 12155,
+    158, 12094, 12264, 12191, 12203, 60, 12082, 51, 33, 12099, 290, 173, 12159, 12196,
+    12156, 189, 216, 12088, 101, 0, 12014, 12251, 211, 12185, 12167, 12253, 29, 77,
+    12042, 268, 12288, 12251, 128, 28, 10, 240, 120, 85, 82, 105, 11909, 12181,
+    82, 121, 100, 254, 88, 19, 168, 12142, 12063, 91, 12104, 12141, 12285, 12110,
+    53, 165, 12003, 12223, 12176, 12236, 314, 12023, 23, 33, 11897, 74, 12235, 12223,
+    4, 95, 264, 242, 12229, 11952, 39, 12225, 12121, 12083, 409, 12114, 12147, 128,
+    11853, 11932, 175, 12237, 170, 87, 12256, 12062, 12241, 11948, 12043, 10, 12225, 98,
+    19, 77, 12145, 12167, 12201, 12232, 12156, 12126, 177, 12057, 12142, 12202, 79, 192,
+    428, 12202, 12275, 12277, 12271, 12056, 12228, 12116, 12104, 12230, 178, 12102, 349, 182,
+    12130, 140, 93, 117, 259, 11880, 12257, 353, 12117, 12275, 60, 31, 252, 12193,
+    12062, 101, 186, 12061, 12115, 59, 32, 12105, 12230, 6, 159, 12097, 12242, 12125,
+    11980, 64, 150, 354, 12241, 169, 51, 168, 298, 110, 12208, 214, 214, 12239,
+    12118, 12087, 84, 12099, 12042, 253, 12153, 11990, 258, 152, 12284, 106, 2, 12215,
+    266, 12276, 12153, 41, 99, 86, 201, 12158, 26, 193, 12268, 28, 25, 214,
+    176, 48, 11995, 91, 106, 12114, 257, 12287, 12170, 12015, 12217, 12228, 35, 91,
+    12047, 27, 29, 12225, 92, 12240, 12070, 3, 175, 57, 12099, 12166, 115, 216,
+    12235, 12143, 385, 54, 12145, 12033, 11956, 79, 12153, 194, 12076, 14, 142, 50,
+    214, 12204, 12256, 12099, 335, 12161, 119, 12108, 12105, 92, 93, 12284, 181, 253,
+    12043, 125, 362, 12101, 12254, 12245, 11991, 219, 104, 12251, 35, 8, 335, 12213,
+    12249, 12152, 12058, 12174, 115, 52, 12063, 131, 177, 12271, 11858, 12240, 12219, 12097,
+    12151, 12099, 79, 5, 11997, 135, 12220, 12113, 12274, 11986, 11979, 12255, 12057, 12210,
+    12222, 11874, 232, 171, 12232, 588, 12155, 64, 12285, 7, 12251, 25, 12284, 12080,
+    277, 171, 142, 153, 8, 12112, 12162, 11989, 11950, 12042, 330, 12051, 12198, 181,
+    322, 12092, 271, 279, 12153, 19, 11957, 12031, 224, 12182, 12119, 12245, 12279, 11964,
+    12119, 12071, 12217, 12268, 12128, 46, 12171, 230, 57, 116, 12063, 38, 12206, 12233,
+    128, 12093, 105, 88, 12115, 12, 12233, 71, 12284, 23, 2, 12173, 181, 48,
+    12214, 60, 104, 12080, 231, 30, 11963, 273, 12184, 12115, 12179, 257, 71, 145,
+    83, 12203, 45, 56, 12152, 12171, 12238, 12127, 12075, 112, 171, 65, 125, 12212,
+    11919, 11967,
+];
+
+// Quotient by x^n + 1
+pub const HINT_T_N1024: [felt252; 1023] = [
+    38766137410, 38630497312, 39006628466, 38685880756, 38761994657, 37822871956, 38160282614,
+    38793924032, 38702721880, 38667406302, 38235134055, 37972121095, 37451674066, 37068884170,
+    38283403180, 38720434186, 38711900402, 38180400156, 40134885934, 38474021196, 38383655376,
+    37328141124, 38974335839, 38124339539, 37222919920, 37888922457, 39113084107, 38150996717,
+    36714272401, 36636981631, 37397564717, 37699282094, 37278778052, 37735726550, 38410180686,
+    37087695385, 36371262300, 37984170793, 37955683304, 37238743366, 37252264005, 36943236844,
+    37660884622, 37446154685, 36968637040, 37355108672, 37620240524, 37499531216, 36676705901,
+    36849534074, 37822104913, 36771385148, 36560893954, 36622490006, 36038731260, 36901771059,
+    35878343825, 36961637402, 36257359357, 36266229277, 36615059809, 37196247896, 37285651836,
+    34975640363, 37467032169, 37623328059, 36805147933, 36764138797, 35849411840, 36651690988,
+    37513374813, 36777912465, 36308884133, 37095885957, 36199240579, 36383372435, 37050600422,
+    37395699033, 36260878801, 36729129721, 35933992186, 35753072876, 35657972167, 35784456154,
+    35110697365, 35726982647, 36091397252, 36239930645, 35881035196, 36162408334, 35270037751,
+    35333444497, 34927388343, 35736316122, 36088660198, 34338860032, 35618862781, 35655725275,
+    35121849202, 34863031073, 34883657416, 35824231341, 33847134034, 35159863960, 34669099417,
+    34464462121, 35199775385, 35176685577, 34570167141, 34586385871, 33397597066, 35087792446,
+    34379528244, 34720964444, 34416960327, 33150915846, 33983802040, 34276360634, 33718906937,
+    33854791038, 34444368354, 33798568813, 33608668900, 33606528349, 33659988189, 33254267682,
+    33320983718, 32610134422, 33838121441, 33023106063, 34375432178, 33531176984, 33692237887,
+    34067528891, 34933975864, 33773707907, 34163299024, 32904918496, 33458609296, 34028879108,
+    32861435026, 33537044286, 33391699987, 33173520977, 32226489820, 32355474085, 32967848381,
+    33365714671, 32506017558, 33616310344, 32706823714, 33015332494, 32280153163, 33411428523,
+    33179654681, 33456370480, 32244009953, 33326734632, 32157167381, 32598264232, 32331408262,
+    33881098852, 33137212092, 31034494689, 31802452494, 32826793334, 30678480399, 31198959234,
+    32375173211, 31404940581, 31067440023, 31431503190, 31962946103, 31901291595, 31999744855,
+    31521654862, 31842345902, 31171272027, 30904928319, 31018221930, 31673981879, 31921607196,
+    32161952159, 32142701232, 29840777376, 31154066581, 29932247786, 31147978491, 30140364722,
+    30833822177, 30109259028, 30634566666, 30085942617, 30169677787, 28896061369, 30267852240,
+    29946506007, 30712738813, 30620317801, 30642775331, 30278265497, 30947628630, 29739662167,
+    30388782077, 29925983691, 29061743541, 29865029107, 30059639641, 30822823792, 30073582076,
+    30554793183, 29179778107, 28729612754, 29670145810, 30031627406, 29729312628, 29547858469,
+    29080681424, 29768815409, 28375176835, 28915778483, 30725780883, 29472374738, 30303269889,
+    29247310815, 29167301693, 28900980178, 28562872790, 28928980037, 30306135735, 29499534383,
+    29836789553, 29636512934, 29260471950, 28520232598, 28295145249, 28570257816, 29180379492,
+    27790428669, 29234903838, 30155356080, 30160010015, 27630917875, 27538651152, 28181573689,
+    27468775192, 28726424063, 28139203843, 27449748958, 27393510327, 28412130059, 28822085402,
+    28033244230, 27362687984, 28041561899, 27769261808, 27675141960, 27350849537, 27715196048,
+    27015789143, 28646318010, 26964280562, 27312327294, 28573863151, 26586998606, 27084742411,
+    27306495674, 27217935309, 27161862198, 26296870100, 26818325103, 25851386999, 26578242337,
+    26528204376, 27650488628, 26704931603, 27703942054, 27095496507, 27017405139, 27953056026,
+    26648473447, 26334998553, 27213524989, 27985802637, 25963874273, 27905694018, 26757908416,
+    26857619615, 25691280002, 27025038202, 27228326175, 25555613948, 26368343744, 26773077138,
+    25775829047, 25571066241, 25089333814, 25977955254, 26893811397, 25980425271, 25613184960,
+    26424394604, 24988397346, 25165807481, 25891310681, 26493003603, 25220199148, 25936539571,
+    26255502592, 25964520760, 26071435385, 25198553414, 24087490706, 25896060144, 26291343756,
+    25688680871, 24528636873, 24151506419, 25556542806, 24738541357, 25285736419, 24048386323,
+    25120854010, 23672485840, 24705336195, 25341030613, 24863361171, 24262632616, 24961076349,
+    24536024096, 23522535617, 24437900735, 24767012898, 23698134997, 24441333514, 24965858857,
+    24427640381, 23754120556, 23957220262, 24165834239, 23904552274, 23556676796, 23764211893,
+    23691114266, 23433788809, 22305625059, 24540989879, 24820344521, 23683679241, 23473776660,
+    24557330742, 23844885672, 23374151420, 23314257804, 23976868104, 24096289030, 23542799809,
+    24077690497, 23315111215, 23435460512, 24317069604, 24877726830, 22846820711, 23466859474,
+    24102679398, 23176841560, 23742653242, 23972632069, 23290619815, 23613126906, 23341153884,
+    22914068380, 23449171109, 22802825653, 23554022571, 23994775494, 23296433556, 23521728162,
+    22642425515, 22517300604, 22310265427, 23116316665, 23444665216, 23601415371, 22579064864,
+    21880132797, 22378081502, 24124106422, 23190635613, 22127080588, 22592743944, 22041491357,
+    23042204596, 21381569669, 23297856698, 21748470236, 21991711150, 22975024594, 23094990717,
+    22063231809, 22273010452, 22015362306, 21932888950, 22047740418, 21712240057, 22487583646,
+    21868347137, 23053940608, 22095224058, 22120875923, 22317685302, 22033597275, 21271968640,
+    21533693554, 22088659784, 23122396494, 21363475002, 21178511009, 22025885689, 22146148232,
+    21138825527, 20909141422, 21728125170, 22123607329, 21432960904, 21857462572, 21214632814,
+    21909337332, 20488820818, 21860412493, 21175828662, 21231900955, 20413179687, 21379072580,
+    21897174746, 20493307722, 20715323122, 20486080599, 21014878762, 20323813879, 20943382325,
+    20330648329, 21462660180, 19734445001, 20849765780, 19550371592, 20944509406, 20422093840,
+    21130777950, 19851168580, 20214820224, 20610222236, 19321375685, 20157540502, 20057999239,
+    20491440893, 20271399792, 20504201563, 20147569129, 20279177007, 20271774185, 21159286658,
+    20347551665, 19288669539, 19480900629, 19638779683, 20502828445, 19223567998, 20724227071,
+    20272213432, 20541513060, 20489136660, 19751929415, 18780985218, 19937582834, 19888109743,
+    19917056123, 19749666421, 19688640184, 19504302622, 19272442592, 18749537001, 18997456632,
+    19667642217, 18959466729, 18446533755, 19797553454, 19106062255, 18729159340, 19149155797,
+    19274851834, 18614702802, 19898511267, 19476036949, 18192578787, 19197342777, 19575187105,
+    19881925485, 19360347087, 18769157250, 18628482107, 18619776781, 19441452545, 19622059586,
+    18197544519, 18006316249, 18630337201, 18850682581, 18575417888, 17873936112, 19123997958,
+    18414864952, 18534127765, 18481923677, 17782157795, 18377924993, 18484990081, 17767647330,
+    18823925139, 18277371488, 18487227623, 17891789686, 18522685517, 18357231740, 18199654932,
+    18506465482, 18271440110, 18757148240, 18188093712, 17752938662, 18069749864, 17902124434,
+    17176053453, 17853272902, 18597633496, 16958406266, 17939347667, 18058859822, 17739598646,
+    17913278805, 17310702363, 17171321836, 17465893332, 17662873085, 17446367664, 17390498344,
+    17121773330, 16810810893, 17207476631, 17461123584, 17392113074, 17142061712, 17166954065,
+    17100575820, 17238819990, 16405947422, 17178014255, 17353324941, 16531733441, 16128512595,
+    16733940496, 16937861873, 16345939991, 16413935382, 15319249724, 16841199323, 16537682364,
+    17087781259, 15907408116, 16160165862, 16603817264, 16552230537, 15841764989, 16219782600,
+    16769580324, 16706170193, 16474792199, 16080130230, 16371136517, 15980639956, 15562397081,
+    16380698357, 16197546526, 16570103957, 17160916496, 15353782756, 16157297769, 15393998078,
+    15407197601, 15768182667, 16343279217, 15783267494, 15631464546, 14519218449, 15332345787,
+    16316717526, 16324927933, 16150989059, 15960128094, 15300483649, 15360001917, 15440835612,
+    15847716847, 15637828301, 15488407058, 15302947253, 15690768621, 15932674430, 14943774087,
+    14507236492, 15118140945, 15682391455, 14439740820, 15908832396, 15936814783, 15078547845,
+    14726176143, 15235490654, 14302681622, 13629201270, 15140335686, 14785893755, 15057335038,
+    15288920386, 14894189876, 14599008877, 14455862577, 14219374531, 14511206758, 15031119376,
+    14616540026, 14504328529, 13734006679, 14622724244, 14239715934, 14504317079, 14322929070,
+    14266305807, 14770837814, 14177383403, 13633541775, 13849755167, 13822999944, 14696433638,
+    13491283858, 14899233545, 13653676121, 14480631363, 14428961009, 14430464826, 13400186534,
+    14200514941, 14030645307, 14436817902, 14170155979, 14028878196, 13993374793, 13385978134,
+    14368107515, 13106363878, 13433852447, 13212420874, 13799344773, 13744301203, 12831072654,
+    13867326611, 13250994894, 13125304251, 13151839440, 13061925195, 13407819204, 12965237506,
+    12710081788, 13060464217, 13755104743, 13834246762, 13028973213, 12727751497, 11634960637,
+    13157735684, 12310295199, 13163805580, 12610108992, 13128578159, 12010456826, 13147075445,
+    12471675427, 12331612302, 11766067264, 12352624378, 12114542604, 12785146761, 11724840259,
+    12434054839, 12315507631, 12419573799, 12290068173, 12675685103, 12206475606, 12514378029,
+    12100398576, 12082455989, 12049581917, 11661558498, 12858434135, 11588149681, 12152757652,
+    12106383053, 12360093756, 11674586076, 12288590685, 11963168440, 11642134517, 10989380579,
+    11462614915, 11442485418, 11554235418, 11771056157, 11331990947, 10952778150, 10899893206,
+    11231881475, 11681265706, 10947252807, 10800829447, 11351876076, 11876482723, 10798311589,
+    9786498235, 11420755645, 10584501972, 10888932114, 11082241316, 10579135292, 10754582483,
+    10891308506, 9959281142, 9688980011, 10829980062, 11102752185, 10836740705, 10472552279,
+    10684913466, 10707659000, 9862730844, 10334253089, 9941989777, 11010815242, 10279727207,
+    11081211024, 9974146166, 10362321248, 9330425993, 10478397346, 10440133694, 10910412574,
+    10038250416, 10835652545, 10421852663, 10445384780, 10053732025, 10180400043, 9759537932,
+    10193527153, 9892466996, 10190477642, 10031959719, 9829062675, 9926423058, 9671063516,
+    9687570773, 9967579336, 9496904121, 9615516606, 9961143910, 8922971205, 9421632917,
+    8813531252, 9150879795, 9717402339, 9722425099, 9003123113, 9113585631, 8977276451,
+    8977536027, 8869968973, 9002186948, 9237967854, 9235296433, 9481495393, 9301065068,
+    8515903440, 8450567375, 8893488988, 9071190867, 8857960369, 9183160963, 8940056483,
+    9147476953, 8785010376, 8187421126, 8540071392, 8688362662, 8742933350, 9033880387,
+    8072722845, 8665852376, 8317609417, 8306726501, 8511237555, 8212312424, 8321778858,
+    8501795710, 8063146969, 8176232299, 8128321760, 8434536351, 8448268694, 8173421315,
+    8749493418, 7781277842, 8006453049, 7673808709, 8288634211, 8165359458, 8161581520,
+    8216449511, 8015982314, 7908697405, 7655463274, 8012692433, 8077904626, 7272108655,
+    8040067613, 7996264972, 8114370988, 7090150831, 7989068767, 7799129752, 7440240282,
+    7302334714, 8223544692, 7391079037, 8027446915, 7653225942, 6999004541, 7621686910,
+    7432462367, 7724316020, 7017716308, 7399218783, 7488159564, 7357809303, 7375839682,
+    6961133294, 6679255978, 6427236254, 7174803913, 7188460133, 6782641041, 6482064655,
+    6322295436, 6712005362, 6842983666, 6059648765, 6614134867, 6639486071, 6846128697,
+    5939767346, 6437016136, 6481586036, 5910491929, 6384008125, 6024754657, 6168556208,
+    6278910478, 6308672036, 5685298182, 5985005684, 5319419766, 6077504681, 5914339657,
+    6026288911, 5860340536, 6223595918, 5833215709, 5753712927, 5908851133, 5441873147,
+    5562346635, 5685358995, 5797467286, 5638291562, 5742123249, 5767918433, 5186931637,
+    5248900921, 5430266938, 5501786877, 5451751529, 5353253834, 5277022076, 5243216086,
+    5050148104, 4651535717, 4945641571, 4866109311, 5009799306, 4992163457, 4705562783,
+    4758046182, 4988887821, 4416494553, 4599399746, 4788325024, 4723119716, 4613674273,
+    4330789094, 4390078652, 4450621865, 4335645669, 4558962441, 4467889436, 4342136363,
+    4443231014, 4421932170, 4551683825, 3858175810, 4106050913, 3914910611, 4211410281,
+    4254449477, 3982538958, 4175433413, 4233334267, 4012142503, 3764130581, 3767940524,
+    3473754056, 3754268166, 3990177201, 3839658692, 3688885370, 3882746324, 3353633770,
+    3293576412, 3520550247, 3399956429, 3034476002, 3424603714, 3359863932, 2692897808,
+    3108551495, 3007610988, 2483879865, 2829144175, 2805966731, 2525795017, 2499332463,
+    2491642516, 2354428506, 2371392094, 2552145774, 2284198340, 2129820035, 1979599604,
+    2337366853, 2034152808, 2095011455, 2435576852, 2313675764, 1716487077, 2106657165,
+    1910636590, 2103264548, 1882823533, 1992893476, 1534740840, 1915267112, 1788708890,
+    1591048668, 1498624607, 1985199349, 1515213390, 1709051654, 1564831182, 1642471257,
+    1189099837, 1600623245, 1397117072, 1759441095, 1341063569, 1630173296, 1361648116,
+    1341189094, 1193085885, 1473620948, 968005217, 1254643496, 968714029, 1055194051,
+    832082858, 1097121758, 725243562, 741209379, 553281530, 697184615, 450481180,
+    725253915, 471888627, 494616371, 504901390, 482392710, 236910295, 355807020,
+    158211080, 224523110, 270361067, 180721625, 96829449, 131237165, 1570370,
+    10702,
+];
+
+// Carries, (low - high + s0 - msg_point) / Q
+pub const HINT_C_N1024: [felt252; 1024] = [
+    3618502788666131213697322783095070105623107215331596699973092056135868866038, 3618502788666131213697322783095070105623107215331596699973092056135868883741,
+    3618502788666131213697322783095070105623107215331596699973092056135868860735, 3618502788666131213697322783095070105623107215331596699973092056135868889047,
+    3618502788666131213697322783095070105623107215331596699973092056135868893538, 3618502788666131213697322783095070105623107215331596699973092056135868971413,
+    3618502788666131213697322783095070105623107215331596699973092056135868948913, 3618502788666131213697322783095070105623107215331596699973092056135868910988,
+    3618502788666131213697322783095070105623107215331596699973092056135868906078, 3618502788666131213697322783095070105623107215331596699973092056135868905250,
+    3618502788666131213697322783095070105623107215331596699973092056135868949249, 3618502788666131213697322783095070105623107215331596699973092056135868968794,
+    3618502788666131213697322783095070105623107215331596699973092056135869008881, 3618502788666131213697322783095070105623107215331596699973092056135869041657,
+    3618502788666131213697322783095070105623107215331596699973092056135868950150, 3618502788666131213697322783095070105623107215331596699973092056135868917513,
+    3618502788666131213697322783095070105623107215331596699973092056135868914277, 3618502788666131213697322783095070105623107215331596699973092056135868971527,
+    3618502788666131213697322783095070105623107215331596699973092056135868806745, 3618502788666131213697322783095070105623107215331596699973092056135868953533,
+    3618502788666131213697322783095070105623107215331596699973092056135868977484, 3618502788666131213697322783095070105623107215331596699973092056135869031803,
+    3618502788666131213697322783095070105623107215331596699973092056135868910650, 3618502788666131213697322783095070105623107215331596699973092056135868982886,
+    3618502788666131213697322783095070105623107215331596699973092056135869050580, 3618502788666131213697322783095070105623107215331596699973092056135869010410,
+    3618502788666131213697322783095070105623107215331596699973092056135868912004, 3618502788666131213697322783095070105623107215331596699973092056135868977331,
+    3618502788666131213697322783095070105623107215331596699973092056135869106672, 3618502788666131213697322783095070105623107215331596699973092056135869127267,
+    3618502788666131213697322783095070105623107215331596699973092056135869064245, 3618502788666131213697322783095070105623107215331596699973092056135869048274,
+    3618502788666131213697322783095070105623107215331596699973092056135869081426, 3618502788666131213697322783095070105623107215331596699973092056135869076243,
+    3618502788666131213697322783095070105623107215331596699973092056135868996154, 3618502788666131213697322783095070105623107215331596699973092056135869097870,
+    3618502788666131213697322783095070105623107215331596699973092056135869153451, 3618502788666131213697322783095070105623107215331596699973092056135869024486,
+    3618502788666131213697322783095070105623107215331596699973092056135869038081, 3618502788666131213697322783095070105623107215331596699973092056135869095002,
+    3618502788666131213697322783095070105623107215331596699973092056135869090088, 3618502788666131213697322783095070105623107215331596699973092056135869126741,
+    3618502788666131213697322783095070105623107215331596699973092056135869084673, 3618502788666131213697322783095070105623107215331596699973092056135869084265,
+    3618502788666131213697322783095070105623107215331596699973092056135869128330, 3618502788666131213697322783095070105623107215331596699973092056135869105288,
+    3618502788666131213697322783095070105623107215331596699973092056135869069015, 3618502788666131213697322783095070105623107215331596699973092056135869126185,
+    3618502788666131213697322783095070105623107215331596699973092056135869159231, 3618502788666131213697322783095070105623107215331596699973092056135869168042,
+    3618502788666131213697322783095070105623107215331596699973092056135869080349, 3618502788666131213697322783095070105623107215331596699973092056135869168134,
+    3618502788666131213697322783095070105623107215331596699973092056135869189703, 3618502788666131213697322783095070105623107215331596699973092056135869194432,
+    3618502788666131213697322783095070105623107215331596699973092056135869263523, 3618502788666131213697322783095070105623107215331596699973092056135869147245,
+    3618502788666131213697322783095070105623107215331596699973092056135869249201, 3618502788666131213697322783095070105623107215331596699973092056135869139607,
+    3618502788666131213697322783095070105623107215331596699973092056135869214399, 3618502788666131213697322783095070105623107215331596699973092056135869179956,
+    3618502788666131213697322783095070105623107215331596699973092056135869199401, 3618502788666131213697322783095070105623107215331596699973092056135869171076,
+    3618502788666131213697322783095070105623107215331596699973092056135869128923, 3618502788666131213697322783095070105623107215331596699973092056135869357525,
+    3618502788666131213697322783095070105623107215331596699973092056135869142709, 3618502788666131213697322783095070105623107215331596699973092056135869139688,
+    3618502788666131213697322783095070105623107215331596699973092056135869224438, 3618502788666131213697322783095070105623107215331596699973092056135869209651,
+    3618502788666131213697322783095070105623107215331596699973092056135869286993, 3618502788666131213697322783095070105623107215331596699973092056135869230524,
+    3618502788666131213697322783095070105623107215331596699973092056135869154235, 3618502788666131213697322783095070105623107215331596699973092056135869198218,
+    3618502788666131213697322783095070105623107215331596699973092056135869267460, 3618502788666131213697322783095070105623107215331596699973092056135869158114,
+    3618502788666131213697322783095070105623107215331596699973092056135869285930, 3618502788666131213697322783095070105623107215331596699973092056135869240527,
+    3618502788666131213697322783095070105623107215331596699973092056135869211223, 3618502788666131213697322783095070105623107215331596699973092056135869210452,
+    3618502788666131213697322783095070105623107215331596699973092056135869276002, 3618502788666131213697322783095070105623107215331596699973092056135869255201,
+    3618502788666131213697322783095070105623107215331596699973092056135869313700, 3618502788666131213697322783095070105623107215331596699973092056135869343683,
+    3618502788666131213697322783095070105623107215331596699973092056135869347002, 3618502788666131213697322783095070105623107215331596699973092056135869341490,
+    3618502788666131213697322783095070105623107215331596699973092056135869373959, 3618502788666131213697322783095070105623107215331596699973092056135869347169,
+    3618502788666131213697322783095070105623107215331596699973092056135869326862, 3618502788666131213697322783095070105623107215331596699973092056135869291329,
+    3618502788666131213697322783095070105623107215331596699973092056135869347694, 3618502788666131213697322783095070105623107215331596699973092056135869349904,
+    3618502788666131213697322783095070105623107215331596699973092056135869428900, 3618502788666131213697322783095070105623107215331596699973092056135869427457,
+    3618502788666131213697322783095070105623107215331596699973092056135869479291, 3618502788666131213697322783095070105623107215331596699973092056135869391363,
+    3618502788666131213697322783095070105623107215331596699973092056135869359531, 3618502788666131213697322783095070105623107215331596699973092056135869506422,
+    3618502788666131213697322783095070105623107215331596699973092056135869460760, 3618502788666131213697322783095070105623107215331596699973092056135869413080,
+    3618502788666131213697322783095070105623107215331596699973092056135869468646, 3618502788666131213697322783095070105623107215331596699973092056135869531327,
+    3618502788666131213697322783095070105623107215331596699973092056135869475683, 3618502788666131213697322783095070105623107215331596699973092056135869416824,
+    3618502788666131213697322783095070105623107215331596699973092056135869547368, 3618502788666131213697322783095070105623107215331596699973092056135869459097,
+    3618502788666131213697322783095070105623107215331596699973092056135869498282, 3618502788666131213697322783095070105623107215331596699973092056135869540410,
+    3618502788666131213697322783095070105623107215331596699973092056135869485781, 3618502788666131213697322783095070105623107215331596699973092056135869471293,
+    3618502788666131213697322783095070105623107215331596699973092056135869563099, 3618502788666131213697322783095070105623107215331596699973092056135869565761,
+    3618502788666131213697322783095070105623107215331596699973092056135869689957, 3618502788666131213697322783095070105623107215331596699973092056135869491631,
+    3618502788666131213697322783095070105623107215331596699973092056135869599197, 3618502788666131213697322783095070105623107215331596699973092056135869577797,
+    3618502788666131213697322783095070105623107215331596699973092056135869575615, 3618502788666131213697322783095070105623107215331596699973092056135869722939,
+    3618502788666131213697322783095070105623107215331596699973092056135869624529, 3618502788666131213697322783095070105623107215331596699973092056135869616377,
+    3618502788666131213697322783095070105623107215331596699973092056135869648261, 3618502788666131213697322783095070105623107215331596699973092056135869652266,
+    3618502788666131213697322783095070105623107215331596699973092056135869608700, 3618502788666131213697322783095070105623107215331596699973092056135869662524,
+    3618502788666131213697322783095070105623107215331596699973092056135869660817, 3618502788666131213697322783095070105623107215331596699973092056135869696283,
+    3618502788666131213697322783095070105623107215331596699973092056135869721191, 3618502788666131213697322783095070105623107215331596699973092056135869692865,
+    3618502788666131213697322783095070105623107215331596699973092056135869758988, 3618502788666131213697322783095070105623107215331596699973092056135869771750,
+    3618502788666131213697322783095070105623107215331596699973092056135869665763, 3618502788666131213697322783095070105623107215331596699973092056135869768665,
+    3618502788666131213697322783095070105623107215331596699973092056135869658679, 3618502788666131213697322783095070105623107215331596699973092056135869724714,
+    3618502788666131213697322783095070105623107215331596699973092056135869698761, 3618502788666131213697322783095070105623107215331596699973092056135869699515,
+    3618502788666131213697322783095070105623107215331596699973092056135869618663, 3618502788666131213697322783095070105623107215331596699973092056135869706063,
+    3618502788666131213697322783095070105623107215331596699973092056135869644725, 3618502788666131213697322783095070105623107215331596699973092056135869769332,
+    3618502788666131213697322783095070105623107215331596699973092056135869749030, 3618502788666131213697322783095070105623107215331596699973092056135869668893,
+    3618502788666131213697322783095070105623107215331596699973092056135869756090, 3618502788666131213697322783095070105623107215331596699973092056135869687659,
+    3618502788666131213697322783095070105623107215331596699973092056135869785751, 3618502788666131213697322783095070105623107215331596699973092056135869787063,
+    3618502788666131213697322783095070105623107215331596699973092056135869853210, 3618502788666131213697322783095070105623107215331596699973092056135869835897,
+    3618502788666131213697322783095070105623107215331596699973092056135869785165, 3618502788666131213697322783095070105623107215331596699973092056135869789843,
+    3618502788666131213697322783095070105623107215331596699973092056135869854542, 3618502788666131213697322783095070105623107215331596699973092056135869769047,
+    3618502788666131213697322783095070105623107215331596699973092056135869842809, 3618502788666131213697322783095070105623107215331596699973092056135869850464,
+    3618502788666131213697322783095070105623107215331596699973092056135869885877, 3618502788666131213697322783095070105623107215331596699973092056135869792611,
+    3618502788666131213697322783095070105623107215331596699973092056135869789570, 3618502788666131213697322783095070105623107215331596699973092056135869835184,
+    3618502788666131213697322783095070105623107215331596699973092056135869906330, 3618502788666131213697322783095070105623107215331596699973092056135869802707,
+    3618502788666131213697322783095070105623107215331596699973092056135869894793, 3618502788666131213697322783095070105623107215331596699973092056135869904140,
+    3618502788666131213697322783095070105623107215331596699973092056135869891024, 3618502788666131213697322783095070105623107215331596699973092056135869794110,
+    3618502788666131213697322783095070105623107215331596699973092056135869885969, 3618502788666131213697322783095070105623107215331596699973092056135870005717,
+    3618502788666131213697322783095070105623107215331596699973092056135869977805, 3618502788666131213697322783095070105623107215331596699973092056135869949142,
+    3618502788666131213697322783095070105623107215331596699973092056135870085925, 3618502788666131213697322783095070105623107215331596699973092056135870047507,
+    3618502788666131213697322783095070105623107215331596699973092056135869877880, 3618502788666131213697322783095070105623107215331596699973092056135870047695,
+    3618502788666131213697322783095070105623107215331596699973092056135870046086, 3618502788666131213697322783095070105623107215331596699973092056135869999600,
+    3618502788666131213697322783095070105623107215331596699973092056135869983451, 3618502788666131213697322783095070105623107215331596699973092056135869993355,
+    3618502788666131213697322783095070105623107215331596699973092056135870019026, 3618502788666131213697322783095070105623107215331596699973092056135870090075,
+    3618502788666131213697322783095070105623107215331596699973092056135870024252, 3618502788666131213697322783095070105623107215331596699973092056135870103953,
+    3618502788666131213697322783095070105623107215331596699973092056135870133971, 3618502788666131213697322783095070105623107215331596699973092056135870145848,
+    3618502788666131213697322783095070105623107215331596699973092056135870067952, 3618502788666131213697322783095070105623107215331596699973092056135870053371,
+    3618502788666131213697322783095070105623107215331596699973092056135870089957, 3618502788666131213697322783095070105623107215331596699973092056135870040902,
+    3618502788666131213697322783095070105623107215331596699973092056135870203891, 3618502788666131213697322783095070105623107215331596699973092056135870144501,
+    3618502788666131213697322783095070105623107215331596699973092056135870224117, 3618502788666131213697322783095070105623107215331596699973092056135870113398,
+    3618502788666131213697322783095070105623107215331596699973092056135870234029, 3618502788666131213697322783095070105623107215331596699973092056135870141433,
+    3618502788666131213697322783095070105623107215331596699973092056135870279963, 3618502788666131213697322783095070105623107215331596699973092056135870246147,
+    3618502788666131213697322783095070105623107215331596699973092056135870274076, 3618502788666131213697322783095070105623107215331596699973092056135870269807,
+    3618502788666131213697322783095070105623107215331596699973092056135870367999, 3618502788666131213697322783095070105623107215331596699973092056135870246381,
+    3618502788666131213697322783095070105623107215331596699973092056135870280804, 3618502788666131213697322783095070105623107215331596699973092056135870205175,
+    3618502788666131213697322783095070105623107215331596699973092056135870267578, 3618502788666131213697322783095070105623107215331596699973092056135870225903,
+    3618502788666131213697322783095070105623107215331596699973092056135870212884, 3618502788666131213697322783095070105623107215331596699973092056135870185112,
+    3618502788666131213697322783095070105623107215331596699973092056135870312418, 3618502788666131213697322783095070105623107215331596699973092056135870238701,
+    3618502788666131213697322783095070105623107215331596699973092056135870285068, 3618502788666131213697322783095070105623107215331596699973092056135870342998,
+    3618502788666131213697322783095070105623107215331596699973092056135870311513, 3618502788666131213697322783095070105623107215331596699973092056135870316261,
+    3618502788666131213697322783095070105623107215331596699973092056135870287570, 3618502788666131213697322783095070105623107215331596699973092056135870334677,
+    3618502788666131213697322783095070105623107215331596699973092056135870285276, 3618502788666131213697322783095070105623107215331596699973092056135870379973,
+    3618502788666131213697322783095070105623107215331596699973092056135870424403, 3618502788666131213697322783095070105623107215331596699973092056135870329114,
+    3618502788666131213697322783095070105623107215331596699973092056135870325120, 3618502788666131213697322783095070105623107215331596699973092056135870355495,
+    3618502788666131213697322783095070105623107215331596699973092056135870378491, 3618502788666131213697322783095070105623107215331596699973092056135870424520,
+    3618502788666131213697322783095070105623107215331596699973092056135870326644, 3618502788666131213697322783095070105623107215331596699973092056135870490739,
+    3618502788666131213697322783095070105623107215331596699973092056135870429291, 3618502788666131213697322783095070105623107215331596699973092056135870243539,
+    3618502788666131213697322783095070105623107215331596699973092056135870349793, 3618502788666131213697322783095070105623107215331596699973092056135870292468,
+    3618502788666131213697322783095070105623107215331596699973092056135870364977, 3618502788666131213697322783095070105623107215331596699973092056135870424687,
+    3618502788666131213697322783095070105623107215331596699973092056135870461478, 3618502788666131213697322783095070105623107215331596699973092056135870427365,
+    3618502788666131213697322783095070105623107215331596699973092056135870464538, 3618502788666131213697322783095070105623107215331596699973092056135870342939,
+    3618502788666131213697322783095070105623107215331596699973092056135870356953, 3618502788666131213697322783095070105623107215331596699973092056135870400937,
+    3618502788666131213697322783095070105623107215331596699973092056135870365271, 3618502788666131213697322783095070105623107215331596699973092056135870497615,
+    3618502788666131213697322783095070105623107215331596699973092056135870495365, 3618502788666131213697322783095070105623107215331596699973092056135870509163,
+    3618502788666131213697322783095070105623107215331596699973092056135870469337, 3618502788666131213697322783095070105623107215331596699973092056135870483253,
+    3618502788666131213697322783095070105623107215331596699973092056135870573207, 3618502788666131213697322783095070105623107215331596699973092056135870475561,
+    3618502788666131213697322783095070105623107215331596699973092056135870390737, 3618502788666131213697322783095070105623107215331596699973092056135870428638,
+    3618502788666131213697322783095070105623107215331596699973092056135870626911, 3618502788666131213697322783095070105623107215331596699973092056135870616788,
+    3618502788666131213697322783095070105623107215331596699973092056135870563878, 3618502788666131213697322783095070105623107215331596699973092056135870674026,
+    3618502788666131213697322783095070105623107215331596699973092056135870532620, 3618502788666131213697322783095070105623107215331596699973092056135870636028,
+    3618502788666131213697322783095070105623107215331596699973092056135870617300, 3618502788666131213697322783095070105623107215331596699973092056135870663887,
+    3618502788666131213697322783095070105623107215331596699973092056135870565980, 3618502788666131213697322783095070105623107215331596699973092056135870609180,
+    3618502788666131213697322783095070105623107215331596699973092056135870621001, 3618502788666131213697322783095070105623107215331596699973092056135870688059,
+    3618502788666131213697322783095070105623107215331596699973092056135870623813, 3618502788666131213697322783095070105623107215331596699973092056135870677250,
+    3618502788666131213697322783095070105623107215331596699973092056135870652512, 3618502788666131213697322783095070105623107215331596699973092056135870687613,
+    3618502788666131213697322783095070105623107215331596699973092056135870661139, 3618502788666131213697322783095070105623107215331596699973092056135870718439,
+    3618502788666131213697322783095070105623107215331596699973092056135870655449, 3618502788666131213697322783095070105623107215331596699973092056135870799562,
+    3618502788666131213697322783095070105623107215331596699973092056135870681226, 3618502788666131213697322783095070105623107215331596699973092056135870651702,
+    3618502788666131213697322783095070105623107215331596699973092056135870866225, 3618502788666131213697322783095070105623107215331596699973092056135870784975,
+    3618502788666131213697322783095070105623107215331596699973092056135870743555, 3618502788666131213697322783095070105623107215331596699973092056135870777289,
+    3618502788666131213697322783095070105623107215331596699973092056135870799877, 3618502788666131213697322783095070105623107215331596699973092056135870873570,
+    3618502788666131213697322783095070105623107215331596699973092056135870767782, 3618502788666131213697322783095070105623107215331596699973092056135870853466,
+    3618502788666131213697322783095070105623107215331596699973092056135870827193, 3618502788666131213697322783095070105623107215331596699973092056135870874484,
+    3618502788666131213697322783095070105623107215331596699973092056135870752560, 3618502788666131213697322783095070105623107215331596699973092056135870764366,
+    3618502788666131213697322783095070105623107215331596699973092056135870731369, 3618502788666131213697322783095070105623107215331596699973092056135870812712,
+    3618502788666131213697322783095070105623107215331596699973092056135870761889, 3618502788666131213697322783095070105623107215331596699973092056135870702731,
+    3618502788666131213697322783095070105623107215331596699973092056135870844614, 3618502788666131213697322783095070105623107215331596699973092056135870883208,
+    3618502788666131213697322783095070105623107215331596699973092056135870793653, 3618502788666131213697322783095070105623107215331596699973092056135870727954,
+    3618502788666131213697322783095070105623107215331596699973092056135870824018, 3618502788666131213697322783095070105623107215331596699973092056135870728405,
+    3618502788666131213697322783095070105623107215331596699973092056135870849762, 3618502788666131213697322783095070105623107215331596699973092056135870807340,
+    3618502788666131213697322783095070105623107215331596699973092056135870901733, 3618502788666131213697322783095070105623107215331596699973092056135870809018,
+    3618502788666131213697322783095070105623107215331596699973092056135870832022, 3618502788666131213697322783095070105623107215331596699973092056135870968605,
+    3618502788666131213697322783095070105623107215331596699973092056135870980983, 3618502788666131213697322783095070105623107215331596699973092056135870882358,
+    3618502788666131213697322783095070105623107215331596699973092056135870941694, 3618502788666131213697322783095070105623107215331596699973092056135870963026,
+    3618502788666131213697322783095070105623107215331596699973092056135871033868, 3618502788666131213697322783095070105623107215331596699973092056135870930882,
+    3618502788666131213697322783095070105623107215331596699973092056135870874751, 3618502788666131213697322783095070105623107215331596699973092056135870931109,
+    3618502788666131213697322783095070105623107215331596699973092056135870912172, 3618502788666131213697322783095070105623107215331596699973092056135870938374,
+    3618502788666131213697322783095070105623107215331596699973092056135871014330, 3618502788666131213697322783095070105623107215331596699973092056135870988490,
+    3618502788666131213697322783095070105623107215331596699973092056135870987773, 3618502788666131213697322783095070105623107215331596699973092056135870933840,
+    3618502788666131213697322783095070105623107215331596699973092056135870990572, 3618502788666131213697322783095070105623107215331596699973092056135870987406,
+    3618502788666131213697322783095070105623107215331596699973092056135870953494, 3618502788666131213697322783095070105623107215331596699973092056135870987968,
+    3618502788666131213697322783095070105623107215331596699973092056135871010514, 3618502788666131213697322783095070105623107215331596699973092056135871047978,
+    3618502788666131213697322783095070105623107215331596699973092056135871149911, 3618502788666131213697322783095070105623107215331596699973092056135871007885,
+    3618502788666131213697322783095070105623107215331596699973092056135870986898, 3618502788666131213697322783095070105623107215331596699973092056135871045376,
+    3618502788666131213697322783095070105623107215331596699973092056135871109893, 3618502788666131213697322783095070105623107215331596699973092056135871175281,
+    3618502788666131213697322783095070105623107215331596699973092056135871030143, 3618502788666131213697322783095070105623107215331596699973092056135871127776,
+    3618502788666131213697322783095070105623107215331596699973092056135871114045, 3618502788666131213697322783095070105623107215331596699973092056135871165203,
+    3618502788666131213697322783095070105623107215331596699973092056135871090327, 3618502788666131213697322783095070105623107215331596699973092056135871301281,
+    3618502788666131213697322783095070105623107215331596699973092056135871180811, 3618502788666131213697322783095070105623107215331596699973092056135871098141,
+    3618502788666131213697322783095070105623107215331596699973092056135871118020, 3618502788666131213697322783095070105623107215331596699973092056135871216467,
+    3618502788666131213697322783095070105623107215331596699973092056135871151756, 3618502788666131213697322783095070105623107215331596699973092056135871216410,
+    3618502788666131213697322783095070105623107215331596699973092056135871284786, 3618502788666131213697322783095070105623107215331596699973092056135871169721,
+    3618502788666131213697322783095070105623107215331596699973092056135871198378, 3618502788666131213697322783095070105623107215331596699973092056135871267172,
+    3618502788666131213697322783095070105623107215331596699973092056135871236520, 3618502788666131213697322783095070105623107215331596699973092056135871163414,
+    3618502788666131213697322783095070105623107215331596699973092056135871204837, 3618502788666131213697322783095070105623107215331596699973092056135871344996,
+    3618502788666131213697322783095070105623107215331596699973092056135871287470, 3618502788666131213697322783095070105623107215331596699973092056135871261017,
+    3618502788666131213697322783095070105623107215331596699973092056135871281927, 3618502788666131213697322783095070105623107215331596699973092056135871271629,
+    3618502788666131213697322783095070105623107215331596699973092056135871318661, 3618502788666131213697322783095070105623107215331596699973092056135871297412,
+    3618502788666131213697322783095070105623107215331596699973092056135871287866, 3618502788666131213697322783095070105623107215331596699973092056135871450629,
+    3618502788666131213697322783095070105623107215331596699973092056135871287063, 3618502788666131213697322783095070105623107215331596699973092056135871238232,
+    3618502788666131213697322783095070105623107215331596699973092056135871303666, 3618502788666131213697322783095070105623107215331596699973092056135871317896,
+    3618502788666131213697322783095070105623107215331596699973092056135871295653, 3618502788666131213697322783095070105623107215331596699973092056135871299412,
+    3618502788666131213697322783095070105623107215331596699973092056135871309961, 3618502788666131213697322783095070105623107215331596699973092056135871327651,
+    3618502788666131213697322783095070105623107215331596699973092056135871294600, 3618502788666131213697322783095070105623107215331596699973092056135871344827,
+    3618502788666131213697322783095070105623107215331596699973092056135871369121, 3618502788666131213697322783095070105623107215331596699973092056135871301582,
+    3618502788666131213697322783095070105623107215331596699973092056135871398240, 3618502788666131213697322783095070105623107215331596699973092056135871372490,
+    3618502788666131213697322783095070105623107215331596699973092056135871245654, 3618502788666131213697322783095070105623107215331596699973092056135871192204,
+    3618502788666131213697322783095070105623107215331596699973092056135871312856, 3618502788666131213697322783095070105623107215331596699973092056135871334434,
+    3618502788666131213697322783095070105623107215331596699973092056135871303678, 3618502788666131213697322783095070105623107215331596699973092056135871363093,
+    3618502788666131213697322783095070105623107215331596699973092056135871335846, 3618502788666131213697322783095070105623107215331596699973092056135871267539,
+    3618502788666131213697322783095070105623107215331596699973092056135871358196, 3618502788666131213697322783095070105623107215331596699973092056135871300190,
+    3618502788666131213697322783095070105623107215331596699973092056135871393445, 3618502788666131213697322783095070105623107215331596699973092056135871429465,
+    3618502788666131213697322783095070105623107215331596699973092056135871406776, 3618502788666131213697322783095070105623107215331596699973092056135871445011,
+    3618502788666131213697322783095070105623107215331596699973092056135871412672, 3618502788666131213697322783095070105623107215331596699973092056135871298260,
+    3618502788666131213697322783095070105623107215331596699973092056135871367612, 3618502788666131213697322783095070105623107215331596699973092056135871409559,
+    3618502788666131213697322783095070105623107215331596699973092056135871451949, 3618502788666131213697322783095070105623107215331596699973092056135871393508,
+    3618502788666131213697322783095070105623107215331596699973092056135871468666, 3618502788666131213697322783095070105623107215331596699973092056135871415023,
+    3618502788666131213697322783095070105623107215331596699973092056135871446492, 3618502788666131213697322783095070105623107215331596699973092056135871417063,
+    3618502788666131213697322783095070105623107215331596699973092056135871482636, 3618502788666131213697322783095070105623107215331596699973092056135871492462,
+    3618502788666131213697322783095070105623107215331596699973092056135871518976, 3618502788666131213697322783095070105623107215331596699973092056135871333916,
+    3618502788666131213697322783095070105623107215331596699973092056135871448150, 3618502788666131213697322783095070105623107215331596699973092056135871548724,
+    3618502788666131213697322783095070105623107215331596699973092056135871538378, 3618502788666131213697322783095070105623107215331596699973092056135871545033,
+    3618502788666131213697322783095070105623107215331596699973092056135871478335, 3618502788666131213697322783095070105623107215331596699973092056135871624243,
+    3618502788666131213697322783095070105623107215331596699973092056135871429523, 3618502788666131213697322783095070105623107215331596699973092056135871567353,
+    3618502788666131213697322783095070105623107215331596699973092056135871563186, 3618502788666131213697322783095070105623107215331596699973092056135871477367,
+    3618502788666131213697322783095070105623107215331596699973092056135871551095, 3618502788666131213697322783095070105623107215331596699973092056135871557084,
+    3618502788666131213697322783095070105623107215331596699973092056135871501855, 3618502788666131213697322783095070105623107215331596699973092056135871580408,
+    3618502788666131213697322783095070105623107215331596699973092056135871616603, 3618502788666131213697322783095070105623107215331596699973092056135871545591,
+    3618502788666131213697322783095070105623107215331596699973092056135871576766, 3618502788666131213697322783095070105623107215331596699973092056135871537615,
+    3618502788666131213697322783095070105623107215331596699973092056135871624390, 3618502788666131213697322783095070105623107215331596699973092056135871537529,
+    3618502788666131213697322783095070105623107215331596699973092056135871603716, 3618502788666131213697322783095070105623107215331596699973092056135871640667,
+    3618502788666131213697322783095070105623107215331596699973092056135871612025, 3618502788666131213697322783095070105623107215331596699973092056135871599206,
+    3618502788666131213697322783095070105623107215331596699973092056135871669187, 3618502788666131213697322783095070105623107215331596699973092056135871622966,
+    3618502788666131213697322783095070105623107215331596699973092056135871608970, 3618502788666131213697322783095070105623107215331596699973092056135871515246,
+    3618502788666131213697322783095070105623107215331596699973092056135871707985, 3618502788666131213697322783095070105623107215331596699973092056135871751415,
+    3618502788666131213697322783095070105623107215331596699973092056135871649817, 3618502788666131213697322783095070105623107215331596699973092056135871654951,
+    3618502788666131213697322783095070105623107215331596699973092056135871756682, 3618502788666131213697322783095070105623107215331596699973092056135871768925,
+    3618502788666131213697322783095070105623107215331596699973092056135871657446, 3618502788666131213697322783095070105623107215331596699973092056135871639346,
+    3618502788666131213697322783095070105623107215331596699973092056135871750445, 3618502788666131213697322783095070105623107215331596699973092056135871634530,
+    3618502788666131213697322783095070105623107215331596699973092056135871729745, 3618502788666131213697322783095070105623107215331596699973092056135871615741,
+    3618502788666131213697322783095070105623107215331596699973092056135871805478, 3618502788666131213697322783095070105623107215331596699973092056135871685743,
+    3618502788666131213697322783095070105623107215331596699973092056135871647379, 3618502788666131213697322783095070105623107215331596699973092056135871646260,
+    3618502788666131213697322783095070105623107215331596699973092056135871828415, 3618502788666131213697322783095070105623107215331596699973092056135871746264,
+    3618502788666131213697322783095070105623107215331596699973092056135871728041, 3618502788666131213697322783095070105623107215331596699973092056135871770660,
+    3618502788666131213697322783095070105623107215331596699973092056135871802124, 3618502788666131213697322783095070105623107215331596699973092056135871816781,
+    3618502788666131213697322783095070105623107215331596699973092056135871775215, 3618502788666131213697322783095070105623107215331596699973092056135871852348,
+    3618502788666131213697322783095070105623107215331596699973092056135871849490, 3618502788666131213697322783095070105623107215331596699973092056135871890433,
+    3618502788666131213697322783095070105623107215331596699973092056135871758670, 3618502788666131213697322783095070105623107215331596699973092056135871802012,
+    3618502788666131213697322783095070105623107215331596699973092056135871745274, 3618502788666131213697322783095070105623107215331596699973092056135871891770,
+    3618502788666131213697322783095070105623107215331596699973092056135871758429, 3618502788666131213697322783095070105623107215331596699973092056135871800354,
+    3618502788666131213697322783095070105623107215331596699973092056135871695881, 3618502788666131213697322783095070105623107215331596699973092056135871885935,
+    3618502788666131213697322783095070105623107215331596699973092056135871861182, 3618502788666131213697322783095070105623107215331596699973092056135871849155,
+    3618502788666131213697322783095070105623107215331596699973092056135871897102, 3618502788666131213697322783095070105623107215331596699973092056135871887614,
+    3618502788666131213697322783095070105623107215331596699973092056135871940342, 3618502788666131213697322783095070105623107215331596699973092056135871849467,
+    3618502788666131213697322783095070105623107215331596699973092056135871877527, 3618502788666131213697322783095070105623107215331596699973092056135871863499,
+    3618502788666131213697322783095070105623107215331596699973092056135871869685, 3618502788666131213697322783095070105623107215331596699973092056135871883942,
+    3618502788666131213697322783095070105623107215331596699973092056135871896024, 3618502788666131213697322783095070105623107215331596699973092056135871815116,
+    3618502788666131213697322783095070105623107215331596699973092056135871880720, 3618502788666131213697322783095070105623107215331596699973092056135871966480,
+    3618502788666131213697322783095070105623107215331596699973092056135871979591, 3618502788666131213697322783095070105623107215331596699973092056135871978499,
+    3618502788666131213697322783095070105623107215331596699973092056135871897309, 3618502788666131213697322783095070105623107215331596699973092056135871985321,
+    3618502788666131213697322783095070105623107215331596699973092056135871886257, 3618502788666131213697322783095070105623107215331596699973092056135871882828,
+    3618502788666131213697322783095070105623107215331596699973092056135871873098, 3618502788666131213697322783095070105623107215331596699973092056135871862972,
+    3618502788666131213697322783095070105623107215331596699973092056135871968584, 68777,
+    3618502788666131213697322783095070105623107215331596699973092056135871952153, 3618502788666131213697322783095070105623107215331596699973092056135871982733,
+    3618502788666131213697322783095070105623107215331596699973092056135871951794, 4815,
+    3618502788666131213697322783095070105623107215331596699973092056135872005637, 3618502788666131213697322783095070105623107215331596699973092056135871997927,
+    3618502788666131213697322783095070105623107215331596699973092056135871978422, 44959,
+    90292, 3618502788666131213697322783095070105623107215331596699973092056135871987814,
+    114142, 92218,
+    3618502788666131213697322783095070105623107215331596699973092056135871977815, 34315,
+    72658, 22749,
+    14162, 57794,
+    3618502788666131213697322783095070105623107215331596699973092056135871977921, 115626,
+    125635, 3611,
+    20998, 3618502788666131213697322783095070105623107215331596699973092056135871958893,
+    41604, 93451,
+    89241, 65107,
+    90963, 50505,
+    164733, 235045,
+    136868, 166270,
+    191322, 174996,
+    107109, 108396,
+    91932, 88487,
+    204568, 135234,
+    150565, 251419,
+    136003, 153483,
+    212109, 253330,
+    162995, 209291,
+    165657, 173852,
+    195467, 174289,
+    190356, 208511,
+    202792, 266159,
+    242273, 293662,
+    112240, 360412,
+    269150, 264754,
+    326458, 277082,
+    326746, 332134,
+    352533, 261667,
+    307830, 411886,
+    330804, 434199,
+    395892, 418487,
+    353234, 464045,
+    394686, 383379,
+    372736, 470839,
+    426995, 351283,
+    468849, 414874,
+    416677, 422395,
+    402975, 454624,
+    529381, 391685,
+    468864, 399993,
+    411603, 494928,
+    482806, 495063,
+    587765, 539257,
+    497020, 548876,
+    456184, 527071,
+    485104, 517194,
+    513799, 465342,
+    485594, 520468,
+    482634, 597610,
+    498647, 532163,
+    585257, 655431,
+    519909, 645369,
+    639439, 696420,
+    595578, 452532,
+    561154, 615640,
+    590004, 687388,
+    583598, 688748,
+    662420, 576752,
+    592422, 657371,
+    616398, 561402,
+    644024, 756374,
+    651829, 639149,
+    716533, 562025,
+    694555, 765753,
+    747969, 762892,
+    768983, 803691,
+    705823, 835022,
+    751615, 670788,
+    873795, 805317,
+    725878, 788654,
+    823097, 695403,
+    758655, 754325,
+    884295, 828709,
+    853682, 826920,
+    875607, 845482,
+    740448, 827115,
+    832250, 861881,
+    894017, 734733,
+    809379, 712436,
+    881883, 726375,
+    858243, 893318,
+    872114, 908610,
+    864305, 793940,
+    916632, 904315,
+    934527, 967712,
+    845709, 932734,
+    999147, 960439,
+    879636, 861985,
+    980794, 965567,
+    880180, 1080742,
+    1015314, 993935,
+    993570, 1001413,
+    1039703, 965291,
+    882893, 960624,
+    946732, 1081043,
+    1161410, 1054487,
+    1087219, 1037224,
+    1008960, 1066778,
+    1165731, 1048223,
+    1080841, 1105333,
+    1186798, 1026689,
+    1119444, 1080082,
+    1202074, 1138123,
+    1086960, 1071172,
+    1216656, 1079779,
+    1196017, 1119560,
+    1213044, 1123843,
+    1224507, 1303793,
+    1144867, 1256154,
+    1261353, 1239476,
+    1150212, 1231798,
+    1243625, 1242326,
+    1282570, 1305578,
+    1235130, 1206643,
+    1340437, 1217998,
+    1290199, 1342863,
+    1236607, 1408010,
+    1300422, 1421207,
+    1283416, 1315473,
+    1219466, 1362349,
+    1424232, 1384401,
+    1445660, 1372859,
+    1319167, 1437771,
+    1383956, 1431105,
+    1448711, 1487134,
+    1406831, 1433054,
+    1362203, 1374207,
+    1424976, 1383710,
+    1424153, 1456822,
+    1519513, 1383802,
+    1533048, 1445518,
+    1466963, 1421133,
+    1550250, 1492939,
+    1389726, 1460668,
+    1558690, 1338223,
+    1399967, 1467719,
+    1450703, 1452043,
+    1485521, 1494900,
+    1576658, 1557352,
+    1556924, 1540413,
+    1475053, 1512211,
+    1642880, 1572971,
+    1699705, 1558680,
+    1531654, 1690340,
+    1538266, 1639252,
+    1590660, 1560784,
+    1522825, 1732149,
+    1707390, 1649837,
+    1720759, 1708597,
+    1718051, 1565646,
+    1639682, 1670832,
+    1665580, 1783014,
+    1786528, 1665293,
+    1658570, 1685551,
+    1579907, 1773063,
+    1771701, 1713440,
+    1721822, 1672343,
+    1667578, 1738813,
+    1723226, 1823308,
+    1709835, 1781561,
+    1706996, 1829305,
+    1766529, 1827500,
+    1797447, 1832971,
+    1849440, 1837852,
+    1795957, 1763624,
+    1810650, 1643105,
+    1764922, 1827151,
+    1820859, 1781471,
+    1825352, 1759342,
+    1779451, 1836484,
+    1827097, 1903083,
+    1853750, 1849308,
+    1953110, 1834619,
+    1882264, 1780258,
+    1933675, 1914327,
+    1931310, 1914909,
+    1939800, 1849863,
+    1928119, 1939884,
+    1895783, 1895746,
+    1915273, 2015257,
+    2013743, 1998710,
+    1961153, 1930194,
+    1824745, 1934480,
+    2024257, 2017642,
+    2049788, 2024076,
+    1991089, 2063058,
+    2108263, 2124647,
+    2029342, 2082315,
+    2098454, 2128044,
+    2091362, 2050885,
+    2173710, 2112743,
+    2187991, 2145665,
+    2088664, 2128532,
+    2091934, 2131954,
+    2152963, 2146778,
+    2108683, 2219551,
+    2151010, 2152564,
+    2281805, 2193777,
+    2111162, 2204582,
+    2253618, 2107272,
+    2193321, 2242975,
+    2279461, 2218865,
+    2272586, 2197502,
+    2184337, 2283457,
+    2298862, 2237988,
+    2246531, 2302421,
+    2300490, 2226068,
+    2295198, 2254378,
+    2271227, 2297777,
+    2414154, 2325137,
+    2319108, 2261028,
+    2434096, 2361094,
+    2464243, 2455388,
+    2312458, 2349905,
+    2326716, 2442949,
+    2456476, 2350656,
+    2383309, 2367636,
+    2411009, 2400415,
+    2523542, 2438707,
+    2356015, 2527367,
+    2434220, 2542508,
+    2519700, 2480262,
+    2445654, 2475678,
+    2503975, 2452330,
+    2495174, 2413474,
+    2627013, 2586357,
+    2463779, 2523297,
+    2537563, 2564447,
+    2581211, 2672645,
+    2606741, 2688449,
+    2572052, 2667886,
+    2576283, 2651224,
+    2640919, 2580730,
+    2803346, 2707068,
+    2651600, 2715440,
+    2775957, 2788318,
+    2846299, 2625799,
+    2837395, 2706623,
+    2881613, 2803597,
+    2863483, 2785140,
+    2838224, 2709604,
+    2852211, 2780165,
+    2849543, 2758105,
+    2890756, 2721023,
+    2864671, 2900592,
+    2859652, 2805746,
+    2831480, 2988240,
+    2805474, 2827581,
+    2860950, 2989886,
+    2990738, 2899040,
+    2818881, 2957039,
+    3022490, 2856252,
+    2868406, 2937659,
+    2888294, 2854586,
+    2844370, 3047724,
+    2890252, 2982622,
+    2893236, 2983715,
+    2940702, 2999747,
+    3027227, 3119341,
+    3120903, 3098508,
+    3005403, 3004077,
+    2978256, 3085146,
+    3181041, 3179109,
+    3027486, 3163774,
+    3179130, 3104914,
+    3223827, 3122689,
+    3172574, 3043644,
+    3134837, 3150335,
+];
@@ -0,0 +1,379 @@
+// Verification hints for falcon_test_vectors_n512
+
+// s0 = msg_point - s1 * pk mod (x^n + 1, Q)
+pub const HINT_S0_N512: [u16; 512] = [
+    12257, 86, 12204, 12240, 12097, 71, 98, 12100, 12287, 0, 12180, 16, 12152, 12084,
+    67, 12251, 152, 153, 87, 122, 30, 12196, 98, 12250, 11968, 11992, 101, 11959,
+    313, 200, 12184, 40, 12182, 12084, 77, 12274, 12165, 12126, 2, 12276, 7, 12159,
+    290, 12279, 19, 12159, 12188, 12079, 12263, 28, 12174, 177, 12086, 27, 12218, 12068,
+    12205, 11990, 45, 246, 12214, 12, 339, 12134, 70, 12154, 12257, 182, 12007, 12242,
+    12213, 12186, 64, 175, 94, 70, 1, 11994, 11987, 12164, 116, 273, 11974, 12000,
+    12251, 47, 72, 157, 12050, 12098, 140, 12081, 12130, 5, 11872, 12115, 53, 133,
+    65, 12084, 12127, 12267, 12157, 12245, 152, 12163, 12205, 12086, 184, 12279, 12, 12274,
+    366, 12045, 12191, 12164, 12036, 257, 57, 102, 44, 261, 155, 27, 12138, 12119,
+    32, 12030, 11984, 82, 165, 11868, 12151, 12075, 11925, 81, 149, 12192, 12269, 49,
+    12217, 12218, 222, 164, 125, 12058, 58, 12201, 11806, 214, 169, 12146, 65, 12073,
+    13, 12151, 23, 17, 12185, 25, 12158, 292, 118, 166, 8, 24, 12176, 12123,
+    344, 12028, 12257, 284, 91, 38, 12197, 256, 12215, 14, 67, 214, 12261, 112,
+    39, 12169, 125, 12184, 12205, 12145, 161, 12163, 295, 30, 170, 12114, 49, 248,
+    12124, 12228, 111, 11993, 12115, 376, 33, 12026, 113, 12018, 11881, 12208, 12140, 57,
+    195, 12140, 235, 66, 13, 12168, 138, 148, 260, 61, 12256, 12150, 11946, 95,
+    48, 157, 12209, 12182, 12277, 227, 130, 12217, 108, 12230, 51, 12129, 12239, 183,
+    12237, 264, 12209, 429, 12029, 12256, 353, 12287, 55, 0, 12170, 12283, 101, 239,
+    12144, 12117, 127, 12257, 144, 12135, 12215, 64, 204, 12235, 12145, 175, 12279, 106,
+    95, 12269, 65, 12237, 197, 117, 12056, 230, 79, 97, 11977, 47, 127, 12096,
+    12086, 12234, 205, 225, 239, 12205, 12188, 430, 12284, 12170, 12251, 12155, 11946, 118,
+    99, 11930, 287, 82, 98, 110, 9, 87, 197, 56, 215, 12, 42, 70,
+    12250, 231, 12262, 12189, 12282, 88, 11867, 58, 12162, 12034, 51, 37, 162, 12222,
+    199, 323, 280, 12086, 152, 12268, 12209, 185, 12022, 44, 24, 191, 37, 47,
+    12029, 11955, 177, 252, 301, 211, 12248, 118, 12273, 17, 166, 140, 143, 270,
+    2, 12281, 12273, 51, 80, 348, 12242, 8, 169, 172, 268, 385, 41, 12160,
+    210, 12044, 11915, 12194, 12234, 86, 81, 12087, 102, 152, 215, 11898, 116, 109,
+    55, 12093, 12029, 54, 161, 122, 241, 53, 11838, 12134, 206, 12099, 12238, 12051,
+    226, 11904, 266, 11895, 158, 12088, 328, 6, 11980, 11931, 12107, 12233, 128, 80,
+    12167, 81, 89, 241, 61, 307, 71, 535, 43, 106, 168, 76, 10, 12179,
+    12278, 47, 11919, 128, 156, 12164, 12196, 40, 12241, 172, 230, 56, 262, 152,
+    11955, 95, 116, 12070, 12012, 224, 11874, 83, 12115, 12008, 12166, 12258, 248, 12264,
+    11948, 12171, 223, 12236, 12253, 12157, 12119, 86, 82, 12007, 12064, 80, 12213, 474,
+    12236, 12261, 94, 12169, 53, 12004, 12000, 12086, 12254, 12126, 35, 134, 134, 12247,
+    91, 12222, 12225, 12282, 10, 81, 93, 12120, 34, 12180, 12169, 166, 199, 63,
+    56, 12210, 234, 12146, 26, 12065, 12129, 296, 135, 12165, 22, 377, 118, 12286,
+    66, 12067, 12223, 12090, 66, 12243, 34, 12272,
+];
+
+// Quotient by x^n + 1
+pub const HINT_T_N512: [felt252; 511] = [
+    18519206199, 18713527254, 19330899730, 19399027913, 19082146332, 19253127675, 18829445205,
+    19007856548, 19334930055, 19120599201, 18770120207, 18667878698, 19800401342, 18683599366,
+    18845585990, 19607800275, 18651061915, 18619669040, 18658484393, 18723776203, 18720647827,
+    18856052739, 19003392254, 18802046532, 18713258874, 18279938763, 18380201803, 18211445790,
+    18434150191, 18349359096, 17959199207, 18062223183, 18109780116, 17861389342, 18817820494,
+    18430318556, 18038069324, 18853202414, 17114152723, 17851504859, 17700687727, 16796758134,
+    17366829268, 17436007421, 17648282789, 16940482098, 18175625223, 17686904700, 16658505456,
+    17257533501, 17558581910, 18026612930, 16992418246, 16582587272, 17081733750, 16335730288,
+    16331963388, 16496905209, 16462821932, 17269487005, 16395702607, 16194819192, 16180700708,
+    16709053222, 17107742643, 16797370277, 16682015264, 16180479811, 16255947661, 16289919368,
+    15989248457, 16685955548, 16602016939, 15924478204, 15540923890, 16014138891, 16634111396,
+    16608258271, 15586100252, 16091403107, 15741116509, 15317453922, 15140601938, 15988406522,
+    16001475420, 15390859493, 16335506458, 16453269634, 15874244439, 16191323006, 15618997730,
+    15732452319, 15342913376, 15459252249, 15044987464, 14549801094, 14914309650, 15310118874,
+    15513801894, 15172228527, 15025763770, 15402354586, 15158232910, 15138359744, 15310114517,
+    14781374142, 14847627008, 15313147442, 14566641448, 15375665661, 14775276642, 15351000449,
+    14599339116, 14973152206, 14778590762, 14740918389, 15586208197, 14641201223, 14501361429,
+    14647886887, 14309428151, 14712959799, 14250437759, 13819195841, 13985837854, 14008729471,
+    14141059624, 13758367563, 14423867227, 14152013217, 14460702337, 14022932134, 13277140131,
+    13685535926, 14074325971, 13192807335, 13895572200, 13751200108, 14225859615, 13818793929,
+    14544953458, 13180188510, 14054576557, 14389182886, 13505333281, 13056780254, 13249440544,
+    13805538341, 13635395860, 13616131349, 13249083047, 13361522711, 13774172273, 12778396051,
+    13152186913, 13448275473, 12895985520, 13409972711, 12840342887, 13618319769, 13607601245,
+    13623298543, 13621897523, 13242428647, 13401107841, 13150513362, 12633879823, 12447437847,
+    13123559150, 13701786266, 12502291879, 12747582915, 12194309873, 12323963242, 12702835878,
+    12097461417, 13197774975, 12438023148, 12701786344, 11761203688, 12768167760, 12597270826,
+    12026257062, 12745884551, 12220924659, 12114158933, 12151281946, 11630135894, 10931053903,
+    11566834174, 11756176236, 11268046502, 12275924265, 12884845769, 12205193515, 12323346723,
+    10971838893, 11267192385, 10994577526, 11106461562, 11137027438, 10914631421, 11039087990,
+    11605471576, 11374284091, 11294683761, 10283992562, 11194047955, 11088225186, 10586650436,
+    10497099672, 10791698130, 11585784729, 11450937661, 10802129219, 10872212925, 10254144563,
+    11368487413, 10261609897, 11025506185, 10598647968, 10164146785, 10575362295, 10993308310,
+    11140052352, 10110896065, 10847428623, 11038647400, 10042075889, 10488274373, 10361800941,
+    10619487738, 9863061955, 10756837045, 10762141370, 10184530107, 10444241133, 10105422476,
+    9738694068, 10241628146, 9568190798, 9938252306, 10043134093, 9873578195, 9522209065,
+    9427178988, 9484560719, 9754066156, 10025419239, 9407874289, 9234403235, 9210519585,
+    9177087819, 8414935278, 8907138499, 8994543982, 9540505972, 9405297908, 9213625160,
+    8640389457, 8798177384, 8903742311, 8172517544, 8143441914, 9237054198, 9170247793,
+    8973636402, 8811481341, 9270506536, 8667108474, 8958995553, 8375361740, 8509467844,
+    8402906499, 8927192783, 8380858481, 8682717128, 8395283070, 8410310336, 8542348696,
+    8260764705, 8572124295, 8198282688, 8322331765, 8693406371, 8134277330, 8408331328,
+    8155851418, 7963411032, 8079387775, 7233112299, 8737721183, 8054653036, 7391714892,
+    8153101405, 7940236939, 8056141396, 7347538152, 8210563996, 7618208507, 7667532761,
+    8441152086, 7248240598, 7803786919, 7634021554, 7841007225, 7451102835, 7130806726,
+    8093396221, 7462534680, 7577627509, 7989032378, 7184791135, 7575780705, 7053183595,
+    7066234848, 6400298367, 6861356162, 7073685176, 6539715915, 7279025348, 7061117498,
+    6585734739, 7265216256, 6109024688, 6934655498, 6314904852, 6861751020, 6486141510,
+    6769975815, 6710409440, 6367158259, 6612494371, 6234441495, 6250404616, 6115805129,
+    5907462716, 6144473447, 6197045781, 6472557108, 5541494498, 6348170112, 5936258951,
+    5827807923, 6486729913, 5740913682, 5690578126, 5390381356, 5413456741, 5706962043,
+    5448998013, 5349153580, 5663735967, 5897160241, 5588960178, 5174241408, 5587377728,
+    5565904676, 5483400579, 5510713912, 5630210270, 4763341101, 5269645148, 5192562306,
+    4872755224, 5044969264, 5061563135, 4890394944, 4604371966, 5407074638, 4916069974,
+    5087867566, 4923487444, 5035097308, 4999179646, 4826563167, 4961772733, 4203544047,
+    4568250181, 4459734287, 4384838821, 4424956348, 4774115459, 4870450339, 4534828321,
+    4687160805, 4791339642, 4183437176, 4512705081, 4112076441, 4225628916, 4070341077,
+    4193502923, 3928410428, 3951307921, 4458561215, 4114121977, 4445320120, 4066496424,
+    4234087191, 4285554457, 4211074648, 4944028601, 3985055765, 4139195736, 4096293321,
+    3906022304, 4162409215, 3347971333, 3983396269, 3978312457, 3823339147, 3821587081,
+    3163434554, 3798333237, 3950115502, 3608094018, 4038012148, 3656149745, 3797618033,
+    3401878034, 3447501799, 3298244732, 3460582867, 3374542059, 3081148661, 3467249119,
+    3229536882, 3207659918, 3216226725, 3328322144, 3394235784, 3269019625, 3083826321,
+    3044418060, 3015423656, 2984884175, 2875733735, 2688403114, 2539166774, 2546289240,
+    2687468315, 2470861800, 2535135706, 2447306980, 2641821978, 2670393887, 2731998724,
+    2454237691, 2586039101, 2336674069, 2558759011, 2478606205, 2306891469, 2225910988,
+    2156462773, 2446310770, 2194714588, 2343169084, 2109770719, 2139248799, 2162795624,
+    2033739519, 2193098164, 1710401598, 2092353053, 1817735238, 1799169646, 2086999610,
+    1512408109, 1727723924, 1815057615, 1625419724, 1894712441, 1572671298, 1539886725,
+    1284122496, 1459334912, 1644579056, 1320544269, 1586121876, 1375459432, 1315547798,
+    1316356918, 1168133015, 1030109548, 937133619, 1018655539, 1002758577, 991126446,
+    833638112, 759288156, 624459763, 836994028, 687293822, 657517425, 592910699,
+    355698466, 462243831, 438553718, 414119638, 204706109, 227728557, 351535595,
+    340018100, 276542514, 188520328, 209865050, 203688273, 151460440, 86681586,
+];
+
+// Carries, (low - high + s0 - msg_point) / Q
+pub const HINT_C_N512: [felt252; 512] = [
+    3618502788666131213697322783095070105623107215331596699973092056135870525080, 3618502788666131213697322783095070105623107215331596699973092056135870500350,
+    3618502788666131213697322783095070105623107215331596699973092056135870468113, 3618502788666131213697322783095070105623107215331596699973092056135870453005,
+    3618502788666131213697322783095070105623107215331596699973092056135870478236, 3618502788666131213697322783095070105623107215331596699973092056135870465926,
+    3618502788666131213697322783095070105623107215331596699973092056135870493214, 3618502788666131213697322783095070105623107215331596699973092056135870481323,
+    3618502788666131213697322783095070105623107215331596699973092056135870466352, 3618502788666131213697322783095070105623107215331596699973092056135870475441,
+    3618502788666131213697322783095070105623107215331596699973092056135870516796, 3618502788666131213697322783095070105623107215331596699973092056135870527801,
+    3618502788666131213697322783095070105623107215331596699973092056135870425597, 3618502788666131213697322783095070105623107215331596699973092056135870520649,
+    3618502788666131213697322783095070105623107215331596699973092056135870523188, 3618502788666131213697322783095070105623107215331596699973092056135870448421,
+    3618502788666131213697322783095070105623107215331596699973092056135870531634, 3618502788666131213697322783095070105623107215331596699973092056135870535430,
+    3618502788666131213697322783095070105623107215331596699973092056135870536242, 3618502788666131213697322783095070105623107215331596699973092056135870534929,
+    3618502788666131213697322783095070105623107215331596699973092056135870546764, 3618502788666131213697322783095070105623107215331596699973092056135870553833,
+    3618502788666131213697322783095070105623107215331596699973092056135870534065, 3618502788666131213697322783095070105623107215331596699973092056135870544440,
+    3618502788666131213697322783095070105623107215331596699973092056135870547070, 3618502788666131213697322783095070105623107215331596699973092056135870579230,
+    3618502788666131213697322783095070105623107215331596699973092056135870581091, 3618502788666131213697322783095070105623107215331596699973092056135870597121,
+    3618502788666131213697322783095070105623107215331596699973092056135870598677, 3618502788666131213697322783095070105623107215331596699973092056135870607294,
+    3618502788666131213697322783095070105623107215331596699973092056135870638634, 3618502788666131213697322783095070105623107215331596699973092056135870636296,
+    3618502788666131213697322783095070105623107215331596699973092056135870624014, 3618502788666131213697322783095070105623107215331596699973092056135870669463,
+    3618502788666131213697322783095070105623107215331596699973092056135870608220, 3618502788666131213697322783095070105623107215331596699973092056135870603785,
+    3618502788666131213697322783095070105623107215331596699973092056135870681556, 3618502788666131213697322783095070105623107215331596699973092056135870598620,
+    3618502788666131213697322783095070105623107215331596699973092056135870730574, 3618502788666131213697322783095070105623107215331596699973092056135870684883,
+    3618502788666131213697322783095070105623107215331596699973092056135870727913, 3618502788666131213697322783095070105623107215331596699973092056135870784600,
+    3618502788666131213697322783095070105623107215331596699973092056135870745553, 3618502788666131213697322783095070105623107215331596699973092056135870746690,
+    3618502788666131213697322783095070105623107215331596699973092056135870722379, 3618502788666131213697322783095070105623107215331596699973092056135870802606,
+    3618502788666131213697322783095070105623107215331596699973092056135870683694, 3618502788666131213697322783095070105623107215331596699973092056135870741843,
+    3618502788666131213697322783095070105623107215331596699973092056135870835139, 3618502788666131213697322783095070105623107215331596699973092056135870769989,
+    3618502788666131213697322783095070105623107215331596699973092056135870766028, 3618502788666131213697322783095070105623107215331596699973092056135870721555,
+    3618502788666131213697322783095070105623107215331596699973092056135870808138, 3618502788666131213697322783095070105623107215331596699973092056135870876204,
+    3618502788666131213697322783095070105623107215331596699973092056135870821574, 3618502788666131213697322783095070105623107215331596699973092056135870911044,
+    3618502788666131213697322783095070105623107215331596699973092056135870906808, 3618502788666131213697322783095070105623107215331596699973092056135870879061,
+    3618502788666131213697322783095070105623107215331596699973092056135870885398, 3618502788666131213697322783095070105623107215331596699973092056135870823350,
+    3618502788666131213697322783095070105623107215331596699973092056135870907986, 3618502788666131213697322783095070105623107215331596699973092056135870937957,
+    3618502788666131213697322783095070105623107215331596699973092056135870899546, 3618502788666131213697322783095070105623107215331596699973092056135870884899,
+    3618502788666131213697322783095070105623107215331596699973092056135870849022, 3618502788666131213697322783095070105623107215331596699973092056135870901730,
+    3618502788666131213697322783095070105623107215331596699973092056135870896791, 3618502788666131213697322783095070105623107215331596699973092056135870947303,
+    3618502788666131213697322783095070105623107215331596699973092056135870924720, 3618502788666131213697322783095070105623107215331596699973092056135870938135,
+    3618502788666131213697322783095070105623107215331596699973092056135870969794, 3618502788666131213697322783095070105623107215331596699973092056135870905589,
+    3618502788666131213697322783095070105623107215331596699973092056135870944005, 3618502788666131213697322783095070105623107215331596699973092056135870961141,
+    3618502788666131213697322783095070105623107215331596699973092056135870980437, 3618502788666131213697322783095070105623107215331596699973092056135870966550,
+    3618502788666131213697322783095070105623107215331596699973092056135870919872, 3618502788666131213697322783095070105623107215331596699973092056135870938110,
+    3618502788666131213697322783095070105623107215331596699973092056135871002843, 3618502788666131213697322783095070105623107215331596699973092056135870978629,
+    3618502788666131213697322783095070105623107215331596699973092056135870998898, 3618502788666131213697322783095070105623107215331596699973092056135871032659,
+    3618502788666131213697322783095070105623107215331596699973092056135871042584, 3618502788666131213697322783095070105623107215331596699973092056135870991797,
+    3618502788666131213697322783095070105623107215331596699973092056135870991625, 3618502788666131213697322783095070105623107215331596699973092056135871045497,
+    3618502788666131213697322783095070105623107215331596699973092056135870967677, 3618502788666131213697322783095070105623107215331596699973092056135870971211,
+    3618502788666131213697322783095070105623107215331596699973092056135870986988, 3618502788666131213697322783095070105623107215331596699973092056135870952627,
+    3618502788666131213697322783095070105623107215331596699973092056135871027389, 3618502788666131213697322783095070105623107215331596699973092056135871011041,
+    3618502788666131213697322783095070105623107215331596699973092056135871072897, 3618502788666131213697322783095070105623107215331596699973092056135871077078,
+    3618502788666131213697322783095070105623107215331596699973092056135871101507, 3618502788666131213697322783095070105623107215331596699973092056135871147757,
+    3618502788666131213697322783095070105623107215331596699973092056135871100689, 3618502788666131213697322783095070105623107215331596699973092056135871107925,
+    3618502788666131213697322783095070105623107215331596699973092056135871071879, 3618502788666131213697322783095070105623107215331596699973092056135871091132,
+    3618502788666131213697322783095070105623107215331596699973092056135871105676, 3618502788666131213697322783095070105623107215331596699973092056135871127579,
+    3618502788666131213697322783095070105623107215331596699973092056135871103502, 3618502788666131213697322783095070105623107215331596699973092056135871135052,
+    3618502788666131213697322783095070105623107215331596699973092056135871113363, 3618502788666131213697322783095070105623107215331596699973092056135871160998,
+    3618502788666131213697322783095070105623107215331596699973092056135871143288, 3618502788666131213697322783095070105623107215331596699973092056135871118817,
+    3618502788666131213697322783095070105623107215331596699973092056135871184535, 3618502788666131213697322783095070105623107215331596699973092056135871083578,
+    3618502788666131213697322783095070105623107215331596699973092056135871163044, 3618502788666131213697322783095070105623107215331596699973092056135871085659,
+    3618502788666131213697322783095070105623107215331596699973092056135871175245, 3618502788666131213697322783095070105623107215331596699973092056135871162106,
+    3618502788666131213697322783095070105623107215331596699973092056135871166429, 3618502788666131213697322783095070105623107215331596699973092056135871183246,
+    3618502788666131213697322783095070105623107215331596699973092056135871145331, 3618502788666131213697322783095070105623107215331596699973092056135871221792,
+    3618502788666131213697322783095070105623107215331596699973092056135871211198, 3618502788666131213697322783095070105623107215331596699973092056135871190931,
+    3618502788666131213697322783095070105623107215331596699973092056135871244450, 3618502788666131213697322783095070105623107215331596699973092056135871211334,
+    3618502788666131213697322783095070105623107215331596699973092056135871249019, 3618502788666131213697322783095070105623107215331596699973092056135871281341,
+    3618502788666131213697322783095070105623107215331596699973092056135871265847, 3618502788666131213697322783095070105623107215331596699973092056135871235809,
+    3618502788666131213697322783095070105623107215331596699973092056135871230197, 3618502788666131213697322783095070105623107215331596699973092056135871291073,
+    3618502788666131213697322783095070105623107215331596699973092056135871258908, 3618502788666131213697322783095070105623107215331596699973092056135871307653,
+    3618502788666131213697322783095070105623107215331596699973092056135871299196, 3618502788666131213697322783095070105623107215331596699973092056135871275963,
+    3618502788666131213697322783095070105623107215331596699973092056135871347608, 3618502788666131213697322783095070105623107215331596699973092056135871306007,
+    3618502788666131213697322783095070105623107215331596699973092056135871257738, 3618502788666131213697322783095070105623107215331596699973092056135871391515,
+    3618502788666131213697322783095070105623107215331596699973092056135871310156, 3618502788666131213697322783095070105623107215331596699973092056135871318397,
+    3618502788666131213697322783095070105623107215331596699973092056135871272826, 3618502788666131213697322783095070105623107215331596699973092056135871334673,
+    3618502788666131213697322783095070105623107215331596699973092056135871287252, 3618502788666131213697322783095070105623107215331596699973092056135871374138,
+    3618502788666131213697322783095070105623107215331596699973092056135871320064, 3618502788666131213697322783095070105623107215331596699973092056135871281481,
+    3618502788666131213697322783095070105623107215331596699973092056135871385760, 3618502788666131213697322783095070105623107215331596699973092056135871412445,
+    3618502788666131213697322783095070105623107215331596699973092056135871379290, 3618502788666131213697322783095070105623107215331596699973092056135871325274,
+    3618502788666131213697322783095070105623107215331596699973092056135871366278, 3618502788666131213697322783095070105623107215331596699973092056135871371140,
+    3618502788666131213697322783095070105623107215331596699973092056135871439130, 3618502788666131213697322783095070105623107215331596699973092056135871405674,
+    3618502788666131213697322783095070105623107215331596699973092056135871367453, 3618502788666131213697322783095070105623107215331596699973092056135871457394,
+    3618502788666131213697322783095070105623107215331596699973092056135871415054, 3618502788666131213697322783095070105623107215331596699973092056135871381371,
+    3618502788666131213697322783095070105623107215331596699973092056135871415028, 3618502788666131213697322783095070105623107215331596699973092056135871416352,
+    3618502788666131213697322783095070105623107215331596699973092056135871434649, 3618502788666131213697322783095070105623107215331596699973092056135871363817,
+    3618502788666131213697322783095070105623107215331596699973092056135871423063, 3618502788666131213697322783095070105623107215331596699973092056135871386401,
+    3618502788666131213697322783095070105623107215331596699973092056135871411634, 3618502788666131213697322783095070105623107215331596699973092056135871433265,
+    3618502788666131213697322783095070105623107215331596699973092056135871469141, 3618502788666131213697322783095070105623107215331596699973092056135871497968,
+    3618502788666131213697322783095070105623107215331596699973092056135871506433, 3618502788666131213697322783095070105623107215331596699973092056135871515962,
+    3618502788666131213697322783095070105623107215331596699973092056135871500415, 3618502788666131213697322783095070105623107215331596699973092056135871410034,
+    3618502788666131213697322783095070105623107215331596699973092056135871500107, 3618502788666131213697322783095070105623107215331596699973092056135871504775,
+    3618502788666131213697322783095070105623107215331596699973092056135871550662, 3618502788666131213697322783095070105623107215331596699973092056135871563149,
+    3618502788666131213697322783095070105623107215331596699973092056135871515880, 3618502788666131213697322783095070105623107215331596699973092056135871539887,
+    3618502788666131213697322783095070105623107215331596699973092056135871450140, 3618502788666131213697322783095070105623107215331596699973092056135871576628,
+    3618502788666131213697322783095070105623107215331596699973092056135871537486, 3618502788666131213697322783095070105623107215331596699973092056135871666131,
+    3618502788666131213697322783095070105623107215331596699973092056135871562192, 3618502788666131213697322783095070105623107215331596699973092056135871548526,
+    3618502788666131213697322783095070105623107215331596699973092056135871648195, 3618502788666131213697322783095070105623107215331596699973092056135871493059,
+    3618502788666131213697322783095070105623107215331596699973092056135871637998, 3618502788666131213697322783095070105623107215331596699973092056135871651474,
+    3618502788666131213697322783095070105623107215331596699973092056135871617431, 3618502788666131213697322783095070105623107215331596699973092056135871648428,
+    3618502788666131213697322783095070105623107215331596699973092056135871718599, 3618502788666131213697322783095070105623107215331596699973092056135871699041,
+    3618502788666131213697322783095070105623107215331596699973092056135871685714, 3618502788666131213697322783095070105623107215331596699973092056135871688042,
+    3618502788666131213697322783095070105623107215331596699973092056135871597936, 3618502788666131213697322783095070105623107215331596699973092056135871557004,
+    3618502788666131213697322783095070105623107215331596699973092056135871602212, 3618502788666131213697322783095070105623107215331596699973092056135871641797,
+    3618502788666131213697322783095070105623107215331596699973092056135871752694, 3618502788666131213697322783095070105623107215331596699973092056135871721028,
+    3618502788666131213697322783095070105623107215331596699973092056135871713042, 3618502788666131213697322783095070105623107215331596699973092056135871714991,
+    3618502788666131213697322783095070105623107215331596699973092056135871772253, 3618502788666131213697322783095070105623107215331596699973092056135871771265,
+    3618502788666131213697322783095070105623107215331596699973092056135871751606, 3618502788666131213697322783095070105623107215331596699973092056135871695963,
+    3618502788666131213697322783095070105623107215331596699973092056135871724185, 3618502788666131213697322783095070105623107215331596699973092056135871681952,
+    3618502788666131213697322783095070105623107215331596699973092056135871795531, 3618502788666131213697322783095070105623107215331596699973092056135871728993,
+    3618502788666131213697322783095070105623107215331596699973092056135871757217, 3618502788666131213697322783095070105623107215331596699973092056135871828169,
+    3618502788666131213697322783095070105623107215331596699973092056135871852619, 3618502788666131213697322783095070105623107215331596699973092056135871841853,
+    3618502788666131213697322783095070105623107215331596699973092056135871747120, 3618502788666131213697322783095070105623107215331596699973092056135871751719,
+    3618502788666131213697322783095070105623107215331596699973092056135871820575, 3618502788666131213697322783095070105623107215331596699973092056135871826190,
+    3618502788666131213697322783095070105623107215331596699973092056135871891993, 3618502788666131213697322783095070105623107215331596699973092056135871806106,
+    3618502788666131213697322783095070105623107215331596699973092056135871909930, 3618502788666131213697322783095070105623107215331596699973092056135871770238,
+    3618502788666131213697322783095070105623107215331596699973092056135871817073, 3618502788666131213697322783095070105623107215331596699973092056135871887671,
+    3618502788666131213697322783095070105623107215331596699973092056135871863726, 3618502788666131213697322783095070105623107215331596699973092056135871848807,
+    3618502788666131213697322783095070105623107215331596699973092056135871875122, 3618502788666131213697322783095070105623107215331596699973092056135871912774,
+    3618502788666131213697322783095070105623107215331596699973092056135871807037, 3618502788666131213697322783095070105623107215331596699973092056135871832380,
+    3618502788666131213697322783095070105623107215331596699973092056135871899051, 3618502788666131213697322783095070105623107215331596699973092056135871898405,
+    3618502788666131213697322783095070105623107215331596699973092056135871912911, 3618502788666131213697322783095070105623107215331596699973092056135871882162,
+    3618502788666131213697322783095070105623107215331596699973092056135871952973, 3618502788666131213697322783095070105623107215331596699973092056135871889637,
+    3618502788666131213697322783095070105623107215331596699973092056135871876149, 3618502788666131213697322783095070105623107215331596699973092056135871930149,
+    3618502788666131213697322783095070105623107215331596699973092056135871891555, 3618502788666131213697322783095070105623107215331596699973092056135871994492,
+    3618502788666131213697322783095070105623107215331596699973092056135871983221, 3618502788666131213697322783095070105623107215331596699973092056135871918587,
+    6252, 3618502788666131213697322783095070105623107215331596699973092056135871965228,
+    3618502788666131213697322783095070105623107215331596699973092056135871949779, 3618502788666131213697322783095070105623107215331596699973092056135871981567,
+    3618502788666131213697322783095070105623107215331596699973092056135872015927, 22968,
+    3618502788666131213697322783095070105623107215331596699973092056135871988845, 3618502788666131213697322783095070105623107215331596699973092056135872016795,
+    3618502788666131213697322783095070105623107215331596699973092056135871983556, 5689,
+    52715, 44831,
+    59467, 122615,
+    123510, 60999,
+    56621, 43144,
+    53258, 143226,
+    171364, 137346,
+    151165, 163703,
+    78549, 62851,
+    44376, 148070,
+    18210, 156398,
+    112337, 151099,
+    151700, 210064,
+    195646, 183498,
+    96257, 165967,
+    147017, 168677,
+    218367, 240127,
+    218349, 208619,
+    150647, 210899,
+    196125, 247640,
+    259530, 265914,
+    320757, 178873,
+    269915, 352801,
+    299869, 280394,
+    321239, 372088,
+    242061, 270818,
+    269836, 219125,
+    331090, 367216,
+    337311, 316933,
+    397481, 427492,
+    321979, 348683,
+    381179, 310881,
+    386595, 337908,
+    347894, 385473,
+    457274, 487262,
+    418073, 470981,
+    420080, 443160,
+    477090, 426865,
+    580222, 506511,
+    512761, 461144,
+    515806, 512847,
+    522589, 467314,
+    528576, 489859,
+    587213, 601435,
+    552012, 606285,
+    572426, 557692,
+    633333, 541024,
+    581531, 574939,
+    605393, 618761,
+    679174, 643609,
+    618820, 634266,
+    658967, 622106,
+    591403, 575368,
+    698768, 583963,
+    632195, 714347,
+    672321, 647342,
+    745776, 797739,
+    671210, 709816,
+    763866, 696377,
+    754923, 812829,
+    767682, 720945,
+    789858, 731290,
+    746112, 800013,
+    776942, 740323,
+    750872, 829195,
+    774281, 822181,
+    826485, 859416,
+    816588, 761631,
+    866750, 815112,
+    734075, 843467,
+    815958, 924596,
+    860619, 861028,
+    813707, 833624,
+    886793, 878158,
+    855935, 841418,
+    844548, 894121,
+    888821, 879442,
+    780927, 926431,
+    901826, 881327,
+    949071, 843438,
+    902796, 948531,
+    858487, 954587,
+    953659, 1010850,
+    963400, 934887,
+    946185, 973495,
+    1004011, 906726,
+    972353, 957475,
+    1015141, 992033,
+    975212, 1005631,
+    965400, 997719,
+    1083385, 995475,
+    998485, 1043916,
+    1035331, 1090049,
+    1066241, 1060870,
+    1071925, 1144234,
+    1108660, 1091150,
+    1088864, 1172439,
+    1157098, 1113802,
+    1141344, 1166256,
+    1103254, 1153483,
+    1143440, 1132442,
+    1186590, 1177778,
+    1223472, 1235812,
+    1204296, 1178754,
+    1132521, 1181880,
+    1152676, 1181554,
+    1155018, 1223402,
+    1235616, 1167344,
+    1336427, 1219683,
+    1308802, 1266004,
+    1246366, 1210083,
+    1285326, 1247966,
+    1230797, 1247791,
+    1359425, 1296132,
+    1359332, 1338966,
+    1355930, 1362510,
+    1273236, 1331110,
+    1359766, 1436190,
+    1439135, 1395665,
+    1392310, 1364146,
+    1414375, 1384281,
+    1441458, 1472638,
+    1438770, 1435536,
+    1441329, 1461204,
+    1443463, 1514607,
+    1417865, 1470859,
+    1460353, 1536173,
+    1508513, 1528805,
+    1494234, 1495123,
+    1482224, 1521164,
+    1485962, 1551970,
+    1597357, 1528591,
+];
@@ -3,7 +3,16 @@ mod test_registration;
 mod test_validation; 
 mod test_verifier;
 mod test_dynamic_falcon_inputs;
+mod test_escrow_setup;
+mod test_packing;
+mod test_compression;
+mod test_verifier_ntt;
+mod test_verifier_hint;
+mod test_sharding;
+mod test_escrow_manager;
 mod inputs {
     pub mod falcon_test_vectors_n512;
     pub mod falcon_test_vectors_n1024;
+    pub mod falcon_hint_vectors_n512;
+    pub mod falcon_hint_vectors_n1024;
 }
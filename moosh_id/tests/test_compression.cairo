@@ -0,0 +1,70 @@
+use core::array::{ArrayTrait, SpanTrait};
+use core::option::OptionTrait;
+use moosh_id::compression::decompress_s1;
+
+use super::inputs::falcon_test_vectors_n512::S1_N512;
+
+// S1_N512 in Falcon's compressed encoding, 31 bytes per felt
+// (scripts/felt_codec.py encode_compressed_s1)
+pub const S1_N512_COMPRESSED: [felt252; 20] = [
+    0xdca03a24369a9090fa3672cb3fdd4c68bf7b451e9fc3f4e21c69212caac298,
+    0x3f5abcc5674c83acc21c260fc926d648b1c6ed8818e5ef5e60b17525ffefd0,
+    0x996930ef5e88d9306815bba2e5f716addce1b0942e89b23a8742d3558efbbf,
+    0xeef090829d86829705214960b8081e61d269f7075379687f7eda255bbe8963,
+    0xe8d6d9c102b9c43e683142bbe8dcaf6e722177e56e2153f93679cb63f8522f,
+    0xd10f8e4855c42d7bcfad7f5af28be3ead9b58ac28f8ea3fd140ab1778faaf0,
+    0x75eb06d4f3a3687197fb74313de84f51a23b23cf79cfb26d00a614a6e0df20,
+    0x113a6dd0c8f9bc58f1af7fa9a8299875b9cddf6b2de66571220a7538f56963,
+    0xc0c8dd1846b27c514f06e7877e66628fd4f5a323a3568959b03f8507b9d39c,
+    0x4d73dc5721ed44deee164d94efad994861539d3e31ee87af539169493ad04c,
+    0xba3a92053e87db622589d397d69dccebf30995df1086114bb34e1ab22555ed,
+    0x34645df0885592ca3fe9ff7fd9e79989bf976b6e4187e82f9123abf8713ff1,
+    0xd5219fcd9f7d52af6b8b43727be78a8f981c88c93a2beabe18dfb9da9c8c56,
+    0x819e77a7770511bb78b20b2cb3eb0990bf5744d88c4bca5e2526dfd0dcb7b6,
+    0xe7b9542aeaa66fa4882b3a8bbc8996c1cc3296a8cc19e344d3a20afab2de9d,
+    0x6e1ae361f77e6b7674754183329de92604c351f0d748a36ed82848064f1310,
+    0x541045175ced5eb5535d1565cb368bee1d1e25a306d961f39db59d0cf3c0be,
+    0x728cd2f2584aecdeb3c65719798edded964a29fe021e30bcbc234170fab4ff,
+    0xf8fe0bd70e2dc87e01f1a5ffb23196ee2cd8eeda97bbcf368ac918076f9be6,
+    0x8db53dff534b57eca52cca012943691a2e55f88df7f8d00000000000000000,
+];
+
+#[test]
+fn test_decompress_s1_matches_uncompressed_vector() {
+    let s1 = decompress_s1(S1_N512_COMPRESSED.span(), 512).unwrap();
+    let expected = S1_N512.span();
+    assert(s1.len() == expected.len(), 'Length mismatch');
+    let mut i: usize = 0;
+    while i < expected.len() {
+        assert(*s1.at(i) == *expected.at(i), 'Coeff mismatch');
+        i += 1;
+    }
+}
+
+#[test]
+fn test_decompress_s1_rejects_truncated_input() {
+    let words = S1_N512_COMPRESSED.span();
+    assert(decompress_s1(words.slice(0, words.len() - 1), 512).is_none(), 'Should reject truncated');
+}
+
+#[test]
+fn test_decompress_s1_rejects_trailing_bits() {
+    // Coefficient 0 (bits 00000000 1), then a stray 1 bit
+    let words = array![0xc00000000000000000000000000000000000000000000000000000000000];
+    assert(decompress_s1(words.span(), 1).is_none(), 'Should reject trailing bits');
+}
+
+#[test]
+fn test_decompress_s1_rejects_negative_zero() {
+    // Sign bit set with value 0: 10000000 1
+    let words = array![0x80800000000000000000000000000000000000000000000000000000000000];
+    assert(decompress_s1(words.span(), 1).is_none(), 'Should reject -0');
+}
+
+#[test]
+fn test_decompress_s1_decodes_negative_coefficient() {
+    // -1: sign 1, low bits 0000001, high terminator -> 10000001 1
+    let words = array![0x81800000000000000000000000000000000000000000000000000000000000];
+    let s1 = decompress_s1(words.span(), 1).unwrap();
+    assert(*s1.at(0) == 12288, 'Expected Q - 1');
+}
@@ -24,7 +24,7 @@ fn test_verify_n512() {
     // Then deploy the verifier, passing the registry's address
     let verifier_contract = declare("FalconSignatureVerifier").unwrap().contract_class();
     let (verifier_address, _) = verifier_contract
-        .deploy(@array![registry.contract_address.into()])
+        .deploy(@array![registry.contract_address.into(), false.into()])
         .unwrap();
     
     let verifier = IFalconSignatureVerifierDispatcher { 
@@ -62,7 +62,7 @@ fn test_verify_n1024() {
     // Then deploy the verifier, passing the registry's address
     let verifier_contract = declare("FalconSignatureVerifier").unwrap().contract_class();
     let (verifier_address, _) = verifier_contract
-        .deploy(@array![registry.contract_address.into()])
+        .deploy(@array![registry.contract_address.into(), false.into()])
         .unwrap();
     
     let verifier = IFalconSignatureVerifierDispatcher { 
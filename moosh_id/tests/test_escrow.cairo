@@ -62,7 +62,7 @@ fn deploy_key_registry() -> IFalconPublicKeyRegistryDispatcher {
 // Helper function to deploy the verifier
 fn deploy_verifier(key_registry_addr: ContractAddress) -> IFalconSignatureVerifierDispatcher {
     let contract = declare("FalconSignatureVerifier").unwrap().contract_class();
-    let constructor_args = array![key_registry_addr.into()];
+    let constructor_args = array![key_registry_addr.into(), false.into()];
     let (contract_address, _) = contract.deploy(@constructor_args).unwrap();
     IFalconSignatureVerifierDispatcher { contract_address }
 }
@@ -0,0 +1,160 @@
+use core::poseidon::poseidon_hash_span;
+use moosh_id::escrow_manager::EscrowManager::{IEscrowManagerDispatcher, IEscrowManagerDispatcherTrait};
+use moosh_id::keyregistry::FalconPublicKeyRegistry::{
+    IFalconPublicKeyRegistryDispatcher, IFalconPublicKeyRegistryDispatcherTrait,
+};
+use moosh_id::packing::pack_u14_words;
+use openzeppelin::token::erc20::interface::{IERC20Dispatcher, IERC20DispatcherTrait};
+use snforge_std::{
+    ContractClassTrait, DeclareResultTrait, declare, start_cheat_block_number,
+    start_cheat_caller_address, stop_cheat_caller_address,
+};
+use starknet::ContractAddress;
+
+use super::inputs::falcon_test_vectors_n512::{MSG_POINT_N512, PK_N512};
+use super::test_compression::S1_N512_COMPRESSED;
+use super::test_utils::pk_u16_span_to_felt252_array_for_hash;
+
+const AMOUNT: u128 = 1000;
+const PERIOD: u64 = 100;
+const START_BLOCK: u64 = 1000;
+
+fn CLIENT() -> ContractAddress {
+    0x123.try_into().unwrap()
+}
+
+fn PROVIDER() -> ContractAddress {
+    0x456.try_into().unwrap()
+}
+
+#[derive(Drop, Copy)]
+struct Setup {
+    manager: IEscrowManagerDispatcher,
+    token: IERC20Dispatcher,
+    key_hash: felt252,
+}
+
+fn setup() -> Setup {
+    let token_contract = declare("ESCToken").unwrap().contract_class();
+    let (token_address, _) = token_contract
+        .deploy(@array![1000000, 0, CLIENT().into()])
+        .unwrap();
+    let token = IERC20Dispatcher { contract_address: token_address };
+
+    // Registry and verifier in one contract; the provider owns the key
+    let registry_contract = declare("FalconVerifierWithRegistry").unwrap().contract_class();
+    let (registry_address, _) = registry_contract.deploy(@array![]).unwrap();
+    let registry = IFalconPublicKeyRegistryDispatcher { contract_address: registry_address };
+    start_cheat_caller_address(registry_address, PROVIDER());
+    registry.register_public_key(PK_N512.span());
+    stop_cheat_caller_address(registry_address);
+    let key_hash = poseidon_hash_span(pk_u16_span_to_felt252_array_for_hash(PK_N512.span()).span());
+
+    let manager_contract = declare("EscrowManager").unwrap().contract_class();
+    let (manager_address, _) = manager_contract
+        .deploy(@array![registry_address.into(), registry_address.into(), token_address.into()])
+        .unwrap();
+    let manager = IEscrowManagerDispatcher { contract_address: manager_address };
+
+    start_cheat_caller_address(token_address, CLIENT());
+    token.approve(manager_address, 10 * AMOUNT.into());
+    stop_cheat_caller_address(token_address);
+    Setup { manager, token, key_hash }
+}
+
+fn create_escrow(setup: Setup) -> u64 {
+    let commitment = poseidon_hash_span(
+        pk_u16_span_to_felt252_array_for_hash(MSG_POINT_N512.span()).span(),
+    );
+    start_cheat_block_number(setup.manager.contract_address, START_BLOCK);
+    start_cheat_caller_address(setup.manager.contract_address, CLIENT());
+    let escrow_id = setup
+        .manager
+        .create_escrow(setup.key_hash, PROVIDER(), AMOUNT, PERIOD, 512, commitment);
+    stop_cheat_caller_address(setup.manager.contract_address);
+    escrow_id
+}
+
+#[test]
+fn test_create_escrow_takes_deposit() {
+    let setup = setup();
+    let escrow_id = create_escrow(setup);
+
+    assert(escrow_id == 1, 'First ID should be 1');
+    assert(setup.manager.get_escrow_count() == 1, 'Wrong escrow count');
+    assert(
+        setup.token.balance_of(setup.manager.contract_address) == AMOUNT.into(),
+        'Deposit not transferred',
+    );
+    let record = setup.manager.get_escrow(escrow_id);
+    assert(record.client == CLIENT(), 'Wrong client');
+    assert(record.provider == PROVIDER(), 'Wrong provider');
+    assert(record.service_start_block == START_BLOCK, 'Wrong start block');
+    assert(!record.is_claimed && !record.is_disputed, 'Wrong initial state');
+}
+
+#[test]
+fn test_get_escrows_batch() {
+    let setup = setup();
+    let first = create_escrow(setup);
+    let second = create_escrow(setup);
+
+    let records = setup.manager.get_escrows(array![second, first].span());
+    assert(records.len() == 2, 'Wrong record count');
+    assert(*records.at(0).total_amount == AMOUNT, 'Wrong amount');
+    assert(setup.token.balance_of(setup.manager.contract_address) == (2 * AMOUNT).into(), 'Wrong balance');
+}
+
+#[test]
+fn test_claim_pays_provider() {
+    let setup = setup();
+    let escrow_id = create_escrow(setup);
+
+    start_cheat_block_number(setup.manager.contract_address, START_BLOCK + PERIOD);
+    let msg_point_packed = pack_u14_words(MSG_POINT_N512.span());
+    assert(
+        setup.manager.claim(escrow_id, S1_N512_COMPRESSED.span(), msg_point_packed.span()),
+        'Claim failed',
+    );
+
+    assert(setup.token.balance_of(PROVIDER()) == AMOUNT.into(), 'Provider not paid');
+    assert(setup.manager.get_escrow(escrow_id).is_claimed, 'Not marked claimed');
+}
+
+#[test]
+#[should_panic(expected: ('Service period not complete',))]
+fn test_claim_before_completion_panics() {
+    let setup = setup();
+    let escrow_id = create_escrow(setup);
+
+    start_cheat_block_number(setup.manager.contract_address, START_BLOCK + PERIOD - 1);
+    let msg_point_packed = pack_u14_words(MSG_POINT_N512.span());
+    setup.manager.claim(escrow_id, S1_N512_COMPRESSED.span(), msg_point_packed.span());
+}
+
+#[test]
+fn test_dispute_midway_splits_deposit() {
+    let setup = setup();
+    let escrow_id = create_escrow(setup);
+    let client_balance_before = setup.token.balance_of(CLIENT());
+
+    start_cheat_block_number(setup.manager.contract_address, START_BLOCK + PERIOD / 4);
+    start_cheat_caller_address(setup.manager.contract_address, CLIENT());
+    assert(setup.manager.dispute(escrow_id), 'Dispute failed');
+
+    assert(setup.token.balance_of(PROVIDER()) == (AMOUNT / 4).into(), 'Wrong provider share');
+    assert(
+        setup.token.balance_of(CLIENT()) == client_balance_before + (3 * AMOUNT / 4).into(),
+        'Wrong client refund',
+    );
+    assert(setup.manager.get_escrow(escrow_id).is_disputed, 'Not marked disputed');
+}
+
+#[test]
+#[should_panic(expected: ('Only client can call',))]
+fn test_dispute_by_other_account_panics() {
+    let setup = setup();
+    let escrow_id = create_escrow(setup);
+    start_cheat_caller_address(setup.manager.contract_address, PROVIDER());
+    setup.manager.dispute(escrow_id);
+}
@@ -0,0 +1,90 @@
+use core::poseidon::poseidon_hash_span;
+use moosh_id::escrow::Escrow::{IEscrowDispatcher, IEscrowDispatcherTrait};
+use snforge_std::{declare, ContractClassTrait, DeclareResultTrait, start_cheat_caller_address};
+use starknet::ContractAddress;
+
+use super::inputs::falcon_test_vectors_n512::MSG_POINT_N512;
+use super::test_utils::pk_u16_span_to_felt252_array_for_hash;
+
+// Escrow setup and view tests; these do not touch the token or the verifier
+fn CLIENT() -> ContractAddress {
+    0x123.try_into().unwrap()
+}
+
+fn PROVIDER() -> ContractAddress {
+    0x456.try_into().unwrap()
+}
+
+/// Deploys an Escrow with placeholder dependency addresses
+pub fn deploy_escrow_without_dependencies() -> IEscrowDispatcher {
+    let contract = declare("Escrow").unwrap().contract_class();
+    let constructor_args = array![
+        0x789, // provider_key_hash
+        1000, // total_amount
+        100, // service_period_blocks
+        0x1, // verifier
+        0x2, // key_registry
+        0x3, // strk_token
+        CLIENT().into(),
+        PROVIDER().into(),
+    ];
+    let (contract_address, _) = contract.deploy(@constructor_args).unwrap();
+    IEscrowDispatcher { contract_address }
+}
+
+#[test]
+fn test_get_message_point_returns_stored_point() {
+    let escrow = deploy_escrow_without_dependencies();
+    start_cheat_caller_address(escrow.contract_address, CLIENT());
+
+    let msg_point = MSG_POINT_N512.span();
+    escrow.set_message_points(msg_point);
+
+    let stored = escrow.get_message_point();
+    assert(stored.len() == msg_point.len(), 'Msg point length mismatch');
+    let mut i: usize = 0;
+    while i < msg_point.len() {
+        assert(*stored.at(i) == *msg_point.at(i), 'Msg point coeff mismatch');
+        i += 1;
+    }
+}
+
+#[test]
+fn test_get_message_point_empty_before_set() {
+    let escrow = deploy_escrow_without_dependencies();
+    assert(escrow.get_message_point().len() == 0, 'Should be empty');
+}
+
+fn msg_point_commitment(msg_point: Span<u16>) -> felt252 {
+    poseidon_hash_span(pk_u16_span_to_felt252_array_for_hash(msg_point).span())
+}
+
+#[test]
+fn test_set_message_point_commitment() {
+    let escrow = deploy_escrow_without_dependencies();
+    start_cheat_caller_address(escrow.contract_address, CLIENT());
+
+    let commitment = msg_point_commitment(MSG_POINT_N512.span());
+    assert(escrow.set_message_point_commitment(512, commitment), 'Commitment not set');
+    assert(escrow.get_message_point_commitment() == commitment, 'Commitment mismatch');
+    // Only the commitment is stored, so there is no point to read back
+    assert(escrow.get_message_point().len() == 0, 'Should be empty');
+}
+
+#[test]
+#[should_panic(expected: ('Message already set',))]
+fn test_commitment_after_message_points_panics() {
+    let escrow = deploy_escrow_without_dependencies();
+    start_cheat_caller_address(escrow.contract_address, CLIENT());
+
+    escrow.set_message_points(MSG_POINT_N512.span());
+    escrow.set_message_point_commitment(512, msg_point_commitment(MSG_POINT_N512.span()));
+}
+
+#[test]
+#[should_panic(expected: ('Only client can call',))]
+fn test_commitment_only_client() {
+    let escrow = deploy_escrow_without_dependencies();
+    start_cheat_caller_address(escrow.contract_address, PROVIDER());
+    escrow.set_message_point_commitment(512, 1);
+}
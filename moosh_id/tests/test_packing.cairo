@@ -0,0 +1,73 @@
+use core::array::{ArrayTrait, SpanTrait};
+use core::option::OptionTrait;
+use moosh_id::packing::{pack_u14_words, packed_len, unpack_u14_words};
+
+use super::inputs::falcon_test_vectors_n512::PK_N512;
+use super::inputs::falcon_test_vectors_n1024::PK_N1024;
+
+fn assert_round_trip(coeffs: Span<u16>, expected_words: u32) {
+    let words = pack_u14_words(coeffs);
+    assert(words.len() == expected_words, 'Packed length mismatch');
+    assert(packed_len(coeffs.len()) == expected_words, 'packed_len mismatch');
+
+    let unpacked = unpack_u14_words(words.span(), coeffs.len()).unwrap();
+    assert(unpacked.len() == coeffs.len(), 'Unpacked length mismatch');
+    let mut i: usize = 0;
+    while i < coeffs.len() {
+        assert(*unpacked.at(i) == *coeffs.at(i), 'Coeff mismatch');
+        i += 1;
+    }
+}
+
+#[test]
+fn test_pack_round_trip_n512() {
+    assert_round_trip(PK_N512.span(), 31);
+}
+
+#[test]
+fn test_pack_round_trip_n1024() {
+    assert_round_trip(PK_N1024.span(), 61);
+}
+
+#[test]
+fn test_pack_layout() {
+    // Coefficient j of a word sits at bit 14 * j of the low half, or 14 * (j - 9) of the high half
+    let mut coeffs = ArrayTrait::new();
+    let mut i: u16 = 0;
+    while i < 17 {
+        coeffs.append(if i == 0 || i == 9 {
+            1
+        } else {
+            0
+        });
+        i += 1;
+    }
+    let words = pack_u14_words(coeffs.span());
+    assert(*words.at(0) == 0x100000000000000000000000000000001, 'Unexpected layout');
+}
+
+#[test]
+fn test_unpack_rejects_wrong_word_count() {
+    let words = pack_u14_words(PK_N512.span());
+    assert(unpack_u14_words(words.span(), 1024).is_none(), 'Should reject word count');
+}
+
+#[test]
+fn test_unpack_rejects_coefficient_out_of_range() {
+    // 12289 = Q in the first coefficient
+    let words = array![12289];
+    assert(unpack_u14_words(words.span(), 1).is_none(), 'Should reject coeff >= Q');
+}
+
+#[test]
+fn test_unpack_rejects_non_canonical_padding() {
+    // One coefficient, but a bit set above it
+    let words = array![0x4000 + 5];
+    assert(unpack_u14_words(words.span(), 1).is_none(), 'Should reject padding bits');
+}
+
+#[test]
+#[should_panic(expected: ('Coefficient out of range',))]
+fn test_pack_rejects_coefficient_out_of_range() {
+    pack_u14_words(array![12289_u16].span());
+}
@@ -2,8 +2,9 @@ use core::array::ArrayTrait;
 use core::poseidon::poseidon_hash_span;
 use core::traits::TryInto;
 use moosh_id::keyregistry::FalconPublicKeyRegistry::{
-    IFalconPublicKeyRegistryDispatcherTrait, PK_SIZE_512,
+    IFalconPublicKeyRegistryDispatcherTrait, KeyRegistrationStatus, PK_SIZE_1024, PK_SIZE_512,
 };
+use moosh_id::packing::pack_u14_words;
 use snforge_std::{CheatSpan, cheat_caller_address, start_cheat_caller_address_global};
 use starknet::ContractAddress;
 use super::test_utils::{deploy_registry, generate_dummy_pk, pk_u16_span_to_felt252_array_for_hash};
@@ -117,3 +118,80 @@ fn test_key_owner_tracking() {
     // This should now pass because the registration was done by `registrant_actor`.
     assert(key_owner == registrant_actor, 'Key owner must be registrant');
 }
+
+#[test]
+fn test_register_packed_pk_uses_same_key_hash() {
+    let mut dispatcher = deploy_registry();
+    let pk_to_register = generate_dummy_pk(400_u16, PK_SIZE_512);
+    let packed_words = pack_u14_words(pk_to_register.span());
+    assert(packed_words.len() == 31, 'Expected 31 packed words');
+
+    assert(dispatcher.register_public_key_packed(packed_words.span()), 'Packed registration fails');
+
+    let expected_key_hash = poseidon_hash_span(
+        pk_u16_span_to_felt252_array_for_hash(pk_to_register.span()).span(),
+    );
+    let retrieved_pk_array = dispatcher.get_public_key(expected_key_hash);
+    assert(retrieved_pk_array.len() == pk_to_register.len(), 'Retrieved PK length mismatch');
+    let mut i: usize = 0;
+    while i < pk_to_register.len() {
+        assert(*retrieved_pk_array.at(i) == *pk_to_register.at(i), 'PK coeff mismatch');
+        i += 1;
+    }
+
+    // Same key through the unpacked entry point is a duplicate
+    assert(!dispatcher.register_public_key(pk_to_register.span()), 'Duplicate should fail');
+}
+
+#[should_panic(expected: ('Invalid packed PK size',))]
+#[test]
+fn test_register_packed_pk_invalid_word_count_panics() {
+    let mut dispatcher = deploy_registry();
+    dispatcher.register_public_key_packed(array![1, 2, 3].span());
+}
+
+#[should_panic(expected: ('Non-canonical packed PK',))]
+#[test]
+fn test_register_packed_pk_non_canonical_panics() {
+    let mut dispatcher = deploy_registry();
+    let packed_words = pack_u14_words(generate_dummy_pk(500_u16, PK_SIZE_512).span());
+    // Set a padding bit in the last word, which only holds 512 - 30 * 17 = 2 coefficients
+    let mut tampered = ArrayTrait::new();
+    let mut i: usize = 0;
+    while i < packed_words.len() {
+        let word = *packed_words.at(i);
+        tampered.append(if i == packed_words.len() - 1 {
+            word + 0x10000000
+        } else {
+            word
+        });
+        i += 1;
+    }
+    dispatcher.register_public_key_packed(tampered.span());
+}
+
+#[test]
+fn test_register_public_keys_batch_statuses() {
+    let mut dispatcher = deploy_registry();
+    let pk_a = generate_dummy_pk(100_u16, PK_SIZE_512);
+    let pk_b = generate_dummy_pk(200_u16, PK_SIZE_1024);
+    let packed_a = pack_u14_words(pk_a.span());
+    let packed_b = pack_u14_words(pk_b.span());
+
+    let statuses = dispatcher
+        .register_public_keys_batch(
+            array![packed_a.span(), array![1, 2, 3].span(), packed_b.span(), packed_a.span()]
+                .span(),
+        );
+    assert(
+        statuses == array![
+            KeyRegistrationStatus::Registered, KeyRegistrationStatus::Invalid,
+            KeyRegistrationStatus::Registered, KeyRegistrationStatus::AlreadyRegistered,
+        ],
+        'Unexpected batch statuses',
+    );
+
+    // Batch-registered keys are stored like single registrations
+    let key_hash_b = poseidon_hash_span(pk_u16_span_to_felt252_array_for_hash(pk_b.span()).span());
+    assert(dispatcher.get_public_key(key_hash_b).span() == pk_b.span(), 'PK mismatch');
+}
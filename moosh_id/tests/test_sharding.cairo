@@ -0,0 +1,95 @@
+use core::poseidon::poseidon_hash_span;
+use moosh_id::addressverifier::FalconSignatureVerifier::{
+    IFalconSignatureVerifierDispatcher, IFalconSignatureVerifierDispatcherTrait,
+};
+use moosh_id::keyregistry::FalconPublicKeyRegistry::{
+    IFalconPublicKeyRegistryDispatcher, IFalconPublicKeyRegistryDispatcherTrait,
+};
+use snforge_std::{
+    CheatSpan, ContractClassTrait, DeclareResultTrait, cheat_caller_address, declare,
+    start_cheat_account_contract_address_global,
+};
+use starknet::ContractAddress;
+
+use super::inputs::falcon_test_vectors_n512::{MSG_POINT_N512, PK_N512, S1_N512};
+use super::test_utils::{deploy_registry, pk_u16_span_to_felt252_array_for_hash};
+
+const SHARD_COUNT: u32 = 3;
+
+fn ADMIN() -> ContractAddress {
+    'admin'.try_into().unwrap()
+}
+
+fn deploy_sharded() -> (Array<IFalconPublicKeyRegistryDispatcher>, IFalconSignatureVerifierDispatcher) {
+    let mut shards = ArrayTrait::new();
+    let mut shard_addresses = ArrayTrait::new();
+    let mut i: u32 = 0;
+    while i < SHARD_COUNT {
+        let registry = deploy_registry();
+        shard_addresses.append(registry.contract_address);
+        shards.append(registry);
+        i += 1;
+    }
+
+    // The verifier's admin is the account sending the deployment
+    start_cheat_account_contract_address_global(ADMIN());
+    let verifier_contract = declare("FalconSignatureVerifier").unwrap().contract_class();
+    let (verifier_address, _) = verifier_contract
+        .deploy(@array![(*shard_addresses.at(0)).into(), false.into()])
+        .unwrap();
+    let verifier = IFalconSignatureVerifierDispatcher { contract_address: verifier_address };
+
+    cheat_caller_address(verifier_address, ADMIN(), CheatSpan::TargetCalls(1));
+    verifier.set_registry_shards(shard_addresses.span());
+    (shards, verifier)
+}
+
+fn shard_index(key_hash: felt252) -> u32 {
+    let key_hash_u256: u256 = key_hash.into();
+    (key_hash_u256 % SHARD_COUNT.into()).try_into().unwrap()
+}
+
+#[test]
+fn test_verify_with_key_on_its_shard() {
+    let (shards, verifier) = deploy_sharded();
+    let key_hash = poseidon_hash_span(pk_u16_span_to_felt252_array_for_hash(PK_N512.span()).span());
+    let shard = *shards.at(shard_index(key_hash));
+    assert(shard.register_public_key(PK_N512.span()), 'Registration should succeed');
+
+    assert(verifier.get_registry_shards().len() == SHARD_COUNT, 'Shard count mismatch');
+    let result = verifier
+        .verify_signature_for_key_hash(key_hash, S1_N512.span(), MSG_POINT_N512.span());
+    assert(result, 'Signature verification failed');
+}
+
+#[test]
+#[should_panic]
+fn test_key_on_wrong_shard_is_not_found() {
+    let (shards, verifier) = deploy_sharded();
+    let key_hash = poseidon_hash_span(pk_u16_span_to_felt252_array_for_hash(PK_N512.span()).span());
+    let wrong_shard = *shards.at((shard_index(key_hash) + 1) % SHARD_COUNT);
+    wrong_shard.register_public_key(PK_N512.span());
+
+    verifier.verify_signature_for_key_hash(key_hash, S1_N512.span(), MSG_POINT_N512.span());
+}
+
+#[test]
+#[should_panic(expected: ('Shards already set',))]
+fn test_shards_can_only_be_set_once() {
+    let (shards, verifier) = deploy_sharded();
+    cheat_caller_address(verifier.contract_address, ADMIN(), CheatSpan::TargetCalls(1));
+    verifier.set_registry_shards(array![(*shards.at(0)).contract_address].span());
+}
+
+#[test]
+#[should_panic(expected: ('Only admin can set shards',))]
+fn test_only_admin_sets_shards() {
+    let registry = deploy_registry();
+    start_cheat_account_contract_address_global(ADMIN());
+    let verifier_contract = declare("FalconSignatureVerifier").unwrap().contract_class();
+    let (verifier_address, _) = verifier_contract
+        .deploy(@array![registry.contract_address.into(), false.into()])
+        .unwrap();
+    let verifier = IFalconSignatureVerifierDispatcher { contract_address: verifier_address };
+    verifier.set_registry_shards(array![registry.contract_address].span());
+}
@@ -9,6 +9,7 @@ use moosh_id::addressverifier::FalconSignatureVerifier::{
     IFalconSignatureVerifierDispatcher,
     IFalconSignatureVerifierDispatcherTrait
 };
+use moosh_id::keyregistry::FalconPublicKeyRegistry::IFalconPublicKeyRegistryDispatcher;
 
 use super::test_utils::{deploy_registry, pk_u16_span_to_felt252_array_for_hash};
 
@@ -246,7 +247,7 @@ fn test_deploy_contracts() {
     // Then deploy the verifier, passing the registry's address
     let verifier_contract = declare("FalconSignatureVerifier").unwrap().contract_class();
     let (verifier_address, _) = verifier_contract
-        .deploy(@array![registry.contract_address.into()])
+        .deploy(@array![registry.contract_address.into(), false.into()])
         .unwrap();
     
     let verifier = IFalconSignatureVerifierDispatcher { 
@@ -276,4 +277,30 @@ fn test_deploy_contracts() {
     );
 
     assert(result == true, 'Signature verification failed');
-} 
\ No newline at end of file
+}
+
+// Same check against FalconVerifierWithRegistry, which reads the key from its own
+// storage; compare with test_deploy_contracts using
+// `make bench-verify-colocated`, which records both in bench/verify_colocated.md
+#[test]
+fn test_deploy_colocated_contract() {
+    let contract = declare("FalconVerifierWithRegistry").unwrap().contract_class();
+    let (contract_address, _) = contract.deploy(@array![]).unwrap();
+    let registry = IFalconPublicKeyRegistryDispatcher { contract_address };
+    let verifier = IFalconSignatureVerifierDispatcher { contract_address };
+
+    let pk_span = PK_N1024.span();
+    let success = registry.register_public_key(pk_span);
+    assert(success, 'Registration should succeed');
+
+    let pk_felts = pk_u16_span_to_felt252_array_for_hash(pk_span);
+    let key_hash = poseidon_hash_span(pk_felts.span());
+
+    let result = verifier.verify_signature_for_key_hash(
+        key_hash,
+        S1_N1024.span(),
+        MSG_POINT_N1024.span()
+    );
+
+    assert(result == true, 'Signature verification failed');
+}
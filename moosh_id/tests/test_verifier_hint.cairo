@@ -0,0 +1,125 @@
+use core::poseidon::poseidon_hash_span;
+use moosh_id::addressverifier::FalconSignatureVerifier::{
+    IFalconSignatureVerifierDispatcher, IFalconSignatureVerifierDispatcherTrait,
+};
+use moosh_id::keyregistry::FalconPublicKeyRegistry::{
+    IFalconPublicKeyRegistryDispatcher, IFalconPublicKeyRegistryDispatcherTrait,
+};
+use snforge_std::{ContractClassTrait, DeclareResultTrait, declare};
+
+use super::inputs::falcon_hint_vectors_n1024::{HINT_C_N1024, HINT_S0_N1024, HINT_T_N1024};
+use super::inputs::falcon_hint_vectors_n512::{HINT_C_N512, HINT_S0_N512, HINT_T_N512};
+use super::inputs::falcon_test_vectors_n1024::{MSG_POINT_N1024, PK_N1024, S1_N1024};
+use super::inputs::falcon_test_vectors_n512::{MSG_POINT_N512, PK_N512, S1_N512};
+use super::test_utils::{deploy_registry, pk_u16_span_to_felt252_array_for_hash};
+
+// Compare with test_verify_n512 / test_verify_n1024 (test_dynamic_falcon_inputs) using
+// `snforge test test_verify_n --detailed-resources` (make bench-verify)
+
+fn deploy_verifier(registry: IFalconPublicKeyRegistryDispatcher) -> IFalconSignatureVerifierDispatcher {
+    let verifier_contract = declare("FalconSignatureVerifier").unwrap().contract_class();
+    let (verifier_address, _) = verifier_contract
+        .deploy(@array![registry.contract_address.into(), false.into()])
+        .unwrap();
+    IFalconSignatureVerifierDispatcher { contract_address: verifier_address }
+}
+
+fn register(registry: IFalconPublicKeyRegistryDispatcher, pk: Span<u16>) -> felt252 {
+    assert(registry.register_public_key(pk), 'Registration should succeed');
+    poseidon_hash_span(pk_u16_span_to_felt252_array_for_hash(pk).span())
+}
+
+#[test]
+fn test_verify_n512_hint() {
+    let registry = deploy_registry();
+    let verifier = deploy_verifier(registry);
+    let key_hash = register(registry, PK_N512.span());
+
+    let result = verifier
+        .verify_signature_for_key_hash_with_hint(
+            key_hash,
+            S1_N512.span(),
+            MSG_POINT_N512.span(),
+            HINT_S0_N512.span(),
+            HINT_T_N512.span(),
+            HINT_C_N512.span(),
+        );
+    assert(result, 'Signature verification failed');
+}
+
+#[test]
+fn test_verify_n1024_hint() {
+    let registry = deploy_registry();
+    let verifier = deploy_verifier(registry);
+    let key_hash = register(registry, PK_N1024.span());
+
+    let result = verifier
+        .verify_signature_for_key_hash_with_hint(
+            key_hash,
+            S1_N1024.span(),
+            MSG_POINT_N1024.span(),
+            HINT_S0_N1024.span(),
+            HINT_T_N1024.span(),
+            HINT_C_N1024.span(),
+        );
+    assert(result, 'Signature verification failed');
+}
+
+#[test]
+fn test_verify_hint_rejects_tampered_s0() {
+    let registry = deploy_registry();
+    let verifier = deploy_verifier(registry);
+    let key_hash = register(registry, PK_N512.span());
+
+    // A smaller s0 would only lower the norm, so it must be the identity that fails
+    let mut s0 = array![0_u16];
+    s0.append_span(HINT_S0_N512.span().slice(1, 511));
+    let result = verifier
+        .verify_signature_for_key_hash_with_hint(
+            key_hash,
+            S1_N512.span(),
+            MSG_POINT_N512.span(),
+            s0.span(),
+            HINT_T_N512.span(),
+            HINT_C_N512.span(),
+        );
+    assert(!result, 'Should not verify');
+}
+
+#[test]
+fn test_verify_hint_rejects_wrong_message() {
+    let registry = deploy_registry();
+    let verifier = deploy_verifier(registry);
+    let key_hash = register(registry, PK_N512.span());
+
+    let result = verifier
+        .verify_signature_for_key_hash_with_hint(
+            key_hash,
+            S1_N512.span(),
+            MSG_POINT_N1024.span().slice(0, 512),
+            HINT_S0_N512.span(),
+            HINT_T_N512.span(),
+            HINT_C_N512.span(),
+        );
+    assert(!result, 'Should not verify');
+}
+
+#[test]
+fn test_verify_hint_rejects_large_carry() {
+    let registry = deploy_registry();
+    let verifier = deploy_verifier(registry);
+    let key_hash = register(registry, PK_N512.span());
+
+    let mut c = array![0x100000000];
+    c.append_span(HINT_C_N512.span().slice(1, 511));
+    let result = verifier
+        .verify_signature_for_key_hash_with_hint(
+            key_hash,
+            S1_N512.span(),
+            MSG_POINT_N512.span(),
+            HINT_S0_N512.span(),
+            HINT_T_N512.span(),
+            c.span(),
+        );
+    assert(!result, 'Should not verify');
+}
@@ -0,0 +1,128 @@
+use core::poseidon::poseidon_hash_span;
+use falcon::ntt::ntt;
+use moosh_id::addressverifier::FalconSignatureVerifier::{
+    IFalconSignatureVerifierDispatcher, IFalconSignatureVerifierDispatcherTrait,
+};
+use moosh_id::keyregistry::FalconPublicKeyRegistry::{
+    IFalconPublicKeyRegistryDispatcher, IFalconPublicKeyRegistryDispatcherTrait,
+};
+use moosh_id::packing::pack_u14_words;
+use snforge_std::fs::{FileTrait, read_txt};
+use snforge_std::{ContractClassTrait, DeclareResultTrait, declare};
+
+use super::inputs::falcon_test_vectors_n1024::{MSG_POINT_N1024, PK_N1024, S1_N1024};
+use super::inputs::falcon_test_vectors_n512::{MSG_POINT_N512, PK_N512, S1_N512};
+use super::test_utils::{deploy_registry, pk_u16_span_to_felt252_array_for_hash};
+
+// Compare with test_verify_n512 / test_verify_n1024 (test_dynamic_falcon_inputs) using
+// `snforge test test_verify_n --detailed-resources` (make bench-verify)
+
+fn deploy_verifier(
+    registry: IFalconPublicKeyRegistryDispatcher, use_ntt_keys: bool,
+) -> IFalconSignatureVerifierDispatcher {
+    let verifier_contract = declare("FalconSignatureVerifier").unwrap().contract_class();
+    let (verifier_address, _) = verifier_contract
+        .deploy(@array![registry.contract_address.into(), use_ntt_keys.into()])
+        .unwrap();
+    IFalconSignatureVerifierDispatcher { contract_address: verifier_address }
+}
+
+fn register_with_ntt(registry: IFalconPublicKeyRegistryDispatcher, pk: Span<u16>) -> felt252 {
+    let pk_packed = pack_u14_words(pk);
+    let pk_ntt_packed = pack_u14_words(ntt(pk));
+    assert(
+        registry.register_public_key_ntt(pk_packed.span(), pk_ntt_packed.span()),
+        'Registration should succeed',
+    );
+    poseidon_hash_span(pk_u16_span_to_felt252_array_for_hash(pk).span())
+}
+
+#[test]
+fn test_verify_n512_ntt_key() {
+    let registry = deploy_registry();
+    let verifier = deploy_verifier(registry, true);
+    let key_hash = register_with_ntt(registry, PK_N512.span());
+
+    assert(registry.get_public_key_ntt(key_hash).len() == 512, 'NTT key not stored');
+    let result = verifier
+        .verify_signature_for_key_hash(key_hash, S1_N512.span(), MSG_POINT_N512.span());
+    assert(result, 'Signature verification failed');
+}
+
+#[test]
+fn test_verify_n1024_ntt_key() {
+    let registry = deploy_registry();
+    let verifier = deploy_verifier(registry, true);
+    let key_hash = register_with_ntt(registry, PK_N1024.span());
+
+    let result = verifier
+        .verify_signature_for_key_hash(key_hash, S1_N1024.span(), MSG_POINT_N1024.span());
+    assert(result, 'Signature verification failed');
+}
+
+#[test]
+fn test_verifier_without_ntt_keys_uses_the_key() {
+    // NTT lookups are opt-in: the key registered alongside is used instead
+    let registry = deploy_registry();
+    let verifier = deploy_verifier(registry, false);
+    let key_hash = register_with_ntt(registry, PK_N512.span());
+
+    let result = verifier
+        .verify_signature_for_key_hash(key_hash, S1_N512.span(), MSG_POINT_N512.span());
+    assert(result, 'Signature verification failed');
+}
+
+#[test]
+fn test_verify_ntt_key_rejects_wrong_message() {
+    let registry = deploy_registry();
+    let verifier = deploy_verifier(registry, true);
+    let key_hash = register_with_ntt(registry, PK_N512.span());
+
+    // The n=1024 message point truncated to 512 coefficients is not what was signed
+    let result = verifier
+        .verify_signature_for_key_hash(key_hash, S1_N512.span(), MSG_POINT_N1024.span().slice(0, 512));
+    assert(!result, 'Should not verify');
+}
+
+#[test]
+fn test_ntt_form_added_to_existing_key() {
+    let registry = deploy_registry();
+    registry.register_public_key(PK_N512.span());
+
+    let pk_packed = pack_u14_words(PK_N512.span());
+    let pk_ntt_packed = pack_u14_words(ntt(PK_N512.span()));
+    let key_hash = poseidon_hash_span(pk_u16_span_to_felt252_array_for_hash(PK_N512.span()).span());
+    assert(registry.get_public_key_ntt(key_hash).len() == 0, 'No NTT form yet');
+
+    // Already registered, so only the NTT form is recorded
+    assert(registry.register_public_key_ntt(pk_packed.span(), pk_ntt_packed.span()), 'NTT not added');
+    assert(registry.get_public_key_ntt(key_hash).len() == 512, 'NTT key not stored');
+    assert(registry.get_public_key(key_hash).span() == PK_N512.span(), 'Key changed');
+
+    // Nothing left to store
+    assert(!registry.register_public_key_ntt(pk_packed.span(), pk_ntt_packed.span()), 'Duplicate');
+}
+
+#[test]
+#[should_panic(expected: ('PK NTT mismatch',))]
+fn test_register_wrong_ntt_form_panics() {
+    let registry = deploy_registry();
+    let pk_packed = pack_u14_words(PK_N512.span());
+    // Packing of the key itself, not of its NTT
+    registry.register_public_key_ntt(pk_packed.span(), pk_packed.span());
+}
+
+// pk_to_ntt(PK_N512) from falcon_offchain, written by `make pk-ntt-vectors`: keys
+// registered from Python are only accepted if it uses the same order as ntt
+#[test]
+fn test_pk_to_ntt_matches_ntt() {
+    let expected = read_txt(@FileTrait::new("tests/inputs/pk_ntt_n512.txt"));
+    let actual = ntt(PK_N512.span());
+    assert(expected.len() == actual.len(), 'PK NTT length mismatch');
+    let mut i: usize = 0;
+    while i < actual.len() {
+        let coeff: felt252 = (*actual.at(i)).into();
+        assert(*expected.at(i) == coeff, 'PK NTT order mismatch');
+        i += 1;
+    }
+}
@@ -1,31 +1,32 @@
 import gradio as gr
 import asyncio
 import time
-import traceback
 
 # Import functions from your scripts directory
 from cairo_interactions import (
     deploy_new_contract_instance,
-    FALCON_KEY_REGISTRY_CONTRACT_HASH,
-    FALCON_ADDRESS_BASED_VERIFIER_CONTRACT_HASH,
     ESCROW_CONTRACT_HASH,
     NODE_URL,
     ESCROW_CONTRACT_HASH,
-    get_deployer_account,
-    call_register_public_key,
-    call_escrow_claim,
+    get_indexed_escrow_status,
+    call_escrow_dispute,
+    FALCON_VERIFIER_WITH_REGISTRY_CONTRACT_HASH,
 )
+from escrow_model import EscrowIndex
+from view_cache import VIEW_CACHE
 import utils
-from falcon import SecretKey
-from generate_inputs import generate_attestation
-from starknet_py.contract import Contract
-from starknet_py.net.full_node_client import FullNodeClient
-from utils import FALCON_ESCROW_ABI
+from provider_setup import run_provider_setup
+from claims import claim_provider_escrows_batched, parse_escrow_addresses
+from jobs import JobQueue
 
+# Upper bound on concurrent background deployments/registrations
+MAX_BACKGROUND_JOBS = 8
+# Upper bound on concurrent short UI callbacks (job progress streams are not counted)
+UI_CONCURRENCY_LIMIT = 4
 
-def sepolia_url_from_contract_address(contract_address):
-    url = f"https://sepolia.starkscan.co/contract/{contract_address}"
-    return url
+job_queue = JobQueue(max_workers=MAX_BACKGROUND_JOBS)
+# Escrow states for the status polling, updated from events
+escrow_index = EscrowIndex(on_event=lambda address, _: VIEW_CACHE.invalidate(address))
 
 
 def mainnnet_url_from_contract_address(contract_address):
@@ -106,67 +107,24 @@ with gr.Blocks(theme=gr.themes.Soft()) as demo:  # Added a soft theme for better
     ):
         """Fetches the current status of the escrow contract"""
         if not contract_address:
-            return "No contract deployed", 0, 0, 0, False, 0
-
-        try:
-            deployer_account = await get_deployer_account(private_key, account_address)
-            if not deployer_account:
-                return "Failed to initialize account", 0, 0, 0, False, 0
-
-            contract = Contract(
-                address=int(contract_address, 16),
-                abi=FALCON_ESCROW_ABI,
-                provider=deployer_account,
-            )
-
-            # Get current block number
-            client = FullNodeClient(node_url=NODE_URL)
-            current_block = await client.get_block_number()
-
-            # Get escrow details - returns a single struct
-            details = (await contract.functions["get_escrow_details"].call())[0]
-
-            # Access struct fields
-            service_start_block = details["service_start_block"]
-            service_period_blocks = details["service_period_blocks"]
-            is_disputed = details["is_disputed"]
-            is_deposited = details["is_deposited"]
-            total_amount = details["total_amount"]
-
-            if service_start_block == 0:
-                return (
-                    "Service not started",
-                    0,
-                    service_period_blocks,
-                    0,
-                    is_disputed,
-                    total_amount,
-                )
-
-            blocks_elapsed = current_block - service_start_block
-            blocks_remaining = max(0, service_period_blocks - blocks_elapsed)
-
-            status = "In Progress"
-            if blocks_remaining == 0:
-                status = "Completed"
-            elif is_disputed:
-                status = "Disputed"
-            elif not is_deposited:
-                status = "Awaiting Deposit"
-
-            return (
-                status,
-                blocks_elapsed,
-                service_period_blocks,
-                blocks_remaining,
-                is_disputed,
-                total_amount,
-            )
-
-        except Exception as e:
-            print(f"Error getting contract status: {e}")
-            traceback.print_exc()
-            return f"Error: {str(e)}", 0, 0, 0, False, 0
+            return "No contract deployed", 0, 0, 0, False, 0, 0
+
+        status, error = await get_indexed_escrow_status(escrow_index, contract_address)
+        if error:
+            return error, 0, 0, 0, False, 0, 0
+
+        # What a dispute right now would refund, from the local model
+        escrow = escrow_index.escrows[int(contract_address, 16)]
+        _, _, client_refund = escrow.dispute_payout(status["current_block"])
+        return (
+            status["status"],
+            status["blocks_elapsed"],
+            status["service_period_blocks"],
+            status["blocks_remaining"],
+            status["is_disputed"],
+            status["total_amount"],
+            client_refund,
+        )
 
     async def handle_dispute_action(
         contract_address: str, private_key: str, account_address: str
@@ -175,28 +133,12 @@ with gr.Blocks(theme=gr.themes.Soft()) as demo:  # Added a soft theme for better
         if not contract_address:
             return "No contract deployed"
 
-        try:
-            deployer_account = await get_deployer_account(private_key, account_address)
-            if not deployer_account:
-                return "Failed to initialize account"
-
-            contract = Contract(
-                address=int(contract_address, 16),
-                abi=FALCON_ESCROW_ABI,
-                provider=deployer_account,
-            )
-
-            # Call dispute function
-            invoke_result = await contract.functions["dispute"].invoke_v3(
-                auto_estimate=True
-            )
-
-            await invoke_result.wait_for_acceptance()
-            return f"Dispute initiated successfully. Transaction hash: {hex(invoke_result.hash)}"
-
-        except Exception as e:
-            print(f"Error disputing contract: {e}")
-            return f"Error: {str(e)}"
+        tx_hash, error = await call_escrow_dispute(
+            contract_address, private_key, account_address
+        )
+        if error:
+            return error
+        return f"Dispute initiated successfully. Transaction hash: {tx_hash}"
 
     def update_countdown(contract_address: str, private_key: str, account_address: str):
         """Updates the countdown display"""
@@ -215,19 +157,15 @@ with gr.Blocks(theme=gr.themes.Soft()) as demo:  # Added a soft theme for better
             blocks_remaining,
             is_disputed,
             total_amount,
+            client_refund,
         ) = asyncio.run(
             get_contract_status(contract_address, private_key, account_address)
         )
 
         progress = f"Blocks elapsed: {blocks_elapsed} / {total_blocks}"
-        # Calculate refund amount with proper STRK decimal handling (18 decimals)
+        # STRK has 18 decimals
         if blocks_elapsed > 0 and total_blocks > 0:
-            earned_amount = (total_amount * blocks_elapsed) // total_blocks
-            earned_amount_strk = earned_amount / (10**18)
-            total_amount_strk = total_amount / (10**18)  # Convert from wei to STRK
-            amount_refund = (
-                f"Amount to refund : {total_amount_strk - earned_amount_strk:.6f} STRK"
-            )
+            amount_refund = f"Amount to refund : {client_refund / (10**18):.6f} STRK"
         else:
             amount_refund = f"Total escrow amount: {total_amount / (10**18):.6f} STRK"
 
@@ -333,121 +271,78 @@ with gr.Blocks(theme=gr.themes.Soft()) as demo:  # Added a soft theme for better
             return f"Error deploying escrow contract: {str(e)}", None, None
 
     # --- Action Handler for Deployments (Provider Page) ---
-    def handle_deploy_contracts_action(current_pk_state, current_aa_state):
-        if not current_pk_state or not current_aa_state:
-            return "Error: Private Key or Account Address not set. Please go back and configure them."
-
-        results_log = []
-        final_message = ""
-        contract_address = ""
-
-        # 1. Deploy Key Registry
-        print(f"Deploying Falcon Key Registry. Account: {current_aa_state[:10]}...")
-        # Constructor args are empty for this example
-        kr_constructor_args = []
-        try:
-            contract_address_kr, tx_hash_kr = asyncio.run(
-                deploy_new_contract_instance(
-                    FALCON_KEY_REGISTRY_CONTRACT_HASH,
-                    current_pk_state,
-                    current_aa_state,
-                    kr_constructor_args,
-                )
-            )
-            if tx_hash_kr:
-                contract_address = contract_address_kr
-                contract_url = sepolia_url_from_contract_address(contract_address_kr)
-                results_log.append(
-                    f"Key Registry Deployment Initiated!\nContract Link: {contract_url}\nTx Hash: {tx_hash_kr}"
-                )
-            else:
-                results_log.append(f"Key Registry Deployment Failed: {contract_url}")
-        except Exception as e:
-            results_log.append(f"Key Registry Deployment Exception: {str(e)}")
-            print(f"Exception during Key Registry deployment: {e}")
-
-        # 2. Deploy Address-Based Verifier
-        print(f"Deploying Address-Based Verifier. Account: {current_aa_state[:10]}...")
-        # Assuming empty constructor args for verifier as well for this minimal example
-        contract_address = int(contract_address, 16)
-        ab_verifier_constructor_args = [contract_address]
-        try:
-            result_msg_verifier, tx_hash_verifier = asyncio.run(
-                deploy_new_contract_instance(
-                    FALCON_ADDRESS_BASED_VERIFIER_CONTRACT_HASH,
-                    current_pk_state,
-                    current_aa_state,
-                    ab_verifier_constructor_args,
-                )
-            )
-            if tx_hash_verifier:
-                results_log.append(
-                    f"Address Verifier Deployment Initiated!\nContract Link: {result_msg_verifier}\nTx Hash: {tx_hash_verifier}"
-                )
-            else:
-                results_log.append(
-                    f"Address Verifier Deployment Failed: {result_msg_verifier}"
-                )
-        except Exception as e:
-            results_log.append(f"Address Verifier Deployment Exception: {str(e)}")
-            print(f"Exception during Address Verifier deployment: {e}")
-
-        # Register a the provider key to use the hash in client escrow contract deployment
-        try:
-            N_FOR_KEY = 512  # Or 1024, or make it configurable in the UI
-            results_log.append(
-                f"\nGenerating Falcon-{N_FOR_KEY} public key coefficients..."
+    def deploy_provider_contracts(
+        report, current_pk_state, current_aa_state, colocated=False
+    ):
+        """
+        Job body for the provider setup: deploys the Key Registry and Verifier and
+        registers a freshly generated Falcon key. Progress is sent through report().
+        """
+        return asyncio.run(
+            run_provider_setup(
+                report, current_pk_state, current_aa_state, n=512, colocated=colocated
             )
+        )
 
-            pk_coeffs = generate_falcon_pk_coefficients(N_FOR_KEY)  # Call the function
-
-            results_log.append(f"Successfully generated {len(pk_coeffs)} coefficients.")
-            results_log.append(
-                f"Attempting to register public key on: {contract_address_kr}..."
+    def handle_deploy_contracts_action(current_pk_state, current_aa_state, colocated):
+        """
+        Queues the provider setup as a background job and streams its progress.
+        Yields (status_text, job_id) so the job can be followed again after a reload.
+        """
+        if not current_pk_state or not current_aa_state:
+            yield (
+                "Error: Private Key or Account Address not set. Please go back and configure them.",
+                "",
             )
-
-            # You'll need to create 'call_register_public_key' in cairo_interactions.py
-            # It will take the registry address, coefficients, and user credentials.
-            reg_status_msg, reg_tx_hash = asyncio.run(
-                call_register_public_key(  # This is a NEW function for cairo_interactions.py
-                    key_registry_contract_address=contract_address,
-                    pk_coefficients=pk_coeffs,
-                    deployer_private_key_hex=current_pk_state,
-                    deployer_account_address_hex=current_aa_state,
-                )
+            return
+        if colocated and not FALCON_VERIFIER_WITH_REGISTRY_CONTRACT_HASH:
+            yield (
+                "Error: Single-contract deployment needs MOOSH_VERIFIER_WITH_REGISTRY_CLASS_HASH "
+                "(the declared FalconVerifierWithRegistry class hash).",
+                "",
             )
-            if reg_tx_hash:
-                results_log.append(
-                    f"Public Key Registration Call Sent!\nStatus: {reg_status_msg}\nTransaction Hash: {reg_tx_hash}"
-                )
-            else:
-                results_log.append(
-                    f"Public Key Registration Call Failed: {reg_status_msg}"
-                )
-
-        except ValueError as ve:  # Catch errors from generate_falcon_pk_coefficients
-            results_log.append(f"Error generating public key: {str(ve)}")
-            print(f"ValueError during PK generation: {ve}")
-        except Exception as e:
-            error_msg = f"An error occurred during public key generation or registration: {str(e)}"
-            results_log.append(error_msg)
-            print(f"Exception during PK generation/registration step: {e}")
+            return
+
+        job = job_queue.submit(
+            "deploy_contracts",
+            deploy_provider_contracts,
+            current_pk_state,
+            current_aa_state,
+            colocated,
+        )
+        for status_text in job_queue.stream(job.id):
+            yield status_text, job.id
 
-        final_message = "\n\n---\n\n".join(results_log)
-        return final_message
+    def handle_follow_job_action(job_id: str):
+        """Re-attaches to a queued or finished job and streams its progress."""
+        if not job_id:
+            yield "Error: Enter a job ID to follow."
+            return
+        yield from job_queue.stream(job_id)
 
     # --- Action Handler for Claim (Provider Page) ---
-    def handle_claim_action(current_pk_state, current_aa_state):
-        if not current_pk_state or not current_aa_state:
-            return "Error: Private Key or Account Address not set."
+    def claim_escrows(report, escrow_addresses, pk, aa):
+        outcomes = asyncio.run(
+            claim_provider_escrows_batched(report, escrow_addresses, pk, aa)
+        )
+        failed = [address for address, (_, tx_hash) in outcomes.items() if not tx_hash]
+        if failed:
+            raise RuntimeError(f"Claim failed for: {', '.join(failed)}")
+        return f"Claimed {len(outcomes)} escrow(s)."
 
-        # This is a stub function. Implement actual claim logic here.
-        print(
-            f"Claim button clicked. Account: {current_aa_state[:10]}... PK used (not shown)"
+    def handle_claim_action(current_pk_state, current_aa_state, escrow_addresses_text):
+        if not current_pk_state or not current_aa_state:
+            yield "Error: Private Key or Account Address not set."
+            return
+        escrow_addresses = parse_escrow_addresses(escrow_addresses_text or "")
+        if not escrow_addresses:
+            yield "Error: Enter at least one escrow contract address."
+            return
+
+        job = job_queue.submit(
+            "claim", claim_escrows, escrow_addresses, current_pk_state, current_aa_state
         )
-        # Simulate a call or return a message
-        # For now, just a placeholder message
-        return "Claim functionality is not yet implemented. This is a stub."
+        yield from job_queue.stream(job.id)
 
     # --- UI Structure ---
     # Screen 1: Entry Screen
@@ -571,17 +466,41 @@ with gr.Blocks(theme=gr.themes.Soft()) as demo:  # Added a soft theme for better
             with gr.Accordion(
                 "Deploy Key Registry & Address Verifier Contracts", open=True
             ):
+                # Only offered once the FalconVerifierWithRegistry class hash is configured
+                colocated_checkbox = gr.Checkbox(
+                    label="Single contract (registry + verifier)",
+                    value=False,
+                    interactive=bool(FALCON_VERIFIER_WITH_REGISTRY_CONTRACT_HASH),
+                    info=(
+                        "Cheaper verification; the verifier address is the registry address."
+                        if FALCON_VERIFIER_WITH_REGISTRY_CONTRACT_HASH
+                        else "Unavailable: set MOOSH_VERIFIER_WITH_REGISTRY_CLASS_HASH to the declared FalconVerifierWithRegistry class hash."
+                    ),
+                )
                 deploy_contracts_btn = gr.Button("🚀 Deploy Key Registry & Verifier")
                 deploy_contracts_output = gr.Textbox(
                     label="Deployment Status", lines=6, interactive=False
                 )
+                with gr.Row():
+                    deploy_job_id_input = gr.Textbox(
+                        label="Job ID",
+                        placeholder="Job ID of a running or finished deployment",
+                        info="Deployments run in the background; follow one again after a reload.",
+                        scale=4,
+                    )
+                    follow_job_btn = gr.Button("🔄 Follow Job", scale=1)
 
             gr.Markdown("---")
 
             with gr.Accordion("Claim Rewards", open=True):  # New section for Claim
+                claim_escrow_addresses_input = gr.Textbox(
+                    label="Escrow Contract Addresses",
+                    placeholder="0x... (separate several with commas or new lines)",
+                    lines=2,
+                )
                 claim_rewards_btn = gr.Button("💰 Claim Rewards")
                 claim_rewards_output = gr.Textbox(
-                    label="Claim Status", lines=2, interactive=False
+                    label="Claim Status", lines=6, interactive=False
                 )
 
             gr.Markdown("---")
@@ -620,16 +539,29 @@ with gr.Blocks(theme=gr.themes.Soft()) as demo:  # Added a soft theme for better
         fn=show_entry_screen_action, inputs=None, outputs=navigation_outputs_to_entry
     )
 
+    # Progress streams only wait on the job queue, so they don't take a UI worker slot
     deploy_contracts_btn.click(
         fn=handle_deploy_contracts_action,
-        inputs=[user_private_key_state, user_account_address_state],
+        inputs=[user_private_key_state, user_account_address_state, colocated_checkbox],
+        outputs=[deploy_contracts_output, deploy_job_id_input],
+        concurrency_limit=None,
+    )
+    follow_job_btn.click(
+        fn=handle_follow_job_action,
+        inputs=[deploy_job_id_input],
         outputs=[deploy_contracts_output],
+        concurrency_limit=None,
     )
 
     claim_rewards_btn.click(
         fn=handle_claim_action,
-        inputs=[user_private_key_state, user_account_address_state],
+        inputs=[
+            user_private_key_state,
+            user_account_address_state,
+            claim_escrow_addresses_input,
+        ],
         outputs=[claim_rewards_output],
+        concurrency_limit=None,
     )
     # Event handler for the escrow deployment button on the Client page
     deploy_escrow_btn.click(
@@ -677,83 +609,10 @@ with gr.Blocks(theme=gr.themes.Soft()) as demo:  # Added a soft theme for better
     )
 
 
-def generate_falcon_pk_coefficients(n_value: int) -> list[int]:
-    """
-    Generates Falcon public key coefficients for a given N (e.g., 512 or 1024).
-    These coefficients are intended for the 'register_public_key' StarkNet contract function
-    which expects a Span<u16>.
-
-    Args:
-        n_value (int): The Falcon parameter N. Your contract likely supports 512 or 1024.
-                       The falcon-py library supports N = 8, 16, ..., 1024.
-
-    Returns:
-        list[int]: A list of public key coefficients. Each coefficient is an integer
-                   expected to be within the range [0, Q-1) where Q=12289 for Falcon,
-                   making them suitable for u16 representation.
-
-    Raises:
-        ValueError: If an unsupported n_value is provided or if key generation fails.
-    """
-    # Validate n_value based on common Falcon parameters, ensure it matches your contract's needs
-    if n_value not in [512, 1024]:  # As per your initial context
-        # You can expand this list if your contract/system supports other N values
-        # supported by falcon-py: 8, 16, 32, 64, 128, 256, 512, 1024
-        raise ValueError(
-            f"N value for Falcon public key must be 512 or 1024, got {n_value}."
-        )
-
-    try:
-        sk = SecretKey(n_value)
-        # sk.h contains the public key coefficients. These are integers.
-        # For Falcon, coefficients are in Z_Q where Q=12289.
-        # The falcon-py library typically provides these as integers within [0, Q-1)
-        # or a symmetric range like [-(Q-1)/2, (Q-1)/2].
-        # Since StarkNet's u16 expects values in [0, 65535], and Falcon coeffs are < 12289,
-        # they fit. If negative values are possible from sk.h, they should be converted
-        # to their positive representation modulo Q (e.g., coeff + Q if coeff < 0).
-        # However, your example `format_array(arg["pk"], ...)` uses `sk.h` directly,
-        # suggesting they are already in a suitable positive form (e.g. [0, Q-1]).
-        public_key_coeffs = sk.h
-
-        if not isinstance(public_key_coeffs, list) or not all(
-            isinstance(c, int) for c in public_key_coeffs
-        ):
-            raise ValueError(
-                "Generated public key coefficients are not a list of integers."
-            )
-
-        if len(public_key_coeffs) != n_value:
-            # This would be unexpected if SecretKey(n_value) works as specified by the library
-            raise ValueError(
-                f"Generated public key has {len(public_key_coeffs)} coefficients, but expected {n_value} for N={n_value}."
-            )
-
-        # Ensure all coefficients are positive and fit u16 (Falcon Q=12289, so they will)
-        # This step might be needed if sk.h can return small negative numbers for coefficients in Z_q.
-        # For StarkNet u16, values should be in [0, 12288].
-        # Q = 12289
-        # processed_coeffs = [c % Q for c in public_key_coeffs] # Ensures positive and within [0, Q-1]
-        # For now, assuming sk.h from falcon-py is already in [0,Q-1] or that the contract handles Z_q.
-        # Based on your example, direct usage of sk.h is implied.
-
-        print(
-            f"Generated Falcon-{n_value} public key with {len(public_key_coeffs)} coefficients. Example: {public_key_coeffs[:3]}..."
-        )
-        return public_key_coeffs
-
-    except Exception as e:
-        print(f"Error generating Falcon public key coefficients for N={n_value}: {e}")
-        raise  # Re-raise the exception to be caught by the caller
-
-
-def generate_claim_signature(sk):
-    generate_attestation(sk, "message #1")
-
-
 if __name__ == "__main__":
     if NODE_URL == "YOUR_STARKNET_NODE_URL":
         print("\n\nCRITICAL: NODE_URL is not set in cairo_interactions.py!")
         print("Please configure it before running the application.\n\n")
 
+    demo.queue(default_concurrency_limit=UI_CONCURRENCY_LIMIT)
     demo.launch()
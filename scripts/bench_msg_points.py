@@ -0,0 +1,62 @@
+# scripts/bench_msg_points.py
+"""
+Compares falcon.py's SecretKey.hash_to_point with msg_points on random
+(message, salt) pairs: hash_to_point alone, get_msg_points on new pairs
+(hashing, commitments and table writes) and on pairs already in the table.
+Checks that all points agree. Uses a throwaway table under target/msg_points.
+
+Usage: python scripts/bench_msg_points.py [--pairs 2000] [--n 512]
+"""
+import argparse
+import os
+import time
+
+import msg_points
+
+
+def timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pairs", type=int, default=2000)
+    parser.add_argument("--n", type=int, default=512, choices=(512, 1024))
+    args = parser.parse_args()
+
+    from falcon import SALT_LEN, SecretKey
+
+    sk = SecretKey(args.n)
+    pairs = [(os.urandom(32), os.urandom(SALT_LEN)) for _ in range(args.pairs)]
+    expected, falcon_s = timed(lambda: [sk.hash_to_point(m, s) for m, s in pairs])
+    direct, direct_s = timed(
+        lambda: [msg_points.hash_to_point(m, s, args.n) for m, s in pairs]
+    )
+
+    path = msg_points.MSG_POINT_DIR / "bench.sqlite"
+    path.unlink(missing_ok=True)
+    table = msg_points.MsgPointTable(path)
+    cold, cold_s = timed(msg_points.get_msg_points, pairs, args.n, table)
+    warm, warm_s = timed(msg_points.get_msg_points, pairs, args.n, table)
+    path.unlink(missing_ok=True)
+    if not (expected == direct == cold == warm):
+        raise SystemExit("Message points differ from falcon.py's hash_to_point.")
+
+    print(f"{args.pairs} pairs, N={args.n}")
+    print(f"{'method':<34} {'seconds':>9} {'pairs/s':>10} {'speedup':>8}")
+    for name, seconds in (
+        ("falcon.py hash_to_point", falcon_s),
+        ("msg_points.hash_to_point", direct_s),
+        ("get_msg_points, new pairs", cold_s),
+        ("get_msg_points, from the table", warm_s),
+    ):
+        print(
+            f"{name:<34} {seconds:>9.3f} {args.pairs / seconds:>10.0f} {falcon_s / seconds:>7.1f}x"
+        )
+    print(f"table: {table.stats()}")
+
+
+if __name__ == "__main__":
+    main()
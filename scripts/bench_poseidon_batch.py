@@ -0,0 +1,60 @@
+# scripts/bench_poseidon_batch.py
+"""
+Compares per-key poseidon_hash_many with poseidon_batch.poseidon_hash_keys on
+random public keys: a cold batch (new keys, duplicates hashed once) and a warm
+one (every key memoized). Checks that all results agree.
+
+Usage: python scripts/bench_poseidon_batch.py [--keys 2000] [--n 512] [--duplicates 0.1]
+"""
+import argparse
+import random
+import time
+
+from generate_inputs import Q
+import poseidon_batch
+
+
+def random_keys(count: int, n: int, duplicates: float) -> list[list[int]]:
+    unique = max(1, int(count * (1 - duplicates)))
+    keys = [[random.randrange(Q) for _ in range(n)] for _ in range(unique)]
+    return keys + [random.choice(keys) for _ in range(count - unique)]
+
+
+def timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=2000)
+    parser.add_argument("--n", type=int, default=512, choices=(512, 1024))
+    parser.add_argument("--duplicates", type=float, default=0.1)
+    args = parser.parse_args()
+
+    from poseidon_py import poseidon_hash
+
+    keys = random_keys(args.keys, args.n, args.duplicates)
+    expected, per_key = timed(lambda: [poseidon_hash.poseidon_hash_many(k) for k in keys])
+
+    cold, cold_s = timed(poseidon_batch.poseidon_hash_keys, keys)
+    warm, warm_s = timed(poseidon_batch.poseidon_hash_keys, keys)
+    if not (expected == cold == warm):
+        raise SystemExit("Batch hashes differ from poseidon_hash_many.")
+
+    print(f"{args.keys} keys, N={args.n}, {args.duplicates:.0%} duplicates")
+    print(f"{'method':<34} {'seconds':>9} {'keys/s':>10} {'speedup':>8}")
+    for name, seconds in (
+        ("poseidon_hash_many per key", per_key),
+        ("batch, cold", cold_s),
+        ("batch, warm (memoized)", warm_s),
+    ):
+        print(
+            f"{name:<34} {seconds:>9.3f} {args.keys / seconds:>10.0f} {per_key / seconds:>7.1f}x"
+        )
+    print(f"memo: {poseidon_batch.memo_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# scripts/bench_registration_calldata.py
+"""
+Compares key registration through register_public_key (Span<u16>) and
+register_public_key_packed (Span<felt252>, 17 coefficients per felt).
+
+Always prints the transaction calldata size for N=512 and N=1024. With
+--registry (and credentials from the flags or MOOSH_PRIVATE_KEY /
+MOOSH_ACCOUNT_ADDRESS) it also estimates the fee of both calls against that
+registry, which must have been declared with the packed entry point.
+
+Usage: python scripts/bench_registration_calldata.py [--registry 0x...]
+"""
+import argparse
+import asyncio
+import os
+import random
+
+from generate_inputs import Q, pack_falcon_pk_coefficients
+
+# __execute__ calldata for a single call: [call_count, to, selector, calldata_len]
+EXECUTE_OVERHEAD_FELTS = 4
+FELT_BYTES = 32
+
+
+def calldata_felts(span_len: int) -> int:
+    # The span itself is serialized as [len, *items]
+    return EXECUTE_OVERHEAD_FELTS + 1 + span_len
+
+
+def random_pk(n: int) -> list[int]:
+    # Fee estimates only need well-formed coefficients, not a real Falcon key
+    return [random.randrange(Q) for _ in range(n)]
+
+
+async def estimate_fees(registry_address: str, private_key: str, account_address: str, n: int):
+    from cairo_interactions import get_deployer_account
+    from starknet_py.contract import Contract
+
+    account = await get_deployer_account(private_key, account_address)
+    if not account:
+        raise SystemExit("Could not initialize the account for fee estimation.")
+    registry = await Contract.from_address(address=registry_address, provider=account)
+    if "register_public_key_packed" not in registry.functions:
+        raise SystemExit("Registry has no register_public_key_packed entry point.")
+
+    pk = random_pk(n)
+    unpacked = await registry.functions["register_public_key"].prepare_invoke_v3(
+        pk_coefficients_span=pk
+    ).estimate_fee()
+    packed = await registry.functions["register_public_key_packed"].prepare_invoke_v3(
+        pk_packed_span=pack_falcon_pk_coefficients(pk)
+    ).estimate_fee()
+    return unpacked, packed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--registry", default=None)
+    parser.add_argument("--private-key", default=os.environ.get("MOOSH_PRIVATE_KEY"))
+    parser.add_argument("--account", default=os.environ.get("MOOSH_ACCOUNT_ADDRESS"))
+    args = parser.parse_args()
+
+    print(f"{'N':>5} {'entry point':<28} {'calldata felts':>15} {'bytes':>7}")
+    for n in (512, 1024):
+        words = len(pack_falcon_pk_coefficients(random_pk(n)))
+        for name, span_len in (
+            ("register_public_key", n),
+            ("register_public_key_packed", words),
+        ):
+            felts = calldata_felts(span_len)
+            print(f"{n:>5} {name:<28} {felts:>15} {felts * FELT_BYTES:>7}")
+        print(f"{'':>5} {'reduction':<28} {calldata_felts(n) / calldata_felts(words):>14.1f}x")
+
+    if not args.registry:
+        return
+    if not args.private_key or not args.account:
+        raise SystemExit("--private-key and --account are required for fee estimates.")
+
+    print(f"\nFee estimates against {args.registry}:")
+    for n in (512, 1024):
+        unpacked, packed = asyncio.run(
+            estimate_fees(args.registry, args.private_key, args.account, n)
+        )
+        print(
+            f"  N={n}: register_public_key {unpacked.overall_fee} {unpacked.unit}, "
+            f"register_public_key_packed {packed.overall_fee} {packed.unit} "
+            f"({unpacked.overall_fee / max(packed.overall_fee, 1):.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# scripts/bench_startup.py
+"""
+Import-time benchmark for the Gradio app.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter (importing
+app builds the UI but does not launch it), reports the slowest imports and fails
+if startup exceeds the budget or if a lazily-loaded module was imported eagerly.
+
+Usage: python scripts/bench_startup.py [--module app] [--budget 6.0] [--runs 3]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Startup budget in seconds for `import app` (gradio and starknet_py dominate it)
+DEFAULT_BUDGET_S = float(os.environ.get("MOOSH_STARTUP_BUDGET_S", "6.0"))
+
+# Modules that must only be imported on first use
+LAZY_MODULES = ("falcon", "poseidon_py")
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    """
+    Parses `-X importtime` output into (module, depth, self_us, cumulative_us) rows.
+    Lines look like: "import time:       123 |       4567 |   package.module"
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Header line
+        name_field = parts[2].rstrip()
+        name = name_field.lstrip()
+        depth = (len(name_field) - len(name) - 1) // 2
+        rows.append((name, depth, int(parts[0]), int(parts[1])))
+    return rows
+
+
+def run_once(module: str) -> tuple[float, list[tuple[str, int, int, int]]]:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SCRIPTS_DIR,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        print(proc.stderr[-2000:], file=sys.stderr)
+        raise SystemExit(f"Importing '{module}' failed with exit code {proc.returncode}")
+    return wall, parse_importtime(proc.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_S)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    walls, import_totals, rows = [], [], []
+    for _ in range(args.runs):
+        wall, rows = run_once(args.module)
+        walls.append(wall)
+        import_totals.append(sum(r[3] for r in rows if r[1] == 0) / 1e6)
+
+    print(f"Startup of 'import {args.module}' over {args.runs} run(s):")
+    print(f"  wall time (median):   {statistics.median(walls):.3f}s")
+    print(f"  import time (median): {statistics.median(import_totals):.3f}s")
+
+    print("\nSlowest top-level imports (last run, cumulative):")
+    top_level = sorted((r for r in rows if r[1] == 0), key=lambda r: r[3], reverse=True)
+    for name, _depth, _self_us, cumulative_us in top_level[: args.top]:
+        print(f"  {cumulative_us / 1e3:9.1f} ms  {name}")
+
+    failures = []
+    imported = {r[0] for r in rows}
+    eager = [m for m in LAZY_MODULES if m in imported]
+    if eager:
+        failures.append(f"lazily-loaded modules imported at startup: {', '.join(eager)}")
+    if statistics.median(walls) > args.budget:
+        failures.append(
+            f"startup {statistics.median(walls):.3f}s exceeds budget {args.budget:.3f}s"
+        )
+
+    if failures:
+        print("\nFAIL: " + "; ".join(failures))
+        return 1
+    print(f"\nOK: within the {args.budget:.3f}s startup budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+# scripts/bench_verify_colocated.py
+"""
+Records the gas of signature verification through the separate registry and
+verifier (test_deploy_contracts) against the co-located FalconVerifierWithRegistry
+(test_deploy_colocated_contract), both in moosh_id/tests/test_verifier.cairo.
+
+Runs snforge with --detailed-resources in moosh_id, prints the two tests side by
+side and writes the same table to --out, together with the snforge version and
+commit it was measured at. Both tests deploy and register the same n=1024 key
+before verifying, so the difference is the cost of the registry call.
+
+Usage: python scripts/bench_verify_colocated.py [--out bench/verify_colocated.md]
+"""
+import argparse
+import re
+import subprocess
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SNFORGE_FILTER = "test_verifier::test_deploy"
+TESTS = {
+    "test_deploy_contracts": "registry + verifier",
+    "test_deploy_colocated_contract": "co-located",
+}
+RESOURCES = ("l1_gas", "l1_data_gas", "l2_gas", "gas", "steps")
+
+# "[PASS] moosh_id_integrationtest::test_verifier::test_deploy_contracts (l1_gas: ~0, ...)"
+PASS_LINE = re.compile(r"^\[PASS\] \S*::(\w+) \((.*)\)$")
+RESOURCE = re.compile(r"(\w+): ~?(\d+)")
+STEPS_LINE = re.compile(r"^\s*steps: (\d+)$")
+
+
+def parse_snforge_output(output: str) -> dict[str, dict[str, int]]:
+    """Resources per test name, from the [PASS] lines and their detailed resources."""
+    results: dict[str, dict[str, int]] = {}
+    current = None
+    for line in output.splitlines():
+        match = PASS_LINE.match(line.strip())
+        if match:
+            current = match.group(1)
+            results[current] = {k: int(v) for k, v in RESOURCE.findall(match.group(2))}
+            continue
+        match = STEPS_LINE.match(line)
+        if match and current is not None:
+            results[current]["steps"] = int(match.group(1))
+    return results
+
+
+def format_table(results: dict[str, dict[str, int]]) -> str:
+    columns = [r for r in RESOURCES if any(r in results.get(t, {}) for t in TESTS)]
+    lines = [
+        "| test | " + " | ".join(columns) + " |",
+        "|---|" + "---:|" * len(columns),
+    ]
+    for test, label in TESTS.items():
+        values = results[test]
+        lines.append(
+            f"| {label} (`{test}`) | "
+            + " | ".join(str(values.get(c, "")) for c in columns)
+            + " |"
+        )
+    separate, colocated = (results[t] for t in TESTS)
+    lines.append(
+        "| difference | "
+        + " | ".join(
+            str(separate[c] - colocated[c]) if c in separate and c in colocated else ""
+            for c in columns
+        )
+        + " |"
+    )
+    return "\n".join(lines)
+
+
+def command_output(*cmd: str, cwd: Path = ROOT) -> str:
+    return subprocess.run(
+        cmd, cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", default=str(ROOT / "bench" / "verify_colocated.md"))
+    args = parser.parse_args()
+
+    run = subprocess.run(
+        ["snforge", "test", SNFORGE_FILTER, "--detailed-resources"],
+        cwd=ROOT / "moosh_id",
+        capture_output=True,
+        text=True,
+    )
+    results = parse_snforge_output(run.stdout)
+    missing = [t for t in TESTS if t not in results]
+    if run.returncode != 0 or missing:
+        print(run.stdout)
+        print(run.stderr)
+        raise SystemExit(f"snforge did not pass {', '.join(missing) or 'all tests'}.")
+
+    table = format_table(results)
+    print(table)
+
+    record = (
+        "# Verification gas: separate registry vs co-located contract\n\n"
+        f"Measured {date.today().isoformat()} at commit "
+        f"{command_output('git', 'rev-parse', '--short', 'HEAD')} with "
+        f"{command_output('snforge', '--version')} "
+        f"(`snforge test {SNFORGE_FILTER} --detailed-resources`).\n\n"
+        f"{table}\n"
+    )
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(record, "utf-8")
+    print(f"Written to {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# scripts/bulk_registration.py
+"""
+Registers many Falcon public keys through register_public_keys_batch.
+
+Keys are validated and packed locally, split into batches that fit one
+transaction and sent with bounded concurrency from one account; nonces are
+handed out by a NonceAllocator so batches do not wait on each other's
+acceptance.
+
+Usage: python scripts/bulk_registration.py keys.json --registry 0x...
+(keys.json holds a list of coefficient lists; credentials come from the flags
+or MOOSH_PRIVATE_KEY / MOOSH_ACCOUNT_ADDRESS)
+"""
+import argparse
+import asyncio
+import json
+import os
+from typing import Callable
+
+from felt_codec import CoeffVec
+from generate_inputs import pack_falcon_pk_coefficients
+
+# Starknet rejects invoke transactions with more calldata than this
+MAX_BATCH_CALLDATA_FELTS = 4000
+# Each key costs a Poseidon hash, an unpack and 31/61 storage writes; keeps a
+# batch well inside the per-transaction step and state-diff limits
+MAX_KEYS_PER_BATCH = 16
+MAX_CONCURRENT_BATCHES = 4
+# __execute__ calldata for a single call ([call_count, to, selector, calldata_len])
+# plus the outer span length
+BATCH_OVERHEAD_FELTS = 5
+
+
+def chunk_packed_keys(
+    packed_keys: list[list[int]],
+    max_felts: int = MAX_BATCH_CALLDATA_FELTS,
+    max_keys: int = MAX_KEYS_PER_BATCH,
+) -> list[list[int]]:
+    """
+    Splits packed keys into batches, in order, each within max_felts of calldata
+    and max_keys keys.
+
+    Returns:
+        list[list[int]]: Indexes into packed_keys, one list per batch.
+    """
+    batches, current, current_felts = [], [], BATCH_OVERHEAD_FELTS
+    for index, words in enumerate(packed_keys):
+        # Each key is serialized as [len, *words]
+        key_felts = 1 + len(words)
+        if current and (
+            current_felts + key_felts > max_felts or len(current) >= max_keys
+        ):
+            batches.append(current)
+            current, current_felts = [], BATCH_OVERHEAD_FELTS
+        current.append(index)
+        current_felts += key_felts
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def register_public_keys_bulk(
+    report: Callable[[str], None],
+    key_registry_contract_address: str,
+    pk_list: list[list[int]],
+    private_key: str,
+    account_address: str,
+    max_concurrency: int = MAX_CONCURRENT_BATCHES,
+) -> dict:
+    """
+    Registers every key in pk_list; duplicates in the list are sent once, and keys
+    already in the registry's KeyIndex are not sent at all.
+
+    Returns:
+        dict: key hash hex (or "#<index>" for a key that could not be packed) ->
+        (status, Transaction_Hash_Hex or None), status one of "registered",
+        "already registered", "invalid: ..." or "failed: ...".
+    """
+    from cairo_interactions import (
+        NonceAllocator,
+        call_register_public_keys_batch,
+        get_deployer_account,
+    )
+    from key_index import synced_key_index
+    from poseidon_batch import poseidon_hash_keys
+
+    account = await get_deployer_account(private_key, account_address)
+    if not account:
+        raise RuntimeError("Deployer account not initialized for key registration.")
+
+    outcomes: dict = {}
+    valid_keys, valid_packed = [], []
+    for index, pk in enumerate(pk_list):
+        try:
+            pk = CoeffVec(pk)
+            valid_packed.append(pack_falcon_pk_coefficients(pk))
+        except ValueError as e:
+            outcomes[f"#{index}"] = (f"invalid: {e}", None)
+            continue
+        valid_keys.append(pk)
+
+    key_hashes, packed_keys, seen = [], [], set()
+    for key_hash, packed in zip(poseidon_hash_keys(valid_keys), valid_packed):
+        if key_hash in seen:
+            continue
+        seen.add(key_hash)
+        key_hashes.append(key_hash)
+        packed_keys.append(packed)
+
+    # Keys seen in the registry's events are reported without being sent
+    registry_address = int(key_registry_contract_address, 16)
+    known_keys = await synced_key_index(account.client, registry_address)
+    new_indexes = []
+    for i, key_hash in enumerate(key_hashes):
+        if key_hash in known_keys:
+            outcomes[hex(key_hash)] = ("already registered", None)
+        else:
+            new_indexes.append(i)
+    key_hashes = [key_hashes[i] for i in new_indexes]
+    packed_keys = [packed_keys[i] for i in new_indexes]
+
+    batches = chunk_packed_keys(packed_keys)
+    report(f"Registering {len(packed_keys)} key(s) in {len(batches)} batch(es)...")
+
+    nonce_allocator = NonceAllocator(account)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def send_batch(number: int, indexes: list[int]):
+        async with semaphore:
+            registered, tx_hash = await call_register_public_keys_batch(
+                registry_address, [packed_keys[i] for i in indexes], nonce_allocator
+            )
+        for i in indexes:
+            if tx_hash is None:
+                outcomes[hex(key_hashes[i])] = (f"failed: {registered}", None)
+            elif key_hashes[i] in registered:
+                known_keys.add(key_hashes[i])
+                outcomes[hex(key_hashes[i])] = ("registered", tx_hash)
+            else:
+                outcomes[hex(key_hashes[i])] = ("already registered", tx_hash)
+        if tx_hash:
+            report(
+                f"Batch {number + 1}/{len(batches)}: {len(registered)} new key(s)\n"
+                f"Tx Hash: {tx_hash}"
+            )
+        else:
+            report(f"Batch {number + 1}/{len(batches)} failed: {registered}")
+
+    await asyncio.gather(*(send_batch(n, b) for n, b in enumerate(batches)))
+    new_keys = sum(1 for status, _ in outcomes.values() if status == "registered")
+    report(f"Registered {new_keys} of {len(pk_list)} key(s).")
+    return outcomes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("keys_file")
+    parser.add_argument("--registry", required=True)
+    parser.add_argument("--private-key", default=os.environ.get("MOOSH_PRIVATE_KEY"))
+    parser.add_argument("--account", default=os.environ.get("MOOSH_ACCOUNT_ADDRESS"))
+    parser.add_argument("--max-concurrency", type=int, default=MAX_CONCURRENT_BATCHES)
+    args = parser.parse_args()
+    if not args.private_key or not args.account:
+        raise SystemExit("--private-key and --account are required.")
+
+    with open(args.keys_file) as f:
+        pk_list = json.load(f)
+    outcomes = asyncio.run(
+        register_public_keys_bulk(
+            print,
+            args.registry,
+            pk_list,
+            args.private_key,
+            args.account,
+            args.max_concurrency,
+        )
+    )
+    for key, (status, tx_hash) in outcomes.items():
+        print(f"{key}: {status}" + (f" ({tx_hash})" if tx_hash else ""))
+
+
+if __name__ == "__main__":
+    main()
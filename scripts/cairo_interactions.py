@@ -1,46 +1,52 @@
 # scripts/cairo_interactions.py
-import json
-import random
-import json
+import asyncio
+import os
+import threading
 import traceback
 from typing import Optional, Tuple, List, Union
 
 from starknet_py.net.full_node_client import FullNodeClient
 from starknet_py.net.account.account import Account
-from starknet_py.net.models import StarknetChainId, InvokeV3
+from starknet_py.net.models import StarknetChainId
 from starknet_py.net.signer.stark_curve_signer import KeyPair
-from starknet_py.constants import (
-    DEFAULT_DEPLOYER_ADDRESS,
-)
 from starknet_py.hash.selector import get_selector_from_name
-from starknet_py.hash.address import compute_address
-from starknet_py.net.client_models import Call, ResourceBounds, ResourceBoundsMapping
-from starknet_py.contract import Contract
-import time
-from starknet_py.common import create_sierra_compiled_contract
-from pathlib import Path
-from utils import FALCON_KEY_REGISTRY_ABI, FALCON_VERIFIER_ABI, FALCON_ESCROW_ABI
-from poseidon_py import poseidon_hash
 from starknet_py.net.client_models import Call, ResourceBounds, ResourceBoundsMapping
 from starknet_py.contract import Contract
-from utils import (
-    FALCON_KEY_REGISTRY_ABI,
-    FALCON_VERIFIER_ABI,
-    FALCON_ESCROW_ABI,
-    MSG_POINT,
-)
+
+# ABIs, the message point and poseidon_py are loaded on first use (see utils.py)
+import utils
+from escrow_model import EscrowIndex, compute_escrow_status
+from felt_codec import CoeffVec
+import rpc_transport
 
 # --- Configuration ---
 # Class hashes are defined as strings with "0x" prefix
-FALCON_KEY_REGISTRY_CONTRACT_HASH = (  # Renamed in app.py to FALCON_KEY_REGISTRY_CLASS_HASH_HEX
-    "0x022A351AB5F1AC13352A3792BE246D8C6513D9029F3674608AC4CD7944AA702E"
-)
-FALCON_ADDRESS_BASED_VERIFIER_CONTRACT_HASH = (
-    "0x0396507525F71D979D306DF5B72C568DFCCA173158086D73806E496B054670A3"
+# FalconPublicKeyRegistry and FalconSignatureVerifier as built from moosh_id/src;
+# empty until those classes have been declared on the target network. (The
+# classes declared earlier store unpacked keys and have no registry shards.)
+FALCON_KEY_REGISTRY_CONTRACT_HASH = os.environ.get("MOOSH_KEY_REGISTRY_CLASS_HASH", "")
+FALCON_ADDRESS_BASED_VERIFIER_CONTRACT_HASH = os.environ.get(
+    "MOOSH_VERIFIER_CLASS_HASH", ""
 )
+# Constructor flag of FalconSignatureVerifier: look up NTT-form keys first. Its
+# registry is deployed from FALCON_KEY_REGISTRY_CONTRACT_HASH, which has
+# get_public_key_ntt; set to 0 for registries declared before that entry point.
+VERIFIER_USE_NTT_KEYS = os.environ.get("MOOSH_VERIFIER_USE_NTT_KEYS", "1") != "0"
 ESCROW_CONTRACT_HASH = (
     "0x0028172888cc58dece1ccaaadcd0b8076eb85f0284f95aecd28027042b0f64a9"
 )
+# Registry and verifier in one contract (FalconVerifierWithRegistry); empty until
+# that class has been declared on the target network
+FALCON_VERIFIER_WITH_REGISTRY_CONTRACT_HASH = os.environ.get(
+    "MOOSH_VERIFIER_WITH_REGISTRY_CLASS_HASH", ""
+)
+# EscrowManager (many escrows keyed by ID in one contract); empty until declared
+ESCROW_MANAGER_CONTRACT_HASH = os.environ.get("MOOSH_ESCROW_MANAGER_CLASS_HASH", "")
+
+# STRK token on Starknet Sepolia
+STRK_TOKEN_ADDRESS = (
+    "0x04718f5a0fc34cc1af16a1cdee98ffb20c31f5cd61d6ab07201858f4287c938d"
+)
 
 # IMPORTANT: Configure your Node URL properly.
 # Using a node that supports RPC v0.8.1+ is recommended for newer starknet-py versions.
@@ -50,6 +56,10 @@ NODE_URL = (
 # NODE_URL = "https://rpc.starknet-testnet.lava.build:443"
 CHAIN_ID = StarknetChainId.SEPOLIA
 
+# Multipliers applied to fee estimates (max amount, max price per unit)
+FEE_AMOUNT_MARGIN = 1.5
+FEE_PRICE_MARGIN = 1.5
+
 # DEFAULT_SIERRA_PATH = "./scripts/Utils/abi/moosh_id_FalconPublicKeyRegistry.contract_class.json"  # Contains ABI + Sierra
 DEFAULT_CASM_PATH = (
     "./scripts/Utils/abi/moosh_id_FalconPublicKeyRegistry.contract_class.json"  # CASM
@@ -57,6 +67,14 @@ DEFAULT_CASM_PATH = (
 # moosh_id_FalconPublicKeyRegistry.compiled_contract_class.json
 
 
+def make_client() -> FullNodeClient:
+    """
+    FullNodeClient over the shared RPC transport: MOOSH_NODE_URLS when set,
+    otherwise NODE_URL (see rpc_transport.py).
+    """
+    return rpc_transport.make_client(NODE_URL)
+
+
 def _hex_str_to_int(hex_str: str) -> int:
     """Helper to convert hex string (with or without 0x) to int."""
     if not isinstance(hex_str, str):
@@ -64,6 +82,14 @@ def _hex_str_to_int(hex_str: str) -> int:
     return int(hex_str, 16)
 
 
+def _is_missing_entry_point(error: Union[Exception, str]) -> bool:
+    """
+    True if a call failed because the contract's class lacks the entry point;
+    takes the exception or its error message.
+    """
+    return "ENTRYPOINT_NOT_FOUND" in str(error) or "Entry point" in str(error)
+
+
 async def get_deployer_account(
     private_key_hex: str, account_address_hex: str
 ) -> Optional[Account]:
@@ -81,7 +107,7 @@ async def get_deployer_account(
         print("CRITICAL Error: NODE_URL is not configured or is a placeholder.")
         return None
 
-    client = FullNodeClient(node_url=NODE_URL)
+    client = make_client()
     try:
         key_pair = KeyPair.from_private_key(private_key_hex)
 
@@ -109,6 +135,160 @@ async def get_deployer_account(
 #     return (file_name).read_text("utf-8")
 
 
+class NonceAllocator:
+    """
+    Hands out consecutive nonces for one account so several of its transactions
+    can be in flight at once. The lock only covers nonce assignment and
+    submission; waiting for acceptance happens outside of it.
+    """
+
+    def __init__(self, account: Account):
+        self.account = account
+        self._lock = asyncio.Lock()
+        self._next_nonce: Optional[int] = None
+
+    async def submit(self, send):
+        """
+        Awaits `send(nonce)` with the next free nonce and returns its result.
+        If sending fails the nonce is re-read from the node on the next submit.
+        """
+        async with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = await self.account.get_nonce()
+            try:
+                result = await send(self._next_nonce)
+            except Exception:
+                self._next_nonce = None
+                raise
+            self._next_nonce += 1
+            return result
+
+
+def _call_key(calls: List[Call]) -> tuple:
+    return tuple((c.to_addr, c.selector, tuple(c.calldata)) for c in calls)
+
+
+def _returned_false(execute_result: List[int]) -> bool:
+    """
+    True if any call in an __execute__ result returned exactly `false`.
+    The result is an Array<Span<felt252>>: [n_calls, len_1, *ret_1, len_2, ...].
+    """
+    if not execute_result:
+        return False
+    i = 1
+    for _ in range(execute_result[0]):
+        if i >= len(execute_result):
+            break
+        length = execute_result[i]
+        if length == 1 and execute_result[i + 1] == 0:
+            return True
+        i += 1 + length
+    return False
+
+
+class PreflightSimulator:
+    """
+    Dry-runs pending transactions of one account with starknet_simulateTransactions
+    (SKIP_VALIDATE, SKIP_FEE_CHARGE), so calls that would revert or return false
+    are dropped before they cost a fee.
+
+    Transactions in one check are simulated in order with consecutive nonces, as
+    they would be executed if all were sent. Outcomes are cached until the chain
+    moves to a new block or the account sends a transaction. Use
+    get_preflight_simulator to share that cache between all callers sending from
+    the same account.
+    """
+
+    def __init__(self, account: Account):
+        self.account = account
+        self._state: Optional[tuple] = None
+        self._results: dict = {}
+        # Checks run from several threads (each with its own event loop)
+        self._lock = threading.Lock()
+
+    async def _simulate(self, pending: List[List[Call]], nonce: int) -> List[Optional[str]]:
+        transactions = [
+            await self.account.sign_invoke_v3(
+                calls,
+                nonce=nonce + offset,
+                l1_resource_bounds=ResourceBounds.init_with_zeros(),
+            )
+            for offset, calls in enumerate(pending)
+        ]
+        simulated = await self.account.client.simulate_transactions(
+            transactions=transactions,
+            skip_validate=True,
+            skip_fee_charge=True,
+            block_number="pending",
+        )
+        reasons = []
+        for simulation in simulated:
+            invocation = simulation.transaction_trace.execute_invocation
+            revert_reason = getattr(invocation, "revert_reason", None)
+            if revert_reason:
+                reasons.append(revert_reason)
+            elif _returned_false(getattr(invocation, "result", [])):
+                reasons.append("Call returned false")
+            else:
+                reasons.append(None)
+        return reasons
+
+    async def check(self, pending: List[List[Call]]) -> List[Optional[str]]:
+        """
+        Simulates each entry of `pending` (the calls of one transaction).
+
+        Returns:
+            List[Optional[str]]: None for each transaction that would succeed,
+            otherwise its revert reason.
+        """
+        block_number = await self.account.client.get_block_number()
+        nonce = await self.account.get_nonce()
+        keys = [_call_key(calls) for calls in pending]
+        with self._lock:
+            if (block_number, nonce) != self._state:
+                self._state, self._results = (block_number, nonce), {}
+            results = self._results
+            known = {key: results[key] for key in keys if key in results}
+        missing = [calls for key, calls in zip(keys, pending) if key not in known]
+        if missing:
+            try:
+                reasons = await self._simulate(missing, nonce)
+            except Exception as e:
+                # A transaction that fails before execution rejects the whole
+                # request; simulate one at a time to attribute the error
+                print(f"Batch simulation failed, retrying one by one: {e}")
+                reasons = []
+                for calls in missing:
+                    try:
+                        reasons.extend(await self._simulate([calls], nonce))
+                    except Exception as single_error:
+                        reasons.append(str(single_error))
+            for calls, reason in zip(missing, reasons):
+                known[_call_key(calls)] = reason
+            with self._lock:
+                # Dropped if another check moved the cache to a newer state meanwhile
+                results.update(known)
+        return [known[key] for key in keys]
+
+
+# One PreflightSimulator per account address for the whole process, so callers
+# sending from the same account share its cached outcomes. Callers run in
+# separate threads and event loops, hence a threading lock.
+_preflight_simulators: dict[int, PreflightSimulator] = {}
+_preflight_simulators_guard = threading.Lock()
+
+
+def get_preflight_simulator(account: Account) -> PreflightSimulator:
+    """The process-wide PreflightSimulator of `account`'s address."""
+    with _preflight_simulators_guard:
+        simulator = _preflight_simulators.get(account.address)
+        if simulator is None:
+            simulator = _preflight_simulators[account.address] = PreflightSimulator(
+                account
+            )
+        return simulator
+
+
 async def deploy_new_contract_instance(
     class_hash_hex: str,
     deployer_private_key_hex: str,
@@ -119,6 +299,10 @@ async def deploy_new_contract_instance(
     Deploys a new contract instance using its class hash via the Universal Deployer Contract (UDC).
     Returns (deployed_contract_address_hex, transaction_hash_hex) or (error_message_str, None).
     """
+    if not class_hash_hex:
+        # Unset MOOSH_*_CLASS_HASH variables leave the class hash empty
+        return "Error: No class hash given; declare the class and set its class hash.", None
+
     deployer_account = await get_deployer_account(
         deployer_private_key_hex, deployer_account_address_hex
     )
@@ -156,11 +340,22 @@ async def deploy_new_contract_instance(
 
         # Select the appropriate ABI based on the class hash
         if class_hash_hex == FALCON_KEY_REGISTRY_CONTRACT_HASH:
-            abi = FALCON_KEY_REGISTRY_ABI
+            abi = utils.FALCON_KEY_REGISTRY_ABI
         elif class_hash_hex == FALCON_ADDRESS_BASED_VERIFIER_CONTRACT_HASH:
-            abi = FALCON_VERIFIER_ABI
+            abi = utils.FALCON_VERIFIER_ABI
         elif class_hash_hex == ESCROW_CONTRACT_HASH:
-            abi = FALCON_ESCROW_ABI
+            abi = utils.FALCON_ESCROW_ABI
+        elif (
+            FALCON_VERIFIER_WITH_REGISTRY_CONTRACT_HASH
+            and class_hash_hex == FALCON_VERIFIER_WITH_REGISTRY_CONTRACT_HASH
+        ):
+            # Same constructor and registry entry points as the standalone registry
+            abi = utils.FALCON_KEY_REGISTRY_ABI
+        elif (
+            ESCROW_MANAGER_CONTRACT_HASH
+            and class_hash_hex == ESCROW_MANAGER_CONTRACT_HASH
+        ):
+            abi = utils.ESCROW_MANAGER_ABI
         else:
             raise ValueError(f"Unknown contract class hash: {class_hash_hex}")
 
@@ -181,10 +376,10 @@ async def deploy_new_contract_instance(
             print("Setting message points for escrow contract...")
 
             tx_hash, error = await call_msg_points(
-                contract_address, deployer_account, MSG_POINT
+                contract_address, deployer_account, utils.MSG_POINT
             )
             tx_hash, error = await Stark_Token_Approve(
-                "0x04718f5a0fc34cc1af16a1cdee98ffb20c31f5cd61d6ab07201858f4287c938d",
+                STRK_TOKEN_ADDRESS,
                 contract_address,
                 deployer_account,
                 constructor_args[1],
@@ -205,31 +400,109 @@ async def deploy_new_contract_instance(
         return f"Deployment Error: {e}", None
 
 
+async def deploy_escrow_manager(
+    verifier_address: str,
+    key_registry_address: str,
+    deployer_private_key_hex: str,
+    deployer_account_address_hex: str,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Deploys an EscrowManager (class hash from MOOSH_ESCROW_MANAGER_CLASS_HASH)
+    bound to a verifier, a key registry and the STRK token.
+
+    Returns:
+        (deployed_contract_address_hex, transaction_hash_hex) or (error_message_str, None)
+    """
+    if not ESCROW_MANAGER_CONTRACT_HASH:
+        return (
+            "Error: MOOSH_ESCROW_MANAGER_CLASS_HASH is not set; declare the "
+            "EscrowManager class and set it to the class hash.",
+            None,
+        )
+    return await deploy_new_contract_instance(
+        ESCROW_MANAGER_CONTRACT_HASH,
+        deployer_private_key_hex,
+        deployer_account_address_hex,
+        [verifier_address, key_registry_address, STRK_TOKEN_ADDRESS],
+    )
+
+
+def compute_msg_point_commitment(msg_points: List[int]) -> int:
+    """Poseidon hash of the message point, as checked by the Escrow contract."""
+    from poseidon_batch import poseidon_hash_key
+
+    return poseidon_hash_key(msg_points)
+
+
 async def call_msg_points(
-    contract_address: str, deployer_account, msg_points: List[int]
+    contract_address: str,
+    deployer_account,
+    msg_points: Optional[List[int]] = None,
+    commit_only: Optional[bool] = None,
+    message: Optional[bytes] = None,
+    salt: Optional[bytes] = None,
 ) -> Tuple[Optional[str], Optional[str]]:
     """
-    Calls the set_message_points function on the escrow contract.
+    Sets the escrow's message point.
+
+    The point is `msg_points`, or hash_to_point(message, salt) read from (or
+    added to) the msg_points table, or by default utils.MSG_POINT. With
+    `commit_only`, only its Poseidon commitment is stored
+    (set_message_point_commitment) and the provider sends the point with the claim;
+    the point is kept in the msg_points table so get_escrow_message_point can
+    resolve the commitment. That table is local to this machine, so by default
+    only utils.MSG_POINT, which every provider knows, is stored as a commitment;
+    other points are stored in full unless `commit_only` is set. Escrows without
+    set_message_point_commitment get the full point via set_message_points.
     Args:
         contract_address: The hex address of the escrow contract
         msg_points: List of u16 integers representing the message points
+        commit_only: Store only the commitment when the escrow supports it
+            (default: only for utils.MSG_POINT)
+        message, salt: Falcon message and salt to derive the point from
     Returns:
         Tuple of (transaction_hash_hex, error_message)
     """
     try:
+        import msg_points as msg_point_table
+
+        if msg_points is None and message is not None:
+            if salt is None:
+                raise ValueError("A salt is required to derive a message point.")
+            msg_points = msg_point_table.get_msg_point(message, salt)
+        elif msg_points is None:
+            msg_points = utils.MSG_POINT
+        msg_points = CoeffVec(msg_points)
+        if commit_only is None:
+            commit_only = msg_points == utils.MSG_POINT
         contract_address_int = _hex_str_to_int(contract_address)
 
         # Create contract instance with escrow ABI
         contract = Contract(
             address=contract_address_int,
-            abi=FALCON_ESCROW_ABI,
+            abi=utils.FALCON_ESCROW_ABI,
             provider=deployer_account,
         )
 
-        # Call set_message_points with the msg_points array
-        invoke_result = await contract.functions["set_message_points"].invoke_v3(
-            msg_points, auto_estimate=True
-        )
+        invoke_result = None
+        if commit_only:
+            if message is None:
+                msg_point_table.remember_msg_point(msg_points)
+            commitment = compute_msg_point_commitment(msg_points)
+            try:
+                invoke_result = await contract.functions[
+                    "set_message_point_commitment"
+                ].invoke_v3(len(msg_points), commitment, auto_estimate=True)
+            except Exception as e:
+                if not _is_missing_entry_point(e):
+                    raise
+                print("Escrow has no set_message_point_commitment, storing the full point.")
+
+        if invoke_result is None:
+            # Call set_message_points with the msg_points array
+            invoke_result = await contract.functions["set_message_points"].invoke_v3(
+                msg_points.tolist(), auto_estimate=True
+            )
 
         await invoke_result.wait_for_acceptance()
         print(
@@ -279,7 +552,7 @@ async def deposit_stark_token(
         # Create contract instance with escrow ABI
         contract = Contract(
             address=escrow_contract_address_int,
-            abi=FALCON_ESCROW_ABI,
+            abi=utils.FALCON_ESCROW_ABI,
             provider=deployer_account,
         )
 
@@ -302,15 +575,28 @@ async def call_register_public_key(
     pk_coefficients: list[int],
     deployer_private_key_hex: str,
     deployer_account_address_hex: str,
+    packed: bool = True,
+    with_ntt: bool = True,
 ) -> tuple[str | None, str | None]:
     """
     Calls the 'register_public_key' function on the deployed Key Registry contract.
 
+    When `packed` is set and the registry has 'register_public_key_packed', the key is
+    sent as 31/61 packed felts instead of 512/1024 u16s; both give the same key hash.
+    With `with_ntt` (and a registry that has 'register_public_key_ntt') the key's NTT
+    form is computed here and stored too, so verifications skip the key's forward NTT.
+    Keys already in the registry's KeyIndex (see key_index.py) are skipped without a
+    transaction, unless `with_ntt` is set and the registry has no NTT form for them
+    yet, in which case register_public_key_ntt only adds that. The call is then simulated (PreflightSimulator) and not sent if it
+    would revert or return false, e.g. for a key registered since the last sync.
+
     Args:
         key_registry_contract_address (str): Address of the Key Registry contract.
-        pk_coefficients (list[int]): List of public key coefficients (e.g., N elements for Falcon-N).
+        pk_coefficients (list[int] | CoeffVec): Public key coefficients (e.g., N elements for Falcon-N).
         deployer_private_key_hex (str): Private key of the account sending the transaction.
         deployer_account_address_hex (str): Address of the account sending the transaction.
+        packed (bool): Prefer the packed entry point when the registry supports it.
+        with_ntt (bool): Also store the NTT form of the key when the registry supports it.
 
     Returns:
         tuple[str | None, str | None]: (Message, Transaction_Hash_Hex) or (Error_Message, None)
@@ -322,6 +608,27 @@ async def call_register_public_key(
         return "Error: Deployer account not initialized for key registration.", None
 
     try:
+        from key_index import synced_key_index
+        from poseidon_batch import poseidon_hash_key
+
+        pk_coefficients = CoeffVec(pk_coefficients)
+        key_hash = poseidon_hash_key(pk_coefficients)
+        # Keys seen in the registry's events are skipped without a transaction
+        known_keys = None
+        try:
+            known_keys = await synced_key_index(
+                account.client, key_registry_contract_address
+            )
+        except Exception as e:
+            print(f"Warning: could not sync the registered key index: {e}")
+        already_registered = (
+            f"Key registration not sent: key {hex(key_hash)} is already registered.",
+            None,
+        )
+        is_known = known_keys is not None and key_hash in known_keys
+        if is_known and not with_ntt:
+            return already_registered
+
         # Ensure the ABI for the Key Registry is available.
         # If FALCON_KEY_REGISTRY_ABI is correctly defined in utils.py and imported:
         key_registry_contract = await Contract.from_address(
@@ -336,8 +643,27 @@ async def call_register_public_key(
         #    provider=account,
         # )
 
+        # Registries declared before the packed entry point only have register_public_key
+        use_ntt = with_ntt and "register_public_key_ntt" in key_registry_contract.functions
+        use_packed = packed and "register_public_key_packed" in key_registry_contract.functions
+        if use_ntt:
+            entry_point = "register_public_key_ntt"
+        elif use_packed:
+            entry_point = "register_public_key_packed"
+        else:
+            entry_point = "register_public_key"
+        if is_known:
+            # A registered key is only sent again to add its missing NTT form
+            if not use_ntt:
+                return already_registered
+            pk_ntt = (
+                await key_registry_contract.functions["get_public_key_ntt"].call(key_hash)
+            )[0]
+            if pk_ntt:
+                return already_registered
+            print(f"Key {hex(key_hash)} is registered without its NTT form; adding it.")
         print(
-            f"Calling 'register_public_key' on {key_registry_contract_address} with {len(pk_coefficients)} coefficients."
+            f"Calling '{entry_point}' on {key_registry_contract_address} with {len(pk_coefficients)} coefficients."
         )
 
         # The Cairo function is: fn register_public_key(ref self: ContractState, pk_coefficients_span: Span<u16>) -> bool
@@ -350,9 +676,42 @@ async def call_register_public_key(
         # )
         # For invoke_v3 (recommended for Sepolia):
 
-        invocation = await key_registry_contract.functions[
-            "register_public_key"
-        ].invoke_v3(pk_coefficients_span=pk_coefficients, auto_estimate=True)
+        from generate_inputs import pack_falcon_pk_coefficients
+
+        def prepare(entry_point: str):
+            function = key_registry_contract.functions[entry_point]
+            if entry_point == "register_public_key_ntt":
+                from falcon_offchain import pk_to_ntt
+
+                return function.prepare_invoke_v3(
+                    pk_packed_span=pack_falcon_pk_coefficients(pk_coefficients),
+                    pk_ntt_packed_span=pack_falcon_pk_coefficients(pk_to_ntt(pk_coefficients)),
+                )
+            if entry_point == "register_public_key_packed":
+                return function.prepare_invoke_v3(
+                    pk_packed_span=pack_falcon_pk_coefficients(pk_coefficients),
+                )
+            return function.prepare_invoke_v3(pk_coefficients_span=pk_coefficients.tolist())
+
+        prepared = prepare(entry_point)
+        # A duplicate key makes the call return false; do not pay for that
+        simulator = get_preflight_simulator(account)
+        [reason] = await simulator.check([[prepared]])
+        if reason and use_ntt and "PK NTT mismatch" in reason:
+            # The registry computed a different NTT than pk_to_ntt: register the
+            # key without its NTT form rather than not at all
+            print(
+                f"Warning: the registry rejected the off-chain NTT of key {hex(key_hash)}; "
+                "registering it with 'register_public_key_packed' instead."
+            )
+            if is_known:
+                return already_registered
+            entry_point = "register_public_key_packed"
+            prepared = prepare(entry_point)
+            [reason] = await simulator.check([[prepared]])
+        if reason:
+            return f"Key registration not sent: {reason}", None
+        invocation = await prepared.invoke(auto_estimate=True)
 
         print(f"Sent transaction with hash: {hex(invocation.hash)}")
         await account.client.wait_for_tx(tx_hash=invocation.hash)  # More robust wait
@@ -360,8 +719,9 @@ async def call_register_public_key(
 
         # Fetch the transaction receipt to get events
         receipt = await account.client.get_transaction_receipt(invocation.hash)
+        if known_keys is not None:
+            known_keys.add(key_hash)
 
-        key_hash = poseidon_hash.poseidon_hash_many(pk_coefficients)
         computed_pk_hash_hex = hex(key_hash)
         transaction_hash_hex = hex(invocation.hash)
 
@@ -387,34 +747,328 @@ async def call_register_public_key(
         return f"Error during key registration: {str(e)}", None
 
 
+async def call_register_public_keys_batch(
+    key_registry_contract_address: int,
+    packed_keys: List[List[int]],
+    nonce_allocator: NonceAllocator,
+) -> tuple[set[int] | str, str | None]:
+    """
+    Registers several packed keys (see felt_codec.pack_u14_words) in one
+    'register_public_keys_batch' transaction.
+
+    The entry point's per-key statuses are not visible in the receipt, so the
+    registered keys are read from its PublicKeyRegistered events; any other key in
+    the batch was already registered (invalid keys should be filtered out first).
+
+    Args:
+        key_registry_contract_address (int): Address of the Key Registry contract.
+        packed_keys (list[list[int]]): Packed keys, 31 or 61 felts each.
+        nonce_allocator (NonceAllocator): Allocator of the sending account, shared by
+            batches sent concurrently.
+
+    Returns:
+        tuple: (set of registered key hashes, Transaction_Hash_Hex) or (Error_Message, None)
+    """
+    account = nonce_allocator.account
+    try:
+        key_registry_contract = Contract(
+            address=key_registry_contract_address,
+            abi=utils.FALCON_KEY_REGISTRY_ABI,
+            provider=account,
+        )
+        prepared = key_registry_contract.functions[
+            "register_public_keys_batch"
+        ].prepare_invoke_v3(pk_packed_keys=packed_keys)
+        estimated_fee = await prepared.estimate_fee()
+        l1_resource_bounds = estimated_fee.to_resource_bounds(
+            FEE_AMOUNT_MARGIN, FEE_PRICE_MARGIN
+        ).l1_gas
+        print(
+            f"Estimated fee for {len(packed_keys)} keys: {estimated_fee.overall_fee} {estimated_fee.unit}"
+        )
+
+        async def send(nonce: Optional[int]):
+            return await prepared.invoke(
+                l1_resource_bounds=l1_resource_bounds, nonce=nonce
+            )
+
+        invocation = await nonce_allocator.submit(send)
+        print(f"Batch registration sent with hash: {hex(invocation.hash)}")
+        await invocation.wait_for_acceptance()
+
+        receipt = await account.client.get_transaction_receipt(invocation.hash)
+        registered_selector = get_selector_from_name("PublicKeyRegistered")
+        registered = {
+            event.keys[1]
+            for event in receipt.events
+            if event.from_address == key_registry_contract_address
+            and len(event.keys) > 1
+            and event.keys[0] == registered_selector
+        }
+        return registered, hex(invocation.hash)
+
+    except Exception as e:
+        print(f"Error calling 'register_public_keys_batch': {e}")
+        traceback.print_exc()
+        return f"Error during batch registration: {str(e)}", None
+
+
+class ShardRouter:
+    """
+    Client side of a sharded key registry: N FalconPublicKeyRegistry instances,
+    with key_hash stored on shard key_hash % N. The shards and N are read from
+    the verifier (get_registry_shards) on every lookup, so keys are routed
+    exactly as the verifier routes them. An unsharded verifier reports its
+    single registry. An Escrow should be given the shard of its provider's key
+    as key registry.
+    """
+
+    def __init__(self, verifier_address: str):
+        self.verifier_address = verifier_address
+
+    @staticmethod
+    def key_hash(pk_coefficients: List[int]) -> int:
+        from poseidon_batch import poseidon_hash_key
+
+        return poseidon_hash_key(pk_coefficients)
+
+    async def get_shards(self) -> List[str]:
+        """The verifier's registry shards, in shard order."""
+        verifier = Contract(
+            address=_hex_str_to_int(self.verifier_address),
+            abi=utils.FALCON_VERIFIER_ABI,
+            provider=make_client(),
+        )
+        shards = (await verifier.functions["get_registry_shards"].call())[0]
+        if not shards:
+            raise ValueError(f"Verifier {self.verifier_address} reports no registry shards.")
+        return [hex(address) for address in shards]
+
+    async def shard_for(self, key_hash: int) -> str:
+        """Address of the registry shard that holds key_hash."""
+        shards = await self.get_shards()
+        return shards[key_hash % len(shards)]
+
+    @staticmethod
+    async def deploy_shards(
+        shard_count: int,
+        deployer_private_key_hex: str,
+        deployer_account_address_hex: str,
+        report=print,
+    ) -> tuple[Optional[List[str]], Optional[str]]:
+        """
+        Deploys shard_count registries. Deployments go one after another since
+        they share the account nonce.
+
+        Returns:
+            tuple: (shard addresses, None) or (None, Error_Message)
+        """
+        if not FALCON_KEY_REGISTRY_CONTRACT_HASH:
+            return None, (
+                "Error: MOOSH_KEY_REGISTRY_CLASS_HASH is not set; declare the "
+                "FalconPublicKeyRegistry class and set it to the class hash."
+            )
+        shard_addresses = []
+        for index in range(shard_count):
+            address, tx_hash = await deploy_new_contract_instance(
+                FALCON_KEY_REGISTRY_CONTRACT_HASH,
+                deployer_private_key_hex,
+                deployer_account_address_hex,
+                [],
+            )
+            if not tx_hash:
+                return None, f"Shard {index} deployment failed: {address}"
+            report(f"Registry shard {index + 1}/{shard_count} deployed at {address}")
+            shard_addresses.append(address)
+        return shard_addresses, None
+
+    async def configure_verifier(
+        self,
+        shard_addresses: List[str],
+        deployer_private_key_hex: str,
+        deployer_account_address_hex: str,
+    ) -> tuple[str | None, str | None]:
+        """
+        Points the verifier at the shards (set_registry_shards). Only its deploying
+        account may do this, and only once.
+
+        Returns:
+            tuple: (Message, Transaction_Hash_Hex) or (Error_Message, None)
+        """
+        account = await get_deployer_account(
+            deployer_private_key_hex, deployer_account_address_hex
+        )
+        if not account:
+            return "Error: Deployer account not initialized.", None
+        try:
+            verifier = Contract(
+                address=_hex_str_to_int(self.verifier_address),
+                abi=utils.FALCON_VERIFIER_ABI,
+                provider=account,
+            )
+            invocation = await verifier.functions["set_registry_shards"].invoke_v3(
+                shards=[_hex_str_to_int(a) for a in shard_addresses],
+                auto_estimate=True,
+            )
+            await invocation.wait_for_acceptance()
+            return (
+                f"Verifier uses {len(shard_addresses)} registry shard(s).",
+                hex(invocation.hash),
+            )
+        except Exception as e:
+            print(f"Error calling 'set_registry_shards': {e}")
+            traceback.print_exc()
+            return f"Error setting registry shards: {str(e)}", None
+
+    async def register_public_key(
+        self,
+        pk_coefficients: List[int],
+        deployer_private_key_hex: str,
+        deployer_account_address_hex: str,
+    ) -> tuple[str | None, str | None]:
+        """call_register_public_key against the key's shard."""
+        try:
+            shard = await self.shard_for(self.key_hash(pk_coefficients))
+        except Exception as e:
+            print(f"Error reading the registry shards of {self.verifier_address}: {e}")
+            traceback.print_exc()
+            return f"Error reading registry shards: {str(e)}", None
+        return await call_register_public_key(
+            _hex_str_to_int(shard),
+            pk_coefficients,
+            deployer_private_key_hex,
+            deployer_account_address_hex,
+        )
+
+    async def get_public_key(self, key_hash: int) -> tuple[Optional[List[int]], Optional[str]]:
+        """
+        Reads a key from its shard's storage.
+
+        Returns:
+            tuple: (coefficients, None) or (None, Error_Message)
+        """
+        from felt_codec import read_packed_public_key
+
+        try:
+            shard = await self.shard_for(key_hash)
+            client = make_client()
+            pk = await read_packed_public_key(client, _hex_str_to_int(shard), key_hash)
+        except Exception as e:
+            print(f"Error reading key {hex(key_hash)} via {self.verifier_address}: {e}")
+            traceback.print_exc()
+            return None, f"Error reading public key: {str(e)}"
+        if pk is None:
+            return None, f"Error: Key {hex(key_hash)} is not registered on shard {shard}."
+        return pk, None
+
+
+async def get_escrow_message_point(
+    escrow_contract_address: str,
+) -> Tuple[Optional[dict], Optional[str]]:
+    """
+    Resolves the message point an escrow expects signatures over.
+
+    If the escrow only stores a commitment (set_message_point_commitment), the point
+    is the default utils.MSG_POINT if it matches the commitment, otherwise the one
+    with that commitment in the msg_points table (see call_msg_points). Escrows
+    without get_message_point_commitment are read with get_message_point; only
+    those with neither view fall back to utils.MSG_POINT.
+
+    Returns:
+        Tuple of ({"msg_point": [...], "commitment": int}, error_message). commitment
+        is 0 when the point itself is stored on-chain.
+    """
+    try:
+        client = make_client()
+        contract = Contract(
+            address=_hex_str_to_int(escrow_contract_address),
+            abi=utils.FALCON_ESCROW_ABI,
+            provider=client,
+        )
+        try:
+            commitment = (
+                await contract.functions["get_message_point_commitment"].call()
+            )[0]
+        except Exception as e:
+            # Escrows deployed before commitments only have get_message_point
+            if not _is_missing_entry_point(e):
+                raise
+            commitment = 0
+        if commitment:
+            msg_point = CoeffVec(utils.MSG_POINT)
+            if compute_msg_point_commitment(msg_point) != commitment:
+                from msg_points import lookup_commitment
+
+                msg_point = lookup_commitment(commitment)
+                if msg_point is None:
+                    return None, "Error: Escrow commits to an unknown message point."
+            return {"msg_point": msg_point, "commitment": commitment}, None
+
+        try:
+            msg_point = (await contract.functions["get_message_point"].call())[0]
+        except Exception as e:
+            # Escrows deployed before either view use the default point
+            if not _is_missing_entry_point(e):
+                raise
+            msg_point = utils.MSG_POINT
+        if not msg_point:
+            return None, "Error: Escrow has no message point set."
+        return {"msg_point": CoeffVec(msg_point), "commitment": 0}, None
+
+    except Exception as e:
+        print(f"Error reading message point: {e}")
+        traceback.print_exc()
+        return None, f"Error: {str(e)}"
+
+
 async def call_escrow_claim(
     escrow_contract_address: str,
     s1_coefficients: list[int],
     deployer_private_key_hex: str,
     deployer_account_address_hex: str,
+    nonce_allocator: Optional[NonceAllocator] = None,
+    compressed: bool = True,
+    msg_point: Optional[List[int]] = None,
 ) -> tuple[str | None, str | None]:
     """
     Calls the 'claim' function on the specified Escrow contract.
 
+    With `compressed`, s1 is sent in Falcon's compressed encoding through
+    'claim_compressed' (about 20 felts instead of 512 for N=512); escrows without
+    that entry point fall back to 'claim'. For escrows that only store a message point
+    commitment, pass `msg_point`; it is sent packed 17 per felt to the
+    '*_with_msg_point' variants. The fee is estimated first and the
+    transaction is sent with resource bounds derived from the estimate
+    (FEE_AMOUNT_MARGIN / FEE_PRICE_MARGIN).
+
     Args:
         escrow_contract_address (str): Address of the Escrow contract.
-        s1_coefficients (list[int]): List of s1 signature coefficients.
+        s1_coefficients (list[int] | CoeffVec): s1 signature coefficients.
         deployer_private_key_hex (str): Private key for the account.
         deployer_account_address_hex (str): Account address.
+        nonce_allocator (NonceAllocator, optional): Shared allocator when several claims
+            are sent from the same account concurrently; its account is used.
+        compressed (bool): Prefer 'claim_compressed' when the escrow supports it.
+        msg_point (list[int], optional): Message point matching the escrow's commitment.
 
     Returns:
         tuple[str | None, str | None]: (Message, Transaction_Hash_Hex) or (Error_Message, None)
     """
-    account = await get_deployer_account(
-        deployer_private_key_hex, deployer_account_address_hex
-    )
+    if nonce_allocator is not None:
+        account = nonce_allocator.account
+    else:
+        account = await get_deployer_account(
+            deployer_private_key_hex, deployer_account_address_hex
+        )
     if not account:
         return "Error: Deployer account not initialized for claim.", None
 
     try:
+        # Signed or centered coefficients are sent mod Q
+        s1_coefficients = CoeffVec(s1_coefficients, reduce=True)
         escrow_contract = Contract(
-            address=escrow_contract_address,  # Address can be hex string or int
-            abi=FALCON_ESCROW_ABI,
+            address=_hex_str_to_int(escrow_contract_address),
+            abi=utils.FALCON_ESCROW_ABI,
             provider=account,
         )
 
@@ -422,35 +1076,501 @@ async def call_escrow_claim(
             f"Calling 'claim' on Escrow contract {escrow_contract_address} with {len(s1_coefficients)} s1 coeffs."
         )
 
-        # Assuming the Escrow's claim function is: fn claim(ref self: ContractState, s1_span: Span<u16>)
-        # For invoke_v3 (recommended for Sepolia)
-        invocation = await escrow_contract.functions[
-            "claim"
-        ].invoke_v3(
-            s1_span=s1_coefficients,  # starknet-py handles Span<T> from list[T]
-            l1_resource_bounds=ResourceBoundsMapping(  # Example, adjust based on typical cost
-                max_amount=int(1 * 10**5),  # Max L1 gas amount
-                max_price_per_unit=int(25 * 10**9),  # Max L1 gas price in wei
-            ),
+        # The *_with_msg_point variants take the point as calldata instead of
+        # reading it from storage
+        suffix, extra_args = "", {}
+        if msg_point is not None:
+            suffix = "_with_msg_point"
+            extra_args = {"msg_point_packed": CoeffVec(msg_point).to_felts()}
+
+        prepared, estimated_fee = None, None
+        if compressed:
+            from felt_codec import encode_compressed_s1
+
+            s1_compressed = encode_compressed_s1(s1_coefficients)
+            prepared = escrow_contract.functions[
+                "claim_compressed" + suffix
+            ].prepare_invoke_v3(s1_compressed=s1_compressed, **extra_args)
+            try:
+                estimated_fee = await prepared.estimate_fee()
+                print(f"Sending s1 compressed into {len(s1_compressed)} felts.")
+            except Exception as e:
+                if not _is_missing_entry_point(e):
+                    raise
+                prepared = None  # Escrow class predates claim_compressed
+
+        if prepared is None:
+            # fn claim(ref self: ContractState, s1_coeffs: Span<u16>) -> bool
+            prepared = escrow_contract.functions["claim" + suffix].prepare_invoke_v3(
+                s1_coeffs=s1_coefficients.tolist(), **extra_args
+            )
+            estimated_fee = await prepared.estimate_fee()
+        l1_resource_bounds = estimated_fee.to_resource_bounds(
+            FEE_AMOUNT_MARGIN, FEE_PRICE_MARGIN
+        ).l1_gas
+        print(
+            f"Estimated claim fee: {estimated_fee.overall_fee} {estimated_fee.unit}, "
+            f"max L1 gas {l1_resource_bounds.max_amount} at {l1_resource_bounds.max_price_per_unit}"
         )
-        # Or for invoke_v1:
-        # invocation = await escrow_contract.functions["claim"].invoke_v1(
-        #    s1_span=s1_coefficients,
-        #    max_fee=int(1 * 10**14)  # Example max_fee (0.0001 ETH at 1 Gwei gas price)
-        # )
+
+        async def send(nonce: Optional[int]):
+            return await prepared.invoke(
+                l1_resource_bounds=l1_resource_bounds, nonce=nonce
+            )
+
+        if nonce_allocator is not None:
+            invocation = await nonce_allocator.submit(send)
+        else:
+            invocation = await send(None)
 
         print(f"Claim transaction sent with hash: {hex(invocation.hash)}")
-        await account.client.wait_for_tx(
-            tx_hash=invocation.hash
-        )  # More robust wait for tx status
+        await invocation.wait_for_acceptance()
         print(f"Claim transaction {hex(invocation.hash)} accepted on-chain.")
 
         return "Claim transaction accepted.", hex(invocation.hash)
 
     except Exception as e:
-        print(f"Error in deposit_stark_token: {e}")
         print(f"Error calling 'claim' on Escrow contract: {e}")
         traceback.print_exc()
+        return f"Error during claim: {str(e)}", None
+
+
+def build_escrow_claim_call(
+    escrow_contract_address: str,
+    s1_coefficients: list[int],
+    msg_point: Optional[List[int]] = None,
+) -> Call:
+    """
+    Builds the 'claim_compressed' call (or 'claim_compressed_with_msg_point' when
+    `msg_point` is given) for one escrow, for use in a multicall.
+    """
+    from felt_codec import encode_compressed_s1
+
+    s1_compressed = encode_compressed_s1(s1_coefficients)
+    # Spans are serialized as [len, *items]
+    calldata = [len(s1_compressed), *s1_compressed]
+    entry_point = "claim_compressed"
+    if msg_point is not None:
+        msg_point_packed = CoeffVec(msg_point).to_felts()
+        calldata += [len(msg_point_packed), *msg_point_packed]
+        entry_point = "claim_compressed_with_msg_point"
+    return Call(
+        to_addr=_hex_str_to_int(escrow_contract_address),
+        selector=get_selector_from_name(entry_point),
+        calldata=calldata,
+    )
+
+
+async def call_escrow_claims_multicall(
+    claim_calls: List[Call],
+    nonce_allocator: NonceAllocator,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Sends several claim calls (see build_escrow_claim_call) in one transaction.
+
+    The fee is estimated first and the transaction is sent with resource bounds
+    derived from the estimate, as in call_escrow_claim. A batch in which any claim
+    would revert, or which exceeds the transaction step limit, fails the estimate
+    before anything is sent and costs no gas.
+
+    Returns:
+        Tuple of (transaction_hash_hex, error_message):
+        (hash, None) once accepted; (None, error) if nothing was sent; (hash, error)
+        if the transaction was sent but was not seen accepted (reverted, timed out,
+        or the node failed while polling).
+    """
+    account = nonce_allocator.account
+    try:
+        estimate_tx = await account.sign_invoke_v3(
+            claim_calls,
+            nonce=await account.get_nonce(),
+            l1_resource_bounds=ResourceBounds.init_with_zeros(),
+        )
+        estimated_fee = await account.estimate_fee(estimate_tx)
+        l1_resource_bounds = estimated_fee.to_resource_bounds(
+            FEE_AMOUNT_MARGIN, FEE_PRICE_MARGIN
+        ).l1_gas
+        print(
+            f"Estimated fee for {len(claim_calls)} claim(s): {estimated_fee.overall_fee} {estimated_fee.unit}"
+        )
+
+        async def send(nonce: Optional[int]):
+            return await account.execute_v3(
+                calls=claim_calls, l1_resource_bounds=l1_resource_bounds, nonce=nonce
+            )
+
+        invocation = await nonce_allocator.submit(send)
+    except Exception as e:
+        print(f"Error sending claim multicall: {e}")
+        traceback.print_exc()
         return None, f"Error: {str(e)}"
 
+    tx_hash = hex(invocation.hash)
+    print(f"Multicall with {len(claim_calls)} claim(s) sent with hash: {tx_hash}")
+    try:
+        await account.client.wait_for_tx(tx_hash=invocation.hash)
+    except Exception as e:
+        print(f"Claim multicall {tx_hash} not confirmed: {e}")
+        return tx_hash, f"Error: Sent but not confirmed: {str(e)}"
+    return tx_hash, None
+
+
+async def get_escrow_status(
+    escrow_contract_address: str,
+    at_block: Optional[int] = None,
+) -> Tuple[Optional[dict], Optional[str]]:
+    """
+    Reads get_escrow_details and the current block number.
+
+    Args:
+        escrow_contract_address (str): Address of the Escrow contract.
+        at_block (int, optional): Block to derive the status fields for instead of
+            the latest one, e.g. the pending block a transaction will execute in.
+            The details are still read at the latest block.
+
+    Returns:
+        Tuple of (status_dict, error_message). status_dict contains the EscrowDetails
+        fields plus status, current_block, blocks_elapsed and blocks_remaining.
+    """
+    try:
+        client = make_client()
+        contract = Contract(
+            address=_hex_str_to_int(escrow_contract_address),
+            abi=utils.FALCON_ESCROW_ABI,
+            provider=client,
+        )
+        current_block = (
+            at_block if at_block is not None else await client.get_block_number()
+        )
+        # get_escrow_details returns a single struct
+        details = (await contract.functions["get_escrow_details"].call())[0]
+        return compute_escrow_status(dict(details), current_block), None
+
+    except Exception as e:
+        print(f"Error getting escrow status: {e}")
+        traceback.print_exc()
+        return None, f"Error: {str(e)}"
+
+
+async def get_indexed_escrow_status(
+    escrow_index: EscrowIndex,
+    escrow_contract_address: str,
+) -> Tuple[Optional[dict], Optional[str]]:
+    """
+    Same result as get_escrow_status, computed from a local EscrowIndex.
+
+    The first query of an escrow seeds it from get_escrow_details; later ones only
+    read the block number and, when it has moved, the escrow's new events.
+
+    Returns:
+        Tuple of (status_dict, error_message)
+    """
+    try:
+        client = make_client()
+        address = _hex_str_to_int(escrow_contract_address)
+        current_block = await client.get_block_number()
+        if address not in escrow_index.escrows:
+            contract = Contract(
+                address=address, abi=utils.FALCON_ESCROW_ABI, provider=client
+            )
+            details = (await contract.functions["get_escrow_details"].call())[0]
+            escrow_index.load_details(address, dict(details))
+            escrow_index.synced_block[address] = current_block
+        else:
+            await escrow_index.sync(client, [address], current_block)
+        return escrow_index.status(address, current_block), None
+
+    except Exception as e:
+        print(f"Error getting indexed escrow status: {e}")
+        traceback.print_exc()
+        return None, f"Error: {str(e)}"
+
+
+async def call_escrow_dispute(
+    escrow_contract_address: str,
+    deployer_private_key_hex: str,
+    deployer_account_address_hex: str,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Calls 'dispute' on the Escrow contract as the client.
+
+    Returns:
+        Tuple of (transaction_hash_hex, error_message)
+    """
+    account = await get_deployer_account(
+        deployer_private_key_hex, deployer_account_address_hex
+    )
+    if not account:
+        return None, "Error: Deployer account not initialized for dispute."
+
+    try:
+        contract = Contract(
+            address=_hex_str_to_int(escrow_contract_address),
+            abi=utils.FALCON_ESCROW_ABI,
+            provider=account,
+        )
+        invoke_result = await contract.functions["dispute"].invoke_v3(
+            auto_estimate=True
+        )
+        await invoke_result.wait_for_acceptance()
+        print(f"Dispute accepted. Transaction hash: {hex(invoke_result.hash)}")
+        return hex(invoke_result.hash), None
+
+    except Exception as e:
+        print(f"Error calling 'dispute' on Escrow contract: {e}")
+        traceback.print_exc()
+        return None, f"Error: {str(e)}"
+
+
+async def call_escrow_deposit(
+    escrow_contract_address: str,
+    amount: int,
+    deployer_private_key_hex: str,
+    deployer_account_address_hex: str,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Approves `amount` STRK for the escrow and calls 'deposit' as the client.
+
+    Returns:
+        Tuple of (deposit_transaction_hash_hex, error_message)
+    """
+    account = await get_deployer_account(
+        deployer_private_key_hex, deployer_account_address_hex
+    )
+    if not account:
+        return None, "Error: Deployer account not initialized for deposit."
+
+    _, error = await Stark_Token_Approve(
+        STRK_TOKEN_ADDRESS, escrow_contract_address, account, amount
+    )
+    if error:
+        return None, error
+    return await deposit_stark_token(escrow_contract_address, account)
+
+
+async def create_managed_escrow(
+    escrow_manager_address: str,
+    provider_key_hash: str,
+    provider_address: str,
+    total_amount: int,
+    service_period_blocks: int,
+    deployer_private_key_hex: str,
+    deployer_account_address_hex: str,
+    msg_point: Optional[List[int]] = None,
+) -> Tuple[Optional[Union[int, str]], Optional[str]]:
+    """
+    Creates an escrow on an EscrowManager and deposits into it.
+
+    The STRK approval and 'create_escrow' are sent as one multicall, so a new
+    escrow costs a single invoke instead of a deployment and three setup
+    transactions. The escrow commits to `msg_point` (default utils.MSG_POINT).
+
+    Args:
+        escrow_manager_address (str): Address of the EscrowManager contract.
+        provider_key_hash (str): Poseidon hash of the provider's Falcon public key.
+        provider_address (str): Account paid on claim.
+        total_amount (int): Deposit in STRK base units.
+        service_period_blocks (int): Length of the service period in blocks.
+        deployer_private_key_hex (str): Private key of the client account.
+        deployer_account_address_hex (str): Address of the client account.
+        msg_point (list[int], optional): Message point the provider signs.
+
+    Returns:
+        tuple: (Escrow_ID, Transaction_Hash_Hex) or (Error_Message, None)
+    """
+    account = await get_deployer_account(
+        deployer_private_key_hex, deployer_account_address_hex
+    )
+    if not account:
+        return "Error: Deployer account not initialized for escrow creation.", None
+
+    try:
+        manager_address_int = _hex_str_to_int(escrow_manager_address)
+        if msg_point is None:
+            msg_point = CoeffVec(utils.MSG_POINT)
+        calls = [
+            Call(
+                to_addr=_hex_str_to_int(STRK_TOKEN_ADDRESS),
+                selector=get_selector_from_name("approve"),
+                # u256 amount as (low, high)
+                calldata=[manager_address_int, total_amount % 2**128, total_amount >> 128],
+            ),
+            Call(
+                to_addr=manager_address_int,
+                selector=get_selector_from_name("create_escrow"),
+                calldata=[
+                    _hex_str_to_int(provider_key_hash),
+                    _hex_str_to_int(provider_address),
+                    total_amount,
+                    service_period_blocks,
+                    len(msg_point),
+                    compute_msg_point_commitment(msg_point),
+                ],
+            ),
+        ]
+        invocation = await account.execute_v3(calls=calls, auto_estimate=True)
+        print(f"Escrow creation sent with hash: {hex(invocation.hash)}")
+        await account.client.wait_for_tx(tx_hash=invocation.hash)
+
+        receipt = await account.client.get_transaction_receipt(invocation.hash)
+        created_selector = get_selector_from_name("EscrowCreated")
+        for event in receipt.events:
+            if (
+                event.from_address == manager_address_int
+                and len(event.keys) > 1
+                and event.keys[0] == created_selector
+            ):
+                print(f"Created escrow {event.keys[1]} on {escrow_manager_address}")
+                return event.keys[1], hex(invocation.hash)
+        return "Error: No EscrowCreated event in the receipt.", None
+
+    except Exception as e:
+        print(f"Error calling 'create_escrow' on EscrowManager: {e}")
+        traceback.print_exc()
+        return f"Error during escrow creation: {str(e)}", None
+
+
+async def get_managed_escrows(
+    escrow_manager_address: str,
+    escrow_ids: List[int],
+) -> Tuple[Optional[dict], Optional[str]]:
+    """
+    Reads several escrows of an EscrowManager with one 'get_escrows' call.
+
+    Returns:
+        Tuple of ({escrow_id: status_dict}, error_message). Each status_dict holds
+        the EscrowRecord fields plus the fields added by compute_escrow_status.
+    """
+    try:
+        client = make_client()
+        contract = Contract(
+            address=_hex_str_to_int(escrow_manager_address),
+            abi=utils.ESCROW_MANAGER_ABI,
+            provider=client,
+        )
+        current_block = await client.get_block_number()
+        records = (await contract.functions["get_escrows"].call(list(escrow_ids)))[0]
+        # Managed escrows are funded at creation
+        return {
+            escrow_id: compute_escrow_status(
+                {**dict(record), "is_deposited": True}, current_block
+            )
+            for escrow_id, record in zip(escrow_ids, records)
+        }, None
+
+    except Exception as e:
+        print(f"Error reading managed escrows: {e}")
+        traceback.print_exc()
+        return None, f"Error: {str(e)}"
+
+
+async def claim_managed_escrow(
+    escrow_manager_address: str,
+    escrow_id: int,
+    s1_coefficients: list[int],
+    deployer_private_key_hex: str,
+    deployer_account_address_hex: str,
+    nonce_allocator: Optional[NonceAllocator] = None,
+    msg_point: Optional[List[int]] = None,
+) -> tuple[str | None, str | None]:
+    """
+    Claims one escrow of an EscrowManager with a compressed s1 and the packed
+    message point (default utils.MSG_POINT) the escrow commits to.
+
+    Args:
+        escrow_manager_address (str): Address of the EscrowManager contract.
+        escrow_id (int): ID returned by create_managed_escrow.
+        s1_coefficients (list[int]): List of s1 signature coefficients.
+        deployer_private_key_hex (str): Private key for the account.
+        deployer_account_address_hex (str): Account address.
+        nonce_allocator (NonceAllocator, optional): Shared allocator when several claims
+            are sent from the same account concurrently; its account is used.
+        msg_point (list[int], optional): Message point matching the escrow's commitment.
+
+    Returns:
+        tuple[str | None, str | None]: (Message, Transaction_Hash_Hex) or (Error_Message, None)
+    """
+    if nonce_allocator is not None:
+        account = nonce_allocator.account
+    else:
+        account = await get_deployer_account(
+            deployer_private_key_hex, deployer_account_address_hex
+        )
+    if not account:
+        return "Error: Deployer account not initialized for claim.", None
+
+    try:
+        from felt_codec import encode_compressed_s1
+
+        if msg_point is None:
+            msg_point = CoeffVec(utils.MSG_POINT)
+        contract = Contract(
+            address=_hex_str_to_int(escrow_manager_address),
+            abi=utils.ESCROW_MANAGER_ABI,
+            provider=account,
+        )
+        prepared = contract.functions["claim"].prepare_invoke_v3(
+            escrow_id=escrow_id,
+            s1_compressed=encode_compressed_s1(s1_coefficients),
+            msg_point_packed=CoeffVec(msg_point).to_felts(),
+        )
+        estimated_fee = await prepared.estimate_fee()
+        l1_resource_bounds = estimated_fee.to_resource_bounds(
+            FEE_AMOUNT_MARGIN, FEE_PRICE_MARGIN
+        ).l1_gas
+
+        async def send(nonce: Optional[int]):
+            return await prepared.invoke(
+                l1_resource_bounds=l1_resource_bounds, nonce=nonce
+            )
+
+        if nonce_allocator is not None:
+            invocation = await nonce_allocator.submit(send)
+        else:
+            invocation = await send(None)
+
+        print(f"Claim of escrow {escrow_id} sent with hash: {hex(invocation.hash)}")
+        await invocation.wait_for_acceptance()
+        return f"Escrow {escrow_id} claimed.", hex(invocation.hash)
+
+    except Exception as e:
+        print(f"Error calling 'claim' on EscrowManager: {e}")
+        traceback.print_exc()
         return f"Error during claim: {str(e)}", None
+
+
+async def dispute_managed_escrow(
+    escrow_manager_address: str,
+    escrow_id: int,
+    deployer_private_key_hex: str,
+    deployer_account_address_hex: str,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Calls 'dispute' for one escrow of an EscrowManager as its client.
+
+    Returns:
+        Tuple of (transaction_hash_hex, error_message)
+    """
+    account = await get_deployer_account(
+        deployer_private_key_hex, deployer_account_address_hex
+    )
+    if not account:
+        return None, "Error: Deployer account not initialized for dispute."
+
+    try:
+        contract = Contract(
+            address=_hex_str_to_int(escrow_manager_address),
+            abi=utils.ESCROW_MANAGER_ABI,
+            provider=account,
+        )
+        invoke_result = await contract.functions["dispute"].invoke_v3(
+            escrow_id, auto_estimate=True
+        )
+        await invoke_result.wait_for_acceptance()
+        print(f"Dispute of escrow {escrow_id} accepted. Transaction hash: {hex(invoke_result.hash)}")
+        return hex(invoke_result.hash), None
+
+    except Exception as e:
+        print(f"Error calling 'dispute' on EscrowManager: {e}")
+        traceback.print_exc()
+        return None, f"Error: {str(e)}"
@@ -0,0 +1,324 @@
+# scripts/claims.py
+"""
+Provider-side escrow claims.
+
+Each claim signs the escrow's message point with the provider's cached
+Falcon key (see keystore.py), checks the signature locally and only then sends
+the claim transaction, so a bad signature never costs gas.
+"""
+import asyncio
+from typing import Callable, Optional
+
+from cairo_interactions import (
+    NonceAllocator,
+    get_deployer_account,
+    get_preflight_simulator,
+    get_escrow_status,
+    get_escrow_message_point,
+    build_escrow_claim_call,
+    call_escrow_claim,
+    call_escrow_claims_multicall,
+    _is_missing_entry_point,
+)
+from falcon_offchain import sign_msg_point, verify_uncompressed
+from felt_codec import CoeffVec
+import keystore
+
+# Claims prepared (status read, signing, fee estimate) at the same time
+MAX_CONCURRENT_CLAIMS = 4
+# Each claim decompresses s1 and runs a full Falcon verification; eight stay
+# well inside the per-transaction step limit. Larger batches that do not fit
+# are split further when their fee estimate fails.
+MAX_CLAIMS_PER_MULTICALL = 8
+# Starknet rejects invoke transactions with more calldata than this
+MAX_MULTICALL_CALLDATA_FELTS = 4000
+
+# Outcome message of a claim whose transaction was accepted
+CLAIM_ACCEPTED = "Claim transaction accepted."
+
+NO_CACHED_KEY_ERROR = (
+    "Error: No cached Falcon signing key for this account. "
+    "Deploy the Key Registry & Verifier first."
+)
+
+
+def parse_escrow_addresses(text: str) -> list[str]:
+    """Splits a comma / whitespace separated list of addresses, dropping duplicates."""
+    addresses = []
+    for part in text.replace(",", " ").split():
+        if part not in addresses:
+            addresses.append(part)
+    return addresses
+
+
+async def prepare_escrow_claim(
+    escrow_contract_address: str,
+    sk,
+    account_address: str,
+    claim_block: Optional[int] = None,
+) -> tuple[Optional[dict], Optional[str]]:
+    """
+    Checks that an escrow can be claimed by account_address, then signs its
+    message point and checks the signature locally.
+
+    Args:
+        claim_block (int, optional): Block the claim will execute in; defaults to
+            the latest block. A claim sent now executes in the pending block,
+            latest + 1, so the keeper passes that to claim on time.
+
+    Returns:
+        tuple: ({"s1": [...], "msg_point": [...] or None}, None) or (None, Error_Message).
+        msg_point is only set for commitment-only escrows, which need it in the
+        claim calldata.
+    """
+    status, error = await get_escrow_status(escrow_contract_address, claim_block)
+    if error:
+        return None, error
+    if int(status["provider"]) != int(account_address, 16):
+        return None, "Error: This account is not the escrow's provider."
+    if status["is_claimed"]:
+        return None, "Error: Escrow already claimed."
+    if status["is_disputed"]:
+        return None, "Error: Escrow is disputed."
+    if not status["is_deposited"]:
+        return None, "Error: Escrow has no deposit yet."
+    if status["status"] != "Completed":
+        return (
+            None,
+            f"Error: Service period not complete ({status['blocks_remaining']} blocks remaining).",
+        )
+
+    message_point, error = await get_escrow_message_point(escrow_contract_address)
+    if error:
+        return None, error
+    msg_point = message_point["msg_point"]
+
+    # Signing is CPU bound; keep it off the event loop
+    s1 = await asyncio.to_thread(sign_msg_point, sk, msg_point)
+    if not verify_uncompressed(s1, CoeffVec(sk.h), msg_point):
+        return None, "Error: Local signature check failed; claim not sent."
+    return {
+        "s1": s1,
+        "msg_point": msg_point if message_point["commitment"] else None,
+    }, None
+
+
+async def claim_escrow_with_cached_key(
+    escrow_contract_address: str,
+    private_key: str,
+    account_address: str,
+    nonce_allocator: Optional[NonceAllocator] = None,
+) -> tuple[Optional[str], Optional[str]]:
+    """
+    Claims one escrow with the provider's cached signing key.
+
+    Returns:
+        tuple: (Message, Transaction_Hash_Hex) or (Error_Message, None)
+    """
+    sk = keystore.load_signing_key(account_address)
+    if sk is None:
+        return NO_CACHED_KEY_ERROR, None
+
+    claim, error = await prepare_escrow_claim(escrow_contract_address, sk, account_address)
+    if error:
+        return error, None
+
+    return await call_escrow_claim(
+        escrow_contract_address,
+        claim["s1"],
+        private_key,
+        account_address,
+        nonce_allocator=nonce_allocator,
+        msg_point=claim["msg_point"],
+    )
+
+
+async def claim_provider_escrows(
+    report: Callable[[str], None],
+    escrow_addresses: list[str],
+    private_key: str,
+    account_address: str,
+    max_concurrency: int = MAX_CONCURRENT_CLAIMS,
+) -> dict:
+    """
+    Claims several escrows for one provider with bounded concurrency. Transactions
+    share one account, so nonces are handed out by a NonceAllocator.
+
+    Returns:
+        dict: escrow address -> (Message, Transaction_Hash_Hex or None)
+    """
+    account = await get_deployer_account(private_key, account_address)
+    if not account:
+        raise RuntimeError("Deployer account not initialized for claim.")
+
+    nonce_allocator = NonceAllocator(account)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def claim_one(address: str):
+        async with semaphore:
+            report(f"Claiming {address}...")
+            message, tx_hash = await claim_escrow_with_cached_key(
+                address, private_key, account_address, nonce_allocator
+            )
+        if tx_hash:
+            report(f"{address}: {message}\nTx Hash: {tx_hash}")
+        else:
+            report(f"{address}: {message}")
+        return address, (message, tx_hash)
+
+    outcomes = dict(await asyncio.gather(*(claim_one(a) for a in escrow_addresses)))
+    claimed = sum(1 for _, tx_hash in outcomes.values() if tx_hash)
+    report(f"Claimed {claimed} of {len(escrow_addresses)} escrow(s).")
+    return outcomes
+
+
+def chunk_claim_calls(
+    claim_calls: list,
+    max_calls: int = MAX_CLAIMS_PER_MULTICALL,
+    max_felts: int = MAX_MULTICALL_CALLDATA_FELTS,
+) -> list[list[int]]:
+    """
+    Splits claim calls into multicalls, in order, each within max_calls calls and
+    max_felts of __execute__ calldata.
+
+    Returns:
+        list[list[int]]: Indexes into claim_calls, one list per multicall.
+    """
+    batches, current, current_felts = [], [], 1
+    for index, call in enumerate(claim_calls):
+        # [to, selector, calldata_len, *calldata]
+        call_felts = 3 + len(call.calldata)
+        if current and (
+            current_felts + call_felts > max_felts or len(current) >= max_calls
+        ):
+            batches.append(current)
+            current, current_felts = [], 1
+        current.append(index)
+        current_felts += call_felts
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def claim_provider_escrows_batched(
+    report: Callable[[str], None],
+    escrow_addresses: list[str],
+    private_key: str,
+    account_address: str,
+    max_concurrency: int = MAX_CONCURRENT_CLAIMS,
+    claim_block: Optional[int] = None,
+) -> dict:
+    """
+    Claims several escrows for one provider with as few transactions as possible.
+
+    Every escrow is prechecked and signed off-chain first (prepare_escrow_claim),
+    then each claim is simulated (PreflightSimulator); escrows that would fail
+    are reported with the reason and left out. The rest are sent as
+    execute_v3 multicalls of up to MAX_CLAIMS_PER_MULTICALL claims. A multicall is
+    all-or-nothing, so one whose fee estimate fails (a claim that would revert,
+    or too many steps) is split in half and retried; a single claim that still
+    fails goes through call_escrow_claim, which handles escrows that predate
+    'claim_compressed'. Only failures before a transaction hash exists are
+    retried: a multicall that was sent but not confirmed is reported with its
+    hash and an error message, never resent.
+
+    `claim_block` is passed to prepare_escrow_claim (see there).
+
+    Returns:
+        dict: escrow address -> (Message, Transaction_Hash_Hex or None). Escrows
+        claimed in the same multicall share its transaction hash; the message is
+        CLAIM_ACCEPTED once that transaction was accepted.
+    """
+    sk = keystore.load_signing_key(account_address)
+    if sk is None:
+        return {address: (NO_CACHED_KEY_ERROR, None) for address in escrow_addresses}
+
+    account = await get_deployer_account(private_key, account_address)
+    if not account:
+        raise RuntimeError("Deployer account not initialized for claim.")
+
+    nonce_allocator = NonceAllocator(account)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    outcomes: dict = {}
+
+    async def prepare_one(address: str):
+        async with semaphore:
+            claim, error = await prepare_escrow_claim(
+                address, sk, account_address, claim_block
+            )
+        if error:
+            outcomes[address] = (error, None)
+            report(f"{address}: skipped, {error}")
+            return None
+        return address, claim
+
+    prepared = [
+        p
+        for p in await asyncio.gather(*(prepare_one(a) for a in escrow_addresses))
+        if p is not None
+    ]
+    # Dry-run every claim on its own and keep the ones that would succeed
+    calls = [
+        build_escrow_claim_call(address, claim["s1"], claim["msg_point"])
+        for address, claim in prepared
+    ]
+    reasons = []
+    if calls:
+        reasons = await get_preflight_simulator(account).check(
+            [[call] for call in calls]
+        )
+    addresses, claim_calls = [], []
+    for (address, _), call, reason in zip(prepared, calls, reasons):
+        if reason and not _is_missing_entry_point(reason):
+            outcomes[address] = (f"Error: Claim would revert: {reason}", None)
+            report(f"{address}: skipped, claim would revert: {reason}")
+            continue
+        addresses.append(address)
+        claim_calls.append(call)
+    claims = dict(prepared)
+
+    async def send(indexes: list[int]):
+        if len(indexes) == 1:
+            address = addresses[indexes[0]]
+            tx_hash, error = await call_escrow_claims_multicall(
+                [claim_calls[indexes[0]]], nonce_allocator
+            )
+            if error and not tx_hash and _is_missing_entry_point(error):
+                message, tx_hash = await call_escrow_claim(
+                    address,
+                    claims[address]["s1"],
+                    private_key,
+                    account_address,
+                    nonce_allocator=nonce_allocator,
+                    msg_point=claims[address]["msg_point"],
+                )
+                outcomes[address] = (message, tx_hash)
+            else:
+                outcomes[address] = (error or CLAIM_ACCEPTED, tx_hash)
+            report(f"{address}: {outcomes[address][0]}")
+            return
+
+        tx_hash, error = await call_escrow_claims_multicall(
+            [claim_calls[i] for i in indexes], nonce_allocator
+        )
+        if error and not tx_hash:
+            # Nothing was sent, so the halves can be tried on their own
+            half = len(indexes) // 2
+            report(f"Multicall of {len(indexes)} claims failed, splitting: {error}")
+            await asyncio.gather(send(indexes[:half]), send(indexes[half:]))
+            return
+        for i in indexes:
+            outcomes[addresses[i]] = (error or CLAIM_ACCEPTED, tx_hash)
+        if error:
+            # Sent; resending could claim twice, so leave it to the receipt or events
+            report(f"{len(indexes)} claim(s) sent but not confirmed: {error}\nTx Hash: {tx_hash}")
+        else:
+            report(f"Claimed {len(indexes)} escrow(s) in one transaction.\nTx Hash: {tx_hash}")
+
+    batches = chunk_claim_calls(claim_calls)
+    report(f"Sending {len(claim_calls)} claim(s) in {len(batches)} transaction(s)...")
+    await asyncio.gather(*(send(batch) for batch in batches))
+
+    claimed = sum(1 for _, tx_hash in outcomes.values() if tx_hash)
+    report(f"Claimed {claimed} of {len(escrow_addresses)} escrow(s).")
+    return outcomes
@@ -0,0 +1,303 @@
+# scripts/escrow_model.py
+"""
+Local model of the Escrow contract's state machine.
+
+EscrowState mirrors the contract's storage and replays its rules
+(get_service_status, calculate_proportional_amount, the claim and dispute
+branches), so status, payout and what-if queries for any block are answered
+without RPC calls. EscrowIndex builds the states from the contracts' events and
+can check them against get_escrow_details.
+"""
+from dataclasses import dataclass, fields
+from typing import Callable, Iterable, Optional
+
+# Values of Escrow::get_service_status
+STATUS_NOT_STARTED = 0
+STATUS_PENDING = 1
+STATUS_ACTIVE = 2
+STATUS_COMPLETED = 3
+
+EVENT_NAMES = ("EscrowCreated", "EscrowDeposited", "EscrowClaimed", "EscrowDisputed")
+# get_events page size
+EVENTS_CHUNK_SIZE = 1000
+
+
+def compute_escrow_status(details: dict, current_block: int) -> dict:
+    """
+    Derives the UI status fields from an EscrowDetails struct and the current block.
+    """
+    service_start_block = details["service_start_block"]
+    service_period_blocks = details["service_period_blocks"]
+
+    if service_start_block == 0:
+        status, blocks_elapsed, blocks_remaining = "Service not started", 0, 0
+    else:
+        blocks_elapsed = current_block - service_start_block
+        blocks_remaining = max(0, service_period_blocks - blocks_elapsed)
+        status = "In Progress"
+        if blocks_remaining == 0:
+            status = "Completed"
+        elif details["is_disputed"]:
+            status = "Disputed"
+        elif not details["is_deposited"]:
+            status = "Awaiting Deposit"
+
+    return {
+        "status": status,
+        "current_block": current_block,
+        "blocks_elapsed": blocks_elapsed,
+        "blocks_remaining": blocks_remaining,
+        **details,
+    }
+
+
+def calculate_proportional_amount(
+    total_amount: int, total_blocks: int, blocks_served: int
+) -> int:
+    """Escrow::calculate_proportional_amount: the provider's share, floored."""
+    return min(total_amount, total_amount * blocks_served // total_blocks)
+
+
+@dataclass
+class EscrowState:
+    """The fields of EscrowDetails, updated by applying the contract's events."""
+
+    provider_key_hash: int
+    total_amount: int
+    service_period_blocks: int
+    service_start_block: int = 0
+    is_completed: bool = False
+    is_claimed: bool = False
+    is_disputed: bool = False
+    is_deposited: bool = False
+    client: int = 0
+    # Not part of any event; filled in from get_escrow_details when known
+    provider: int = 0
+
+    @property
+    def claimable_block(self) -> Optional[int]:
+        """First block at which claim() passes its status check, once deposited."""
+        if not self.is_deposited:
+            return None
+        return self.service_start_block + self.service_period_blocks
+
+    def service_status(self, block: int) -> int:
+        if not self.is_deposited:
+            return STATUS_NOT_STARTED
+        if block <= self.service_start_block:
+            return STATUS_PENDING
+        if block < self.service_start_block + self.service_period_blocks:
+            return STATUS_ACTIVE
+        return STATUS_COMPLETED
+
+    def claim_error(self, block: int) -> Optional[str]:
+        """The assertion claim() would fail with at `block`, if any."""
+        if not self.is_deposited:
+            return "Not deposited"
+        if self.is_claimed:
+            return "Already claimed"
+        if self.is_disputed:
+            return "Contract disputed"
+        if self.service_status(block) != STATUS_COMPLETED:
+            return "Service period not complete"
+        return None
+
+    def dispute_error(self) -> Optional[str]:
+        """The assertion dispute() would fail with, if any (the caller is not checked)."""
+        if not self.is_deposited:
+            return "Not deposited"
+        if self.is_claimed:
+            return "Already claimed"
+        if self.is_disputed:
+            return "Already disputed"
+        return None
+
+    def dispute_payout(self, block: int) -> tuple[int, int, int]:
+        """
+        What a dispute at `block` pays out.
+
+        Returns:
+            tuple: (blocks_served, provider_amount, client_refund)
+        """
+        status = self.service_status(block)
+        if status <= STATUS_PENDING:
+            return 0, 0, self.total_amount
+        if status == STATUS_COMPLETED:
+            blocks_served = self.service_period_blocks
+        else:
+            blocks_served = block - self.service_start_block
+        provider_amount = calculate_proportional_amount(
+            self.total_amount, self.service_period_blocks, blocks_served
+        )
+        return blocks_served, provider_amount, self.total_amount - provider_amount
+
+    def apply_deposit(self, block: int) -> None:
+        self.service_start_block = block
+        self.is_deposited = True
+
+    def apply_claim(self) -> None:
+        self.is_claimed = True
+        self.is_completed = True
+
+    def apply_dispute(self) -> None:
+        self.is_disputed = True
+        self.is_completed = True
+
+    def details(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def status(self, block: int) -> dict:
+        """Same fields as cairo_interactions.get_escrow_status, computed locally."""
+        return compute_escrow_status(self.details(), block)
+
+
+class EscrowIndex:
+    """
+    EscrowStates for a set of Escrow contracts, kept current from their events.
+
+    sync() fetches the events emitted since the last synced block, so following
+    the chain costs one get_events page per new block rather than one call per
+    escrow.
+    """
+
+    def __init__(self, on_event: Optional[Callable[[int, str], None]] = None):
+        """
+        Args:
+            on_event: Called with (address, event name) for every applied event,
+                e.g. to invalidate cached view results of that contract.
+        """
+        self.escrows: dict[int, EscrowState] = {}
+        self.synced_block: dict[int, int] = {}
+        self.on_event = on_event
+
+    def apply_event(
+        self, address: int, name: str, data: list[int], block_number: int
+    ) -> None:
+        """Applies one decoded Escrow event (no #[key] fields, so data holds them all)."""
+        if self.on_event is not None:
+            self.on_event(address, name)
+        if name == "EscrowCreated":
+            client, provider_key_hash, total_amount, service_period_blocks = data[:4]
+            self.escrows[address] = EscrowState(
+                provider_key_hash=provider_key_hash,
+                total_amount=total_amount,
+                service_period_blocks=service_period_blocks,
+                client=client,
+            )
+            return
+        escrow = self.escrows.get(address)
+        if escrow is None:
+            return  # Created before the synced range
+        if name == "EscrowDeposited":
+            escrow.apply_deposit(block_number)
+        elif name == "EscrowClaimed":
+            escrow.provider = data[0]
+            escrow.apply_claim()
+        elif name == "EscrowDisputed":
+            escrow.apply_dispute()
+
+    def load_details(self, address: int, details: dict) -> EscrowState:
+        """Seeds (or replaces) an escrow from its get_escrow_details result."""
+        names = {f.name for f in fields(EscrowState)}
+        escrow = EscrowState(**{k: v for k, v in details.items() if k in names})
+        self.escrows[address] = escrow
+        return escrow
+
+    async def sync(
+        self,
+        client,
+        addresses: Iterable[int],
+        to_block: int,
+        from_block: int = 0,
+    ) -> None:
+        """
+        Applies the events of `addresses` up to `to_block`, starting after the
+        last block synced for each (or at `from_block`).
+
+        Args:
+            client: A starknet_py FullNodeClient.
+            addresses (Iterable[int]): Escrow contract addresses.
+            to_block (int): Last block to include.
+            from_block (int): First block for addresses not synced before.
+        """
+        from starknet_py.hash.selector import get_selector_from_name
+
+        names = {get_selector_from_name(name): name for name in EVENT_NAMES}
+        for address in addresses:
+            start = self.synced_block.get(address, from_block - 1) + 1
+            if start > to_block:
+                continue
+            chunk = await client.get_events(
+                address=address,
+                keys=[list(names)],
+                from_block_number=start,
+                to_block_number=to_block,
+                follow_continuation_token=True,
+                chunk_size=EVENTS_CHUNK_SIZE,
+            )
+            for event in chunk.events:
+                self.apply_event(
+                    address, names[event.keys[0]], list(event.data), event.block_number
+                )
+            self.synced_block[address] = to_block
+
+    async def sync_watched(self, client, from_block: int, to_block: int) -> None:
+        """
+        Applies the Escrow events of every indexed address in [from_block, to_block]
+        with a single get_events query over all contracts.
+        """
+        from starknet_py.hash.selector import get_selector_from_name
+
+        names = {get_selector_from_name(name): name for name in EVENT_NAMES}
+        chunk = await client.get_events(
+            keys=[list(names)],
+            from_block_number=from_block,
+            to_block_number=to_block,
+            follow_continuation_token=True,
+            chunk_size=EVENTS_CHUNK_SIZE,
+        )
+        for event in chunk.events:
+            if event.from_address in self.escrows:
+                self.apply_event(
+                    event.from_address,
+                    names[event.keys[0]],
+                    list(event.data),
+                    event.block_number,
+                )
+        for address in self.escrows:
+            self.synced_block[address] = to_block
+
+    def status(self, address: int, block: int) -> Optional[dict]:
+        escrow = self.escrows.get(address)
+        return escrow.status(block) if escrow else None
+
+    def statuses(self, block: int) -> dict[int, dict]:
+        return {address: e.status(block) for address, e in self.escrows.items()}
+
+    def claimable(self, block: int) -> list[int]:
+        """Addresses whose claim() would pass every check but the signature."""
+        return [a for a, e in self.escrows.items() if e.claim_error(block) is None]
+
+    async def check_consistency(self, client, address: int) -> list[str]:
+        """
+        Compares the local state of `address` with on-chain get_escrow_details.
+
+        Returns:
+            list[str]: One "field: local != chain" entry per mismatch; the provider
+            is only compared once it is known locally.
+        """
+        from starknet_py.contract import Contract
+        import utils
+
+        contract = Contract(address=address, abi=utils.FALCON_ESCROW_ABI, provider=client)
+        details = dict((await contract.functions["get_escrow_details"].call())[0])
+        escrow = self.escrows.get(address)
+        if escrow is None:
+            return ["escrow not indexed"]
+        mismatches = []
+        for name, local in escrow.details().items():
+            if name == "provider" and not local:
+                continue
+            if name in details and details[name] != local:
+                mismatches.append(f"{name}: {local} != {details[name]}")
+        return mismatches
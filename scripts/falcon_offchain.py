@@ -0,0 +1,129 @@
+# scripts/falcon_offchain.py
+"""
+Off-chain Falcon helpers that mirror what the verifier contract checks, so a
+signature can be produced and validated locally before paying for a transaction.
+"""
+from typing import TYPE_CHECKING
+
+from felt_codec import CoeffVec
+
+if TYPE_CHECKING:
+    from falcon import SecretKey
+
+Q = 12289
+
+# Squared-norm bounds, as in falcon.py's Params[n]["sig_bound"]
+SIG_BOUND = {512: 34034726, 1024: 70265242}
+
+
+def center(x: int) -> int:
+    """Maps a coefficient mod Q to its centered representative in (-Q/2, Q/2]."""
+    x %= Q
+    return x - Q if x > Q // 2 else x
+
+
+def squared_norm(*polys) -> int:
+    return sum(center(c) ** 2 for poly in polys for c in poly)
+
+
+def sign_msg_point(sk: "SecretKey", msg_point: list[int]) -> CoeffVec:
+    """
+    Signs a precomputed message point (hash_to_point output) with sk.
+
+    This is the core of SecretKey.sign without hashing or compression: sample
+    preimages until the signature norm is within the bound.
+
+    Returns:
+        CoeffVec: s1 reduced mod Q, ready to be sent as Span<u16>.
+    """
+    if len(msg_point) != sk.n:
+        raise ValueError(
+            f"Message point has {len(msg_point)} coefficients, expected {sk.n}."
+        )
+    while True:
+        s0, s1 = sk.sample_preimage(list(msg_point))
+        if squared_norm(s0, s1) <= sk.signature_bound:
+            return CoeffVec(s1, reduce=True)
+
+
+def verify_uncompressed(s1: list[int], pk: list[int], msg_point: list[int]) -> bool:
+    """
+    Local equivalent of falcon::verify_uncompressed used by the verifier contract:
+    s0 = msg_point - s1 * pk mod (x^n + 1, Q) and ||(s0, s1)||^2 <= sig_bound(n).
+    """
+    from ntt import mul_zq, sub_zq
+
+    n = len(pk)
+    if n not in SIG_BOUND or len(s1) != n or len(msg_point) != n:
+        return False
+    s0 = sub_zq(list(msg_point), mul_zq(list(s1), list(pk)))
+    return squared_norm(s0, s1) <= SIG_BOUND[n]
+
+
+def pk_to_ntt(pk: list[int]) -> CoeffVec:
+    """
+    NTT form of a public key, as stored by register_public_key_ntt. Uses falcon.py's
+    ntt, whose evaluation order the Cairo falcon library follows; the registry
+    recomputes it once at registration and rejects a mismatch.
+    """
+    from ntt import ntt
+
+    return CoeffVec(ntt(list(pk)), reduce=True)
+
+
+# Starknet field prime; hint values are sent as felt252, negatives wrapped mod P
+FELT_PRIME = 2**251 + 17 * 2**192 + 1
+# Kronecker substitution slot width: holds any coefficient of an n=1024 product
+_KRONECKER_BITS = 40
+
+
+def _int_poly_mul(a: list[int], b: list[int]) -> list[int]:
+    """
+    Integer product of two polynomials with coefficients in [0, Q), through one
+    big-integer multiplication (Kronecker substitution).
+    """
+    shift = _KRONECKER_BITS
+    a_int = sum(x << (shift * i) for i, x in enumerate(a))
+    b_int = sum(x << (shift * i) for i, x in enumerate(b))
+    prod = a_int * b_int
+    mask = (1 << shift) - 1
+    return [(prod >> (shift * i)) & mask for i in range(len(a) + len(b) - 1)]
+
+
+def compute_verification_hint(
+    s1: list[int], pk: list[int], msg_point: list[int]
+) -> dict:
+    """
+    Hint for the verifier's verify_signature_for_key_hash_with_hint.
+
+    s0 comes from the off-chain NTT, as in verify_uncompressed. t and c are the
+    integer polynomials with s1 * pk + s0 - msg_point = Q * c + (x^n + 1) * t,
+    which the contract checks at a single hashed point instead of computing s1 * pk.
+
+    Returns:
+        dict: {"s0": list[int] (mod Q), "t": list[int], "c": list[int]}, t and c as
+        felt252 values.
+    """
+    from ntt import mul_zq, sub_zq
+
+    n = len(pk)
+    if n not in SIG_BOUND or len(s1) != n or len(msg_point) != n:
+        raise ValueError(f"Expected s1, pk and msg_point of length 512 or 1024, got {n}.")
+    s1 = [x % Q for x in s1]
+    s0 = [x % Q for x in sub_zq(list(msg_point), mul_zq(list(s1), list(pk)))]
+
+    # s1 * pk = low + x^n * high = (x^n + 1) * high + (low - high)
+    product = _int_poly_mul(s1, list(pk))
+    low, high = product[:n], product[n:] + [0]
+    carries = []
+    for i in range(n):
+        remainder = low[i] - high[i] + s0[i] - msg_point[i]
+        if remainder % Q:
+            raise ValueError("s0 does not match s1 * pk; NTT and integer product disagree.")
+        carries.append(remainder // Q)
+
+    return {
+        "s0": s0,
+        "t": [x % FELT_PRIME for x in high[: n - 1]],
+        "c": [x % FELT_PRIME for x in carries],
+    }
@@ -0,0 +1,267 @@
+# scripts/felt_codec.py
+"""
+Python side of moosh_id/src/packing.cairo and moosh_id/src/compression.cairo.
+
+Falcon coefficients (< Q = 12289 < 2^14) are stored 17 per felt252: coefficients
+0..8 of a word in the low 128 bits and 9..16 in the high 128 bits, coefficient j
+at bit 14 * j of its half. n = 512 packs into 31 words, n = 1024 into 61.
+
+Coefficient vectors are kept as CoeffVec (an array('H')) rather than lists of
+ints: 2 bytes per coefficient instead of a list slot plus an int object.
+"""
+import asyncio
+from array import array
+from typing import Iterable, Optional
+
+Q = 12289
+COEFF_BITS = 14
+COEFFS_PER_WORD = 17
+LOW_COEFFS = 9
+COEFF_MASK = (1 << COEFF_BITS) - 1
+
+
+class CoeffVec(array):
+    """
+    Falcon coefficients mod Q, stored as unsigned 16-bit values.
+
+    Accepts any iterable of ints (lists, arrays, NumPy arrays) and checks every
+    coefficient is in [0, Q); with `reduce` it reduces them mod Q instead, so
+    signed or centered coefficients are accepted too. Being an array, it exposes
+    the buffer protocol: to_numpy() and tobytes() do not copy per coefficient.
+    Lists are still accepted everywhere a CoeffVec is.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, coeffs: Iterable[int] = (), reduce: bool = False):
+        if hasattr(coeffs, "dtype"):
+            # NumPy arrays: reduce and check without a Python loop
+            import numpy
+
+            values = numpy.asarray(coeffs, dtype=numpy.int64)
+            if reduce:
+                values = values % Q
+            elif values.size and (values.min() < 0 or values.max() >= Q):
+                raise ValueError(f"Coefficients must be in [0, {Q})")
+            return super().__new__(cls, "H", values.astype(numpy.uint16).tobytes())
+        if isinstance(coeffs, array) and coeffs.typecode == "H" and not reduce:
+            vec = super().__new__(cls, "H", coeffs.tobytes())
+        else:
+            if reduce:
+                coeffs = (c % Q for c in coeffs)
+            try:
+                vec = super().__new__(cls, "H", coeffs)
+            except OverflowError:
+                raise ValueError(f"Coefficients must be in [0, {Q})") from None
+        if vec and max(vec) >= Q:
+            raise ValueError(f"Coefficients must be in [0, {Q})")
+        return vec
+
+    def __reduce_ex__(self, protocol):
+        # array pickles as array(typecode, items), which __new__ does not take
+        return type(self), (array("H", self),)
+
+    def __repr__(self) -> str:
+        return f"CoeffVec({self.tolist()})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, array):
+            return super().__eq__(other)
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        # array.__ne__ compares against arrays only, so mirror __eq__ instead
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    @classmethod
+    def from_felts(cls, words: list[int], n: int) -> "CoeffVec":
+        """Unpacks n coefficients packed 17 per felt252 (see unpack_u14_words)."""
+        return cls(unpack_u14_words(words, n))
+
+    def to_felts(self) -> list[int]:
+        """The coefficients packed 17 per felt252 (see pack_u14_words)."""
+        return pack_u14_words(self)
+
+    def to_numpy(self):
+        """A uint16 NumPy view of the coefficients (no copy)."""
+        import numpy
+
+        return numpy.frombuffer(self, dtype=numpy.uint16)
+
+
+def packed_len(n: int) -> int:
+    return -(-n // COEFFS_PER_WORD)
+
+
+def _pack_half(coeffs: list[int]) -> int:
+    half = 0
+    for j, c in enumerate(coeffs):
+        if not 0 <= c < Q:
+            raise ValueError(f"Coefficient {c} out of range [0, {Q})")
+        half |= c << (COEFF_BITS * j)
+    return half
+
+
+def pack_u14_words(coeffs: list[int]) -> list[int]:
+    """Packs coefficients into felt252 words, matching pack_u14_words in Cairo."""
+    words = []
+    for start in range(0, len(coeffs), COEFFS_PER_WORD):
+        chunk = coeffs[start : start + COEFFS_PER_WORD]
+        low = _pack_half(chunk[:LOW_COEFFS])
+        high = _pack_half(chunk[LOW_COEFFS:])
+        words.append(low | (high << 128))
+    return words
+
+
+def unpack_u14_words(words: list[int], n: int) -> list[int]:
+    """
+    Unpacks n coefficients from felt252 words.
+    Raises ValueError unless words is the canonical packing of n coefficients below Q.
+    """
+    if len(words) != packed_len(n):
+        raise ValueError(f"Expected {packed_len(n)} words for n={n}, got {len(words)}")
+    coeffs = []
+    for word in words:
+        for half, count in (
+            (word & ((1 << 128) - 1), LOW_COEFFS),
+            (word >> 128, COEFFS_PER_WORD - LOW_COEFFS),
+        ):
+            count = min(count, n - len(coeffs))
+            for _ in range(count):
+                c = half & COEFF_MASK
+                if c >= Q:
+                    raise ValueError(f"Coefficient {c} out of range [0, {Q})")
+                coeffs.append(c)
+                half >>= COEFF_BITS
+            if half:
+                raise ValueError("Non-canonical packing: bits set past the last coefficient")
+    return coeffs
+
+
+async def read_packed_public_key(
+    client, registry_address: int, key_hash: int
+) -> Optional[list[int]]:
+    """
+    Reads a public key straight from FalconPublicKeyRegistry storage
+    (pk_metadata and pk_packed) without calling get_public_key.
+
+    The key is checked against key_hash. Registry classes without pk_packed
+    (keys stored unpacked) read back as zeros there, so on a mismatch the key is
+    taken from the registry's get_public_key instead.
+
+    Returns:
+        CoeffVec | None: The coefficients, or None if the key is not registered.
+
+    Raises:
+        ValueError: If neither read gives a key that hashes to key_hash.
+    """
+    from starknet_py.hash.selector import get_selector_from_name
+    from starknet_py.hash.storage import get_storage_var_address
+    from starknet_py.net.client_models import Call
+
+    from poseidon_batch import poseidon_hash_key
+
+    n = await client.get_storage_at(
+        registry_address, get_storage_var_address("pk_metadata", key_hash)
+    )
+    if n == 0:
+        return None
+    words = await asyncio.gather(
+        *(
+            client.get_storage_at(
+                registry_address, get_storage_var_address("pk_packed", key_hash, i)
+            )
+            for i in range(packed_len(n))
+        )
+    )
+    try:
+        pk = CoeffVec.from_felts(words, n)
+    except ValueError:
+        pk = None
+    if pk is not None and poseidon_hash_key(pk) == key_hash:
+        return pk
+
+    result = await client.call_contract(
+        Call(
+            to_addr=registry_address,
+            selector=get_selector_from_name("get_public_key"),
+            calldata=[key_hash],
+        )
+    )
+    pk = CoeffVec(result[1:])  # Array<u16>: length, then the coefficients
+    if poseidon_hash_key(pk) != key_hash:
+        raise ValueError(
+            f"Registry {hex(registry_address)} returned a key that does not hash to {hex(key_hash)}"
+        )
+    return pk
+
+
+# --- Compressed signatures (moosh_id/src/compression.cairo) ---
+BYTES_PER_WORD = 31
+
+
+def compress_s1(s1: list[int]) -> bytes:
+    """
+    Falcon's compressed encoding of s1 (as in falcon.py's compress, without the
+    fixed-length padding): per coefficient a sign bit, 7 low bits, then |x| >> 7
+    in unary. Accepts coefficients mod Q or centered.
+    """
+    bits = []
+    for c in s1:
+        c %= Q
+        c = c - Q if c > Q // 2 else c
+        bits.append(1 if c < 0 else 0)
+        bits.extend((abs(c) >> k) & 1 for k in range(6, -1, -1))
+        bits.extend([0] * (abs(c) >> 7) + [1])
+    bits.extend([0] * (-len(bits) % 8))
+    return bytes(
+        int("".join(map(str, bits[i : i + 8])), 2) for i in range(0, len(bits), 8)
+    )
+
+
+def bytes_to_words(data: bytes) -> list[int]:
+    """Packs bytes 31 per felt252, big-endian, zero-padding the last word at the end."""
+    data += b"\x00" * (-len(data) % BYTES_PER_WORD)
+    return [
+        int.from_bytes(data[i : i + BYTES_PER_WORD], "big")
+        for i in range(0, len(data), BYTES_PER_WORD)
+    ]
+
+
+def encode_compressed_s1(s1: list[int]) -> list[int]:
+    """s1 as the felt252 words expected by Escrow.claim_compressed."""
+    return bytes_to_words(compress_s1(s1))
+
+
+def decode_compressed_s1(words: list[int], n: int) -> list[int]:
+    """
+    Inverse of encode_compressed_s1, with the same checks as decompress_s1 in Cairo.
+    Returns coefficients mod Q; raises ValueError on malformed input.
+    """
+    if any(w >= 1 << (8 * BYTES_PER_WORD) for w in words):
+        raise ValueError("Word does not fit in 31 bytes")
+    data = b"".join(w.to_bytes(BYTES_PER_WORD, "big") for w in words)
+    bits = "".join(f"{b:08b}" for b in data)
+    coeffs, pos = [], 0
+    while len(coeffs) < n:
+        if pos + 8 > len(bits):
+            raise ValueError("Truncated signature")
+        negative, value = bits[pos] == "1", int(bits[pos + 1 : pos + 8], 2)
+        pos += 8
+        end = bits.find("1", pos)
+        if end < 0:
+            raise ValueError("Truncated signature")
+        value += (end - pos) << 7
+        pos = end + 1
+        if value > Q // 2 or (negative and value == 0):
+            raise ValueError("Invalid coefficient encoding")
+        coeffs.append((Q - value) if negative else value)
+    if "1" in bits[pos:]:
+        raise ValueError("Set bits after the last coefficient")
+    return coeffs
@@ -1,10 +1,21 @@
-from falcon import SecretKey, decompress, HEAD_LEN, SALT_LEN
 import argparse
+import re
+from typing import TYPE_CHECKING, Sequence
+
+from felt_codec import CoeffVec, pack_u14_words
+
+if TYPE_CHECKING:
+    from falcon import SecretKey
+
+# falcon is imported inside the functions that need it so importing this module
+# (e.g. from app.py) does not pay for loading the Falcon implementation.
 
 Q = 12289
 
 
 def generate_attestations(n: int, num_signatures: int) -> list[dict]:
+    from falcon import SecretKey
+
     sk = SecretKey(n)
     attestations = [
         generate_attestation(sk, f"message #{i}".encode())
@@ -13,24 +24,120 @@ def generate_attestations(n: int, num_signatures: int) -> list[dict]:
     return attestations
 
 
-def generate_attestation(sk: SecretKey, message: bytes):
+def generate_attestation(sk: "SecretKey", message: bytes):
+    from falcon import decompress, HEAD_LEN, SALT_LEN
+    from msg_points import hash_to_point
+
     signature = sk.sign(message)
     salt = signature[HEAD_LEN : HEAD_LEN + SALT_LEN]
     enc_s = signature[HEAD_LEN + SALT_LEN :]
     s1 = decompress(enc_s, sk.sig_bytelen - HEAD_LEN - SALT_LEN, sk.n)
-    msg_point = sk.hash_to_point(message, salt)
-    return {"s1": [x % Q for x in s1], "pk": sk.h, "msg_point": msg_point}
-
-
-def format_array(arr: list, name: str, size: int) -> str:
+    msg_point = hash_to_point(message, salt, sk.n)
+    return {
+        "s1": CoeffVec(s1, reduce=True),
+        "pk": CoeffVec(sk.h),
+        "msg_point": CoeffVec(msg_point),
+    }
+
+
+def generate_falcon_pk_coefficients(n_value: int) -> CoeffVec:
+    """
+    Generates Falcon public key coefficients for a given N (e.g., 512 or 1024).
+    These coefficients are intended for the 'register_public_key' StarkNet contract function
+    which expects a Span<u16>.
+
+    Args:
+        n_value (int): The Falcon parameter N. Your contract likely supports 512 or 1024.
+                       The falcon-py library supports N = 8, 16, ..., 1024.
+
+    Returns:
+        CoeffVec: The public key coefficients, each in [0, Q) where Q=12289 for
+                  Falcon, making them suitable for u16 representation.
+
+    Raises:
+        ValueError: If an unsupported n_value is provided or if key generation fails.
+    """
+    # Validate n_value based on common Falcon parameters, ensure it matches your contract's needs
+    if n_value not in [512, 1024]:  # As per your initial context
+        # You can expand this list if your contract/system supports other N values
+        # supported by falcon-py: 8, 16, 32, 64, 128, 256, 512, 1024
+        raise ValueError(
+            f"N value for Falcon public key must be 512 or 1024, got {n_value}."
+        )
+
+    from falcon import SecretKey
+
+    try:
+        sk = SecretKey(n_value)
+        # sk.h contains the public key coefficients, integers in Z_Q where Q=12289.
+        # Reducing mod Q maps any negative representative to [0, Q-1], which is
+        # what StarkNet's u16 expects.
+        public_key_coeffs = CoeffVec(sk.h, reduce=True)
+
+        if len(public_key_coeffs) != n_value:
+            # This would be unexpected if SecretKey(n_value) works as specified by the library
+            raise ValueError(
+                f"Generated public key has {len(public_key_coeffs)} coefficients, but expected {n_value} for N={n_value}."
+            )
+
+        print(
+            f"Generated Falcon-{n_value} public key with {len(public_key_coeffs)} coefficients. Example: {public_key_coeffs[:3]}..."
+        )
+        return public_key_coeffs
+
+    except Exception as e:
+        print(f"Error generating Falcon public key coefficients for N={n_value}: {e}")
+        raise  # Re-raise the exception to be caught by the caller
+
+
+def pack_falcon_pk_coefficients(pk_coefficients: Sequence[int]) -> list[int]:
+    """
+    Packs public key coefficients 17 per felt252 for register_public_key_packed
+    (31 words for N=512, 61 for N=1024; layout in felt_codec.py).
+    """
+    if len(pk_coefficients) not in [512, 1024]:
+        raise ValueError(
+            f"Public key must have 512 or 1024 coefficients, got {len(pk_coefficients)}."
+        )
+    return pack_u14_words(pk_coefficients)
+
+
+def generate_falcon_keypair(n_value: int) -> dict:
+    """
+    Generates a Falcon key pair as plain lists so it can be returned from a worker
+    process and stored on disk (see keystore.py).
+
+    Returns:
+        dict: {"n", "f", "g", "F", "G", "pk"} where pk is sk.h.
+    """
+    if n_value not in [512, 1024]:
+        raise ValueError(
+            f"N value for Falcon public key must be 512 or 1024, got {n_value}."
+        )
+
+    from falcon import SecretKey
+
+    sk = SecretKey(n_value)
+    return {
+        "n": n_value,
+        "f": list(sk.f),
+        "g": list(sk.g),
+        "F": list(sk.F),
+        "G": list(sk.G),
+        "pk": list(sk.h),
+    }
+
+
+def format_array(
+    arr: list, name: str, size: int, elem_type: str = "u16", elements_per_line: int = 14
+) -> str:
     # Format array with 14 elements per line for readability
-    elements_per_line = 14
     lines = []
     for i in range(0, len(arr), elements_per_line):
         chunk = arr[i : i + elements_per_line]
         lines.append("    " + ", ".join(str(x) for x in chunk) + ",")
 
-    return f"pub const {name}: [u16; {size}] = [\n" + "\n".join(lines) + "\n];\n"
+    return f"pub const {name}: [{elem_type}; {size}] = [\n" + "\n".join(lines) + "\n];\n"
 
 
 def format_args(args: list[dict], n: int):
@@ -58,11 +165,78 @@ def format_args(args: list[dict], n: int):
     return f"Test vectors have been written to falcon_test_vectors_n{n}.cairo"
 
 
+def format_hint(args: list[dict], n: int):
+    from falcon_offchain import compute_verification_hint
+
+    if len(args) == 0:
+        return "No attestations generated"
+
+    # Hint for the same attestation format_args writes out
+    arg = args[0]
+    hint = compute_verification_hint(arg["s1"], list(arg["pk"]), arg["msg_point"])
+
+    result = "// Verification hints for falcon_test_vectors_n" + str(n) + "\n\n"
+    result += "// s0 = msg_point - s1 * pk mod (x^n + 1, Q)\n"
+    result += format_array(hint["s0"], "HINT_S0_N" + str(n), n) + "\n"
+    # felt252 values, negatives wrapped mod p
+    result += "// Quotient by x^n + 1\n"
+    result += format_array(hint["t"], "HINT_T_N" + str(n), n - 1, "felt252", 7) + "\n"
+    result += "// Carries, (low - high + s0 - msg_point) / Q\n"
+    result += format_array(hint["c"], "HINT_C_N" + str(n), n, "felt252", 2)
+
+    with open(f"moosh_id/tests/inputs/falcon_hint_vectors_n{n}.cairo", "w") as f:
+        f.write(result)
+
+    return f"Verification hints have been written to falcon_hint_vectors_n{n}.cairo"
+
+
+def read_cairo_array(path: str, name: str) -> list[int]:
+    """Reads back an array written by format_array (`pub const NAME: [..] = [...];`)."""
+    with open(path) as f:
+        match = re.search(
+            rf"pub const {name}: \[[^\]]+\] = \[(.*?)\];", f.read(), re.DOTALL
+        )
+    if match is None:
+        raise ValueError(f"{name} not found in {path}")
+    return [int(x, 0) for x in re.findall(r"0x[0-9a-fA-F]+|\d+", match.group(1))]
+
+
+def format_pk_ntt(n: int):
+    """
+    Writes pk_to_ntt(PK_N{n}) one coefficient per line, for the snforge test that
+    checks it against falcon::ntt::ntt (test_pk_to_ntt_matches_ntt). Reads the key
+    from the vectors file, so it can be rerun without regenerating the vectors.
+    """
+    from falcon_offchain import pk_to_ntt
+
+    pk = read_cairo_array(
+        f"moosh_id/tests/inputs/falcon_test_vectors_n{n}.cairo", "PK_N" + str(n)
+    )
+    with open(f"moosh_id/tests/inputs/pk_ntt_n{n}.txt", "w") as f:
+        f.write("\n".join(str(x) for x in pk_to_ntt(pk)) + "\n")
+
+    return f"Public key NTT has been written to pk_ntt_n{n}.txt"
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--n", type=int, default=512)
     parser.add_argument("--num_signatures", type=int, default=1)
+    parser.add_argument(
+        "--hint", action="store_true", help="also write verification hints for the vectors"
+    )
+    parser.add_argument(
+        "--pk-ntt-only",
+        action="store_true",
+        help="only rewrite the public key NTT for the existing vectors",
+    )
     args = parser.parse_args()
 
-    attestations = generate_attestations(args.n, args.num_signatures)
-    print(format_args(attestations, args.n))
+    if args.pk_ntt_only:
+        print(format_pk_ntt(args.n))
+    else:
+        attestations = generate_attestations(args.n, args.num_signatures)
+        print(format_args(attestations, args.n))
+        print(format_pk_ntt(args.n))
+        if args.hint:
+            print(format_hint(attestations, args.n))
@@ -0,0 +1,153 @@
+# scripts/jobs.py
+import json
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+# --- Configuration ---
+# Job state lives next to the other generated artifacts (see TARGET_DIR in the Makefile)
+JOB_STATE_DIR = Path(__file__).resolve().parent.parent / "target" / "jobs"
+DEFAULT_MAX_WORKERS = 4
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_INTERRUPTED = "interrupted"  # Was queued/running when the process stopped
+TERMINAL_JOB_STATUSES = (JOB_SUCCEEDED, JOB_FAILED, JOB_INTERRUPTED)
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    status: str = JOB_QUEUED
+    progress: list[str] = field(default_factory=list)
+    result: Optional[str] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_JOB_STATUSES
+
+    def render(self) -> str:
+        """Formats the job as the text shown in the Gradio status boxes."""
+        header = f"Job {self.id} ({self.kind}): {self.status}"
+        body = "\n\n---\n\n".join(self.progress)
+        if self.error:
+            body = f"{body}\n\n---\n\nError: {self.error}" if body else f"Error: {self.error}"
+        return f"{header}\n\n{body}" if body else header
+
+
+class JobQueue:
+    """
+    Runs long blocking actions (deployments, registrations) on a bounded worker pool.
+
+    Each job gets an ID and its state is written to JOB_STATE_DIR on every update,
+    so progress survives a UI reload and can be followed from any session.
+    The job function is called as fn(report, *args) where report(message) appends
+    a progress line; its return value (if any) is stored as the job result.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        state_dir: Path = JOB_STATE_DIR,
+    ):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="moosh-job"
+        )
+        self._state_dir = Path(state_dir)
+        self._state_dir.mkdir(parents=True, exist_ok=True)
+        self._jobs: dict[str, Job] = {}
+        self._changed = threading.Condition()
+        self._load_persisted_jobs()
+
+    # --- Persistence ---
+    def _job_path(self, job_id: str) -> Path:
+        return self._state_dir / f"{job_id}.json"
+
+    def _persist(self, job: Job) -> None:
+        path = self._job_path(job.id)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(asdict(job), indent=2), "utf-8")
+        tmp_path.replace(path)
+
+    def _load_persisted_jobs(self) -> None:
+        for path in self._state_dir.glob("*.json"):
+            try:
+                job = Job(**json.loads(path.read_text("utf-8")))
+            except (ValueError, TypeError) as e:
+                print(f"Warning: Skipping unreadable job state {path}: {e}")
+                continue
+            if not job.done:
+                # Nothing is executing it any more after a restart
+                job.status = JOB_INTERRUPTED
+                job.updated_at = time.time()
+                self._persist(job)
+            self._jobs[job.id] = job
+
+    def _update(self, job: Job, **changes) -> None:
+        with self._changed:
+            for name, value in changes.items():
+                setattr(job, name, value)
+            job.updated_at = time.time()
+            self._persist(job)
+            self._changed.notify_all()
+
+    # --- Public API ---
+    def submit(self, kind: str, fn: Callable[..., Optional[str]], *args) -> Job:
+        """Queues fn(report, *args) and returns the new Job immediately."""
+        job = Job(id=uuid.uuid4().hex[:12], kind=kind)
+        with self._changed:
+            self._jobs[job.id] = job
+            self._persist(job)
+        self._executor.submit(self._run, job, fn, args)
+        print(f"Queued job {job.id} ({kind})")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id.strip()) if job_id else None
+
+    def _run(self, job: Job, fn: Callable[..., Optional[str]], args: tuple) -> None:
+        def report(message: str) -> None:
+            print(f"[job {job.id}] {message}")
+            self._update(job, progress=job.progress + [message])
+
+        self._update(job, status=JOB_RUNNING)
+        try:
+            result = fn(report, *args)
+            self._update(job, status=JOB_SUCCEEDED, result=result)
+        except Exception as e:
+            print(f"Exception in job {job.id}: {e}")
+            traceback.print_exc()
+            self._update(job, status=JOB_FAILED, error=str(e))
+
+    def stream(self, job_id: str, timeout: float = 1.0) -> Iterator[str]:
+        """
+        Yields the rendered job state every time it changes, until the job finishes.
+        Intended to be used directly as a Gradio generator output.
+        """
+        job = self.get(job_id)
+        if job is None:
+            yield f"Error: Unknown job ID: {job_id}"
+            return
+
+        last_seen = None
+        while True:
+            with self._changed:
+                if job.updated_at == last_seen and not job.done:
+                    self._changed.wait(timeout=timeout)
+                snapshot = (job.updated_at, job.done, job.render())
+            if snapshot[0] != last_seen:
+                last_seen = snapshot[0]
+                yield snapshot[2]
+            if snapshot[1]:
+                return
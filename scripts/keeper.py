@@ -0,0 +1,224 @@
+# scripts/keeper.py
+"""
+Long-running escrow keeper.
+
+Follows new blocks and keeps the watched escrows in an EscrowIndex, updated with
+one get_events query per block for all of them. Deposited escrows sit in a heap
+ordered by service_start_block + service_period_blocks, so each block only
+looks at the escrows that just became claimable. Escrows of the keeper's
+account are claimed (in multicalls, see claims.py); the others, and deposits
+that do not arrive, are reported through `alert`.
+
+Usage: python scripts/keeper.py escrows.txt
+(escrows.txt lists escrow addresses separated by commas or whitespace;
+credentials come from the flags or MOOSH_PRIVATE_KEY / MOOSH_ACCOUNT_ADDRESS;
+without them the keeper only alerts)
+"""
+import argparse
+import asyncio
+import heapq
+import os
+import traceback
+from typing import Callable, Optional
+
+from escrow_model import EscrowIndex
+
+# Seconds between block number polls (Starknet blocks take several seconds)
+POLL_INTERVAL_SECONDS = 5
+# Alert once when an escrow is still not deposited this many blocks after it
+# started being watched
+DEPOSIT_ALERT_BLOCKS = 50
+# Blocks to wait before retrying a failed claim
+CLAIM_RETRY_BLOCKS = 5
+# Escrow details read at the same time when escrows are added
+MAX_CONCURRENT_LOADS = 8
+
+
+class EscrowKeeper:
+    """
+    Watches escrows and fires claims or alerts the moment each becomes claimable.
+
+    Claims are sent when the latest block is one short of the claimable block:
+    the transaction executes in the next block, which is the one claim() checks.
+    """
+
+    def __init__(
+        self,
+        private_key: Optional[str],
+        account_address: Optional[str],
+        report: Callable[[str], None] = print,
+        alert: Callable[[str], None] = print,
+    ):
+        self.private_key = private_key
+        self.account_address = account_address
+        self.report = report
+        self.alert = alert
+        from view_cache import VIEW_CACHE
+
+        self.index = EscrowIndex(on_event=lambda address, _: VIEW_CACHE.invalidate(address))
+        # (claimable_block, address); entries go stale when an escrow is
+        # claimed or disputed and are dropped when popped
+        self._due: list[tuple[int, int]] = []
+        # address -> block at which it started being watched without a deposit
+        self._awaiting_deposit: dict[int, int] = {}
+        self._deposit_alerted: set[int] = set()
+        self.last_block: Optional[int] = None
+
+    def _schedule(self, address: int, block: int) -> None:
+        escrow = self.index.escrows[address]
+        if escrow.is_claimed or escrow.is_disputed:
+            return
+        if escrow.is_deposited:
+            heapq.heappush(self._due, (escrow.claimable_block, address))
+        else:
+            self._awaiting_deposit[address] = block
+
+    async def watch(self, client, addresses: list[str]) -> None:
+        """Adds escrows, reading each one's current state once."""
+        from starknet_py.contract import Contract
+        import utils
+
+        block = await client.get_block_number()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOADS)
+
+        async def load(address_hex: str):
+            address = int(address_hex, 16)
+            if address in self.index.escrows:
+                return
+            contract = Contract(
+                address=address, abi=utils.FALCON_ESCROW_ABI, provider=client
+            )
+            try:
+                async with semaphore:
+                    details = (await contract.functions["get_escrow_details"].call())[0]
+            except Exception as e:
+                self.alert(f"{address_hex}: could not read escrow details: {e}")
+                return
+            self.index.load_details(address, dict(details))
+            self.index.synced_block[address] = block
+            self._schedule(address, block)
+
+        await asyncio.gather(*(load(a) for a in addresses))
+        self.report(f"Watching {len(self.index.escrows)} escrow(s) from block {block}.")
+        if self.last_block is None:
+            self.last_block = block
+
+    def _check_deposits(self, block: int) -> None:
+        for address, since in list(self._awaiting_deposit.items()):
+            escrow = self.index.escrows[address]
+            if escrow.is_deposited:
+                del self._awaiting_deposit[address]
+                self._schedule(address, block)
+                self.report(
+                    f"{hex(address)}: deposited, claimable at block {escrow.claimable_block}."
+                )
+            elif escrow.is_disputed or escrow.is_claimed:
+                del self._awaiting_deposit[address]
+            elif block - since >= DEPOSIT_ALERT_BLOCKS and address not in self._deposit_alerted:
+                self._deposit_alerted.add(address)
+                self.alert(f"{hex(address)}: no deposit after {block - since} blocks.")
+
+    def _pop_due(self, block: int) -> list[int]:
+        due = []
+        while self._due and self._due[0][0] <= block + 1:
+            _, address = heapq.heappop(self._due)
+            escrow = self.index.escrows[address]
+            if escrow.claim_error(block + 1) is None and address not in due:
+                due.append(address)
+        return due
+
+    async def _claim(self, addresses: list[int], block: int) -> None:
+        ours, others = [], []
+        for address in addresses:
+            provider = self.index.escrows[address].provider
+            if self.account_address and provider == int(self.account_address, 16):
+                ours.append(address)
+            else:
+                others.append(address)
+        for address in others:
+            self.alert(f"{hex(address)}: claimable since block {block + 1}.")
+        if not ours:
+            return
+
+        from claims import CLAIM_ACCEPTED, claim_provider_escrows_batched
+
+        try:
+            # Checked against the block the claims execute in, not the latest
+            outcomes = await claim_provider_escrows_batched(
+                self.report,
+                [hex(a) for a in ours],
+                self.private_key,
+                self.account_address,
+                claim_block=block + 1,
+            )
+        except Exception as e:
+            print(f"Error claiming escrows: {e}")
+            traceback.print_exc()
+            outcomes = {hex(a): (f"Error: {e}", None) for a in ours}
+        for address in ours:
+            message, tx_hash = outcomes.get(hex(address), ("Error: No outcome", None))
+            if tx_hash and message == CLAIM_ACCEPTED:
+                # The claim event arrives with a later sync; do not fire again
+                self.index.escrows[address].apply_claim()
+            elif tx_hash:
+                # Sent but not confirmed: the EscrowClaimed event, if it lands,
+                # settles it before the retry comes due
+                heapq.heappush(self._due, (block + CLAIM_RETRY_BLOCKS, address))
+                self.report(f"{hex(address)}: {message} Tx Hash: {tx_hash}")
+            else:
+                heapq.heappush(self._due, (block + CLAIM_RETRY_BLOCKS, address))
+                self.alert(f"{hex(address)}: claim failed, retrying: {message}")
+
+    async def on_block(self, client, block: int) -> None:
+        """Syncs events up to `block` and handles what became due."""
+        if self.last_block is not None and block > self.last_block:
+            await self.index.sync_watched(client, self.last_block + 1, block)
+        self.last_block = block
+        self._check_deposits(block)
+        due = self._pop_due(block)
+        if due:
+            await self._claim(due, block)
+
+    async def run(self, client, poll_interval: float = POLL_INTERVAL_SECONDS) -> None:
+        """Follows the chain until cancelled."""
+        while True:
+            try:
+                block = await client.get_block_number()
+                if self.last_block is None or block > self.last_block:
+                    await self.on_block(client, block)
+            except Exception as e:
+                print(f"Keeper error at block {self.last_block}: {e}")
+                traceback.print_exc()
+            await asyncio.sleep(poll_interval)
+
+
+def main() -> None:
+    from cairo_interactions import make_client
+    from claims import parse_escrow_addresses
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("escrows_file")
+    parser.add_argument("--private-key", default=os.environ.get("MOOSH_PRIVATE_KEY"))
+    parser.add_argument("--account", default=os.environ.get("MOOSH_ACCOUNT_ADDRESS"))
+    parser.add_argument("--poll-interval", type=float, default=POLL_INTERVAL_SECONDS)
+    args = parser.parse_args()
+    if bool(args.private_key) != bool(args.account):
+        raise SystemExit("--private-key and --account go together.")
+
+    with open(args.escrows_file) as f:
+        addresses = parse_escrow_addresses(f.read())
+
+    async def run():
+        client = make_client()
+        keeper = EscrowKeeper(args.private_key, args.account)
+        await keeper.watch(client, addresses)
+        await keeper.run(client, args.poll_interval)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# scripts/key_index.py
+"""
+Local index of the key hashes registered in a FalconPublicKeyRegistry.
+
+Fed from the registry's PublicKeyRegistered events (key_hash is the event's
+first key) and saved under target/key_index, so each run only fetches the
+events since the last one. Lookups go through a Bloom filter first; the exact
+set behind it confirms positives, so a key is never skipped by mistake.
+"""
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+# Saved indexes live next to the other generated artifacts (see TARGET_DIR in the Makefile)
+KEY_INDEX_DIR = Path(__file__).resolve().parent.parent / "target" / "key_index"
+# Sized for ~100k keys at a 1% false positive rate
+BLOOM_BITS = 1 << 20
+BLOOM_HASHES = 7
+# get_events page size
+EVENTS_CHUNK_SIZE = 1000
+
+
+class BloomFilter:
+    def __init__(self, bits: int = BLOOM_BITS, hashes: int = BLOOM_HASHES):
+        self.bits = bits
+        self.hashes = hashes
+        self._array = bytearray(bits // 8)
+
+    def _positions(self, value: int) -> Iterable[int]:
+        # Double hashing: h1 + i * h2 over one 16-byte digest
+        digest = hashlib.blake2b(value.to_bytes(32, "big"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def add(self, value: int) -> None:
+        for position in self._positions(value):
+            self._array[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: int) -> bool:
+        return all(
+            self._array[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+
+class KeyIndex:
+    """Registered key hashes of one registry."""
+
+    def __init__(self, registry_address: int):
+        self.registry_address = registry_address
+        self.synced_block = -1
+        self._bloom = BloomFilter()
+        self._key_hashes: set[int] = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._key_hashes)
+
+    def __contains__(self, key_hash: int) -> bool:
+        with self._lock:
+            return key_hash in self._bloom and key_hash in self._key_hashes
+
+    def add(self, key_hash: int) -> None:
+        with self._lock:
+            self._bloom.add(key_hash)
+            self._key_hashes.add(key_hash)
+
+    @property
+    def path(self) -> Path:
+        return KEY_INDEX_DIR / f"{hex(self.registry_address)}.json"
+
+    def load(self) -> None:
+        """Restores a saved index, if any."""
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        for key_hash in data.get("key_hashes", []):
+            self.add(int(key_hash, 16))
+        self.synced_block = data.get("synced_block", -1)
+
+    def save(self) -> None:
+        with self._lock:
+            data = {
+                "synced_block": self.synced_block,
+                "key_hashes": [hex(k) for k in self._key_hashes],
+            }
+        try:
+            KEY_INDEX_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data))
+            tmp.replace(self.path)
+        except OSError as e:
+            print(f"Warning: could not save key index: {e}")
+
+    async def sync(self, client, to_block: Optional[int] = None) -> None:
+        """Adds the keys registered since the last sync, up to `to_block` (default latest)."""
+        from starknet_py.hash.selector import get_selector_from_name
+
+        if to_block is None:
+            to_block = await client.get_block_number()
+        if to_block <= self.synced_block:
+            return
+        chunk = await client.get_events(
+            address=self.registry_address,
+            keys=[[get_selector_from_name("PublicKeyRegistered")]],
+            from_block_number=self.synced_block + 1,
+            to_block_number=to_block,
+            follow_continuation_token=True,
+            chunk_size=EVENTS_CHUNK_SIZE,
+        )
+        for event in chunk.events:
+            if len(event.keys) > 1:
+                self.add(event.keys[1])
+        self.synced_block = to_block
+        self.save()
+
+
+_indexes: dict[int, KeyIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_key_index(registry_address: int) -> KeyIndex:
+    """The process-wide index of a registry, loaded from disk on first use."""
+    with _indexes_lock:
+        index = _indexes.get(registry_address)
+        if index is None:
+            index = KeyIndex(registry_address)
+            index.load()
+            _indexes[registry_address] = index
+        return index
+
+
+async def synced_key_index(client, registry_address: int) -> KeyIndex:
+    index = get_key_index(registry_address)
+    await index.sync(client)
+    return index
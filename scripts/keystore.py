@@ -0,0 +1,65 @@
+# scripts/keystore.py
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from falcon import SecretKey
+
+# Same directory as KEY_DIR in the Makefile
+KEY_DIR = Path(__file__).resolve().parent.parent / "target" / "keys"
+
+
+def _canonical_address(account_address: str) -> str:
+    return f"{int(account_address, 16):#066x}"
+
+
+def _key_path(account_address: str, key_dir: Path = KEY_DIR) -> Path:
+    return Path(key_dir) / f"{_canonical_address(account_address)}.json"
+
+
+def save_signing_key(
+    account_address: str, keypair: dict, key_dir: Path = KEY_DIR
+) -> Path:
+    """
+    Stores a Falcon key pair (as returned by generate_falcon_keypair) for an account.
+    The file holds the secret polynomials, so it is only readable by the owner.
+    """
+    path = _key_path(account_address, key_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(keypair, f)
+    _load_signing_key.cache_clear()
+    print(f"Saved Falcon-{keypair['n']} signing key for {account_address[:10]}... to {path}")
+    return path
+
+
+def load_keypair(account_address: str, key_dir: Path = KEY_DIR) -> Optional[dict]:
+    path = _key_path(account_address, key_dir)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text("utf-8"))
+
+
+def load_signing_key(account_address: str) -> Optional["SecretKey"]:
+    """
+    Returns the cached Falcon SecretKey for an account, rebuilding it from disk
+    on first use. Returns None if the account has no stored key.
+    """
+    return _load_signing_key(_canonical_address(account_address))
+
+
+@lru_cache(maxsize=32)
+def _load_signing_key(account_address: str) -> Optional["SecretKey"]:
+    keypair = load_keypair(account_address)
+    if keypair is None:
+        return None
+
+    from falcon import SecretKey
+
+    return SecretKey(
+        keypair["n"], polys=[keypair["f"], keypair["g"], keypair["F"], keypair["G"]]
+    )
@@ -0,0 +1,254 @@
+# scripts/msg_points.py
+"""
+Message points (Falcon's hash_to_point) for many (message, salt) pairs.
+
+hash_to_point reads SHAKE256(salt || message) two bytes at a time, big-endian,
+and keeps the values below 5 * Q, reduced mod Q, until it has n coefficients.
+Here each pair's SHAKE output is drawn in one hashlib call, sized for the
+expected rejection rate, and filtered in one pass; the rare pair that runs short
+is redrawn with twice the bytes (a shorter SHAKE output is a prefix of a longer
+one), so the result is the same as falcon.py's.
+
+Computed points are kept in an on-disk table (SQLite, under target/msg_points)
+keyed by a digest of (n, salt, message) and indexed by their Poseidon
+commitment, so the point behind an escrow's commitment is found without
+recomputing it. Least recently used rows are dropped past MAX_TABLE_ROWS.
+"""
+import hashlib
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Iterable, Optional
+
+from felt_codec import CoeffVec, Q
+
+# Next to the other generated artifacts (see TARGET_DIR in the Makefile)
+MSG_POINT_DIR = Path(__file__).resolve().parent.parent / "target" / "msg_points"
+# Rows kept before the least recently used are dropped; ~1 KB each for n=512
+MAX_TABLE_ROWS = 100000
+
+# Two-byte values below this are kept (falcon.py's k * q, k = 2^16 // q)
+ACCEPT_BOUND = (1 << 16) // Q * Q
+# SHAKE bytes drawn per coefficient: 2 / (ACCEPT_BOUND / 2^16) ~ 2.13, with
+# enough margin that a redraw is a ~5 sigma event
+BYTES_PER_COEFF = 2.25
+
+
+def hash_to_point(message: bytes, salt: bytes, n: int = 512) -> CoeffVec:
+    """Same as falcon.py's SecretKey.hash_to_point(message, salt) for degree n."""
+    shake = hashlib.shake_256(salt + message)
+    length = 2 * int(n * BYTES_PER_COEFF / 2)
+    while True:
+        values = array("H", shake.digest(length))
+        if sys.byteorder == "little":
+            values.byteswap()  # SHAKE bytes are read big-endian
+        coeffs = [v % Q for v in values if v < ACCEPT_BOUND]
+        if len(coeffs) >= n:
+            return CoeffVec(coeffs[:n])
+        length *= 2
+
+
+def point_digest(message: bytes, salt: bytes, n: int = 512) -> bytes:
+    """Table key of a (message, salt) pair."""
+    return hashlib.blake2b(
+        n.to_bytes(2, "big") + len(salt).to_bytes(2, "big") + salt + message,
+        digest_size=16,
+    ).digest()
+
+
+def _to_blob(point: CoeffVec) -> bytes:
+    values = array("H", point)
+    if sys.byteorder == "big":
+        values.byteswap()  # Stored little-endian
+    return values.tobytes()
+
+
+def _from_blob(blob: bytes) -> CoeffVec:
+    values = array("H", blob)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return CoeffVec(values)
+
+
+class MsgPointTable:
+    """On-disk LRU table of message points; safe to share between threads."""
+
+    def __init__(self, path: Optional[Path] = None, max_rows: int = MAX_TABLE_ROWS):
+        self.path = Path(path) if path else MSG_POINT_DIR / "msg_points.sqlite"
+        self.max_rows = max_rows
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            db.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS msg_points (
+                    digest BLOB PRIMARY KEY,
+                    n INTEGER NOT NULL,
+                    commitment TEXT NOT NULL,
+                    point BLOB NOT NULL,
+                    used_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS msg_points_commitment ON msg_points (commitment);
+                CREATE INDEX IF NOT EXISTS msg_points_used_at ON msg_points (used_at);
+                """
+            )
+            self._db = db
+        return self._db
+
+    def get_many(self, digests: list[bytes]) -> dict[bytes, CoeffVec]:
+        """The stored points among `digests`, marking them as used."""
+        if not digests:
+            return {}
+        found = {}
+        with self._lock:
+            db = self._connect()
+            # SQLite allows 999 parameters per statement in older builds
+            for start in range(0, len(digests), 900):
+                part = digests[start : start + 900]
+                rows = db.execute(
+                    "SELECT digest, point FROM msg_points WHERE digest IN "
+                    f"({','.join('?' * len(part))})",
+                    part,
+                ).fetchall()
+                found.update((digest, _from_blob(point)) for digest, point in rows)
+            now = time.time()
+            db.executemany(
+                "UPDATE msg_points SET used_at = ? WHERE digest = ?",
+                [(now, digest) for digest in found],
+            )
+            db.commit()
+            self.hits += len(found)
+            self.misses += len(set(digests)) - len(found)
+        return found
+
+    def by_commitment(self, commitment: int) -> Optional[CoeffVec]:
+        """The point whose Poseidon commitment is `commitment`, if stored."""
+        with self._lock:
+            db = self._connect()
+            row = db.execute(
+                "SELECT digest, point FROM msg_points WHERE commitment = ? LIMIT 1",
+                (hex(commitment),),
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                "UPDATE msg_points SET used_at = ? WHERE digest = ?", (time.time(), row[0])
+            )
+            db.commit()
+        return _from_blob(row[1])
+
+    def put_many(self, rows: list[tuple[bytes, CoeffVec, int]]) -> None:
+        """Stores (digest, point, commitment) rows, evicting the least recently used."""
+        if not rows:
+            return
+        now = time.time()
+        with self._lock:
+            db = self._connect()
+            db.executemany(
+                "INSERT OR REPLACE INTO msg_points VALUES (?, ?, ?, ?, ?)",
+                [
+                    (digest, len(point), hex(commitment), _to_blob(point), now)
+                    for digest, point, commitment in rows
+                ],
+            )
+            (count,) = db.execute("SELECT COUNT(*) FROM msg_points").fetchone()
+            if count > self.max_rows:
+                db.execute(
+                    "DELETE FROM msg_points WHERE digest IN "
+                    "(SELECT digest FROM msg_points ORDER BY used_at LIMIT ?)",
+                    (count - self.max_rows,),
+                )
+            db.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_table: Optional[MsgPointTable] = None
+_table_lock = threading.Lock()
+
+
+def get_table() -> MsgPointTable:
+    """The process-wide table, opened on first use."""
+    global _table
+    with _table_lock:
+        if _table is None:
+            _table = MsgPointTable()
+        return _table
+
+
+def get_msg_points(
+    pairs: Iterable[tuple[bytes, bytes]],
+    n: int = 512,
+    table: Optional[MsgPointTable] = None,
+) -> list[CoeffVec]:
+    """
+    Message points of many (message, salt) pairs, read from the table where
+    possible; new points are computed once each and stored with their
+    commitments.
+
+    Args:
+        pairs: (message, salt) pairs, as passed to hash_to_point.
+        n (int): Falcon degree (512 or 1024).
+        table (MsgPointTable, optional): Defaults to the shared table.
+
+    Returns:
+        list[CoeffVec]: One point per pair, in order.
+    """
+    from poseidon_batch import poseidon_hash_keys
+
+    table = table or get_table()
+    pairs = list(pairs)
+    digests = [point_digest(message, salt, n) for message, salt in pairs]
+    points = table.get_many(digests)
+
+    new: dict[bytes, CoeffVec] = {}
+    for digest, (message, salt) in zip(digests, pairs):
+        if digest not in points and digest not in new:
+            new[digest] = hash_to_point(message, salt, n)
+    if new:
+        commitments = poseidon_hash_keys(new.values())
+        table.put_many(
+            [(d, p, c) for (d, p), c in zip(new.items(), commitments)]
+        )
+        points.update(new)
+    return [points[digest] for digest in digests]
+
+
+def get_msg_point(message: bytes, salt: bytes, n: int = 512) -> CoeffVec:
+    """get_msg_points for a single pair."""
+    return get_msg_points([(message, salt)], n)[0]
+
+
+def remember_msg_point(msg_point: Iterable[int]) -> int:
+    """
+    Stores a point that was not derived here (e.g. utils.MSG_POINT) so it can be
+    found by commitment. Returns its commitment.
+    """
+    from poseidon_batch import poseidon_hash_key
+
+    point = CoeffVec(msg_point)
+    commitment = poseidon_hash_key(point)
+    digest = hashlib.blake2b(b"point" + _to_blob(point), digest_size=16).digest()
+    get_table().put_many([(digest, point, commitment)])
+    return commitment
+
+
+def lookup_commitment(commitment: int) -> Optional[CoeffVec]:
+    """The stored point with this Poseidon commitment, or None."""
+    return get_table().by_commitment(commitment)
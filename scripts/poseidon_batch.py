@@ -0,0 +1,100 @@
+# scripts/poseidon_batch.py
+"""
+Poseidon key hashes (poseidon_hash_many over the coefficients) for many keys.
+
+Results are memoized by a blake2b digest of the coefficient buffer, so a key
+is hashed once per process however often it is audited, indexed or checked for
+duplicates, and keys repeated within a batch are hashed once.
+"""
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Iterable, Sequence
+
+# Memoized hashes kept; ~100 bytes each
+MEMO_MAX_ENTRIES = 65536
+
+_memo: "OrderedDict[bytes, int]" = OrderedDict()
+_memo_lock = threading.Lock()
+_memo_hits = 0
+_memo_misses = 0
+
+
+def coeff_digest(coeffs: Sequence[int]) -> bytes:
+    """Cheap 16-byte digest of a coefficient list, used as the memo key."""
+    try:
+        # CoeffVec and other u16 arrays are hashed straight from their buffer
+        if isinstance(coeffs, array) and coeffs.typecode == "H":
+            buffer = coeffs.tobytes()
+        else:
+            buffer = array("H", coeffs).tobytes()
+    except OverflowError:
+        # Not u16 coefficients; hash their decimal form instead
+        buffer = b"w" + ",".join(map(str, coeffs)).encode()
+    return hashlib.blake2b(buffer, digest_size=16).digest()
+
+
+def _hash_new_keys(keys: list[list[int]]) -> list[int]:
+    from poseidon_py import poseidon_hash
+
+    return [poseidon_hash.poseidon_hash_many(key) for key in keys]
+
+
+def poseidon_hash_keys(keys: Iterable[Sequence[int]]) -> list[int]:
+    """
+    Poseidon hash of each key's coefficients, same as poseidon_hash_many.
+
+    Args:
+        keys: Coefficient lists (public keys, message points, ...).
+
+    Returns:
+        list[int]: One hash per key, in order.
+    """
+    global _memo_hits, _memo_misses
+
+    keys = list(keys)
+    digests = [coeff_digest(key) for key in keys]
+    hashes: dict[bytes, int] = {}
+    with _memo_lock:
+        for digest in digests:
+            if digest in _memo:
+                _memo.move_to_end(digest)
+                hashes[digest] = _memo[digest]
+
+    # New keys, each once
+    pending: dict[bytes, list[int]] = {}
+    for digest, key in zip(digests, keys):
+        if digest not in hashes and digest not in pending:
+            # poseidon_py wants plain ints
+            pending[digest] = list(key)
+    with _memo_lock:
+        _memo_hits += len(keys) - len(pending)
+        _memo_misses += len(pending)
+
+    if pending:
+        results = _hash_new_keys(list(pending.values()))
+        with _memo_lock:
+            for digest, key_hash in zip(pending, results):
+                hashes[digest] = key_hash
+                _memo[digest] = key_hash
+            while len(_memo) > MEMO_MAX_ENTRIES:
+                _memo.popitem(last=False)
+
+    return [hashes[digest] for digest in digests]
+
+
+def poseidon_hash_key(coeffs: Sequence[int]) -> int:
+    """poseidon_hash_many(coeffs), memoized."""
+    return poseidon_hash_keys([coeffs])[0]
+
+
+def memo_stats() -> dict:
+    with _memo_lock:
+        lookups = _memo_hits + _memo_misses
+        return {
+            "hits": _memo_hits,
+            "misses": _memo_misses,
+            "hit_rate": _memo_hits / lookups if lookups else 0.0,
+            "entries": len(_memo),
+        }
@@ -0,0 +1,264 @@
+# scripts/provider_setup.py
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from cairo_interactions import (
+    deploy_new_contract_instance,
+    call_register_public_key,
+    FALCON_KEY_REGISTRY_CONTRACT_HASH,
+    FALCON_ADDRESS_BASED_VERIFIER_CONTRACT_HASH,
+    FALCON_VERIFIER_WITH_REGISTRY_CONTRACT_HASH,
+    VERIFIER_USE_NTT_KEYS,
+)
+from generate_inputs import generate_falcon_keypair
+import keystore
+
+# Falcon key generation is pure-Python and CPU bound, so it runs in its own processes
+KEYGEN_MAX_WORKERS = 2
+
+_keygen_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_keygen_pool() -> ProcessPoolExecutor:
+    """Returns the shared process pool used for Falcon key generation."""
+    global _keygen_pool
+    if _keygen_pool is None:
+        _keygen_pool = ProcessPoolExecutor(max_workers=KEYGEN_MAX_WORKERS)
+    return _keygen_pool
+
+
+# Seconds between attempts to take a busy account lock
+ACCOUNT_LOCK_POLL_SECONDS = 0.05
+
+# One lock per deployer account for the whole process. Setups run as jobs in
+# separate threads, each with its own event loop, so these are threading locks
+# (an asyncio.Lock belongs to a single loop).
+_account_locks: dict[int, threading.Lock] = {}
+_account_locks_guard = threading.Lock()
+
+
+def get_account_lock(account_address: str) -> threading.Lock:
+    with _account_locks_guard:
+        return _account_locks.setdefault(int(account_address, 16), threading.Lock())
+
+
+@asynccontextmanager
+async def holding_account(account_address: str):
+    """
+    Holds the account's process-wide lock, polling so the event loop keeps
+    running and a cancelled waiter never ends up owning the lock.
+    """
+    lock = get_account_lock(account_address)
+    while not lock.acquire(blocking=False):
+        await asyncio.sleep(ACCOUNT_LOCK_POLL_SECONDS)
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def sepolia_url_from_contract_address(contract_address):
+    url = f"https://sepolia.starkscan.co/contract/{contract_address}"
+    return url
+
+
+@dataclass
+class Stage:
+    """
+    One node of the setup graph.
+
+    run receives a dict of the results of the stages listed in deps.
+    Stages with uses_account=True send transactions from the deployer account and
+    are serialized with each other, and with those of any other setup running in
+    the process for the same account, since they share the account nonce.
+    """
+
+    name: str
+    run: Callable[[dict], Awaitable[Any]]
+    deps: tuple[str, ...] = ()
+    uses_account: bool = False
+
+
+async def run_stage_graph(
+    stages: list[Stage], report: Callable[[str], None], account_address: str
+) -> tuple[dict, dict]:
+    """
+    Runs every stage as soon as its dependencies have finished; stages with
+    uses_account hold the lock of `account_address` (see holding_account).
+    Returns (results, timings); a failed stage is missing from results and
+    all stages depending on it are skipped.
+    """
+    by_name = {stage.name: stage for stage in stages}
+    for stage in stages:
+        for dep in stage.deps:
+            if dep not in by_name:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+
+    tasks: dict[str, asyncio.Task] = {}
+    results: dict[str, Any] = {}
+    timings: dict[str, float] = {}
+
+    async def run_one(stage: Stage) -> Any:
+        dep_results = {}
+        for dep in stage.deps:
+            try:
+                dep_results[dep] = await tasks[dep]
+            except Exception:
+                report(f"Skipping {stage.name}: '{dep}' did not complete.")
+                raise
+
+        if stage.uses_account:
+            async with holding_account(account_address):
+                result = await timed(stage, dep_results)
+        else:
+            result = await timed(stage, dep_results)
+        results[stage.name] = result
+        return result
+
+    async def timed(stage: Stage, dep_results: dict) -> Any:
+        # Measured once the stage can actually start (after waiting for the account)
+        start = time.perf_counter()
+        try:
+            result = await stage.run(dep_results)
+        except Exception as e:
+            timings[stage.name] = time.perf_counter() - start
+            report(f"{stage.name} failed after {timings[stage.name]:.2f}s: {e}")
+            raise
+        timings[stage.name] = time.perf_counter() - start
+        report(f"{stage.name} finished in {timings[stage.name]:.2f}s")
+        return result
+
+    # Tasks are created in declaration order, so deps must be declared first
+    for stage in stages:
+        tasks[stage.name] = asyncio.create_task(run_one(stage))
+    await asyncio.gather(*tasks.values(), return_exceptions=True)
+    return results, timings
+
+
+def format_timings(timings: dict, wall_time: float) -> str:
+    lines = [f"  {name}: {seconds:.2f}s" for name, seconds in timings.items()]
+    lines.append(
+        f"  total: {wall_time:.2f}s wall ({sum(timings.values()):.2f}s summed across stages)"
+    )
+    return "Stage timings:\n" + "\n".join(lines)
+
+
+async def run_provider_setup(
+    report: Callable[[str], None],
+    private_key: str,
+    account_address: str,
+    n: int = 512,
+    colocated: bool = False,
+) -> str:
+    """
+    Provider onboarding as a dependency graph:
+
+        deploy_registry ──> deploy_verifier
+              │
+              └──────────┐
+        keygen ──────────┴──> register_key
+
+    Key generation does not depend on the chain and overlaps with both deployments.
+
+    With colocated=True a single FalconVerifierWithRegistry is deployed; it is both
+    the registry and the verifier, so deploy_verifier sends nothing and returns the
+    same address. Verification then reads the key from the contract's own storage.
+    """
+    if colocated and not FALCON_VERIFIER_WITH_REGISTRY_CONTRACT_HASH:
+        raise RuntimeError(
+            "Co-located deployment needs MOOSH_VERIFIER_WITH_REGISTRY_CLASS_HASH "
+            "(the declared FalconVerifierWithRegistry class hash)."
+        )
+    if not colocated and not (
+        FALCON_KEY_REGISTRY_CONTRACT_HASH and FALCON_ADDRESS_BASED_VERIFIER_CONTRACT_HASH
+    ):
+        raise RuntimeError(
+            "Deployment needs MOOSH_KEY_REGISTRY_CLASS_HASH and MOOSH_VERIFIER_CLASS_HASH "
+            "(the declared FalconPublicKeyRegistry and FalconSignatureVerifier class hashes)."
+        )
+    registry_class_hash = (
+        FALCON_VERIFIER_WITH_REGISTRY_CONTRACT_HASH
+        if colocated
+        else FALCON_KEY_REGISTRY_CONTRACT_HASH
+    )
+
+    async def deploy_registry(_deps: dict) -> str:
+        label = "Key Registry & Verifier" if colocated else "Falcon Key Registry"
+        report(f"Deploying {label}. Account: {account_address[:10]}...")
+        address, tx_hash = await deploy_new_contract_instance(
+            registry_class_hash, private_key, account_address, []
+        )
+        if not tx_hash:
+            raise RuntimeError(f"Key Registry Deployment Failed: {address}")
+        report(
+            f"Key Registry Deployment Initiated!\nContract Link: {sepolia_url_from_contract_address(address)}\nTx Hash: {tx_hash}"
+        )
+        return address
+
+    async def deploy_verifier(deps: dict) -> str:
+        registry_address = deps["deploy_registry"]
+        if colocated:
+            report(f"Verifier is co-located with the registry at {registry_address}.")
+            return registry_address
+        report(f"Deploying Address-Based Verifier. Account: {account_address[:10]}...")
+        address, tx_hash = await deploy_new_contract_instance(
+            FALCON_ADDRESS_BASED_VERIFIER_CONTRACT_HASH,
+            private_key,
+            account_address,
+            [int(registry_address, 16), int(VERIFIER_USE_NTT_KEYS)],
+        )
+        if not tx_hash:
+            raise RuntimeError(f"Address Verifier Deployment Failed: {address}")
+        report(
+            f"Address Verifier Deployment Initiated!\nContract Link: {sepolia_url_from_contract_address(address)}\nTx Hash: {tx_hash}"
+        )
+        return address
+
+    async def keygen(_deps: dict) -> dict:
+        report(f"Generating Falcon-{n} key pair...")
+        loop = asyncio.get_running_loop()
+        keypair = await loop.run_in_executor(
+            get_keygen_pool(), generate_falcon_keypair, n
+        )
+        report(f"Successfully generated {len(keypair['pk'])} public key coefficients.")
+        return keypair
+
+    async def register_key(deps: dict) -> str:
+        registry_address = deps["deploy_registry"]
+        report(f"Attempting to register public key on: {registry_address}...")
+        reg_status_msg, reg_tx_hash = await call_register_public_key(
+            key_registry_contract_address=int(registry_address, 16),
+            pk_coefficients=deps["keygen"]["pk"],
+            deployer_private_key_hex=private_key,
+            deployer_account_address_hex=account_address,
+        )
+        if not reg_tx_hash:
+            raise RuntimeError(f"Public Key Registration Call Failed: {reg_status_msg}")
+        # Cache the signing key only once it matches the registered public key
+        keystore.save_signing_key(account_address, deps["keygen"])
+        report(
+            f"Public Key Registration Call Sent!\nStatus: {reg_status_msg}\nTransaction Hash: {reg_tx_hash}"
+        )
+        return reg_tx_hash
+
+    stages = [
+        Stage("deploy_registry", deploy_registry, uses_account=True),
+        Stage("keygen", keygen),
+        Stage("deploy_verifier", deploy_verifier, ("deploy_registry",), uses_account=True),
+        Stage("register_key", register_key, ("deploy_registry", "keygen"), uses_account=True),
+    ]
+
+    start = time.perf_counter()
+    results, timings = await run_stage_graph(stages, report, account_address)
+    summary = format_timings(timings, time.perf_counter() - start)
+    report(summary)
+
+    failed = [stage.name for stage in stages if stage.name not in results]
+    if failed:
+        raise RuntimeError(f"Provider setup incomplete, failed or skipped: {', '.join(failed)}")
+    return summary
@@ -0,0 +1,313 @@
+# scripts/rpc_transport.py
+"""
+RPC transport shared by every FullNodeClient of the process.
+
+Requests are spread over the endpoints in MOOSH_NODE_URLS (comma separated,
+each optionally suffixed with "|<requests per second>"), falling back to the
+single default URL. Each endpoint has a token bucket that paces requests to its
+rate limit, a latency average used for routing and a circuit breaker that takes
+it out of rotation after repeated failures. Reads are retried on another
+endpoint with jittered backoff; transaction submissions are only retried when
+the request never reached the node.
+
+State is guarded by threading locks rather than asyncio ones, since the app
+runs coroutines in several threads and event loops.
+"""
+import asyncio
+import os
+import random
+import threading
+import time
+from typing import Optional
+
+NODE_URLS_ENV = "MOOSH_NODE_URLS"
+# Public endpoints start throttling around here
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+# Requests an idle endpoint may send at once
+BURST_SECONDS = 2.0
+REQUEST_TIMEOUT_SECONDS = 30.0
+MAX_ATTEMPTS = 4
+BACKOFF_BASE_SECONDS = 0.25
+BACKOFF_MAX_SECONDS = 4.0
+# Consecutive failures that open an endpoint's circuit, and how long it stays open
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_SECONDS = 30.0
+# Weight of the newest sample in the latency average
+LATENCY_SMOOTHING = 0.2
+# Added to a failed request's latency sample, so routing moves away from it
+FAILURE_LATENCY_PENALTY_SECONDS = 1.0
+
+RETRYABLE_HTTP_STATUSES = {"408", "429", "500", "502", "503", "504"}
+# JSON-RPC codes some providers use for rate limiting
+RETRYABLE_RPC_CODES = {-32005, -32029, 429}
+# Methods that change state; anything else is safe to send twice
+WRITE_METHODS = {
+    "starknet_addInvokeTransaction",
+    "starknet_addDeclareTransaction",
+    "starknet_addDeployAccountTransaction",
+}
+
+
+class TokenBucket:
+    """Paces requests to `rate` per second with bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self) -> float:
+        """Seconds until a token is free, without taking it."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0.0, (1 - self._tokens) / self.rate)
+
+    def reserve(self) -> float:
+        """Takes a token and returns how long to wait before using it."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+
+class CircuitBreaker:
+    """
+    Closed until `threshold` consecutive failures, then open for `reset_seconds`;
+    after that one trial request is let through (half-open).
+    """
+
+    def __init__(
+        self,
+        threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_seconds: float = BREAKER_RESET_SECONDS,
+    ):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.reset_seconds:
+                # Half-open: the next failure re-opens it right away
+                self._opened_at = None
+                self._failures = self.threshold - 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+
+
+class Endpoint:
+    def __init__(self, url: str, requests_per_second: float):
+        self.url = url
+        self.bucket = TokenBucket(
+            requests_per_second, max(1.0, requests_per_second * BURST_SECONDS)
+        )
+        self.breaker = CircuitBreaker()
+        # Unmeasured endpoints look fast so each gets tried
+        self.latency = 0.0
+        self._lock = threading.Lock()
+
+    def record_latency(self, seconds: float) -> None:
+        with self._lock:
+            if self.latency == 0.0:
+                self.latency = seconds
+            else:
+                self.latency += LATENCY_SMOOTHING * (seconds - self.latency)
+
+    def expected_delay(self) -> float:
+        return self.latency + self.bucket.wait_time()
+
+
+def parse_node_urls(spec: str) -> list[Endpoint]:
+    """Parses "url[|rps],url[|rps],..." into endpoints."""
+    endpoints = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        url, _, rate = part.partition("|")
+        endpoints.append(
+            Endpoint(url.strip(), float(rate) if rate else DEFAULT_REQUESTS_PER_SECOND)
+        )
+    return endpoints
+
+
+def _is_retryable(error: Exception) -> bool:
+    from starknet_py.net.client_errors import ClientError
+
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    if isinstance(error, ClientError):
+        return str(error.code) in RETRYABLE_HTTP_STATUSES
+    import aiohttp
+
+    return isinstance(error, aiohttp.ClientError)
+
+
+def _never_sent(error: Exception) -> bool:
+    """True if the request failed before reaching the node."""
+    import aiohttp
+
+    return isinstance(error, aiohttp.ClientConnectorError)
+
+
+class RpcTransport:
+    """Routes JSON-RPC requests over a set of endpoints (see the module docstring)."""
+
+    def __init__(self, endpoints: list[Endpoint]):
+        if not endpoints:
+            raise ValueError("At least one RPC endpoint is required.")
+        self.endpoints = endpoints
+
+    def choose(self, exclude: set[str]) -> Endpoint:
+        """The endpoint expected to answer first, skipping open circuits."""
+        candidates = [
+            e for e in self.endpoints if e.url not in exclude and e.breaker.allow()
+        ] or [e for e in self.endpoints if e.breaker.allow()]
+        if not candidates:
+            # Every circuit is open; fall back to the least bad endpoint
+            candidates = self.endpoints
+        return min(candidates, key=lambda e: e.expected_delay())
+
+    async def request(self, send, payload: Optional[dict]) -> dict:
+        """
+        Sends one request, retrying where that is safe.
+
+        Args:
+            send: Coroutine function taking an endpoint URL and returning the
+                decoded JSON response.
+            payload (dict): The JSON-RPC request, used to tell reads from writes.
+
+        Returns:
+            dict: The JSON-RPC response.
+        """
+        method = (payload or {}).get("method", "")
+        is_write = method in WRITE_METHODS
+        tried: set[str] = set()
+        for attempt in range(MAX_ATTEMPTS):
+            endpoint = self.choose(tried)
+            tried.add(endpoint.url)
+            await asyncio.sleep(endpoint.bucket.reserve())
+            started = time.monotonic()
+            try:
+                response = await asyncio.wait_for(
+                    send(endpoint.url), REQUEST_TIMEOUT_SECONDS
+                )
+                error = response.get("error") if isinstance(response, dict) else None
+                if error and error.get("code") in RETRYABLE_RPC_CODES and not is_write:
+                    raise _RateLimited(response)
+            except Exception as e:
+                retryable = isinstance(e, _RateLimited) or _is_retryable(e)
+                endpoint.breaker.record_failure()
+                endpoint.record_latency(
+                    time.monotonic() - started + FAILURE_LATENCY_PENALTY_SECONDS
+                )
+                if (
+                    not retryable
+                    or (is_write and not _never_sent(e))
+                    or attempt == MAX_ATTEMPTS - 1
+                ):
+                    if isinstance(e, _RateLimited):
+                        return e.response
+                    raise
+                backoff = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt)
+                # Full jitter, so retries from many coroutines do not line up
+                delay = random.uniform(0, backoff)
+                print(
+                    f"RPC {method} failed on {endpoint.url} ({e}); retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+            endpoint.record_latency(time.monotonic() - started)
+            endpoint.breaker.record_success()
+            return response
+        raise RuntimeError("unreachable")
+
+
+class _RateLimited(Exception):
+    def __init__(self, response: dict):
+        error = response["error"]
+        super().__init__(f"RPC error {error.get('code')}: {error.get('message')}")
+        # Returned unchanged once the retries run out
+        self.response = response
+
+
+_transport: Optional[RpcTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport(default_url: str) -> RpcTransport:
+    """The process-wide transport, built on first use."""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            spec = os.environ.get(NODE_URLS_ENV, "") or default_url
+            _transport = RpcTransport(parse_node_urls(spec))
+        return _transport
+
+
+def make_client(default_url: str):
+    """
+    A FullNodeClient whose requests go through the shared RpcTransport, with
+    view calls answered from view_cache.VIEW_CACHE where possible.
+
+    Args:
+        default_url (str): Endpoint used when MOOSH_NODE_URLS is not set.
+    """
+    from starknet_py.net.full_node_client import FullNodeClient
+    from starknet_py.net.http_client import RpcHttpClient
+    from view_cache import VIEW_CACHE
+
+    transport = get_transport(default_url)
+
+    class RoutedRpcHttpClient(RpcHttpClient):
+        async def request(self, address, http_method, params=None, payload=None):
+            if VIEW_CACHE.is_tagged_call(payload) and VIEW_CACHE.current_block() is None:
+                # Block-scoped results need the current block to be keyed by
+                await self.request(
+                    address,
+                    http_method,
+                    payload={
+                        "jsonrpc": "2.0",
+                        "method": "starknet_blockNumber",
+                        "id": 0,
+                        "params": [],
+                    },
+                )
+            cached = VIEW_CACHE.lookup(payload)
+            if cached is not None:
+                return cached
+
+            async def send(url: str) -> dict:
+                return await RpcHttpClient.request(
+                    self, address=url, http_method=http_method, params=params, payload=payload
+                )
+
+            response = await transport.request(send, payload)
+            VIEW_CACHE.store(payload, response)
+            return response
+
+    client = FullNodeClient(node_url=transport.endpoints[0].url)
+    # FullNodeClient has no hook for a custom HTTP client
+    client._client = RoutedRpcHttpClient(url=transport.endpoints[0].url)
+    return client
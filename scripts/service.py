@@ -0,0 +1,263 @@
+# scripts/service.py
+"""
+Headless JSON API for escrow operations.
+
+Exposes the cairo_interactions coroutines over HTTP on localhost (or a Unix socket)
+so batch clients and load tests can drive them without the Gradio UI:
+
+    GET  /health
+    POST /keys                        {"registry_address", "pk_coefficients"} or {"registry_address", "n"}
+    POST /escrows                     {"provider_key_hash", "total_amount", "service_period_blocks",
+                                       "verifier_address", "key_registry_address",
+                                       "provider_address", "strk_token_address"?}
+    GET  /escrows/{address}/status
+    POST /escrows/{address}/deposit   {"amount"}
+    POST /escrows/{address}/claim     {"s1_coefficients"?}  (signs with the cached key if omitted)
+    POST /escrows/{address}/dispute
+
+Amounts are in the token's smallest unit. Transactions are signed with the
+"private_key"/"account_address" given in the request body, falling back to the
+MOOSH_PRIVATE_KEY / MOOSH_ACCOUNT_ADDRESS environment variables.
+
+Usage: python scripts/service.py [--host 127.0.0.1] [--port 8080] [--unix-socket PATH]
+"""
+import argparse
+import asyncio
+import os
+
+from aiohttp import web
+
+from cairo_interactions import (
+    ESCROW_CONTRACT_HASH,
+    STRK_TOKEN_ADDRESS,
+    deploy_new_contract_instance,
+    get_escrow_status,
+    call_escrow_deposit,
+    call_escrow_claim,
+    call_escrow_dispute,
+    call_register_public_key,
+)
+from claims import claim_escrow_with_cached_key
+from felt_codec import CoeffVec
+from view_cache import VIEW_CACHE
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+# Requests executing at once; more wait in line up to MAX_PENDING_REQUESTS
+MAX_CONCURRENT_REQUESTS = 16
+MAX_PENDING_REQUESTS = 256
+
+
+class RequestLimiter:
+    """Bounds in-flight requests and rejects new ones once the wait line is full."""
+
+    def __init__(self, max_concurrent: int, max_pending: int):
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._max_pending = max_pending
+        self._pending = 0
+
+    async def __aenter__(self):
+        if self._pending >= self._max_pending:
+            raise web.HTTPServiceUnavailable(
+                text='{"ok": false, "error": "Too many pending requests"}',
+                content_type="application/json",
+            )
+        self._pending += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._pending -= 1
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._semaphore.release()
+
+
+def concurrency_middleware(limiter: RequestLimiter):
+    @web.middleware
+    async def limit_concurrency(request: web.Request, handler):
+        if request.path == "/health":
+            return await handler(request)
+        async with limiter:
+            return await handler(request)
+
+    return limit_concurrency
+
+
+@web.middleware
+async def json_errors(request: web.Request, handler):
+    try:
+        return await handler(request)
+    except web.HTTPException:
+        raise
+    except (KeyError, ValueError, TypeError) as e:
+        return json_response(None, f"Bad request: {e}", status=400)
+
+
+def json_response(result, error, status: int = 200) -> web.Response:
+    if error:
+        return web.json_response(
+            {"ok": False, "error": error}, status=status if status != 200 else 502
+        )
+    return web.json_response({"ok": True, "result": result}, status=status)
+
+
+async def read_body(request: web.Request) -> dict:
+    if not request.can_read_body:
+        return {}
+    body = await request.json()
+    if not isinstance(body, dict):
+        raise ValueError("JSON body must be an object")
+    return body
+
+
+def credentials(body: dict) -> tuple[str, str]:
+    private_key = body.get("private_key") or os.environ.get("MOOSH_PRIVATE_KEY")
+    account_address = body.get("account_address") or os.environ.get(
+        "MOOSH_ACCOUNT_ADDRESS"
+    )
+    if not private_key or not account_address:
+        raise ValueError("private_key and account_address are required")
+    return private_key, account_address
+
+
+def as_hex(value) -> str:
+    if isinstance(value, int):
+        return hex(value)
+    value = str(value)
+    return value if value.startswith("0x") else f"0x{value}"
+
+
+# --- Handlers ---
+async def handle_health(request: web.Request) -> web.Response:
+    return json_response({"status": "ok", "view_cache": VIEW_CACHE.stats()}, None)
+
+
+async def handle_register_key(request: web.Request) -> web.Response:
+    body = await read_body(request)
+    private_key, account_address = credentials(body)
+    pk_coefficients = body.get("pk_coefficients")
+    if pk_coefficients is None:
+        from generate_inputs import generate_falcon_pk_coefficients
+
+        # Keygen is CPU bound; keep it off the event loop
+        pk_coefficients = await asyncio.to_thread(
+            generate_falcon_pk_coefficients, int(body.get("n", 512))
+        )
+    message, tx_hash = await call_register_public_key(
+        key_registry_contract_address=int(as_hex(body["registry_address"]), 16),
+        pk_coefficients=CoeffVec(pk_coefficients),
+        deployer_private_key_hex=private_key,
+        deployer_account_address_hex=account_address,
+    )
+    if not tx_hash:
+        return json_response(None, message)
+    return json_response({"message": message, "tx_hash": tx_hash}, None)
+
+
+async def handle_deploy_escrow(request: web.Request) -> web.Response:
+    body = await read_body(request)
+    private_key, account_address = credentials(body)
+    constructor_args = [
+        as_hex(body["provider_key_hash"]),
+        int(body["total_amount"]),
+        int(body["service_period_blocks"]),
+        as_hex(body["verifier_address"]),
+        as_hex(body["key_registry_address"]),
+        as_hex(body.get("strk_token_address", STRK_TOKEN_ADDRESS)),
+        as_hex(account_address),
+        as_hex(body["provider_address"]),
+    ]
+    contract_address, tx_hash = await deploy_new_contract_instance(
+        ESCROW_CONTRACT_HASH, private_key, account_address, constructor_args
+    )
+    if not tx_hash:
+        return json_response(None, contract_address)
+    return json_response({"contract_address": contract_address, "tx_hash": tx_hash}, None)
+
+
+async def handle_status(request: web.Request) -> web.Response:
+    status, error = await get_escrow_status(as_hex(request.match_info["address"]))
+    if status:
+        status = {
+            k: (hex(v) if k in ("client", "provider", "provider_key_hash") else v)
+            for k, v in status.items()
+        }
+    return json_response(status, error)
+
+
+async def handle_deposit(request: web.Request) -> web.Response:
+    body = await read_body(request)
+    private_key, account_address = credentials(body)
+    tx_hash, error = await call_escrow_deposit(
+        as_hex(request.match_info["address"]),
+        int(body["amount"]),
+        private_key,
+        account_address,
+    )
+    return json_response({"tx_hash": tx_hash}, error)
+
+
+async def handle_claim(request: web.Request) -> web.Response:
+    body = await read_body(request)
+    private_key, account_address = credentials(body)
+    escrow_address = as_hex(request.match_info["address"])
+    if "s1_coefficients" in body:
+        message, tx_hash = await call_escrow_claim(
+            escrow_address,
+            CoeffVec(body["s1_coefficients"], reduce=True),
+            private_key,
+            account_address,
+        )
+    else:
+        message, tx_hash = await claim_escrow_with_cached_key(
+            escrow_address, private_key, account_address
+        )
+    if not message or not tx_hash:
+        return json_response(None, message or tx_hash or "Claim failed")
+    return json_response({"message": message, "tx_hash": tx_hash}, None)
+
+
+async def handle_dispute(request: web.Request) -> web.Response:
+    body = await read_body(request)
+    private_key, account_address = credentials(body)
+    tx_hash, error = await call_escrow_dispute(
+        as_hex(request.match_info["address"]), private_key, account_address
+    )
+    return json_response({"tx_hash": tx_hash}, error)
+
+
+def create_app(
+    max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+    max_pending: int = MAX_PENDING_REQUESTS,
+) -> web.Application:
+    limiter = RequestLimiter(max_concurrent, max_pending)
+    app = web.Application(middlewares=[json_errors, concurrency_middleware(limiter)])
+    app.add_routes(
+        [
+            web.get("/health", handle_health),
+            web.post("/keys", handle_register_key),
+            web.post("/escrows", handle_deploy_escrow),
+            web.get("/escrows/{address}/status", handle_status),
+            web.post("/escrows/{address}/deposit", handle_deposit),
+            web.post("/escrows/{address}/claim", handle_claim),
+            web.post("/escrows/{address}/dispute", handle_dispute),
+        ]
+    )
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix-socket", default=None)
+    parser.add_argument("--max-concurrent", type=int, default=MAX_CONCURRENT_REQUESTS)
+    parser.add_argument("--max-pending", type=int, default=MAX_PENDING_REQUESTS)
+    args = parser.parse_args()
+
+    service = create_app(args.max_concurrent, args.max_pending)
+    if args.unix_socket:
+        web.run_app(service, path=args.unix_socket)
+    else:
+        web.run_app(service, host=args.host, port=args.port)
@@ -0,0 +1,25 @@
+# scripts/tests/conftest.py
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# The scripts import each other by bare module name
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+CAIRO_TESTS_DIR = Path(__file__).resolve().parents[2] / "moosh_id" / "tests"
+
+
+@pytest.fixture
+def cairo_const():
+    """Reads a `pub const NAME: [...] = [...];` array from a moosh_id/tests file."""
+
+    def read(relative_path: str, name: str) -> list[int]:
+        source = (CAIRO_TESTS_DIR / relative_path).read_text("utf-8")
+        match = re.search(rf"pub const {name}: \[[^\]]*\] = \[(.*?)\];", source, re.S)
+        assert match, f"{name} not found in {relative_path}"
+        return [int(value, 0) for value in re.findall(r"0x[0-9a-fA-F]+|\d+", match.group(1))]
+
+    return read
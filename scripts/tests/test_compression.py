@@ -0,0 +1,51 @@
+# scripts/tests/test_compression.py
+"""
+felt_codec's compressed s1 encoding against compression.cairo: the encoder must
+reproduce S1_N512_COMPRESSED from test_compression.cairo and the decoder must
+reject the same malformed inputs as decompress_s1.
+"""
+import pytest
+
+from felt_codec import Q, decode_compressed_s1, encode_compressed_s1
+
+VECTORS = "inputs/falcon_test_vectors_n512.cairo"
+
+
+def test_encode_matches_cairo_vector(cairo_const):
+    s1 = cairo_const(VECTORS, "S1_N512")
+    compressed = cairo_const("test_compression.cairo", "S1_N512_COMPRESSED")
+    assert encode_compressed_s1(s1) == compressed
+    assert decode_compressed_s1(compressed, 512) == s1
+
+
+def test_round_trip_of_centered_coefficients():
+    s1 = [0, 1, -1, 127, -128, 6144, -6144, Q - 1]
+    assert decode_compressed_s1(encode_compressed_s1(s1), len(s1)) == [c % Q for c in s1]
+
+
+def test_decodes_negative_coefficient():
+    # -1: sign 1, low bits 0000001, high terminator -> 10000001 1
+    words = [0x81800000000000000000000000000000000000000000000000000000000000]
+    assert decode_compressed_s1(words, 1) == [Q - 1]
+
+
+def test_rejects_truncated_input(cairo_const):
+    compressed = cairo_const("test_compression.cairo", "S1_N512_COMPRESSED")
+    with pytest.raises(ValueError):
+        decode_compressed_s1(compressed[:-1], 512)
+
+
+@pytest.mark.parametrize(
+    "words",
+    [
+        # Coefficient 0 (bits 00000000 1), then a stray 1 bit
+        [0xc00000000000000000000000000000000000000000000000000000000000],
+        # Sign bit set with value 0: 10000000 1
+        [0x80800000000000000000000000000000000000000000000000000000000000],
+        # Wider than the 31 bytes a word carries
+        [1 << 248],
+    ],
+)
+def test_rejects_malformed_input(words):
+    with pytest.raises(ValueError):
+        decode_compressed_s1(words, 1)
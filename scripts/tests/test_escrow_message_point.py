@@ -0,0 +1,98 @@
+# scripts/tests/test_escrow_message_point.py
+"""
+Escrows are read with whichever message point view they have, and a point that
+only this machine knows is published in full unless commit-only is asked for.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("starknet_py")
+
+import cairo_interactions  # noqa: E402
+import msg_points  # noqa: E402
+import utils  # noqa: E402
+from cairo_interactions import call_msg_points, get_escrow_message_point  # noqa: E402
+
+ESCROW = "0xe5c"
+STORED_POINT = [7] * 512
+
+
+def missing(name):
+    async def call(*args, **kwargs):
+        raise Exception(f"Entry point {name} not found in contract (ENTRYPOINT_NOT_FOUND)")
+
+    return call
+
+
+@pytest.fixture
+def escrow(monkeypatch):
+    """Views and sent invokes of a fake escrow, by entry point name."""
+    state = SimpleNamespace(views={}, sent=[])
+
+    class Contract:
+        def __init__(self, address, abi, provider):
+            self.functions = {}
+            for name in ("get_message_point_commitment", "get_message_point"):
+                view = state.views.get(name)
+                call = missing(name) if view is None else view
+                self.functions[name] = SimpleNamespace(call=call)
+            for name in ("set_message_point_commitment", "set_message_points"):
+                self.functions[name] = SimpleNamespace(invoke_v3=self.invoke(name))
+
+        @staticmethod
+        def invoke(name):
+            async def invoke_v3(*args, **kwargs):
+                state.sent.append(name)
+
+                async def wait_for_acceptance():
+                    pass
+
+                return SimpleNamespace(hash=0x1, wait_for_acceptance=wait_for_acceptance)
+
+            return invoke_v3
+
+    monkeypatch.setattr(cairo_interactions, "Contract", Contract)
+    monkeypatch.setattr(cairo_interactions, "make_client", lambda: None)
+    monkeypatch.setattr(cairo_interactions, "compute_msg_point_commitment", lambda p: 0x99)
+    monkeypatch.setattr(msg_points, "remember_msg_point", lambda p: 0x99)
+    return state
+
+
+def view(value):
+    async def call():
+        return [value]
+
+    return call
+
+
+def test_escrow_without_commitment_view_is_read_with_get_message_point(escrow):
+    escrow.views["get_message_point"] = view(STORED_POINT)
+    point, error = asyncio.run(get_escrow_message_point(ESCROW))
+    assert error is None
+    assert point == {"msg_point": STORED_POINT, "commitment": 0}
+
+
+def test_escrow_without_either_view_uses_the_default_point(escrow):
+    point, error = asyncio.run(get_escrow_message_point(ESCROW))
+    assert error is None
+    assert point["msg_point"] == utils.MSG_POINT
+
+
+def test_stored_point_is_read_when_no_commitment_is_set(escrow):
+    escrow.views["get_message_point_commitment"] = view(0)
+    escrow.views["get_message_point"] = view(STORED_POINT)
+    point, _ = asyncio.run(get_escrow_message_point(ESCROW))
+    assert point["msg_point"] == STORED_POINT
+
+
+def test_only_the_default_point_is_committed_by_default(escrow):
+    asyncio.run(call_msg_points(ESCROW, None))
+    asyncio.run(call_msg_points(ESCROW, None, STORED_POINT))
+    asyncio.run(call_msg_points(ESCROW, None, STORED_POINT, commit_only=True))
+    assert escrow.sent == [
+        "set_message_point_commitment",
+        "set_message_points",
+        "set_message_point_commitment",
+    ]
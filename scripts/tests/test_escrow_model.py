@@ -0,0 +1,125 @@
+# scripts/tests/test_escrow_model.py
+"""
+escrow_model replays Escrow's get_service_status, claim and dispute rules; the
+boundary blocks are where an off-by-one would send a claim that reverts.
+"""
+import pytest
+
+from escrow_model import (
+    STATUS_ACTIVE,
+    STATUS_COMPLETED,
+    STATUS_NOT_STARTED,
+    STATUS_PENDING,
+    EscrowIndex,
+    EscrowState,
+)
+
+START = 100
+PERIOD = 10
+TOTAL = 1000
+ESCROW = 0xE5C
+CLIENT = 0xC1
+PROVIDER = 0xB2
+KEY_HASH = 0x4E7
+
+
+def new_escrow(total: int = TOTAL, period: int = PERIOD) -> EscrowState:
+    return EscrowState(
+        provider_key_hash=KEY_HASH, total_amount=total, service_period_blocks=period
+    )
+
+
+def deposited() -> EscrowState:
+    escrow = new_escrow()
+    escrow.apply_deposit(START)
+    return escrow
+
+
+def test_not_deposited():
+    escrow = new_escrow()
+    assert escrow.service_status(START + PERIOD) == STATUS_NOT_STARTED
+    assert escrow.claim_error(START + PERIOD) == "Not deposited"
+    assert escrow.dispute_error() == "Not deposited"
+    assert escrow.claimable_block is None
+
+
+@pytest.mark.parametrize(
+    "block, status, claim_error, payout",
+    [
+        (START, STATUS_PENDING, "Service period not complete", (0, 0, TOTAL)),
+        (START + 1, STATUS_ACTIVE, "Service period not complete", (1, 100, 900)),
+        (START + PERIOD - 1, STATUS_ACTIVE, "Service period not complete", (9, 900, 100)),
+        (START + PERIOD, STATUS_COMPLETED, None, (PERIOD, TOTAL, 0)),
+        (START + PERIOD + 5, STATUS_COMPLETED, None, (PERIOD, TOTAL, 0)),
+    ],
+)
+def test_boundaries(block, status, claim_error, payout):
+    escrow = deposited()
+    assert escrow.service_status(block) == status
+    assert escrow.claim_error(block) == claim_error
+    assert escrow.dispute_payout(block) == payout
+    assert escrow.claimable_block == START + PERIOD
+
+
+def test_payout_is_floored():
+    escrow = new_escrow(total=10, period=3)
+    escrow.apply_deposit(START)
+    assert escrow.dispute_payout(START + 1) == (1, 3, 7)
+
+
+def test_claimed_and_disputed_escrows_cannot_be_claimed():
+    claimed, disputed = deposited(), deposited()
+    claimed.apply_claim()
+    disputed.apply_dispute()
+    assert claimed.claim_error(START + PERIOD) == "Already claimed"
+    assert claimed.dispute_error() == "Already claimed"
+    assert disputed.claim_error(START + PERIOD) == "Contract disputed"
+    assert disputed.dispute_error() == "Already disputed"
+    assert claimed.is_completed and disputed.is_completed
+
+
+def test_apply_event_replays_each_event():
+    applied = []
+    index = EscrowIndex(on_event=lambda address, name: applied.append((address, name)))
+
+    index.apply_event(ESCROW, "EscrowCreated", [CLIENT, KEY_HASH, TOTAL, PERIOD], 90)
+    escrow = index.escrows[ESCROW]
+    assert escrow == EscrowState(
+        provider_key_hash=KEY_HASH,
+        total_amount=TOTAL,
+        service_period_blocks=PERIOD,
+        client=CLIENT,
+    )
+    assert index.claimable(START + PERIOD) == []
+
+    index.apply_event(ESCROW, "EscrowDeposited", [], START)
+    assert escrow.is_deposited and escrow.service_start_block == START
+    assert index.claimable(START + PERIOD - 1) == []
+    assert index.claimable(START + PERIOD) == [ESCROW]
+    assert index.status(ESCROW, START + PERIOD)["status"] == "Completed"
+
+    index.apply_event(ESCROW, "EscrowClaimed", [PROVIDER], START + PERIOD)
+    assert escrow.is_claimed and escrow.is_completed and escrow.provider == PROVIDER
+    assert index.claimable(START + PERIOD) == []
+
+    assert applied == [
+        (ESCROW, "EscrowCreated"),
+        (ESCROW, "EscrowDeposited"),
+        (ESCROW, "EscrowClaimed"),
+    ]
+
+
+def test_apply_dispute_event():
+    index = EscrowIndex()
+    index.apply_event(ESCROW, "EscrowCreated", [CLIENT, KEY_HASH, TOTAL, PERIOD], 90)
+    index.apply_event(ESCROW, "EscrowDeposited", [], START)
+    index.apply_event(ESCROW, "EscrowDisputed", [], START + 3)
+    escrow = index.escrows[ESCROW]
+    assert escrow.is_disputed and escrow.is_completed
+    assert index.status(ESCROW, START + 3)["status"] == "Disputed"
+
+
+def test_events_of_escrows_created_before_the_synced_range_are_ignored():
+    index = EscrowIndex()
+    index.apply_event(ESCROW, "EscrowDeposited", [], START)
+    assert index.escrows == {}
@@ -0,0 +1,133 @@
+# scripts/tests/test_felt_codec.py
+"""
+felt_codec against packing.cairo and the registry layout: the packed form must
+round-trip the Cairo test keys and reject non-canonical words, and reading a key
+straight from storage must never hand back a key that does not hash to the
+requested key_hash.
+"""
+import asyncio
+import random
+
+import pytest
+
+import felt_codec
+import poseidon_batch
+from felt_codec import CoeffVec, Q, pack_u14_words, packed_len, unpack_u14_words
+
+
+@pytest.mark.parametrize(
+    "vectors, name, words",
+    [
+        ("inputs/falcon_test_vectors_n512.cairo", "PK_N512", 31),
+        ("inputs/falcon_test_vectors_n1024.cairo", "PK_N1024", 61),
+    ],
+)
+def test_pack_round_trip(cairo_const, vectors, name, words):
+    pk = cairo_const(vectors, name)
+    packed = pack_u14_words(pk)
+    assert len(packed) == packed_len(len(pk)) == words
+    assert all(0 <= word < 2**251 for word in packed)
+    assert unpack_u14_words(packed, len(pk)) == pk
+
+    vec = CoeffVec(pk)
+    assert vec.to_felts() == packed
+    assert CoeffVec.from_felts(packed, len(pk)) == vec
+
+
+def test_pack_layout():
+    # Same word as test_pack_layout in test_packing.cairo
+    coeffs = [1 if j in (0, 9) else 0 for j in range(17)]
+    assert pack_u14_words(coeffs) == [0x100000000000000000000000000000001]
+
+
+def test_pack_rejects_coefficient_out_of_range():
+    with pytest.raises(ValueError):
+        pack_u14_words([Q])
+
+
+@pytest.mark.parametrize(
+    "words, n",
+    [
+        ([Q], 1),  # Coefficient not below Q
+        ([0x4000 + 5], 1),  # Bit set above the only coefficient
+        ([1 << 128], 9),  # High half used by a word that has only 9 coefficients
+        ([0] * 31, 1024),  # Word count of n=512
+    ],
+)
+def test_unpack_rejects_non_canonical_words(words, n):
+    with pytest.raises(ValueError):
+        unpack_u14_words(words, n)
+    with pytest.raises(ValueError):
+        CoeffVec.from_felts(words, n)
+
+
+def test_coeff_vec_compares_with_lists():
+    vec = CoeffVec([1, 2])
+    assert vec == [1, 2] and not vec != [1, 2]
+    assert vec != [1, 3] and not vec == [1, 3]
+    assert vec != [1, 2, 3]
+    assert vec != CoeffVec([2, 1])
+    assert not vec != CoeffVec([1, 2])
+    assert vec != 5
+
+
+def fake_hash(coeffs) -> int:
+    # Stands in for poseidon_hash_many; only equality matters here
+    return hash(tuple(coeffs)) & ((1 << 251) - 1)
+
+
+class FakeRegistry:
+    """Storage and get_public_key of one registry holding one key."""
+
+    def __init__(self, pk: list[int], packed: bool):
+        from starknet_py.hash.storage import get_storage_var_address
+
+        self.key_hash = fake_hash(pk)
+        self.pk = pk
+        self.storage = {get_storage_var_address("pk_metadata", self.key_hash): len(pk)}
+        if packed:
+            for i, word in enumerate(pack_u14_words(pk)):
+                self.storage[get_storage_var_address("pk_packed", self.key_hash, i)] = word
+        self.calls = []
+
+    async def get_storage_at(self, address, key):
+        return self.storage.get(key, 0)
+
+    async def call_contract(self, call):
+        self.calls.append(call)
+        return [len(self.pk), *self.pk]
+
+
+@pytest.fixture
+def registry_key(monkeypatch):
+    pytest.importorskip("starknet_py")
+    monkeypatch.setattr(poseidon_batch, "poseidon_hash_key", fake_hash)
+    return [random.randrange(Q) for _ in range(512)]
+
+
+def read(registry, key_hash):
+    return asyncio.run(felt_codec.read_packed_public_key(registry, 0x1, key_hash))
+
+
+def test_packed_registry_is_read_from_storage(registry_key):
+    registry = FakeRegistry(registry_key, packed=True)
+    assert read(registry, registry.key_hash) == registry_key
+    assert registry.calls == []
+
+
+def test_unpacked_registry_falls_back_to_get_public_key(registry_key):
+    # Without pk_packed every word reads as zero; that must not pass as the key
+    registry = FakeRegistry(registry_key, packed=False)
+    assert read(registry, registry.key_hash) == registry_key
+    assert len(registry.calls) == 1
+
+
+def test_key_that_does_not_hash_to_key_hash_is_an_error(registry_key):
+    registry = FakeRegistry(registry_key, packed=False)
+    registry.pk = [0] * 512
+    with pytest.raises(ValueError):
+        read(registry, registry.key_hash)
+
+
+def test_unregistered_key_reads_as_none(registry_key):
+    assert read(FakeRegistry(registry_key, packed=True), 12345) is None
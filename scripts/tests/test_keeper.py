@@ -0,0 +1,155 @@
+# scripts/tests/test_keeper.py
+"""
+EscrowKeeper driven block by block against a fake chain: the claim must go out
+when the latest block is one short of the claimable block and pass the claim
+precheck, which judges it at the block it executes in.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("starknet_py")
+
+import claims  # noqa: E402
+import keeper  # noqa: E402
+from escrow_model import compute_escrow_status  # noqa: E402
+
+PROVIDER = 0x123
+ESCROW = 0xE5C
+START, PERIOD = 100, 10
+CLAIMABLE = START + PERIOD
+DETAILS = {
+    "provider_key_hash": 1,
+    "total_amount": 1000,
+    "service_period_blocks": PERIOD,
+    "service_start_block": START,
+    "is_completed": False,
+    "is_claimed": False,
+    "is_disputed": False,
+    "is_deposited": True,
+    "client": 0x456,
+    "provider": PROVIDER,
+}
+SIGNING_KEY = SimpleNamespace(h=[0] * 512)
+
+
+class FakeClient:
+    def __init__(self):
+        self.block = START
+        # Error returned with the hash of every multicall sent
+        self.multicall_error = None
+
+    async def get_block_number(self):
+        return self.block
+
+    async def get_events(self, **kwargs):
+        return SimpleNamespace(events=[])
+
+
+@pytest.fixture
+def chain(monkeypatch):
+    """A fake client plus the multicalls sent, as (latest block, calls)."""
+    client, sent = FakeClient(), []
+
+    async def get_escrow_status(address, at_block=None):
+        block = at_block if at_block is not None else client.block
+        return compute_escrow_status(dict(DETAILS), block), None
+
+    async def get_escrow_message_point(address):
+        return {"msg_point": [0] * 512, "commitment": 0}, None
+
+    async def get_deployer_account(private_key, account_address):
+        return SimpleNamespace()
+
+    class Preflight:
+        def __init__(self, account):
+            pass
+
+        async def check(self, pending):
+            return [None] * len(pending)
+
+    async def call_escrow_claims_multicall(calls, nonce_allocator):
+        sent.append((client.block, calls))
+        return "0xabc", client.multicall_error
+
+    monkeypatch.setattr(claims, "get_escrow_status", get_escrow_status)
+    monkeypatch.setattr(claims, "get_escrow_message_point", get_escrow_message_point)
+    monkeypatch.setattr(claims, "get_deployer_account", get_deployer_account)
+    monkeypatch.setattr(claims, "get_preflight_simulator", Preflight)
+    monkeypatch.setattr(claims, "NonceAllocator", lambda account: None)
+    monkeypatch.setattr(claims, "call_escrow_claims_multicall", call_escrow_claims_multicall)
+    monkeypatch.setattr(
+        claims,
+        "build_escrow_claim_call",
+        lambda address, s1, msg_point: SimpleNamespace(to=address, calldata=[]),
+    )
+    monkeypatch.setattr(claims, "sign_msg_point", lambda sk, msg_point: [0] * 512)
+    monkeypatch.setattr(claims, "verify_uncompressed", lambda s1, pk, msg_point: True)
+    monkeypatch.setattr(claims.keystore, "load_signing_key", lambda account: SIGNING_KEY)
+    return client, sent
+
+
+def test_precheck_judges_the_claim_block(chain):
+    client, _ = chain
+    client.block = CLAIMABLE - 1
+
+    _, error = asyncio.run(claims.prepare_escrow_claim(hex(ESCROW), SIGNING_KEY, hex(PROVIDER)))
+    assert "Service period not complete" in error
+
+    claim, error = asyncio.run(
+        claims.prepare_escrow_claim(
+            hex(ESCROW), SIGNING_KEY, hex(PROVIDER), claim_block=CLAIMABLE
+        )
+    )
+    assert error is None and claim["s1"] is not None
+
+
+def watching_keeper(alerts: list) -> keeper.EscrowKeeper:
+    escrow_keeper = keeper.EscrowKeeper(
+        "0x1", hex(PROVIDER), report=lambda message: None, alert=alerts.append
+    )
+    escrow_keeper.index.load_details(ESCROW, DETAILS)
+    escrow_keeper.index.synced_block[ESCROW] = START
+    escrow_keeper.last_block = START
+    escrow_keeper._schedule(ESCROW, START)
+    return escrow_keeper
+
+
+def following(client, escrow_keeper):
+    async def follow(last_block: int):
+        for block in range(escrow_keeper.last_block + 1, last_block + 1):
+            client.block = block
+            await escrow_keeper.on_block(client, block)
+
+    return follow
+
+
+def test_keeper_claims_on_time_across_the_boundary(chain):
+    client, sent = chain
+    alerts = []
+    escrow_keeper = watching_keeper(alerts)
+    follow = following(client, escrow_keeper)
+
+    asyncio.run(follow(CLAIMABLE - 2))
+    assert sent == []
+
+    asyncio.run(follow(CLAIMABLE + 5))
+    assert [block for block, _ in sent] == [CLAIMABLE - 1]
+    assert [call.to for call in sent[0][1]] == [hex(ESCROW)]
+    assert alerts == []
+    assert escrow_keeper.index.escrows[ESCROW].is_claimed
+
+
+def test_unconfirmed_multicall_is_not_resent(chain):
+    client, sent = chain
+    client.multicall_error = "Error: Sent but not confirmed: timeout"
+    alerts = []
+    escrow_keeper = watching_keeper(alerts)
+
+    # Up to the block before the retry comes due
+    asyncio.run(following(client, escrow_keeper)(CLAIMABLE + keeper.CLAIM_RETRY_BLOCKS - 3))
+    # Sent once, neither split nor resent, and left for the events to settle
+    assert [block for block, _ in sent] == [CLAIMABLE - 1]
+    assert alerts == []
+    assert not escrow_keeper.index.escrows[ESCROW].is_claimed
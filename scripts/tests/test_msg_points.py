@@ -0,0 +1,64 @@
+# scripts/tests/test_msg_points.py
+"""
+msg_points.hash_to_point against falcon.py's two-bytes-at-a-time loop, and the
+least-recently-used eviction of MsgPointTable.
+"""
+import hashlib
+from types import SimpleNamespace
+
+import pytest
+
+import msg_points
+from felt_codec import Q
+from msg_points import MsgPointTable, hash_to_point
+
+
+def reference_hash_to_point(message: bytes, salt: bytes, n: int) -> list[int]:
+    # falcon.py's SecretKey.hash_to_point: read SHAKE256 output two bytes at a time
+    k = (1 << 16) // Q
+    output = hashlib.shake_256(salt + message).digest(8 * n)
+    hashed, i = [], 0
+    while len(hashed) < n:
+        elt = (output[i] << 8) + output[i + 1]
+        if elt < k * Q:
+            hashed.append(elt % Q)
+        i += 2
+    return hashed
+
+
+PAIRS = [(b"message #%d" % i, bytes([i]) * 40) for i in range(8)]
+
+
+@pytest.mark.parametrize("n", [512, 1024])
+def test_hash_to_point_matches_reference(n):
+    for message, salt in PAIRS:
+        assert hash_to_point(message, salt, n) == reference_hash_to_point(message, salt, n)
+
+
+def test_short_draw_is_redrawn(monkeypatch):
+    # One byte per coefficient is always short, so every point goes through the redraw
+    monkeypatch.setattr(msg_points, "BYTES_PER_COEFF", 1.0)
+    for message, salt in PAIRS:
+        assert hash_to_point(message, salt, 512) == reference_hash_to_point(message, salt, 512)
+
+
+def test_table_evicts_least_recently_used(tmp_path, monkeypatch):
+    clock = SimpleNamespace(now=0.0)
+
+    def tick():
+        clock.now += 1
+        return clock.now
+
+    monkeypatch.setattr(msg_points, "time", SimpleNamespace(time=tick))
+    table = MsgPointTable(tmp_path / "points.sqlite", max_rows=2)
+    a, b, c = (hash_to_point(message, salt) for message, salt in PAIRS[:3])
+
+    table.put_many([(b"a", a, 1)])
+    table.put_many([(b"b", b, 2)])
+    assert table.get_many([b"a"]) == {b"a": a}  # a is now more recent than b
+    table.put_many([(b"c", c, 3)])
+
+    assert table.get_many([b"a", b"b", b"c"]) == {b"a": a, b"c": c}
+    assert table.by_commitment(2) is None
+    assert table.by_commitment(3) == c
+    assert table.stats()["misses"] == 1
@@ -0,0 +1,86 @@
+# scripts/tests/test_preflight.py
+"""
+Pre-flight simulations are shared by every caller sending from one account, and
+are redone once the chain or the account's nonce has moved.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("starknet_py")
+
+import cairo_interactions  # noqa: E402
+from cairo_interactions import get_preflight_simulator  # noqa: E402
+from starknet_py.net.client_models import Call  # noqa: E402
+
+
+class Chain:
+    def __init__(self):
+        self.block = 1
+        self.nonce = 0
+        self.simulated = []
+
+    async def get_block_number(self):
+        return self.block
+
+    async def simulate_transactions(self, transactions, **kwargs):
+        self.simulated.extend(transactions)
+        return [
+            SimpleNamespace(
+                transaction_trace=SimpleNamespace(
+                    execute_invocation=SimpleNamespace(revert_reason=None, result=[1, 1, 1])
+                )
+            )
+            for _ in transactions
+        ]
+
+
+class FakeAccount:
+    def __init__(self, address: int, chain: Chain):
+        self.address = address
+        self.client = chain
+
+    async def get_nonce(self):
+        return self.client.nonce
+
+    async def sign_invoke_v3(self, calls, nonce, l1_resource_bounds):
+        return calls
+
+
+@pytest.fixture
+def chain(monkeypatch):
+    monkeypatch.setattr(cairo_interactions, "_preflight_simulators", {})
+    return Chain()
+
+
+def check(account, calls):
+    return asyncio.run(get_preflight_simulator(account).check([calls]))
+
+
+CALL = Call(to_addr=0x1, selector=0x2, calldata=[3])
+
+
+def test_one_simulator_per_account_address(chain):
+    assert get_preflight_simulator(FakeAccount(0xA, chain)) is get_preflight_simulator(
+        FakeAccount(0xA, chain)
+    )
+    assert get_preflight_simulator(FakeAccount(0xA, chain)) is not get_preflight_simulator(
+        FakeAccount(0xB, chain)
+    )
+
+
+def test_outcomes_are_shared_between_callers(chain):
+    assert check(FakeAccount(0xA, chain), [CALL]) == [None]
+    assert check(FakeAccount(0xA, chain), [CALL]) == [None]
+    assert len(chain.simulated) == 1
+
+
+def test_new_block_or_nonce_simulates_again(chain):
+    account = FakeAccount(0xA, chain)
+    check(account, [CALL])
+    chain.nonce += 1
+    check(account, [CALL])
+    chain.block += 1
+    check(account, [CALL])
+    assert len(chain.simulated) == 3
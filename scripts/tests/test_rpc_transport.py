@@ -0,0 +1,144 @@
+# scripts/tests/test_rpc_transport.py
+"""
+RpcTransport retries reads but never a write that may have reached the node,
+paces each endpoint with its token bucket and routes around open circuits.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import rpc_transport
+from rpc_transport import CircuitBreaker, Endpoint, RpcTransport, TokenBucket
+
+READ = {"jsonrpc": "2.0", "method": "starknet_call", "id": 1, "params": []}
+WRITE = {"jsonrpc": "2.0", "method": "starknet_addInvokeTransaction", "id": 1, "params": []}
+OK = {"jsonrpc": "2.0", "id": 1, "result": []}
+RATE_LIMITED = {"jsonrpc": "2.0", "id": 1, "error": {"code": -32005, "message": "slow down"}}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replaces time.monotonic in rpc_transport; advance with clock.now += s."""
+    state = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(rpc_transport, "time", SimpleNamespace(monotonic=lambda: state.now))
+    return state
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(rpc_transport, "BACKOFF_BASE_SECONDS", 0.0)
+    monkeypatch.setattr(rpc_transport, "BACKOFF_MAX_SECONDS", 0.0)
+
+
+def transport(*urls: str) -> RpcTransport:
+    return RpcTransport([Endpoint(url, 1000.0) for url in urls])
+
+
+def fake_send(*outcomes):
+    """send() returning (or raising) the outcomes in turn, recording the URLs used."""
+    pending = list(outcomes)
+    urls = []
+
+    async def send(url):
+        urls.append(url)
+        outcome = pending.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return send, urls
+
+
+def connection_refused():
+    import aiohttp
+
+    key = SimpleNamespace(host="node", port=443, ssl=True, is_ssl=True)
+    return aiohttp.ClientConnectorError(key, OSError(111, "Connection refused"))
+
+
+def test_token_bucket_paces_after_the_burst(clock):
+    bucket = TokenBucket(rate=2.0, capacity=2.0)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.wait_time() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(0.5)
+    clock.now += 1.5
+    assert bucket.wait_time() == 0.0
+
+
+def test_circuit_breaker_opens_and_half_opens(clock):
+    breaker = CircuitBreaker(threshold=2, reset_seconds=30.0)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    clock.now += 30.0
+    assert breaker.allow()  # Half-open: one trial
+    breaker.record_failure()
+    assert not breaker.allow()  # A single failure re-opens it
+
+    clock.now += 30.0
+    assert breaker.allow()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.allow()  # Closed again, with the count reset
+
+
+def test_read_is_retried_on_another_endpoint(clock):
+    send, urls = fake_send(asyncio.TimeoutError(), OK)
+    assert asyncio.run(transport("a", "b").request(send, READ)) == OK
+    assert sorted(urls) == ["a", "b"]
+
+
+def test_rate_limited_read_is_retried(clock):
+    send, urls = fake_send(RATE_LIMITED, RATE_LIMITED, OK)
+    assert asyncio.run(transport("a").request(send, READ)) == OK
+    assert len(urls) == 3
+
+
+def test_rate_limited_read_returns_the_error_after_the_last_attempt(clock):
+    send, urls = fake_send(*[RATE_LIMITED] * rpc_transport.MAX_ATTEMPTS)
+    assert asyncio.run(transport("a").request(send, READ)) == RATE_LIMITED
+    assert len(urls) == rpc_transport.MAX_ATTEMPTS
+
+
+def test_write_that_may_have_been_sent_is_not_retried(clock):
+    pytest.importorskip("aiohttp")
+    import aiohttp
+
+    send, urls = fake_send(aiohttp.ServerDisconnectedError(), OK)
+    with pytest.raises(aiohttp.ServerDisconnectedError):
+        asyncio.run(transport("a", "b").request(send, WRITE))
+    assert len(urls) == 1
+
+
+def test_write_that_never_connected_is_retried(clock):
+    pytest.importorskip("aiohttp")
+    send, urls = fake_send(connection_refused(), OK)
+    assert asyncio.run(transport("a", "b").request(send, WRITE)) == OK
+    assert len(urls) == 2
+
+
+def test_rate_limited_write_is_not_retried(clock):
+    send, urls = fake_send(RATE_LIMITED, OK)
+    assert asyncio.run(transport("a").request(send, WRITE)) == RATE_LIMITED
+    assert len(urls) == 1
+
+
+def test_open_circuit_is_skipped_until_it_half_opens(clock):
+    rpc = transport("a", "b")
+    a, b = rpc.endpoints
+    for _ in range(rpc_transport.BREAKER_FAILURE_THRESHOLD):
+        a.breaker.record_failure()
+    # a has never been measured, so it would otherwise be chosen first
+    b.record_latency(0.5)
+
+    send, urls = fake_send(OK, OK)
+    asyncio.run(rpc.request(send, READ))
+    assert urls == ["b"]
+
+    clock.now += rpc_transport.BREAKER_RESET_SECONDS
+    asyncio.run(rpc.request(send, READ))
+    assert urls == ["b", "a"]
@@ -0,0 +1,62 @@
+# scripts/tests/test_shard_router.py
+"""
+ShardRouter routes keys with the shard list the verifier reports, read on every
+lookup, rather than a list held by the caller.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("starknet_py")
+
+import cairo_interactions  # noqa: E402
+from cairo_interactions import ShardRouter  # noqa: E402
+
+VERIFIER = "0xfeed"
+
+
+@pytest.fixture
+def verifier(monkeypatch):
+    """The verifier's registry shards (as ints) and the number of reads."""
+    state = SimpleNamespace(shards=[0xA], reads=0)
+
+    class Contract:
+        def __init__(self, address, abi, provider):
+            assert address == int(VERIFIER, 16)
+            names = {
+                item["name"]
+                for entry in abi
+                if entry["type"] == "interface"
+                for item in entry["items"]
+            }
+            assert "get_registry_shards" in names
+            self.functions = {"get_registry_shards": SimpleNamespace(call=self.call)}
+
+        async def call(self):
+            state.reads += 1
+            return [list(state.shards)]
+
+    monkeypatch.setattr(cairo_interactions, "Contract", Contract)
+    return state
+
+
+def test_unsharded_verifier_routes_to_its_registry(verifier):
+    router = ShardRouter(VERIFIER)
+    assert asyncio.run(router.shard_for(7)) == hex(0xA)
+
+
+def test_shard_count_is_read_on_every_lookup(verifier):
+    router = ShardRouter(VERIFIER)
+    assert asyncio.run(router.shard_for(5)) == hex(0xA)
+
+    verifier.shards = [0xA, 0xB, 0xC]
+    assert asyncio.run(router.shard_for(5)) == hex(0xC)
+    assert asyncio.run(router.shard_for(6)) == hex(0xA)
+    assert verifier.reads == 3
+
+
+def test_verifier_without_shards_is_an_error(verifier):
+    verifier.shards = []
+    with pytest.raises(ValueError):
+        asyncio.run(ShardRouter(VERIFIER).shard_for(1))
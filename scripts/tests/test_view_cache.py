@@ -0,0 +1,143 @@
+# scripts/tests/test_view_cache.py
+"""
+ViewCache keys "latest" view calls by the current block, keeps immutable and
+historical results for good, forgets block-scoped results on writes and on
+events of their contract, and never stores an error.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("starknet_py")
+
+import view_cache  # noqa: E402
+from escrow_model import EscrowIndex  # noqa: E402
+from starknet_py.hash.selector import get_selector_from_name  # noqa: E402
+from view_cache import ViewCache  # noqa: E402
+
+REGISTRY = 0x1234
+ESCROW = 0xE5C
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replaces time.monotonic in view_cache; advance with clock.now += s."""
+    state = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(view_cache, "time", SimpleNamespace(monotonic=lambda: state.now))
+    return state
+
+
+def call(address: int, view: str, calldata=(), block=None) -> dict:
+    params = {
+        "request": {
+            "contract_address": hex(address),
+            "entry_point_selector": hex(get_selector_from_name(view)),
+            "calldata": [hex(x) for x in calldata],
+        },
+        "block_id": {"block_number": block} if block is not None else "latest",
+    }
+    return {"jsonrpc": "2.0", "method": "starknet_call", "id": 7, "params": params}
+
+
+def response(result) -> dict:
+    return {"jsonrpc": "2.0", "id": 7, "result": result}
+
+
+def at_block(cache: ViewCache, block: int) -> None:
+    cache.store({"method": "starknet_blockNumber"}, response(block))
+
+
+def cached(cache: ViewCache, payload: dict):
+    hit = cache.lookup(payload)
+    return None if hit is None else hit["result"]
+
+
+def test_latest_call_lasts_one_block(clock):
+    cache = ViewCache()
+    at_block(cache, 10)
+    payload = call(ESCROW, "get_escrow_details")
+    cache.store(payload, response(["0x1"]))
+    assert cache.lookup(payload) == response(["0x1"])
+
+    at_block(cache, 11)
+    assert cached(cache, payload) is None
+
+
+def test_block_number_expires_after_its_ttl(clock):
+    cache = ViewCache()
+    at_block(cache, 10)
+    assert cache.current_block() == 10
+    clock.now += view_cache.BLOCK_NUMBER_TTL_SECONDS + 0.1
+    assert cache.current_block() is None
+    assert cache.lookup({"method": "starknet_blockNumber", "id": 1}) is None
+
+
+def test_immutable_view_is_promoted_to_forever_once_set(clock):
+    cache = ViewCache()
+    at_block(cache, 10)
+    unset = call(REGISTRY, "get_public_key", [0xAA])
+    key = call(REGISTRY, "get_public_key", [0xBB])
+    cache.store(unset, response(["0x0"]))
+    cache.store(key, response(["0x2", "0x5", "0x6"]))
+
+    at_block(cache, 11)
+    cache.invalidate(REGISTRY)
+    cache.invalidate_block_scoped()
+    assert cached(cache, unset) is None  # An empty key may still be registered
+    assert cached(cache, key) == ["0x2", "0x5", "0x6"]
+
+
+def test_call_at_an_explicit_block_is_kept(clock):
+    cache = ViewCache()
+    payload = call(ESCROW, "get_escrow_details", block=5)
+    # No current block needed to key it
+    cache.store(payload, response(["0x1"]))
+    at_block(cache, 11)
+    cache.invalidate(ESCROW)
+    assert cached(cache, payload) == ["0x1"]
+
+
+def test_write_drops_block_scoped_entries(clock):
+    cache = ViewCache()
+    at_block(cache, 10)
+    payload = call(ESCROW, "get_escrow_details")
+    cache.store(payload, response(["0x1"]))
+
+    write = {"method": "starknet_addInvokeTransaction"}
+    cache.store(write, response({"transaction_hash": "0x9"}))
+    assert cached(cache, payload) is None
+    # The block number is re-read after a write
+    assert cache.current_block() is None
+
+
+def test_indexed_event_drops_its_contract_entries(clock):
+    cache = ViewCache()
+    index = EscrowIndex(on_event=lambda address, _: cache.invalidate(address))
+    at_block(cache, 10)
+    escrow = call(ESCROW, "get_escrow_details")
+    other = call(ESCROW + 1, "get_escrow_details")
+    cache.store(escrow, response(["0x1"]))
+    cache.store(other, response(["0x1"]))
+
+    index.apply_event(ESCROW, "EscrowDeposited", [], 10)
+    assert cached(cache, escrow) is None
+    assert cached(cache, other) == ["0x1"]
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_errors_are_never_stored(clock):
+    cache = ViewCache()
+    at_block(cache, 10)
+    payload = call(REGISTRY, "get_public_key", [0xAA])
+    cache.store(payload, {"jsonrpc": "2.0", "id": 7, "error": {"code": 40, "message": "x"}})
+    assert cached(cache, payload) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_oldest_entry_is_evicted(clock):
+    cache = ViewCache(max_entries=2)
+    at_block(cache, 10)
+    payloads = [call(ESCROW + i, "get_escrow_details") for i in range(3)]
+    for payload in payloads:
+        cache.store(payload, response(["0x1"]))
+    assert [cached(cache, p) for p in payloads] == [None, ["0x1"], ["0x1"]]
@@ -0,0 +1,189 @@
+# scripts/view_cache.py
+"""
+Read-through cache for contract view calls, used by rpc_transport.
+
+starknet_call results are keyed by (address, selector, calldata, block). For
+"latest"/"pending" calls the block is the current block number, itself cached
+for BLOCK_NUMBER_TTL_SECONDS, so repeated calls within one block cost one
+request. Calls at an explicit block, and views whose result never changes once
+set (a registered key, its owner), are kept for good. Entries are dropped when
+an indexed event comes from their contract and, for block-scoped ones, when this
+process submits a transaction.
+"""
+import threading
+import time
+from typing import Optional
+
+from starknet_py.hash.selector import get_selector_from_name
+
+# How long the current block number is trusted; close to the Sepolia block time
+BLOCK_NUMBER_TTL_SECONDS = 3.0
+# Entries kept before the oldest are evicted
+MAX_ENTRIES = 10000
+
+# Views that never change once they return something non-zero
+IMMUTABLE_VIEWS = (
+    "get_public_key",
+    "get_public_key_ntt",
+    "get_public_key_packed",
+    "get_key_owner",
+)
+IMMUTABLE_SELECTORS = {get_selector_from_name(name) for name in IMMUTABLE_VIEWS}
+WRITE_METHODS = {
+    "starknet_addInvokeTransaction",
+    "starknet_addDeclareTransaction",
+    "starknet_addDeployAccountTransaction",
+}
+
+FOREVER = -1
+
+
+def _to_int(value) -> int:
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+class ViewCache:
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        # (address, selector, calldata, explicit block) -> (block or FOREVER, result)
+        self._entries: dict[tuple, tuple[int, list]] = {}
+        self._block_number: Optional[int] = None
+        self._block_number_at = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def current_block(self) -> Optional[int]:
+        """The cached block number, or None once it is older than the TTL."""
+        with self._lock:
+            if time.monotonic() - self._block_number_at > BLOCK_NUMBER_TTL_SECONDS:
+                return None
+            return self._block_number
+
+    @staticmethod
+    def _call_key(params) -> Optional[tuple]:
+        """(address, selector, calldata, block number or None for a block tag)"""
+        request = params.get("request") if isinstance(params, dict) else None
+        if not request:
+            return None
+        block_id = params.get("block_id")
+        block = None
+        if isinstance(block_id, dict):
+            if "block_number" not in block_id:
+                return None  # By hash; rare enough not to bother
+            block = block_id["block_number"]
+        return (
+            _to_int(request["contract_address"]),
+            _to_int(request["entry_point_selector"]),
+            tuple(_to_int(x) for x in request.get("calldata", [])),
+            block,
+        )
+
+    @staticmethod
+    def is_tagged_call(payload: Optional[dict]) -> bool:
+        """True for a starknet_call at "latest"/"pending", which needs the current block."""
+        if not payload or payload.get("method") != "starknet_call":
+            return False
+        params = payload.get("params")
+        return isinstance(params, dict) and not isinstance(params.get("block_id"), dict)
+
+    def lookup(self, payload: Optional[dict]) -> Optional[dict]:
+        """A cached JSON-RPC response for `payload`, or None."""
+        if not payload:
+            return None
+        method = payload.get("method")
+        if method == "starknet_blockNumber":
+            block = self.current_block()
+            return self._hit(payload, block) if block is not None else self._miss()
+        if method != "starknet_call":
+            return None
+        key = self._call_key(payload.get("params"))
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            scope, result = entry
+            if scope == FOREVER or scope == self.current_block():
+                return self._hit(payload, result)
+        return self._miss()
+
+    def _hit(self, payload: dict, result) -> dict:
+        with self._lock:
+            self.hits += 1
+        return {"jsonrpc": "2.0", "id": payload.get("id", 0), "result": result}
+
+    def _miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def store(self, payload: Optional[dict], response: dict) -> None:
+        """Records the response to `payload` if it is cacheable."""
+        if not payload or not isinstance(response, dict) or "result" not in response:
+            return
+        method = payload.get("method")
+        result = response["result"]
+        if method == "starknet_blockNumber":
+            with self._lock:
+                self._block_number = result
+                self._block_number_at = time.monotonic()
+            return
+        if method in WRITE_METHODS:
+            self.invalidate_block_scoped()
+            return
+        if method != "starknet_call":
+            return
+        key = self._call_key(payload.get("params"))
+        if key is None:
+            return
+        # Historical state does not change
+        scope = FOREVER if key[3] is not None else self.current_block()
+        if key[1] in IMMUTABLE_SELECTORS and any(_to_int(x) for x in result):
+            scope = FOREVER
+        if scope is None:
+            return  # Current block unknown; nothing to key it by
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                # Dicts keep insertion order, so this is the oldest entry
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (scope, result)
+
+    def invalidate(self, address: int) -> None:
+        """
+        Drops the block-scoped entries of `address`, e.g. when one of its events
+        is indexed; immutable and historical results stay valid.
+        """
+        with self._lock:
+            stale = [
+                k
+                for k, (scope, _) in self._entries.items()
+                if k[0] == address and scope != FOREVER
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def invalidate_block_scoped(self) -> None:
+        with self._lock:
+            stale = [k for k, (scope, _) in self._entries.items() if scope != FOREVER]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            self._block_number_at = 0.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "invalidations": self.invalidations,
+            }
+
+
+# Shared by every client of the process (see rpc_transport.make_client)
+VIEW_CACHE = ViewCache()